@@ -1,22 +1,54 @@
+import atexit
+import os
+from functools import wraps
 from flask import Flask, jsonify
 from flask_cors import CORS
 from controllers.BoardController import BoardController
 from controllers.RobotController import RobotController
+from controllers.GameController import GameController
+from controllers.RobotRegistryController import RobotRegistryController
+from controllers.SimulationController import SimulationController
 from exceptions import (
     WallOutOfBoundsException,
     WallAlreadyExistsException,
     RobotNotPlacedException,
     WallCollisionException,
     InvalidDirectionException,
-    RobotOutOfBoundsException
+    RobotOutOfBoundsException,
+    RobotCollisionException,
+    RobotNotFoundException,
+    PathNotFoundException,
+    GameNotFoundException,
+    ConcurrentModificationException
 
 )
 
 from repositories.BoardRepository import BoardRepository
 from repositories.RobotRepository import RobotRepository
+from repositories.RobotRegistryRepository import RobotRegistryRepository
+from repositories.BinaryBoardRepository import BinaryBoardRepository
+from repositories.CachedRepository import CachedRepository
+from repositories.AtomicFileWriter import AtomicFileWriter
+from repositories.SqliteDatabase import SqliteDatabase
+from repositories.SqliteBoardRepository import SqliteBoardRepository
+from repositories.SqliteRobotRepository import SqliteRobotRepository
+from repositories.JournalStore import JournalStore
+from repositories.JournalBoardRepository import JournalBoardRepository
+from repositories.JournalRobotRepository import JournalRobotRepository
+from repositories.TrackingRepository import TrackingRepository
+from repositories.GameSessionStore import GameSessionStore
+from repositories.SessionBoardRepository import SessionBoardRepository
+from repositories.SessionRobotRepository import SessionRobotRepository
+from repositories.UnitOfWork import UnitOfWork
+from repositories.LandmarkRepository import LandmarkRepository
 
 from services.BoardService import BoardService
 from services.RobotService import RobotService
+from services.RobotRegistryService import RobotRegistryService
+from services.SimulationService import SimulationService
+from services.DistanceFieldCache import DistanceFieldCache
+from services.LandmarkService import LandmarkService
+from models.Landmarks import Landmarks
 
 from controllers.BoardController import BoardController
 from controllers.RobotController import RobotController
@@ -25,17 +57,150 @@ app = Flask(__name__)
 CORS(app)  # Permitir peticiones desde el frontend
 
 
+# ============================================================================
+# CONFIGURACIÓN
+# ============================================================================
 
-
-
-board_repo = BoardRepository()
-robot_repo = RobotRepository()
+# Backend de persistencia: 'json' (data/*.json), 'sqlite' (data/game.db),
+# 'journal' (diario de solo-añadir en data/journal) o 'binary' (tablero
+# binario mapeado en memoria en data/board.bin, robot en JSON)
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'json')
+
+# Durabilidad de las escrituras JSON: 'none' (rename atómico sin fsync),
+# 'write' (fsync en cada escritura) o 'group' (fsync agrupado de las
+# escrituras que llegan dentro de GROUP_COMMIT_WINDOW segundos)
+DURABILITY = os.environ.get('DURABILITY', AtomicFileWriter.DURABILITY_NONE)
+GROUP_COMMIT_WINDOW = float(os.environ.get('GROUP_COMMIT_WINDOW', '0.005'))
+
+# Segundos entre volcados de la caché con escritura diferida (0 = sin caché).
+# Solo debe activarse con un único proceso servidor
+WRITE_BACK_INTERVAL = float(os.environ.get('WRITE_BACK_INTERVAL', '0'))
+# Cambios acumulados que fuerzan un volcado inmediato
+WRITE_BACK_MAX_DIRTY = int(os.environ.get('WRITE_BACK_MAX_DIRTY', '100'))
+
+# Reintentos de una petición cuando otro proceso guardó el mismo documento
+# entre su lectura y su escritura (bloqueo optimista con versiones)
+MAX_CONFLICT_RETRIES = int(os.environ.get('MAX_CONFLICT_RETRIES', '3'))
+
+# Los robots de /api/robots se guardan siempre en un único documento JSON
+ROBOTS_PATH = os.environ.get('ROBOTS_PATH', 'data/robots.json')
+
+# Procesos para los lotes de /api/simulations (por defecto uno por núcleo)
+SIMULATION_WORKERS = int(os.environ.get('SIMULATION_WORKERS', '0')) or None
+
+# Memoria para los campos de distancias de /api/robot/goto (LRU)
+DISTANCE_FIELD_BYTES = int(os.environ.get('DISTANCE_FIELD_BYTES', str(DistanceFieldCache.DEFAULT_MAX_BYTES)))
+
+# Landmarks ALT para goto en tableros de más de StateSpace.MAX_CELLS celdas
+# (0 = A* sin preprocesado). Se guardan en LANDMARKS_PATH, junto al tablero
+LANDMARK_COUNT = int(os.environ.get('LANDMARK_COUNT', str(Landmarks.DEFAULT_COUNT)))
+LANDMARKS_PATH = os.environ.get('LANDMARKS_PATH', 'data/board.landmarks')
+
+# Partidas de /api/games que se mantienen en memoria (como mucho
+# MAX_GAME_SESSIONS y unos MAX_GAME_BYTES); el resto se expulsan comprimidas
+# a GAMES_DIRECTORY y se recargan al usarlas
+MAX_GAME_SESSIONS = int(os.environ.get('MAX_GAME_SESSIONS', '1000'))
+MAX_GAME_BYTES = int(os.environ.get('MAX_GAME_BYTES', str(GameSessionStore.DEFAULT_MAX_BYTES)))
+GAMES_DIRECTORY = os.environ.get('GAMES_DIRECTORY', 'data/games')
+
+
+def build_base_repositories():
+    """Crea los repositorios del tablero y del robot del backend configurado"""
+    if STORAGE_BACKEND == 'json':
+        writer = AtomicFileWriter(DURABILITY, GROUP_COMMIT_WINDOW)
+        return BoardRepository(writer=writer), RobotRepository(writer=writer)
+    if STORAGE_BACKEND == 'binary':
+        writer = AtomicFileWriter(DURABILITY, GROUP_COMMIT_WINDOW)
+        board_repository = BinaryBoardRepository(writer=writer)
+        atexit.register(board_repository.close)
+        return board_repository, RobotRepository(writer=writer)
+    if STORAGE_BACKEND == 'sqlite':
+        database = SqliteDatabase()
+        return SqliteBoardRepository(database), SqliteRobotRepository(database)
+    if STORAGE_BACKEND == 'journal':
+        store = JournalStore()
+        atexit.register(store.close)
+        return JournalBoardRepository(store), JournalRobotRepository(store)
+    raise ValueError(f"STORAGE_BACKEND '{STORAGE_BACKEND}' no válido. Debe ser: json, sqlite, journal, binary")
+
+
+def build_repository(repository):
+    """Envuelve un repositorio con la caché (si está activa) y la unidad de trabajo"""
+    if WRITE_BACK_INTERVAL > 0:
+        repository = CachedRepository(repository, WRITE_BACK_INTERVAL, WRITE_BACK_MAX_DIRTY)
+        atexit.register(repository.close)
+    return TrackingRepository(repository)
+
+
+# 1. Creas los repositorios. Cada petición es una unidad de trabajo: cada
+#    agregado se lee como mucho una vez y se escribe una vez al final
+base_board_repo, base_robot_repo = build_base_repositories()
+board_repo = build_repository(base_board_repo)
+robot_repo = build_repository(base_robot_repo)
+registry_repo = build_repository(
+    RobotRegistryRepository(ROBOTS_PATH, AtomicFileWriter(DURABILITY, GROUP_COMMIT_WINDOW))
+)
+unit_of_work = UnitOfWork(board_repo, robot_repo, registry_repo)
 
 # 2. Creas los servicios (les INYECTAS los repos)
-board_service = BoardService(board_repo)  # ← Inyección
-robot_service = RobotService(robot_repo, board_service)
+board_service = BoardService(board_repo, unit_of_work.after_commit)  # ← Inyección
+distance_fields = DistanceFieldCache(DISTANCE_FIELD_BYTES)
+board_service.add_listener(distance_fields.on_board_changed)
+landmark_service = None
+if LANDMARK_COUNT > 0:
+    landmark_service = LandmarkService(LandmarkRepository(LANDMARKS_PATH), LANDMARK_COUNT)
+    board_service.add_listener(landmark_service.on_board_changed)
+robot_service = RobotService(robot_repo, board_service, distance_fields, landmark_service)
 board_controller = BoardController(board_service)  # ← Inyección
 robot_controller = RobotController(robot_service)
+registry_service = RobotRegistryService(registry_repo, board_service)
+registry_controller = RobotRegistryController(registry_service)
+simulation_service = SimulationService(board_service, SIMULATION_WORKERS)
+atexit.register(simulation_service.close)
+simulation_controller = SimulationController(simulation_service)
+
+# 3. Partidas independientes de /api/games/<game_id>/...
+game_store = GameSessionStore(GAMES_DIRECTORY, MAX_GAME_SESSIONS, max_bytes=MAX_GAME_BYTES)
+atexit.register(game_store.close)
+game_controller = GameController(game_store)
+
+
+def transactional(view):
+    """
+    Ejecuta la vista dentro de la unidad de trabajo de la petición
+
+    Si al guardar otro proceso ya había modificado el documento, la unidad de
+    trabajo se descarta y la vista se repite con el estado recién cargado,
+    hasta MAX_CONFLICT_RETRIES veces.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        for attempt in range(MAX_CONFLICT_RETRIES + 1):
+            try:
+                with unit_of_work:
+                    return view(*args, **kwargs)
+            except ConcurrentModificationException:
+                if attempt == MAX_CONFLICT_RETRIES:
+                    raise
+    return wrapper
+
+
+def with_game(view):
+    """
+    Ejecuta la vista sobre la partida <game_id>
+
+    Los servicios y controladores de la partida se crean en cada petición
+    sobre su sesión, que queda fijada en memoria mientras dura la petición.
+    Una partida que no se creó con POST /api/games responde 404. Si la vista
+    falla, la partida vuelve al estado de antes de la petición.
+    """
+    @wraps(view)
+    def wrapper(game_id):
+        with game_store.session(game_id) as session, session.transaction():
+            game_board_service = BoardService(SessionBoardRepository(session))
+            game_robot_service = RobotService(SessionRobotRepository(session), game_board_service)
+            return view(BoardController(game_board_service), RobotController(game_robot_service))
+    return wrapper
 
 
 # ============================================================================
@@ -104,6 +269,51 @@ def handle_robot_out_of_bounds(e):
     }), 400
 
 
+@app.errorhandler(RobotCollisionException)
+def handle_robot_collision(e):
+    """Maneja colisiones entre robots"""
+    return jsonify({
+        'success': False,
+        'message': str(e)
+    }), 400
+
+
+@app.errorhandler(RobotNotFoundException)
+def handle_robot_not_found(e):
+    """Maneja robots que no existen"""
+    return jsonify({
+        'success': False,
+        'message': str(e)
+    }), 404
+
+
+@app.errorhandler(PathNotFoundException)
+def handle_path_not_found(e):
+    """Maneja destinos inalcanzables o búsquedas que agotan su presupuesto"""
+    return jsonify({
+        'success': False,
+        'message': str(e)
+    }), 404
+
+
+@app.errorhandler(GameNotFoundException)
+def handle_game_not_found(e):
+    """Maneja partidas que no existen"""
+    return jsonify({
+        'success': False,
+        'message': str(e)
+    }), 404
+
+
+@app.errorhandler(ConcurrentModificationException)
+def handle_concurrent_modification(e):
+    """Maneja conflictos de escritura que persisten tras los reintentos"""
+    return jsonify({
+        'success': False,
+        'message': str(e)
+    }), 409
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Maneja endpoints no encontrados"""
@@ -136,69 +346,329 @@ def handle_generic_error(e):
 # ============================================================================
 
 @app.route('/api/board', methods=['POST'])
+@transactional
 def create_board():
     """POST /api/board - Crear tablero"""
     return board_controller.create()
 
 
 @app.route('/api/board', methods=['GET'])
+@transactional
 def get_board():
     """GET /api/board - Obtener tablero"""
     return board_controller.get()
 
 
 @app.route('/api/board', methods=['DELETE'])
+@transactional
 def delete_board():
     """DELETE /api/board - Eliminar tablero"""
     return board_controller.delete()
 
 
 @app.route('/api/board/wall', methods=['POST'])
+@transactional
 def add_wall():
     """POST /api/board/wall - Añadir pared"""
     return board_controller.add_wall()
 
 
+@app.route('/api/board/walls', methods=['POST'])
+@transactional
+def add_walls():
+    """POST /api/board/walls - Añadir paredes en bloque"""
+    return board_controller.add_walls()
+
+
 # ============================================================================
 # RUTAS DEL ROBOT
 # ============================================================================
 
 @app.route('/api/robot/place', methods=['POST'])
+@transactional
 def place_robot():
     """POST /api/robot/place - Colocar robot"""
     return robot_controller.place()
 
 
 @app.route('/api/robot/move', methods=['POST'])
+@transactional
 def move_robot():
     """POST /api/robot/move - Mover robot"""
     return robot_controller.move()
 
 
+@app.route('/api/robot/dash', methods=['POST'])
+@transactional
+def dash_robot():
+    """POST /api/robot/dash - Avanzar hasta la siguiente pared"""
+    return robot_controller.dash()
+
+
+@app.route('/api/robot/goto', methods=['POST'])
+@transactional
+def goto_robot():
+    """POST /api/robot/goto - Camino más corto hasta una casilla"""
+    return robot_controller.goto()
+
+
 @app.route('/api/robot/left', methods=['POST'])
+@transactional
 def turn_left():
     """POST /api/robot/left - Girar izquierda"""
     return robot_controller.left()
 
 
 @app.route('/api/robot/right', methods=['POST'])
+@transactional
 def turn_right():
     """POST /api/robot/right - Girar derecha"""
     return robot_controller.right()
 
 
 @app.route('/api/robot/report', methods=['GET'])
+@transactional
 def report_robot():
     """GET /api/robot/report - Obtener posición"""
     return robot_controller.report()
 
 
+@app.route('/api/robot/commands', methods=['POST'])
+@transactional
+def run_robot_commands():
+    """POST /api/robot/commands - Ejecutar un script de comandos"""
+    return robot_controller.run_commands()
+
+
+@app.route('/api/robot/program/repeat', methods=['POST'])
+@transactional
+def repeat_robot_program():
+    """POST /api/robot/program/repeat - Ejecutar un programa k veces"""
+    return robot_controller.repeat_program()
+
+
 @app.route('/api/robot', methods=['DELETE'])
+@transactional
 def delete_robot():
     """DELETE /api/robot - Eliminar robot"""
     return robot_controller.delete()
 
 
+# ============================================================================
+# RUTAS DE VARIOS ROBOTS
+# ============================================================================
+
+@app.route('/api/robots', methods=['GET'])
+@transactional
+def list_robots():
+    """GET /api/robots - Listar robots"""
+    return registry_controller.list()
+
+
+@app.route('/api/robots', methods=['POST'])
+@transactional
+def create_robot():
+    """POST /api/robots - Crear y colocar un robot"""
+    return registry_controller.create()
+
+
+@app.route('/api/robots/<robot_id>/place', methods=['POST'])
+@transactional
+def place_registered_robot(robot_id):
+    """POST /api/robots/<robot_id>/place - Colocar robot"""
+    return registry_controller.place(robot_id)
+
+
+@app.route('/api/robots/<robot_id>/move', methods=['POST'])
+@transactional
+def move_registered_robot(robot_id):
+    """POST /api/robots/<robot_id>/move - Mover robot"""
+    return registry_controller.move(robot_id)
+
+
+@app.route('/api/robots/<robot_id>/left', methods=['POST'])
+@transactional
+def turn_registered_robot_left(robot_id):
+    """POST /api/robots/<robot_id>/left - Girar izquierda"""
+    return registry_controller.left(robot_id)
+
+
+@app.route('/api/robots/<robot_id>/right', methods=['POST'])
+@transactional
+def turn_registered_robot_right(robot_id):
+    """POST /api/robots/<robot_id>/right - Girar derecha"""
+    return registry_controller.right(robot_id)
+
+
+@app.route('/api/robots/<robot_id>/report', methods=['GET'])
+@transactional
+def report_registered_robot(robot_id):
+    """GET /api/robots/<robot_id>/report - Obtener posición"""
+    return registry_controller.report(robot_id)
+
+
+@app.route('/api/robots/<robot_id>', methods=['DELETE'])
+@transactional
+def delete_registered_robot(robot_id):
+    """DELETE /api/robots/<robot_id> - Eliminar robot"""
+    return registry_controller.delete(robot_id)
+
+
+# ============================================================================
+# RUTAS DE SIMULACIONES
+# ============================================================================
+
+@app.route('/api/simulations', methods=['POST'])
+def create_simulations():
+    """POST /api/simulations - Enviar un lote de simulaciones al pool de procesos"""
+    return simulation_controller.create()
+
+
+@app.route('/api/simulations/<batch_id>', methods=['GET'])
+def get_simulations(batch_id):
+    """GET /api/simulations/<batch_id> - Progreso y resultados de un lote"""
+    return simulation_controller.get(batch_id)
+
+
+# ============================================================================
+# RUTAS DE ANÁLISIS
+# ============================================================================
+
+@app.route('/api/analysis/orbit', methods=['POST'])
+@transactional
+def analyze_orbit():
+    """POST /api/analysis/orbit - Preperiodo, periodo y ciclo de un programa repetido"""
+    return robot_controller.orbit()
+
+
+# ============================================================================
+# RUTAS DE PARTIDAS
+# ============================================================================
+
+@app.route('/api/games', methods=['POST'])
+def create_game():
+    """POST /api/games - Crear partida"""
+    return game_controller.create()
+
+
+@app.route('/api/games/<game_id>', methods=['DELETE'])
+def delete_game(game_id):
+    """DELETE /api/games/<game_id> - Eliminar partida"""
+    return game_controller.delete(game_id)
+
+
+@app.route('/api/games/<game_id>/board', methods=['POST'])
+@with_game
+def create_game_board(board, robot):
+    """POST /api/games/<game_id>/board - Crear tablero de la partida"""
+    return board.create()
+
+
+@app.route('/api/games/<game_id>/board', methods=['GET'])
+@with_game
+def get_game_board(board, robot):
+    """GET /api/games/<game_id>/board - Obtener tablero de la partida"""
+    return board.get()
+
+
+@app.route('/api/games/<game_id>/board', methods=['DELETE'])
+@with_game
+def delete_game_board(board, robot):
+    """DELETE /api/games/<game_id>/board - Eliminar tablero de la partida"""
+    return board.delete()
+
+
+@app.route('/api/games/<game_id>/board/wall', methods=['POST'])
+@with_game
+def add_game_wall(board, robot):
+    """POST /api/games/<game_id>/board/wall - Añadir pared"""
+    return board.add_wall()
+
+
+@app.route('/api/games/<game_id>/board/walls', methods=['POST'])
+@with_game
+def add_game_walls(board, robot):
+    """POST /api/games/<game_id>/board/walls - Añadir paredes en bloque"""
+    return board.add_walls()
+
+
+@app.route('/api/games/<game_id>/robot/place', methods=['POST'])
+@with_game
+def place_game_robot(board, robot):
+    """POST /api/games/<game_id>/robot/place - Colocar robot"""
+    return robot.place()
+
+
+@app.route('/api/games/<game_id>/robot/move', methods=['POST'])
+@with_game
+def move_game_robot(board, robot):
+    """POST /api/games/<game_id>/robot/move - Mover robot"""
+    return robot.move()
+
+
+@app.route('/api/games/<game_id>/robot/dash', methods=['POST'])
+@with_game
+def dash_game_robot(board, robot):
+    """POST /api/games/<game_id>/robot/dash - Avanzar hasta la siguiente pared"""
+    return robot.dash()
+
+
+@app.route('/api/games/<game_id>/robot/goto', methods=['POST'])
+@with_game
+def goto_game_robot(board, robot):
+    """POST /api/games/<game_id>/robot/goto - Camino más corto hasta una casilla"""
+    return robot.goto()
+
+
+@app.route('/api/games/<game_id>/robot/left', methods=['POST'])
+@with_game
+def turn_game_robot_left(board, robot):
+    """POST /api/games/<game_id>/robot/left - Girar izquierda"""
+    return robot.left()
+
+
+@app.route('/api/games/<game_id>/robot/right', methods=['POST'])
+@with_game
+def turn_game_robot_right(board, robot):
+    """POST /api/games/<game_id>/robot/right - Girar derecha"""
+    return robot.right()
+
+
+@app.route('/api/games/<game_id>/robot/report', methods=['GET'])
+@with_game
+def report_game_robot(board, robot):
+    """GET /api/games/<game_id>/robot/report - Obtener posición"""
+    return robot.report()
+
+
+@app.route('/api/games/<game_id>/robot/commands', methods=['POST'])
+@with_game
+def run_game_robot_commands(board, robot):
+    """POST /api/games/<game_id>/robot/commands - Ejecutar un script de comandos"""
+    return robot.run_commands()
+
+
+@app.route('/api/games/<game_id>/robot/program/repeat', methods=['POST'])
+@with_game
+def repeat_game_robot_program(board, robot):
+    """POST /api/games/<game_id>/robot/program/repeat - Ejecutar un programa k veces"""
+    return robot.repeat_program()
+
+
+@app.route('/api/games/<game_id>/robot', methods=['DELETE'])
+@with_game
+def delete_game_robot(board, robot):
+    """DELETE /api/games/<game_id>/robot - Eliminar robot"""
+    return robot.delete()
+
+
+@app.route('/api/games/<game_id>/analysis/orbit', methods=['POST'])
+@with_game
+def analyze_game_orbit(board, robot):
+    """POST /api/games/<game_id>/analysis/orbit - Órbita de un programa en la partida"""
+    return robot.orbit()
+
+
 # ============================================================================
 # ENDPOINT DE SALUD
 # ============================================================================
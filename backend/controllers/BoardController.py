@@ -6,6 +6,9 @@ from models.Wall import Wall
 class BoardController:
     """Controlador HTTP para gestionar el tablero"""
     
+    # Máximo de celdas que se aceptan en una petición de paredes en bloque
+    MAX_BULK_WALLS = 1_000_000
+    
     def __init__(self, board_service: BoardService):
         self._board_service = board_service
     
@@ -81,4 +84,77 @@ class BoardController:
         return jsonify({
             'success': True,
             'message': f'Pared añadida en ({x}, {y})'
-        }), 201
\ No newline at end of file
+        }), 201
+    
+    def add_walls(self):
+        """
+        Maneja POST /api/board/walls
+        
+        Acepta una lista de coordenadas ([x, y] o {"x", "y"}) y/o rectángulos
+        {"x1", "y1", "x2", "y2"} (un segmento es un rectángulo de ancho 1):
+        {"walls": [...], "rects": [...]} o directamente la lista de coordenadas.
+        """
+        data = request.get_json()
+        
+        if not data:
+            raise ValueError('Body JSON requerido')
+        
+        if isinstance(data, list):
+            data = {'walls': data}
+        
+        walls = self._parse_bulk_walls(data.get('walls', []), data.get('rects', []))
+        if not walls:
+            raise ValueError('walls o rects son requeridos')
+        
+        added, rejected = self._board_service.add_walls(walls)
+        
+        return jsonify({
+            'success': bool(added),
+            'message': f'{len(added)} paredes añadidas, {len(rejected)} rechazadas',
+            'added': len(added),
+            'rejected': [
+                {
+                    'x': wall.x,
+                    'y': wall.y,
+                    'error': type(error).__name__,
+                    'message': str(error)
+                }
+                for wall, error in rejected
+            ]
+        }), 201 if added else 400
+    
+    def _parse_bulk_walls(self, coordinates, rects) -> list[Wall]:
+        """Convierte coordenadas y rectángulos del body en paredes"""
+        if not isinstance(coordinates, list) or not isinstance(rects, list):
+            raise ValueError('walls y rects deben ser listas')
+        
+        walls = []
+        for item in coordinates:
+            if isinstance(item, dict):
+                x, y = item.get('x'), item.get('y')
+            elif isinstance(item, (list, tuple)) and len(item) == 2:
+                x, y = item
+            else:
+                raise ValueError(f'Coordenada no válida: {item}')
+            
+            if x is None or y is None:
+                raise ValueError('x e y son requeridos')
+            walls.append(Wall(int(x), int(y)))
+        
+        total = len(walls)
+        for rect in rects:
+            if not isinstance(rect, dict) or any(rect.get(k) is None for k in ('x1', 'y1', 'x2', 'y2')):
+                raise ValueError('x1, y1, x2 e y2 son requeridos en cada rectángulo')
+            
+            x1, x2 = sorted((int(rect['x1']), int(rect['x2'])))
+            y1, y2 = sorted((int(rect['y1']), int(rect['y2'])))
+            total += (x2 - x1 + 1) * (y2 - y1 + 1)
+            if total > self.MAX_BULK_WALLS:
+                raise ValueError(f'Como máximo {self.MAX_BULK_WALLS} paredes por petición')
+            
+            walls.extend(Wall(x, y) for x in range(x1, x2 + 1) for y in range(y1, y2 + 1))
+        
+        if total > self.MAX_BULK_WALLS:
+            raise ValueError(f'Como máximo {self.MAX_BULK_WALLS} paredes por petición')
+        
+        return walls
\ No newline at end of file
@@ -0,0 +1,34 @@
+from flask import jsonify
+from repositories.GameSessionStore import GameSessionStore
+
+
+class GameController:
+    """Controlador HTTP para crear y eliminar partidas"""
+
+    def __init__(self, game_store: GameSessionStore):
+        self._game_store = game_store
+
+    def create(self):
+        """Maneja POST /api/games"""
+        game_id = self._game_store.create()
+
+        return jsonify({
+            'success': True,
+            'message': 'Partida creada exitosamente',
+            'game_id': game_id
+        }), 201
+
+    def delete(self, game_id: str):
+        """Maneja DELETE /api/games/<game_id>"""
+        if not self._game_store.exists(game_id):
+            return jsonify({
+                'success': False,
+                'message': f'No existe la partida {game_id}'
+            }), 404
+
+        self._game_store.delete(game_id)
+
+        return jsonify({
+            'success': True,
+            'message': 'Partida eliminada exitosamente'
+        }), 200
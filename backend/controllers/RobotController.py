@@ -1,10 +1,14 @@
 from flask import request, jsonify
 from services.RobotService import RobotService
+from services.CommandParser import CommandParser
 
 
 class RobotController:
     """Controlador HTTP para gestionar el robot"""
     
+    # Máximo de comandos que se aceptan en un script
+    MAX_COMMANDS = 100_000
+    
     def __init__(self, robot_service: RobotService):
         self._robot_service = robot_service
     
@@ -31,12 +35,29 @@ class RobotController:
         }), 200
     
     def move(self):
-        """Maneja POST /api/robot/move"""
-        # Flask captura RobotNotPlacedException y WallCollisionException automáticamente
-        self._robot_service.move()
-        position = self._robot_service.report()
+        """Maneja POST /api/robot/move, con {"steps": n} opcional"""
+        data = request.get_json(silent=True)
+        steps = data.get('steps') if isinstance(data, dict) else None
         
-        x, y, facing = position
+        # Flask captura RobotNotPlacedException y WallCollisionException automáticamente
+        if steps is None:
+            x, y, facing = self._robot_service.move()
+        else:
+            x, y, facing = self._robot_service.move_steps(int(steps))
+        return jsonify({
+            'success': True,
+            'message': f'Robot movido a ({x}, {y})',
+            'position': {
+                'x': x,
+                'y': y,
+                'facing': facing
+            }
+        }), 200
+    
+    def dash(self):
+        """Maneja POST /api/robot/dash"""
+        # Flask captura RobotNotPlacedException y WallCollisionException automáticamente
+        x, y, facing = self._robot_service.dash()
         return jsonify({
             'success': True,
             'message': f'Robot movido a ({x}, {y})',
@@ -50,10 +71,7 @@ class RobotController:
     def left(self):
         """Maneja POST /api/robot/left"""
         # Flask captura RobotNotPlacedException automáticamente
-        self._robot_service.left()
-        position = self._robot_service.report()
-        
-        x, y, facing = position
+        x, y, facing = self._robot_service.left()
         return jsonify({
             'success': True,
             'message': f'Robot girado a la izquierda, ahora mira {facing}',
@@ -67,10 +85,7 @@ class RobotController:
     def right(self):
         """Maneja POST /api/robot/right"""
         # Flask captura RobotNotPlacedException automáticamente
-        self._robot_service.right()
-        position = self._robot_service.report()
-        
-        x, y, facing = position
+        x, y, facing = self._robot_service.right()
         return jsonify({
             'success': True,
             'message': f'Robot girado a la derecha, ahora mira {facing}',
@@ -109,4 +124,150 @@ class RobotController:
         return jsonify({
             'success': True,
             'message': 'Robot eliminado exitosamente'
-        }), 200
\ No newline at end of file
+        }), 200
+    
+    def run_commands(self):
+        """
+        Maneja POST /api/robot/commands
+        
+        Acepta el script como texto plano (un comando por línea), como JSON
+        {"script": "..."} / {"commands": [...]} o como una lista JSON de comandos.
+        """
+        commands = CommandParser.parse(self._read_script())
+        if len(commands) > self.MAX_COMMANDS:
+            raise ValueError(f'Como máximo {self.MAX_COMMANDS} comandos por script')
+        
+        runner = self._robot_service.run_commands(commands)
+        
+        robot = runner.robot
+        return jsonify({
+            'success': not runner.errors,
+            'executed': runner.executed,
+            'reports': [
+                {'x': x, 'y': y, 'facing': facing} for x, y, facing in runner.reports
+            ],
+            'errors': [
+                {'index': index, 'command': command.source, 'code': code, 'message': message}
+                for index, command, code, message in runner.errors
+            ],
+            'position': {
+                'x': robot.x,
+                'y': robot.y,
+                'facing': robot.facing
+            } if robot.is_placed() else None
+        }), 200
+    
+    def repeat_program(self):
+        """Maneja POST /api/robot/program/repeat con {"program": ..., "times": k}"""
+        data = request.get_json()
+        
+        if not data:
+            raise ValueError('Body JSON requerido')
+        
+        program = data.get('program')
+        times = data.get('times')
+        
+        if program is None or times is None:
+            raise ValueError('program y times son requeridos')
+        
+        commands = CommandParser.parse(program)
+        if len(commands) > self.MAX_COMMANDS:
+            raise ValueError(f'Como máximo {self.MAX_COMMANDS} comandos por programa')
+        
+        x, y, facing = self._robot_service.repeat_program(commands, int(times))
+        return jsonify({
+            'success': True,
+            'message': f'Programa ejecutado {int(times)} veces: robot en ({x}, {y}) mirando {facing}',
+            'position': {
+                'x': x,
+                'y': y,
+                'facing': facing
+            }
+        }), 200
+    
+    def goto(self):
+        """Maneja POST /api/robot/goto con {"x", "y", "facing"?, "execute"?}"""
+        data = request.get_json()
+        
+        if not data:
+            raise ValueError('Body JSON requerido')
+        
+        x = data.get('x')
+        y = data.get('y')
+        if x is None or y is None:
+            raise ValueError('x e y son requeridos')
+        facing = data.get('facing')
+        if facing is not None and not isinstance(facing, str):
+            raise ValueError('facing debe ser una dirección (NORTH, SOUTH, EAST o WEST)')
+        execute = bool(data.get('execute', False))
+        
+        # Flask captura RobotNotPlacedException y PathNotFoundException automáticamente
+        commands, (x, y, facing) = self._robot_service.goto(
+            int(x), int(y), facing.upper() if facing else None, execute
+        )
+        return jsonify({
+            'success': True,
+            'message': f'{len(commands)} comandos hasta ({x}, {y}) mirando {facing}',
+            'commands': commands,
+            'executed': execute,
+            'position': {
+                'x': x,
+                'y': y,
+                'facing': facing
+            }
+        }), 200
+    
+    def orbit(self):
+        """
+        Maneja POST /api/analysis/orbit con
+        {"program": ..., "start": {"x", "y", "facing"}?, "times": k?}
+        """
+        data = request.get_json()
+        
+        if not data:
+            raise ValueError('Body JSON requerido')
+        
+        program = data.get('program')
+        if program is None:
+            raise ValueError('program es requerido')
+        
+        commands = CommandParser.parse(program)
+        if len(commands) > self.MAX_COMMANDS:
+            raise ValueError(f'Como máximo {self.MAX_COMMANDS} comandos por programa')
+        
+        start = data.get('start')
+        if start is not None:
+            if not isinstance(start, dict) or start.get('x') is None or start.get('y') is None or not start.get('facing'):
+                raise ValueError('start requiere x, y y facing')
+            start = (int(start['x']), int(start['y']), str(start['facing']).upper())
+        
+        times = data.get('times')
+        pre_period, period, cells, position = self._robot_service.analyze_orbit(
+            commands, start, None if times is None else int(times)
+        )
+        return jsonify({
+            'success': True,
+            'pre_period': pre_period,
+            'period': period,
+            'cycle_cells': [{'x': x, 'y': y} for x, y in cells],
+            'position': {
+                'x': position[0],
+                'y': position[1],
+                'facing': position[2]
+            } if position is not None else None
+        }), 200
+    
+    def _read_script(self):
+        """Obtiene el script del cuerpo de la petición"""
+        if request.is_json:
+            data = request.get_json()
+            if isinstance(data, dict):
+                data = data.get('script', data.get('commands'))
+            if not isinstance(data, (str, list)):
+                raise ValueError('Se requiere script (texto) o commands (lista)')
+            return data
+        
+        script = request.get_data(as_text=True)
+        if not script.strip():
+            raise ValueError('Script requerido')
+        return script
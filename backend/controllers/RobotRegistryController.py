@@ -0,0 +1,104 @@
+from flask import request, jsonify
+from services.RobotRegistryService import RobotRegistryService
+
+
+class RobotRegistryController:
+    """Controlador HTTP para gestionar varios robots (/api/robots)"""
+    
+    def __init__(self, registry_service: RobotRegistryService):
+        self._registry_service = registry_service
+    
+    def list(self):
+        """Maneja GET /api/robots"""
+        robots = self._registry_service.list_robots()
+        return jsonify({
+            'success': True,
+            'robots': [
+                {'id': robot_id, 'x': x, 'y': y, 'facing': facing}
+                for robot_id, x, y, facing in robots
+            ]
+        }), 200
+    
+    def create(self):
+        """Maneja POST /api/robots"""
+        x, y, facing = self._read_placement()
+        
+        # Flask captura WallCollisionException y RobotCollisionException automáticamente
+        robot_id, (x, y, facing) = self._registry_service.create(x, y, facing)
+        return jsonify({
+            'success': True,
+            'message': f'Robot {robot_id} colocado en ({x}, {y}) mirando {facing}',
+            'id': robot_id,
+            'position': {
+                'x': x,
+                'y': y,
+                'facing': facing
+            }
+        }), 201
+    
+    def place(self, robot_id: str):
+        """Maneja POST /api/robots/<robot_id>/place"""
+        x, y, facing = self._registry_service.place(robot_id, *self._read_placement())
+        return self._position_response(robot_id, f'Robot {robot_id} colocado en ({x}, {y}) mirando {facing}', x, y, facing)
+    
+    def move(self, robot_id: str):
+        """Maneja POST /api/robots/<robot_id>/move"""
+        x, y, facing = self._registry_service.move(robot_id)
+        return self._position_response(robot_id, f'Robot {robot_id} movido a ({x}, {y})', x, y, facing)
+    
+    def left(self, robot_id: str):
+        """Maneja POST /api/robots/<robot_id>/left"""
+        x, y, facing = self._registry_service.left(robot_id)
+        return self._position_response(
+            robot_id, f'Robot {robot_id} girado a la izquierda, ahora mira {facing}', x, y, facing
+        )
+    
+    def right(self, robot_id: str):
+        """Maneja POST /api/robots/<robot_id>/right"""
+        x, y, facing = self._registry_service.right(robot_id)
+        return self._position_response(
+            robot_id, f'Robot {robot_id} girado a la derecha, ahora mira {facing}', x, y, facing
+        )
+    
+    def report(self, robot_id: str):
+        """Maneja GET /api/robots/<robot_id>/report"""
+        x, y, facing = self._registry_service.report(robot_id)
+        return self._position_response(robot_id, f'Robot {robot_id} en ({x}, {y}) mirando {facing}', x, y, facing)
+    
+    def delete(self, robot_id: str):
+        """Maneja DELETE /api/robots/<robot_id>"""
+        self._registry_service.delete(robot_id)
+        
+        return jsonify({
+            'success': True,
+            'message': f'Robot {robot_id} eliminado exitosamente'
+        }), 200
+    
+    def _read_placement(self) -> tuple[int, int, str]:
+        """Obtiene x, y y facing del cuerpo de la petición"""
+        data = request.get_json()
+        
+        if not data:
+            raise ValueError('Body JSON requerido')
+        
+        x = data.get('x')
+        y = data.get('y')
+        facing = data.get('facing')
+        
+        if x is None or y is None or not facing:
+            raise ValueError('x, y y facing son requeridos')
+        
+        return int(x), int(y), str(facing).upper()
+    
+    @staticmethod
+    def _position_response(robot_id: str, message: str, x: int, y: int, facing: str):
+        return jsonify({
+            'success': True,
+            'message': message,
+            'id': robot_id,
+            'position': {
+                'x': x,
+                'y': y,
+                'facing': facing
+            }
+        }), 200
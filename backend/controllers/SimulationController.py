@@ -0,0 +1,51 @@
+from flask import request, jsonify
+from services.SimulationService import SimulationService
+
+
+class SimulationController:
+    """Controlador HTTP para los lotes de simulaciones (/api/simulations)"""
+    
+    def __init__(self, simulation_service: SimulationService):
+        self._simulation_service = simulation_service
+    
+    def create(self):
+        """
+        Maneja POST /api/simulations con
+        {"boards": [{width, height, walls}]?, "jobs": [{board?, start, program, times?}]}
+        """
+        data = request.get_json()
+        
+        if not data:
+            raise ValueError('Body JSON requerido')
+        
+        jobs = data.get('jobs')
+        if not isinstance(jobs, list):
+            raise ValueError('jobs debe ser una lista de trabajos')
+        
+        batch_id = self._simulation_service.submit(data.get('boards'), jobs)
+        return jsonify({
+            'success': True,
+            'message': f'{len(jobs)} simulaciones en cola',
+            'id': batch_id
+        }), 202
+    
+    def get(self, batch_id: str):
+        """Maneja GET /api/simulations/<batch_id>"""
+        batch = self._simulation_service.get(batch_id)
+        
+        if batch is None:
+            return jsonify({
+                'success': False,
+                'message': f'No existe la simulación {batch_id}'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'id': batch.id,
+            'status': 'done' if batch.done else 'running',
+            'total': batch.total,
+            'completed': batch.completed,
+            'progress': batch.completed / batch.total,
+            # Los resultados de los trabajos aún pendientes son null
+            'results': list(batch.results)
+        }), 200
@@ -37,4 +37,28 @@ class RobotOutOfBoundsException(GameException):
 
 class WallCollisionException(GameException):
     """El robot colisionaría con una pared"""
-    pass
\ No newline at end of file
+    pass
+
+
+class RobotCollisionException(GameException):
+    """El robot colisionaría con otro robot"""
+    pass
+
+
+class RobotNotFoundException(GameException):
+    """No existe ningún robot con ese identificador"""
+    pass
+
+
+class PathNotFoundException(GameException):
+    """No hay camino hasta el destino (o la búsqueda agotó su presupuesto)"""
+    pass
+
+class GameNotFoundException(GameException):
+    """No existe ninguna partida con ese identificador"""
+    pass
+
+# Excepciones de persistencia
+class ConcurrentModificationException(GameException):
+    """Otro proceso modificó el documento desde que se cargó"""
+    pass
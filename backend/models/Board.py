@@ -1,32 +1,146 @@
+import copy
+import hashlib
+from operator import attrgetter
+from typing import Iterable, Optional
+import numpy as np
 from models.Wall import Wall
-from exceptions import WallOutOfBoundsException, WallAlreadyExistsException
+from models.WallList import WallList
+from models.WallBitmap import WallBitmap
+from models.WallChunks import WallChunks
+from models.StateSpace import StateSpace, DIRECTION_INDEX, DELTAS
+from models.WallRays import WallRays
+from exceptions import GameException, WallOutOfBoundsException, WallAlreadyExistsException
 
 
 class Board:
-    def __init__(self, width, height):
+    STORAGE_LIST = 'list'
+    STORAGE_DENSE = 'dense'
+    STORAGE_SPARSE = 'sparse'
+    VALID_STORAGES = [STORAGE_LIST, STORAGE_DENSE, STORAGE_SPARSE]
+
+    # A partir de este número de celdas el tablero nunca usa la lista
+    LARGE_BOARD_CELLS = 1_000_000
+    # Por debajo de este número de celdas se usa siempre la lista
+    DENSITY_MIN_CELLS = 65_536
+    # Coste aproximado de una pared en WallList (objeto Wall, hueco en la lista e índice)
+    LIST_BYTES_PER_WALL = 150
+    # Coste aproximado de un bloque de WallChunks (mapa de bits y entrada del diccionario)
+    CHUNK_OVERHEAD_BYTES = WallChunks.CHUNK_BYTES + 150
+    # Coste aproximado de una pared en WallRays (entradas de by_x y by_y)
+    RAYS_BYTES_PER_WALL = 80
+
+    def __init__(
+        self,
+        width,
+        height,
+        storage: Optional[str] = None,
+        expected_walls: int = 0,
+        walls=None
+    ):
         self.width = width
         self.height = height
-        self.walls: list[Wall] = [] 
+        self.storage = storage or self.choose_storage(width, height, expected_walls)
+        # Se puede pasar un almacenamiento ya construido (p. ej. un WallBitmap sobre un mmap)
+        self.walls: list[Wall] = walls if walls is not None else self._create_walls(self.storage)
+        # Paredes añadidas con add_wall/add_walls pendientes de persistir
+        self._new_walls: list[Wall] = []
+        # Versión del documento persistido del que se cargó (0 = nunca guardado)
+        self.version = 0
+        # Tablas de transición del núcleo de simulación (se construyen al pedirlas)
+        self._state_space: Optional[StateSpace] = None
+        # Índice de paredes por fila y columna para movimientos largos (al pedirlo)
+        self._wall_rays: Optional[WallRays] = None
+
+    def __deepcopy__(self, memo) -> 'Board':
+        """
+        Copia el tablero sin sus estructuras derivadas
+
+        Las tablas de transición y el índice por filas y columnas ocupan del
+        orden del tablero entero y se reconstruyen al pedirlos, así que no se
+        copian. Las paredes se copian con el copy-on-write del almacenamiento.
+        """
+        copied = Board.__new__(Board)
+        memo[id(self)] = copied
+        copied.width = self.width
+        copied.height = self.height
+        copied.storage = self.storage
+        copied.walls = copy.deepcopy(self.walls, memo)
+        copied._new_walls = list(self._new_walls)
+        copied.version = self.version
+        copied._state_space = None
+        copied._wall_rays = None
+        return copied
+
+    @classmethod
+    def choose_storage(cls, width, height, expected_walls: int = 0) -> str:
+        """
+        Elige el almacenamiento de paredes según el tamaño y la densidad
+
+        Los tableros pequeños usan WallList (orden de inserción). Los medianos
+        pasan a WallBitmap (W·H/8 bytes) si la lista ocuparía más. En los
+        grandes se compara el mapa de bits con el peor caso de WallChunks (una
+        pared por bloque) y se elige el que menos memoria ocupe.
+        """
+        cells = width * height
+        if cells >= cls.LARGE_BOARD_CELLS:
+            chunks = min(expected_walls, -(-cells // (WallChunks.CHUNK_SIZE ** 2)))
+            if chunks * cls.CHUNK_OVERHEAD_BYTES < cells / 8:
+                return cls.STORAGE_SPARSE
+            return cls.STORAGE_DENSE
+        if cells < cls.DENSITY_MIN_CELLS:
+            return cls.STORAGE_LIST
+        if expected_walls * cls.LIST_BYTES_PER_WALL > cells / 8:
+            return cls.STORAGE_DENSE
+        return cls.STORAGE_LIST
+
+    def _create_walls(self, storage: str):
+        if storage == self.STORAGE_LIST:
+            return WallList()
+        if storage == self.STORAGE_DENSE:
+            return WallBitmap(self.width, self.height)
+        if storage == self.STORAGE_SPARSE:
+            return WallChunks(self.width, self.height)
+        raise ValueError(
+            f"Almacenamiento '{storage}' no válido. Debe ser: {', '.join(self.VALID_STORAGES)}"
+        )
 
     def is_valid_position(self, x, y) -> bool:
         """Comprueba si la posicion esta dentro del tablero y si no tiene una pared"""
         if not self.is_inside(x, y):
             return False
         
-        for wall in self.walls:
-            if (wall.x, wall.y) == (x, y):
-                return False
-            
-        return True
+        return not self.has_wall_at(x, y)
     
     def is_inside(self, x, y) -> bool:
         """Comprueba si la posicion esta dentro de los límites del tablero"""
         return 1 <= x <= self.width and 1 <= y <= self.height
     
+    @staticmethod
+    def wrap_coordinate(coordinate: int, max_value: int) -> int:
+        """
+        Aplica wrap around a una coordenada
+        Si sale por un borde, aparece por el opuesto
+        
+        Ejemplo: si coordinate = 0 y max_value = 5 → retorna 5
+                 si coordinate = 6 y max_value = 5 → retorna 1
+        """
+        if coordinate < 1:
+            return max_value
+        elif coordinate > max_value:
+            return 1
+        return coordinate
+    
+    def wrap_position(self, x, y) -> tuple[int, int]:
+        """Aplica wrap around a una posición que ha salido un paso del tablero"""
+        return self.wrap_coordinate(x, self.width), self.wrap_coordinate(y, self.height)
+    
     def has_wall_at(self, x, y) -> bool:
-        """Verifica si hay una pared en la posición especificada"""
-
-        return any(wall.x == x and wall.y == y for wall in self.walls)
+        """Verifica si hay una pared en la posición especificada (O(1))"""
+        return self.walls.has(x, y)
+    
+    def walls_in_region(self, x1, y1, x2, y2):
+        """Itera las paredes del rectángulo [x1..x2] x [y1..y2]"""
+        return self.walls.walls_in_region(x1, y1, x2, y2)
     
     def add_wall(self, wall: Wall) -> None:
         """
@@ -36,14 +150,230 @@ class Board:
             WallOutOfBoundsException: Si la pared está fuera del tablero
             WallAlreadyExistsException: Si ya existe una pared en esa posición
         """
+        error = self._validate_wall(wall)
+        if error is not None:
+            raise error
+        
+        self.walls.append(wall)
+        self._new_walls.append(wall)
+        self._on_wall_added(wall)
+    
+    def add_walls(self, walls: Iterable[Wall]) -> tuple[list[Wall], list[tuple[Wall, GameException]]]:
+        """
+        Añade varias paredes en una sola pasada
+        
+        No lanza excepciones por pared: las que están fuera del tablero o
+        repetidas (también dentro del mismo lote) se devuelven junto con la
+        excepción que habría lanzado add_wall.
+
+        Los límites, los repetidos del lote y las paredes existentes se
+        comprueban con arrays de NumPy sobre todas las coordenadas, y en el
+        mapa de bits se marcan todas de una vez. Solo se recorre pared a
+        pared para construir los motivos de las rechazadas.
+
+        Returns:
+            (paredes añadidas, [(pared rechazada, motivo)])
+        """
+        walls = list(walls)
+        try:
+            xs = np.fromiter(map(attrgetter('x'), walls), dtype=np.int64, count=len(walls))
+            ys = np.fromiter(map(attrgetter('y'), walls), dtype=np.int64, count=len(walls))
+        except OverflowError:
+            # Coordenadas que no caben en int64: están fuera de cualquier tablero
+            return self._add_walls_one_by_one(walls)
+
+        inside = (xs >= 1) & (xs <= self.width) & (ys >= 1) & (ys <= self.height)
+        cells = (xs - 1) * self.height + (ys - 1)
+        candidates = np.flatnonzero(inside)
+        # Dentro del lote solo cuenta la primera aparición de cada celda: con
+        # una ordenación estable la primera de cada grupo es la más antigua
+        order = np.argsort(cells[candidates], kind='stable')
+        ordered = cells[candidates][order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = ordered[1:] != ordered[:-1]
+        candidates = np.sort(candidates[order[first]])
+        candidates = candidates[~self._existing_walls(xs[candidates], ys[candidates], cells[candidates])]
+
+        if isinstance(self.walls, WallBitmap):
+            self.walls.set_many(np.column_stack((xs[candidates], ys[candidates])))
+        else:
+            for index in candidates.tolist():
+                self.walls.append(walls[index])
+        added = [walls[index] for index in candidates.tolist()]
+
+        if self._state_space is not None or self._wall_rays is not None:
+            for wall in added:
+                self._on_wall_added(wall)
+        self._new_walls.extend(added)
+
+        # Ya insertadas las válidas, _validate_wall da el motivo de cada rechazada
+        rejected_mask = np.ones(len(walls), dtype=bool)
+        rejected_mask[candidates] = False
+        rejected = [
+            (walls[index], self._validate_wall(walls[index]))
+            for index in np.flatnonzero(rejected_mask).tolist()
+        ]
+        return added, rejected
+
+    def _existing_walls(self, xs: np.ndarray, ys: np.ndarray, cells: np.ndarray) -> np.ndarray:
+        """Máscara de las celdas (dentro del tablero) que ya tienen pared"""
+        walls = self.walls
+        if isinstance(walls, WallBitmap):
+            bits = np.frombuffer(walls.buffer(), dtype=np.uint8)
+            return ((bits[cells >> 3] >> (cells & 7)) & 1).astype(bool)
+        return np.fromiter(
+            (walls.has(x, y) for x, y in zip(xs.tolist(), ys.tolist())), dtype=bool, count=len(xs)
+        )
+
+    def _add_walls_one_by_one(self, walls: list[Wall]) -> tuple[list[Wall], list[tuple[Wall, GameException]]]:
+        """add_walls validando pared a pared"""
+        added: list[Wall] = []
+        rejected: list[tuple[Wall, GameException]] = []
+
+        for wall in walls:
+            error = self._validate_wall(wall)
+            if error is None:
+                self.walls.append(wall)
+                added.append(wall)
+                self._on_wall_added(wall)
+            else:
+                rejected.append((wall, error))
+
+        self._new_walls.extend(added)
+        return added, rejected
+    
+    def state_space(self, build: bool = True) -> Optional[StateSpace]:
+        """
+        Tablas de transición del tablero para el núcleo de simulación
+        
+        Se construyen la primera vez y add_wall/add_walls las actualizan.
+        Si se añadieron paredes directamente a `walls` se reconstruyen.
+        Devuelve None si el tablero es demasiado grande para las tablas, o
+        si build es False y no hay tablas construidas al día.
+        """
+        if not StateSpace.fits(self.width, self.height):
+            return None
+        
+        space = self._state_space
+        if space is None or space.wall_count != len(self.walls):
+            if not build:
+                return None
+            space = StateSpace(self.width, self.height, self.walls)
+            self._state_space = space
+        return space
+    
+    def wall_rays(self) -> WallRays:
+        """
+        Índice de paredes por fila y columna
+        
+        Se construye la primera vez y add_wall/add_walls lo actualizan.
+        Si se añadieron paredes directamente a `walls` se reconstruye.
+        """
+        rays = self._wall_rays
+        if rays is None or rays.count != len(self.walls):
+            rays = WallRays(self.width, self.height, self.walls)
+            self._wall_rays = rays
+        return rays
+    
+    def free_steps(self, x, y, facing: str, limit: Optional[int] = None) -> Optional[int]:
+        """
+        Pasos que se pueden avanzar desde (x, y) mirando a facing antes de
+        chocar con una pared (con wrap around), como mucho `limit`
+        
+        Devuelve None si no hay ninguna pared en la línea y no hay límite.
+        """
+        distance = self.wall_rays().distance_to_wall(x, y, DIRECTION_INDEX[facing])
+        if distance is None:
+            return limit
+        steps = distance - 1
+        return steps if limit is None else min(steps, limit)
+    
+    def advance(self, x, y, facing: str, steps: int) -> tuple[int, int]:
+        """Posición tras avanzar `steps` celdas mirando a facing (con wrap around)"""
+        dx, dy = DELTAS[DIRECTION_INDEX[facing]]
+        return (x - 1 + dx * steps) % self.width + 1, (y - 1 + dy * steps) % self.height + 1
+    
+    def wall_grid(self) -> np.ndarray:
+        """Paredes del tablero como array booleano W x H (grid[x - 1, y - 1])"""
+        walls = self.walls
+        if isinstance(walls, WallBitmap):
+            # Mismo orden de bits que WallBitmap: (x - 1) * height + (y - 1), LSB primero
+            bits = np.frombuffer(walls.buffer(), dtype=np.uint8)
+            cells = np.unpackbits(bits, count=self.width * self.height, bitorder='little')
+            return cells.astype(bool).reshape(self.width, self.height)
+        
+        grid = np.zeros((self.width, self.height), dtype=bool)
+        for wall in walls:
+            grid[wall.x - 1, wall.y - 1] = True
+        return grid
+    
+    def fingerprint(self) -> bytes:
+        """Resumen de las dimensiones y las paredes (no depende del almacenamiento)"""
+        walls = self.walls
+        if isinstance(walls, WallBitmap):
+            return self._digest(self.width, self.height, walls.buffer())
+        
+        # Los mismos bits que WallBitmap, sin construir la rejilla de W·H booleanos
+        cells = np.fromiter(
+            ((wall.x - 1) * self.height + (wall.y - 1) for wall in walls), dtype=np.int64, count=len(walls)
+        )
+        bits = np.zeros(WallBitmap.size_for(self.width, self.height), dtype=np.uint8)
+        np.bitwise_or.at(bits, cells >> 3, (1 << (cells & 7)).astype(np.uint8))
+        return self._digest(self.width, self.height, bits)
+    
+    def grid_fingerprint(self, grid: np.ndarray) -> bytes:
+        """fingerprint() de un tablero de estas dimensiones con las paredes de grid"""
+        return self._digest(self.width, self.height, np.packbits(grid.ravel(), bitorder='little'))
+    
+    @staticmethod
+    def _digest(width: int, height: int, bits) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f'{width}x{height}:'.encode())
+        digest.update(bits)
+        return digest.digest()
+    
+    def nbytes(self) -> int:
+        """Memoria aproximada de las paredes y de las estructuras derivadas construidas"""
+        walls = self.walls
+        if isinstance(walls, (WallBitmap, WallChunks)):
+            total = walls.nbytes()
+        else:
+            total = len(walls) * self.LIST_BYTES_PER_WALL
+        if self._state_space is not None:
+            total += self._state_space.nbytes()
+        if self._wall_rays is not None:
+            total += self._wall_rays.count * self.RAYS_BYTES_PER_WALL
+        return total
+    
+    def _on_wall_added(self, wall: Wall) -> None:
+        """Mantiene al día las estructuras derivadas de las paredes"""
+        if self._state_space is not None:
+            self._state_space.add_wall(wall.x, wall.y)
+        if self._wall_rays is not None:
+            self._wall_rays.add(wall.x, wall.y)
+    
+    def pending_walls(self) -> list[Wall]:
+        """Paredes añadidas con add_wall/add_walls aún no persistidas (sin olvidarlas)"""
+        return list(self._new_walls)
+    
+    def pop_new_walls(self) -> list[Wall]:
+        """
+        Devuelve y olvida las paredes añadidas con add_wall/add_walls desde la
+        última llamada. Lo usan los repositorios que persisten de forma incremental.
+        """
+        new_walls, self._new_walls = self._new_walls, []
+        return new_walls
+    
+    def _validate_wall(self, wall: Wall) -> Optional[GameException]:
+        """Devuelve la excepción que impide añadir la pared, o None si es válida"""
         if not self.is_inside(wall.get_x(), wall.get_y()):
-            raise WallOutOfBoundsException(
+            return WallOutOfBoundsException(
                 f"Pared en posición ({wall.x}, {wall.y}) está fuera del tablero (1-{self.width}, 1-{self.height})"
             )
         
         if self.has_wall_at(wall.x, wall.y):
-            raise WallAlreadyExistsException(
+            return WallAlreadyExistsException(
                 f"Ya existe una pared en la posición ({wall.x}, {wall.y})"
             )
         
-        self.walls.append(wall)
\ No newline at end of file
+        return None
@@ -0,0 +1,187 @@
+from typing import Callable, Optional
+import numpy as np
+from models.Board import Board
+from models.StateSpace import DELTAS
+
+
+class Landmarks:
+    """
+    Distancias exactas desde k casillas de referencia (landmarks) para la heurística ALT
+
+    Cada landmark L guarda la distancia en pasos, con wrap around y
+    esquivando paredes, hasta todas las casillas (una BFS sobre el grafo de
+    casillas, que es no dirigido). Por la desigualdad triangular,
+
+        |d(L, objetivo) - d(L, casilla)| <= d(casilla, objetivo)
+
+    y como cada paso es un MOVE, el máximo sobre los landmarks es una cota
+    inferior de los MOVE que faltan: PathFinder la combina con su distancia
+    en el toro. Alrededor de grupos de paredes la cota crece mucho más
+    deprisa que la distancia en el toro y A* expande muchos menos estados.
+
+    Los landmarks se eligen por el punto más lejano: cada uno es la casilla
+    de la zona conectada principal más alejada de los ya elegidos, así
+    quedan en los extremos del tablero. Las distancias se guardan en un
+    array (k, W·H) de uint16 o uint32 en el que `UNREACHABLE` marca las
+    casillas sin camino; `fingerprint` es el Board.fingerprint del tablero
+    con que se calcularon.
+    """
+
+    DEFAULT_COUNT = 4
+    # Casillas desde las que se busca la zona conectada principal
+    MAX_REGION_SEEDS = 8
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: np.ndarray,
+        distances: np.ndarray,
+        fingerprint: bytes,
+        wall_count: int
+    ):
+        self.width = width
+        self.height = height
+        # Índice (x - 1) * height + (y - 1) de cada landmark
+        self.cells = cells
+        self.distances = distances
+        self.fingerprint = fingerprint
+        self.wall_count = wall_count
+        self.UNREACHABLE = np.iinfo(distances.dtype).max
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    @staticmethod
+    def dtype_for(width: int, height: int) -> np.dtype:
+        """uint16 si ninguna distancia puede llegar a 65535, uint32 si no"""
+        return np.dtype(np.uint16 if width * height < np.iinfo(np.uint16).max else np.uint32)
+
+    # ==================== Construcción ====================
+
+    @classmethod
+    def build(cls, board: Board, count: int = DEFAULT_COUNT) -> 'Landmarks':
+        """
+        Elige hasta `count` landmarks y calcula sus distancias
+
+        Raises:
+            ValueError: Si count no es positivo o el tablero no tiene casillas libres
+        """
+        if count < 1:
+            raise ValueError("Se requiere al menos un landmark")
+        walls = board.wall_grid().ravel()
+        free = np.flatnonzero(~walls)
+        if not len(free):
+            raise ValueError("El tablero no tiene casillas libres para los landmarks")
+
+        dtype = cls.dtype_for(board.width, board.height)
+        unreachable = np.iinfo(dtype).max
+        # Distancia de cada casilla al landmark más cercano (al principio, a la
+        # semilla). Solo se eligen casillas de la zona conectada principal:
+        # ni paredes ni huecos aislados
+        nearest = cls._main_region(board.width, board.height, walls, free, dtype)
+        nearest[nearest == unreachable] = 0
+
+        cells, rows = [], []
+        for _ in range(count):
+            cell = int(np.argmax(nearest))
+            if cells and nearest[cell] == 0:
+                # Todas las casillas de la zona ya son landmarks
+                break
+            row = cls._bfs(board.width, board.height, walls, cell, dtype)
+            if not cells:
+                # La semilla no es un landmark: se mide desde el primero
+                nearest = row.copy()
+                nearest[nearest == unreachable] = 0
+            else:
+                np.minimum(nearest, row, out=nearest)
+            cells.append(cell)
+            rows.append(row)
+
+        return cls(
+            board.width,
+            board.height,
+            np.array(cells, dtype=np.uint32),
+            np.stack(rows),
+            board.grid_fingerprint(walls),
+            len(board.walls)
+        )
+
+    @classmethod
+    def _main_region(cls, width: int, height: int, walls: np.ndarray, free: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """
+        Distancias desde una casilla de la zona conectada más grande
+
+        Se prueba desde unas pocas casillas libres hasta dar con una zona
+        que tenga más de la mitad de las casillas libres (que por fuerza es
+        la mayor); si no aparece, se queda la mayor de las encontradas.
+        """
+        unreachable = np.iinfo(dtype).max
+        best, best_size = None, 0
+        seed = int(free[len(free) // 2])
+        for _ in range(cls.MAX_REGION_SEEDS):
+            distances = cls._bfs(width, height, walls, seed, dtype)
+            reached = distances != unreachable
+            size = int(np.count_nonzero(reached))
+            if size > best_size:
+                best, best_size = distances, size
+            if best_size * 2 > len(free):
+                break
+            remaining = free[~reached[free]]
+            if not len(remaining):
+                break
+            seed = int(remaining[len(remaining) // 2])
+        return best
+
+    @staticmethod
+    def _bfs(width: int, height: int, walls: np.ndarray, source: int, dtype: np.dtype) -> np.ndarray:
+        """Distancias en pasos desde `source` a todas las casillas, nivel a nivel"""
+        unreachable = np.iinfo(dtype).max
+        distances = np.full(width * height, unreachable, dtype=dtype)
+        distances[source] = 0
+        # Marca por casilla para quitar repetidos de la frontera sin ordenarla
+        claimed = np.zeros(width * height, dtype=np.int32)
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+        while len(frontier):
+            level += 1
+            cell_x, cell_y = np.divmod(frontier, height)
+            neighbours = np.concatenate([
+                ((cell_x + dx) % width) * height + (cell_y + dy) % height
+                for dx, dy in DELTAS
+            ])
+            neighbours = neighbours[(distances[neighbours] == unreachable) & ~walls[neighbours]]
+            # De cada casilla repetida se queda la última aparición
+            order = np.arange(len(neighbours), dtype=np.int32)
+            claimed[neighbours] = order
+            neighbours = neighbours[claimed[neighbours] == order]
+            distances[neighbours] = level
+            frontier = neighbours
+        return distances
+
+    # ==================== Cotas ====================
+
+    def lower_bound_to(self, x: int, y: int) -> Callable[[int, int], Optional[int]]:
+        """
+        Función (x, y) -> cota inferior de los pasos hasta (x, y), o None si
+        los landmarks demuestran que no hay camino
+        """
+        cell = (x - 1) * self.height + (y - 1)
+        # A* llama a la cota por cada vecino, así que se consulta fila a fila
+        # con enteros (más rápido que una operación de NumPy sobre k valores)
+        pairs = [(row, int(row[cell])) for row in self.distances]
+        height, unreachable = self.height, int(self.UNREACHABLE)
+
+        def bound(cell_x: int, cell_y: int) -> Optional[int]:
+            cell = (cell_x - 1) * height + (cell_y - 1)
+            best = 0
+            for row, target in pairs:
+                distance = int(row[cell])
+                if (distance == unreachable) != (target == unreachable):
+                    # Un landmark llega a una casilla y no a la otra: zonas distintas
+                    return None
+                if distance != unreachable:
+                    best = max(best, abs(distance - target))
+            return best
+
+        return bound
@@ -1,18 +1,43 @@
 from typing import Optional
 from exceptions import InvalidDirectionException
+from models.StateSpace import StateSpace, DIRECTIONS, DIRECTION_INDEX, LEFT_OF, RIGHT_OF, DELTAS
 
 
 class Robot:
+    """
+    Robot del juego: fachada sobre el núcleo de simulación (StateSpace)
+    
+    La orientación se guarda como índice (0-3) y los giros y el paso hacia
+    delante son consultas a tuplas precalculadas; `facing` la expone como texto.
+    """
+    
     VALID_DIRECTIONS = ['NORTH', 'SOUTH', 'EAST', 'WEST']
     
     def __init__(self):
         self.x: Optional[int] = None
         self.y: Optional[int] = None
-        self.facing: Optional[str] = None
+        self._direction: Optional[int] = None
+        # Versión del documento persistido del que se cargó (0 = nunca guardado)
+        self.version = 0
+    
+    @property
+    def facing(self) -> Optional[str]:
+        return None if self._direction is None else DIRECTIONS[self._direction]
+    
+    @facing.setter
+    def facing(self, facing: Optional[str]) -> None:
+        if facing is None:
+            self._direction = None
+            return
+        if facing not in DIRECTION_INDEX:
+            raise InvalidDirectionException(
+                f"Dirección '{facing}' no válida. Debe ser: {', '.join(self.VALID_DIRECTIONS)}"
+            )
+        self._direction = DIRECTION_INDEX[facing]
     
     def is_placed(self) -> bool:
         """Verifica si el robot ha sido colocado en el tablero"""
-        return self.x is not None and self.y is not None and self.facing is not None
+        return self.x is not None and self.y is not None and self._direction is not None
     
     def place(self, x: int, y: int, facing: str) -> None:
         """
@@ -32,23 +57,11 @@ class Robot:
     
     def turn_left(self) -> None:
         """Gira el robot 90 grados a la izquierda"""
-        rotations = {
-            'NORTH': 'WEST',
-            'WEST': 'SOUTH',
-            'SOUTH': 'EAST',
-            'EAST': 'NORTH'
-        }
-        self.facing = rotations[self.facing]
+        self._direction = LEFT_OF[self._direction]
     
     def turn_right(self) -> None:
         """Gira el robot 90 grados a la derecha"""
-        rotations = {
-            'NORTH': 'EAST',
-            'EAST': 'SOUTH',
-            'SOUTH': 'WEST',
-            'WEST': 'NORTH'
-        }
-        self.facing = rotations[self.facing]
+        self._direction = RIGHT_OF[self._direction]
     
     def get_position(self) -> tuple[int, int, str]:
         """Retorna la posición y orientación actual"""
@@ -56,11 +69,18 @@ class Robot:
     
     def get_next_position(self) -> tuple[int, int]:
         """Calcula la siguiente posición sin moverse"""
-        movements = {
-            'NORTH': (1, 0),
-            'SOUTH': (-1, 0),
-            'EAST': (0, 1),
-            'WEST': (0, -1)
-        }
-        dx, dy = movements[self.facing]
-        return (self.x + dx, self.y + dy)
\ No newline at end of file
+        dx, dy = DELTAS[self._direction]
+        return (self.x + dx, self.y + dy)
+    
+    # ==================== Estado empaquetado ====================
+    
+    def to_state(self, space: StateSpace) -> int:
+        """Estado empaquetado del robot en las tablas de un tablero"""
+        return ((self.x - 1) * space.height + (self.y - 1)) * 4 + self._direction
+    
+    def set_state(self, space: StateSpace, state: int) -> None:
+        """Coloca el robot en el estado empaquetado"""
+        cell, self._direction = divmod(state, 4)
+        x, y = divmod(cell, space.height)
+        self.x = x + 1
+        self.y = y + 1
@@ -0,0 +1,115 @@
+import re
+import uuid
+from typing import Iterator, Optional
+from models.Robot import Robot
+from exceptions import RobotCollisionException, RobotNotFoundException
+
+
+class RobotRegistry:
+    """
+    Robots de un tablero identificados por id
+
+    Además de los robots mantiene un índice posición -> id, así saber si una
+    celda está ocupada es una consulta O(1) en lugar de recorrer todos los
+    robots. place/move_to/remove validan antes de modificar nada y actualizan
+    el robot y el índice juntos, de modo que nunca quedan desincronizados.
+    Las posiciones de los robots solo deben cambiarse a través del registro.
+    """
+
+    ROBOT_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+    def __init__(self):
+        self._robots: dict[str, Robot] = {}
+        # (x, y) -> id del robot que la ocupa
+        self._positions: dict[tuple[int, int], str] = {}
+        # Versión del documento persistido del que se cargó (0 = nunca guardado)
+        self.version = 0
+
+    @staticmethod
+    def new_robot_id() -> str:
+        """Genera un identificador de robot nuevo"""
+        return uuid.uuid4().hex
+
+    def validate_robot_id(self, robot_id: str) -> None:
+        if not self.ROBOT_ID_PATTERN.match(robot_id):
+            raise ValueError(
+                "Identificador de robot no válido: 1-64 caracteres entre letras, dígitos, '-' y '_'"
+            )
+
+    def __len__(self) -> int:
+        return len(self._robots)
+
+    def __iter__(self) -> Iterator[tuple[str, Robot]]:
+        return iter(self._robots.items())
+
+    def get(self, robot_id: str) -> Robot:
+        """
+        Raises:
+            RobotNotFoundException: Si no existe el robot
+        """
+        robot = self._robots.get(robot_id)
+        if robot is None:
+            raise RobotNotFoundException(f"No existe el robot '{robot_id}'")
+        return robot
+
+    def occupant(self, x: int, y: int) -> Optional[str]:
+        """Id del robot que ocupa (x, y), o None si está libre"""
+        return self._positions.get((x, y))
+
+    def place(self, robot_id: str, x: int, y: int, facing: str) -> Robot:
+        """
+        Coloca un robot (lo crea si no existe) o lo reposiciona
+
+        Raises:
+            ValueError: Si el identificador no es válido
+            InvalidDirectionException: Si la dirección no es válida
+            RobotCollisionException: Si otro robot ocupa la posición
+        """
+        self.validate_robot_id(robot_id)
+        self._check_free(robot_id, x, y)
+
+        robot = self._robots.get(robot_id)
+        if robot is None:
+            robot = Robot()
+            # El dominio valida la dirección antes de registrar el robot
+            robot.place(x, y, facing)
+            self._robots[robot_id] = robot
+        else:
+            old_position = (robot.x, robot.y)
+            robot.place(x, y, facing)
+            del self._positions[old_position]
+        self._positions[(x, y)] = robot_id
+        return robot
+
+    def move_to(self, robot_id: str, x: int, y: int) -> Robot:
+        """
+        Mueve un robot a (x, y) sin cambiar su orientación
+
+        Raises:
+            RobotNotFoundException: Si no existe el robot
+            RobotCollisionException: Si otro robot ocupa la posición
+        """
+        robot = self.get(robot_id)
+        self._check_free(robot_id, x, y)
+
+        del self._positions[(robot.x, robot.y)]
+        robot.x = x
+        robot.y = y
+        self._positions[(x, y)] = robot_id
+        return robot
+
+    def remove(self, robot_id: str) -> None:
+        """
+        Raises:
+            RobotNotFoundException: Si no existe el robot
+        """
+        robot = self.get(robot_id)
+        del self._positions[(robot.x, robot.y)]
+        del self._robots[robot_id]
+
+    def _check_free(self, robot_id: str, x: int, y: int) -> None:
+        occupant = self._positions.get((x, y))
+        if occupant is not None and occupant != robot_id:
+            raise RobotCollisionException(
+                f"No se puede ocupar ({x}, {y}): está el robot '{occupant}'"
+            )
@@ -0,0 +1,165 @@
+from array import array
+from itertools import chain
+from typing import Optional
+
+
+# Orientaciones en sentido horario: girar a la derecha es sumar 1 (mod 4)
+NORTH, EAST, SOUTH, WEST = range(4)
+DIRECTIONS = ('NORTH', 'EAST', 'SOUTH', 'WEST')
+DIRECTION_INDEX = {name: index for index, name in enumerate(DIRECTIONS)}
+LEFT_OF = (3, 0, 1, 2)
+RIGHT_OF = (1, 2, 3, 0)
+# (dx, dy) de un paso hacia delante: NORTH avanza en x, EAST en y
+DELTAS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+class StateSpace:
+    """
+    Núcleo de simulación con el estado del robot empaquetado en un entero
+
+        estado = ((x - 1) * height + (y - 1)) * 4 + dirección
+
+    Para un tablero concreto se precalculan tablas planas (array 'I') con el
+    estado siguiente de cada comando, así que un paso es una única consulta:
+
+        estado = space.forward[estado]
+
+    `forward` ya incluye el wrap around de los bordes y las paredes: si la
+    celda siguiente es una pared el estado no cambia y `blocked[estado]` es 1.
+    `left` y `right` son las rotaciones.
+
+    Las tablas ocupan 13 bytes por estado (52 por celda), por eso solo se
+    construyen para tableros de hasta MAX_CELLS celdas. Board.state_space()
+    las mantiene al día cuando se añaden paredes.
+    """
+
+    MAX_CELLS = 1_000_000
+    MOVE = 'MOVE'
+    LEFT = 'LEFT'
+    RIGHT = 'RIGHT'
+
+    def __init__(self, width: int, height: int, walls=()):
+        cells = width * height
+        if cells > self.MAX_CELLS:
+            raise ValueError(
+                f"Tablero de {cells} celdas demasiado grande para las tablas (máximo {self.MAX_CELLS})"
+            )
+        self.width = width
+        self.height = height
+        self.size = cells * 4
+        self.left = self._rotation_table(LEFT_OF)
+        self.right = self._rotation_table(RIGHT_OF)
+        self.forward = self._forward_table()
+        self.blocked = bytearray(self.size)
+        self.wall_count = 0
+        for wall in walls:
+            self.add_wall(wall.x, wall.y)
+
+    @classmethod
+    def fits(cls, width: int, height: int) -> bool:
+        """Indica si se pueden construir las tablas para un tablero width x height"""
+        return width * height <= cls.MAX_CELLS
+
+    def nbytes(self) -> int:
+        """Memoria ocupada por las tablas"""
+        tables = (self.left, self.right, self.forward)
+        return sum(table.itemsize * len(table) for table in tables) + len(self.blocked)
+
+    # ==================== Codificación ====================
+
+    def encode(self, x: int, y: int, facing: str) -> int:
+        """Empaqueta (x, y, facing) en un estado"""
+        return ((x - 1) * self.height + (y - 1)) * 4 + DIRECTION_INDEX[facing]
+
+    def decode(self, state: int) -> tuple[int, int, str]:
+        """Desempaqueta un estado en (x, y, facing)"""
+        cell, direction = divmod(state, 4)
+        x, y = divmod(cell, self.height)
+        return x + 1, y + 1, DIRECTIONS[direction]
+
+    def table(self, command: str) -> array:
+        """Tabla de transición del comando (MOVE, LEFT o RIGHT)"""
+        if command == self.MOVE:
+            return self.forward
+        if command == self.LEFT:
+            return self.left
+        if command == self.RIGHT:
+            return self.right
+        raise ValueError(f"Comando '{command}' sin tabla de transición")
+
+    # ==================== Construcción de las tablas ====================
+
+    def _rotation_table(self, turn: tuple) -> array:
+        table = array('I', [0]) * self.size
+        for direction in range(4):
+            # Los estados de dirección d son d, d+4, d+8...: solo cambia el resto
+            table[direction::4] = array('I', range(turn[direction], self.size, 4))
+        return table
+
+    def _forward_table(self) -> array:
+        """Estado tras un paso hacia delante sin paredes (con wrap around)"""
+        width, height = self.width, self.height
+        cells = width * height
+        table = array('I', [0]) * self.size
+
+        for direction in range(4):
+            # Celda destino de cada celda, en orden de celda, como rangos de
+            # estados (destino * 4 + dirección) para no recorrerlas en Python
+            d = direction
+            if direction == NORTH:
+                # x + 1: la celda + height; la última fila x vuelve a x = 1
+                targets = chain(range((height * 4) + d, cells * 4, 4), range(d, height * 4, 4))
+            elif direction == SOUTH:
+                # x - 1: la primera fila x vuelve a x = width
+                targets = chain(
+                    range((cells - height) * 4 + d, cells * 4, 4),
+                    range(d, (cells - height) * 4, 4)
+                )
+            elif direction == EAST:
+                # y + 1 dentro del bloque de cada x; y = height vuelve a y = 1
+                targets = chain.from_iterable(
+                    chain(range((base + 1) * 4 + d, (base + height) * 4, 4), (base * 4 + d,))
+                    for base in range(0, cells, height)
+                )
+            else:
+                # y - 1; y = 1 vuelve a y = height
+                targets = chain.from_iterable(
+                    chain(((base + height - 1) * 4 + d,), range(base * 4 + d, (base + height - 1) * 4, 4))
+                    for base in range(0, cells, height)
+                )
+            table[direction::4] = array('I', targets)
+        return table
+
+    # ==================== Paredes ====================
+
+    def _wrap(self, x: int, y: int) -> tuple[int, int]:
+        """Wrap around de una posición que ha salido un paso del tablero (como Board.wrap_position)"""
+        if x < 1:
+            x = self.width
+        elif x > self.width:
+            x = 1
+        if y < 1:
+            y = self.height
+        elif y > self.height:
+            y = 1
+        return x, y
+
+    def add_wall(self, x: int, y: int) -> None:
+        """Bloquea los cuatro pasos que entran en (x, y)"""
+        height = self.height
+        for direction in range(4):
+            dx, dy = DELTAS[direction]
+            # Celda desde la que un paso en esta dirección llega a (x, y)
+            source_x, source_y = self._wrap(x - dx, y - dy)
+            state = ((source_x - 1) * height + (source_y - 1)) * 4 + direction
+            self.forward[state] = state
+            self.blocked[state] = 1
+        self.wall_count += 1
+
+    def blocked_target(self, state: int) -> Optional[tuple[int, int]]:
+        """Celda con pared contra la que choca un paso desde `state` (None si no choca)"""
+        if not self.blocked[state]:
+            return None
+        x, y, facing = self.decode(state)
+        dx, dy = DELTAS[DIRECTION_INDEX[facing]]
+        return self._wrap(x + dx, y + dy)
@@ -0,0 +1,281 @@
+import re
+from typing import Iterable, Iterator, Optional
+import numpy as np
+from models.Wall import Wall
+
+
+_NON_ZERO_BYTE = re.compile(rb'[^\x00]')
+
+# Bits a 1 de cada valor de byte (0..255)
+_BYTE_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+
+def _popcount(data) -> int:
+    """Cuenta los bits a 1 de un bloque de bytes"""
+    return int(_BYTE_POPCOUNT[np.frombuffer(data, dtype=np.uint8)].sum(dtype=np.int64))
+
+
+class WallBitmap:
+    """
+    Almacenamiento denso de paredes como un mapa de bits empaquetado
+
+    Cada celda ocupa un bit (W·H/8 bytes en total). La celda (x, y) está en
+    el bit (x - 1) * height + (y - 1), de modo que las celdas de una misma x
+    son contiguas y las operaciones por regiones trabajan con rodajas de bytes.
+    Ofrece la misma interfaz que WallList (has, append, iteración, len),
+    pero itera las paredes en orden de celda, no de inserción.
+
+    El mapa puede vivir en un buffer externo escribible (por ejemplo un mmap
+    de un fichero o memoria compartida), que se usa directamente sin copiarlo.
+    Con copy_on_write el buffer puede ser de solo lectura: solo se lee, y la
+    primera modificación lo copia a memoria propia.
+
+    Las copias (deepcopy) comparten el mapa de bits hasta que una de ellas
+    lo modifica (copy-on-write), así que copiar un tablero es O(1).
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        walls: Iterable[Wall] = (),
+        buffer=None,
+        count: Optional[int] = None,
+        copy_on_write: bool = False
+    ):
+        self.width = width
+        self.height = height
+        size = self.size_for(width, height)
+        if buffer is None:
+            self._bits = bytearray(size)
+            self._count = 0
+        else:
+            if len(buffer) != size:
+                raise ValueError(f"El buffer debe tener {size} bytes y tiene {len(buffer)}")
+            self._bits = buffer
+            self._count = _popcount(buffer) if count is None else count
+        # True si el mapa de bits se comparte con otra copia (o es un buffer
+        # de solo lectura): se copia antes de la primera modificación
+        self._shared = copy_on_write
+        self.extend(walls)
+
+    def __deepcopy__(self, memo) -> 'WallBitmap':
+        if not isinstance(self._bits, bytearray):
+            # Un buffer externo (mmap, memoria compartida) puede cerrarse
+            # mientras la copia sigue viva: se copia en el momento
+            return WallBitmap(self.width, self.height, buffer=bytearray(self._bits), count=self._count)
+        copied = WallBitmap(self.width, self.height, buffer=self._bits, count=self._count)
+        self._shared = copied._shared = True
+        return copied
+
+    def _own(self) -> bytearray:
+        """Devuelve el mapa de bits para modificarlo, copiándolo si se comparte"""
+        if self._shared:
+            self._bits = bytearray(self._bits)
+            self._shared = False
+        return self._bits
+
+    @staticmethod
+    def size_for(width: int, height: int) -> int:
+        """Bytes que ocupa el mapa de bits de un tablero width x height"""
+        return (width * height + 7) // 8
+
+    # ==================== Direccionamiento ====================
+
+    def _bit_index(self, x, y) -> int:
+        if not (1 <= x <= self.width and 1 <= y <= self.height):
+            raise ValueError(
+                f"Posición ({x}, {y}) fuera del tablero (1-{self.width}, 1-{self.height})"
+            )
+        return (x - 1) * self.height + (y - 1)
+
+    def _coordinates(self, bit_index: int) -> tuple[int, int]:
+        x, y = divmod(bit_index, self.height)
+        return x + 1, y + 1
+
+    # ==================== Consultas ====================
+
+    def has(self, x, y) -> bool:
+        """Comprueba en O(1) si hay una pared en (x, y)"""
+        if not (1 <= x <= self.width and 1 <= y <= self.height):
+            return False
+        index = (x - 1) * self.height + (y - 1)
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, Wall):
+            item = (item.x, item.y)
+        return self.has(*item)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def count(self) -> int:
+        """Número de paredes del tablero"""
+        return self._count
+
+    def __iter__(self) -> Iterator[Wall]:
+        bits = self._bits
+        # La búsqueda de bytes no nulos se hace en C, así que las zonas vacías
+        # del mapa se saltan sin recorrerlas byte a byte en Python
+        for match in _NON_ZERO_BYTE.finditer(bits):
+            byte_index = match.start()
+            byte = bits[byte_index]
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield Wall(*self._coordinates(byte_index * 8 + bit))
+
+    def walls_in_region(self, x1, y1, x2, y2) -> Iterator[Wall]:
+        """Itera las paredes del rectángulo [x1..x2] x [y1..y2]"""
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        # Recortar después de ordenar: una región fuera del tablero queda vacía
+        x1, x2 = max(x1, 1), min(x2, self.width)
+        y1, y2 = max(y1, 1), min(y2, self.height)
+        if x1 > x2 or y1 > y2:
+            return
+        bits = self._bits
+        for x in range(x1, x2 + 1):
+            start = self._bit_index(x, y1)
+            end = self._bit_index(x, y2) + 1
+            first_byte = start >> 3
+            for match in _NON_ZERO_BYTE.finditer(bits, first_byte, ((end - 1) >> 3) + 1):
+                byte_index = match.start()
+                byte = bits[byte_index]
+                for bit in range(8):
+                    index = byte_index * 8 + bit
+                    if byte & (1 << bit) and start <= index < end:
+                        yield Wall(*self._coordinates(index))
+
+    def nbytes(self) -> int:
+        """Memoria ocupada por el mapa de bits"""
+        return len(self._bits)
+
+    def buffer(self) -> memoryview:
+        """Vista de solo lectura del mapa de bits (sin copiarlo)"""
+        return memoryview(self._bits).toreadonly()
+
+    # ==================== Modificación ====================
+
+    def add(self, x, y) -> bool:
+        """Marca una pared en (x, y). Devuelve False si ya existía"""
+        index = self._bit_index(x, y)
+        mask = 1 << (index & 7)
+        if self._bits[index >> 3] & mask:
+            return False
+        self._own()[index >> 3] |= mask
+        self._count += 1
+        return True
+
+    def discard(self, x, y) -> bool:
+        """Quita la pared de (x, y). Devuelve False si no existía"""
+        index = self._bit_index(x, y)
+        mask = 1 << (index & 7)
+        if not self._bits[index >> 3] & mask:
+            return False
+        self._own()[index >> 3] &= ~mask & 0xFF
+        self._count -= 1
+        return True
+
+    def append(self, wall: Wall) -> None:
+        self.add(wall.x, wall.y)
+
+    def extend(self, walls: Iterable[Wall]) -> None:
+        for wall in walls:
+            self.add(wall.x, wall.y)
+
+    def set_many(self, coordinates: Iterable[tuple[int, int]]) -> int:
+        """
+        Marca muchas paredes de una vez. Devuelve cuántas eran nuevas
+
+        Acepta pares (x, y) o directamente un array N x 2 de coordenadas.
+        """
+        if not isinstance(coordinates, np.ndarray):
+            coordinates = list(coordinates)
+        points = np.array(coordinates, dtype=np.int64).reshape(-1, 2)
+        if not len(points):
+            return 0
+        xs, ys = points[:, 0], points[:, 1]
+        outside = (xs < 1) | (xs > self.width) | (ys < 1) | (ys > self.height)
+        if outside.any():
+            x, y = points[np.argmax(outside)]
+            raise ValueError(
+                f"Posición ({x}, {y}) fuera del tablero (1-{self.width}, 1-{self.height})"
+            )
+
+        # Ordenar y quitar repetidos es más rápido que np.unique (por hash)
+        indices = np.sort((xs - 1) * self.height + (ys - 1))
+        indices = indices[np.concatenate(([True], indices[1:] != indices[:-1]))]
+        byte_indices = indices >> 3
+        masks = (1 << (indices & 7)).astype(np.uint8)
+        bits = np.frombuffer(self._bits, dtype=np.uint8)
+        new = (bits[byte_indices] & masks) == 0
+        if not new.any():
+            return 0
+        bits = np.frombuffer(self._own(), dtype=np.uint8)
+        # bitwise_or.at acumula varios bits que caen en el mismo byte
+        np.bitwise_or.at(bits, byte_indices[new], masks[new])
+        added = int(new.sum())
+        self._count += added
+        return added
+
+    def set_region(self, x1, y1, x2, y2) -> int:
+        """Marca como pared el rectángulo [x1..x2] x [y1..y2]. Devuelve las nuevas"""
+        return self._fill_region(x1, y1, x2, y2, True)
+
+    def clear_region(self, x1, y1, x2, y2) -> int:
+        """Quita las paredes del rectángulo [x1..x2] x [y1..y2]. Devuelve las quitadas"""
+        return -self._fill_region(x1, y1, x2, y2, False)
+
+    def clear(self) -> None:
+        if self._shared:
+            self._bits = bytearray(len(self._bits))
+            self._shared = False
+        else:
+            self._bits[:] = bytes(len(self._bits))
+        self._count = 0
+
+    def _fill_region(self, x1, y1, x2, y2, value: bool) -> int:
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        self._bit_index(x1, y1)
+        self._bit_index(x2, y2)
+
+        if y1 == 1 and y2 == self.height:
+            # Las columnas completas son contiguas: un único rango de bits
+            spans = [(self._bit_index(x1, 1), self._bit_index(x2, self.height) + 1)]
+        else:
+            spans = [
+                (self._bit_index(x, y1), self._bit_index(x, y2) + 1)
+                for x in range(x1, x2 + 1)
+            ]
+
+        delta = 0
+        for start, end in spans:
+            delta += self._fill_bits(start, end, value)
+        self._count += delta
+        return delta
+
+    def _fill_bits(self, start: int, end: int, value: bool) -> int:
+        """Pone a value los bits [start, end) y devuelve la variación de paredes"""
+        bits = self._own()
+        first_byte, last_byte = start >> 3, (end - 1) >> 3
+        before = _popcount(bits[first_byte:last_byte + 1])
+
+        head_mask = (0xFF << (start & 7)) & 0xFF
+        tail_mask = 0xFF >> (7 - ((end - 1) & 7))
+        if first_byte == last_byte:
+            masks = {first_byte: head_mask & tail_mask}
+        else:
+            masks = {first_byte: head_mask, last_byte: tail_mask}
+            middle = last_byte - first_byte - 1
+            if middle:
+                bits[first_byte + 1:last_byte] = (b'\xff' if value else b'\x00') * middle
+
+        for byte_index, mask in masks.items():
+            if value:
+                bits[byte_index] |= mask
+            else:
+                bits[byte_index] &= ~mask & 0xFF
+
+        return _popcount(bits[first_byte:last_byte + 1]) - before
@@ -0,0 +1,193 @@
+from typing import Iterable, Iterator
+from models.Wall import Wall
+from models.WallBitmap import _NON_ZERO_BYTE
+
+
+class WallChunks:
+    """
+    Almacenamiento disperso de paredes por bloques (tiles)
+
+    El tablero se divide en bloques de CHUNK_SIZE x CHUNK_SIZE celdas y solo
+    se reserva el mapa de bits de los bloques que contienen alguna pared, así
+    que la memoria crece con el número de paredes y no con el área. Ofrece la
+    misma interfaz que WallList y WallBitmap.
+
+    Las copias (deepcopy) comparten los mapas de bits de los bloques y cada
+    una copia un bloque la primera vez que lo modifica (copy-on-write).
+    """
+
+    CHUNK_SIZE = 64
+    CHUNK_BYTES = CHUNK_SIZE * CHUNK_SIZE // 8
+
+    def __init__(self, width: int, height: int, walls: Iterable[Wall] = ()):
+        self.width = width
+        self.height = height
+        # {(cx, cy): [mapa de bits del bloque, número de paredes]}
+        self._chunks: dict[tuple[int, int], list] = {}
+        self._count = 0
+        # Bloques cuyo mapa de bits no se comparte con ninguna copia
+        self._owned: set[tuple[int, int]] = set()
+        self.extend(walls)
+
+    def __deepcopy__(self, memo) -> 'WallChunks':
+        copied = WallChunks(self.width, self.height)
+        copied._chunks = {key: [bits, count] for key, (bits, count) in self._chunks.items()}
+        copied._count = self._count
+        # A partir de aquí ninguna de las dos es dueña de los bloques
+        self._owned = set()
+        return copied
+
+    # ==================== Direccionamiento ====================
+
+    def _locate(self, x, y) -> tuple[tuple[int, int], int]:
+        """Devuelve el bloque y el bit dentro del bloque de la celda (x, y)"""
+        size = self.CHUNK_SIZE
+        cx, lx = divmod(x - 1, size)
+        cy, ly = divmod(y - 1, size)
+        return (cx, cy), lx * size + ly
+
+    def _check_inside(self, x, y) -> None:
+        if not (1 <= x <= self.width and 1 <= y <= self.height):
+            raise ValueError(
+                f"Posición ({x}, {y}) fuera del tablero (1-{self.width}, 1-{self.height})"
+            )
+
+    # ==================== Consultas ====================
+
+    def has(self, x, y) -> bool:
+        """Comprueba en O(1) si hay una pared en (x, y)"""
+        if not (1 <= x <= self.width and 1 <= y <= self.height):
+            return False
+        key, bit = self._locate(x, y)
+        chunk = self._chunks.get(key)
+        return chunk is not None and bool(chunk[0][bit >> 3] & (1 << (bit & 7)))
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, Wall):
+            item = (item.x, item.y)
+        return self.has(*item)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def count(self) -> int:
+        """Número de paredes del tablero"""
+        return self._count
+
+    def chunk_count(self) -> int:
+        """Número de bloques reservados"""
+        return len(self._chunks)
+
+    def nbytes(self) -> int:
+        """Memoria ocupada por los mapas de bits de los bloques"""
+        return len(self._chunks) * self.CHUNK_BYTES
+
+    def __iter__(self) -> Iterator[Wall]:
+        for key in list(self._chunks):
+            yield from self._iter_chunk(key)
+
+    def walls_in_region(self, x1, y1, x2, y2) -> Iterator[Wall]:
+        """
+        Itera las paredes del rectángulo [x1..x2] x [y1..y2]
+
+        Solo se visitan los bloques reservados que se solapan con la región.
+        """
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        # Recortar después de ordenar: una región fuera del tablero queda vacía
+        x1, x2 = max(x1, 1), min(x2, self.width)
+        y1, y2 = max(y1, 1), min(y2, self.height)
+        if x1 > x2 or y1 > y2:
+            return
+        (cx1, cy1), _ = self._locate(x1, y1)
+        (cx2, cy2), _ = self._locate(x2, y2)
+
+        region_chunks = (cx2 - cx1 + 1) * (cy2 - cy1 + 1)
+        if region_chunks <= len(self._chunks):
+            keys = [
+                (cx, cy)
+                for cx in range(cx1, cx2 + 1)
+                for cy in range(cy1, cy2 + 1)
+                if (cx, cy) in self._chunks
+            ]
+        else:
+            keys = [
+                (cx, cy) for cx, cy in self._chunks
+                if cx1 <= cx <= cx2 and cy1 <= cy <= cy2
+            ]
+
+        for key in keys:
+            for wall in self._iter_chunk(key):
+                if x1 <= wall.x <= x2 and y1 <= wall.y <= y2:
+                    yield wall
+
+    def _iter_chunk(self, key: tuple[int, int]) -> Iterator[Wall]:
+        bits = self._chunks[key][0]
+        size = self.CHUNK_SIZE
+        base_x, base_y = key[0] * size + 1, key[1] * size + 1
+        for match in _NON_ZERO_BYTE.finditer(bits):
+            byte_index = match.start()
+            byte = bits[byte_index]
+            for bit in range(8):
+                if byte & (1 << bit):
+                    lx, ly = divmod(byte_index * 8 + bit, size)
+                    yield Wall(base_x + lx, base_y + ly)
+
+    # ==================== Modificación ====================
+
+    def add(self, x, y) -> bool:
+        """Marca una pared en (x, y). Devuelve False si ya existía"""
+        self._check_inside(x, y)
+        key, bit = self._locate(x, y)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._chunks[key] = [bytearray(self.CHUNK_BYTES), 0]
+            self._owned.add(key)
+
+        mask = 1 << (bit & 7)
+        if chunk[0][bit >> 3] & mask:
+            return False
+        self._own(key, chunk)[bit >> 3] |= mask
+        chunk[1] += 1
+        self._count += 1
+        return True
+
+    def discard(self, x, y) -> bool:
+        """Quita la pared de (x, y) y libera el bloque si queda vacío"""
+        self._check_inside(x, y)
+        key, bit = self._locate(x, y)
+        chunk = self._chunks.get(key)
+        mask = 1 << (bit & 7)
+        if chunk is None or not chunk[0][bit >> 3] & mask:
+            return False
+
+        self._own(key, chunk)[bit >> 3] &= ~mask & 0xFF
+        chunk[1] -= 1
+        self._count -= 1
+        if chunk[1] == 0:
+            del self._chunks[key]
+            self._owned.discard(key)
+        return True
+
+    def _own(self, key: tuple[int, int], chunk: list) -> bytearray:
+        """Devuelve el mapa de bits del bloque para modificarlo, copiándolo si se comparte"""
+        if key not in self._owned:
+            chunk[0] = bytearray(chunk[0])
+            self._owned.add(key)
+        return chunk[0]
+
+    def append(self, wall: Wall) -> None:
+        self.add(wall.x, wall.y)
+
+    def extend(self, walls: Iterable[Wall]) -> None:
+        for wall in walls:
+            self.add(wall.x, wall.y)
+
+    def set_many(self, coordinates: Iterable[tuple[int, int]]) -> int:
+        """Marca muchas paredes de una vez. Devuelve cuántas eran nuevas"""
+        return sum(1 for x, y in coordinates if self.add(x, y))
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._owned.clear()
+        self._count = 0
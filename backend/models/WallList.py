@@ -0,0 +1,115 @@
+from models.Wall import Wall
+
+
+class WallList(list):
+    """
+    Lista de paredes con un índice por coordenada
+
+    Se comporta como una lista normal (mismo orden de inserción), pero
+    mantiene un diccionario {(x, y): ocurrencias} sincronizado con cada
+    modificación, de forma que comprobar si hay una pared es O(1).
+    """
+
+    def __init__(self, walls=()):
+        super().__init__()
+        self._index: dict[tuple[int, int], int] = {}
+        self.extend(walls)
+
+    def __reduce__(self):
+        # pickle/deepcopy reconstruyen las listas con append antes de
+        # restaurar __dict__; se reconstruye desde __init__ para que el
+        # índice exista antes de añadir paredes
+        return (type(self), (list(self),))
+
+    def __deepcopy__(self, memo) -> 'WallList':
+        # Las paredes no se modifican nunca: la copia las comparte y copia
+        # la lista y el índice sin volver a indexar pared a pared
+        copied = type(self)()
+        list.extend(copied, self)
+        copied._index = dict(self._index)
+        return copied
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, Wall):
+            item = (item.x, item.y)
+        if isinstance(item, tuple):
+            return item in self._index
+        return super().__contains__(item)
+
+    def has(self, x, y) -> bool:
+        """Comprueba en O(1) si hay una pared en (x, y)"""
+        return (x, y) in self._index
+
+    def walls_in_region(self, x1, y1, x2, y2):
+        """Itera las paredes del rectángulo [x1..x2] x [y1..y2]"""
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        return (wall for wall in self if x1 <= wall.x <= x2 and y1 <= wall.y <= y2)
+
+    # ==================== Mantenimiento del índice ====================
+
+    def _track(self, wall: Wall) -> None:
+        key = (wall.x, wall.y)
+        self._index[key] = self._index.get(key, 0) + 1
+
+    def _untrack(self, wall: Wall) -> None:
+        key = (wall.x, wall.y)
+        count = self._index.get(key, 0) - 1
+        if count > 0:
+            self._index[key] = count
+        else:
+            self._index.pop(key, None)
+
+    # ==================== Métodos de list que modifican ====================
+
+    def append(self, wall: Wall) -> None:
+        super().append(wall)
+        self._track(wall)
+
+    def insert(self, index, wall: Wall) -> None:
+        super().insert(index, wall)
+        self._track(wall)
+
+    def extend(self, walls) -> None:
+        for wall in walls:
+            self.append(wall)
+
+    def __iadd__(self, walls):
+        self.extend(walls)
+        return self
+
+    def __imul__(self, times):
+        super().__imul__(times)
+        self._index.clear()
+        for wall in self:
+            self._track(wall)
+        return self
+
+    def remove(self, wall: Wall) -> None:
+        super().remove(wall)
+        self._untrack(wall)
+
+    def pop(self, index=-1) -> Wall:
+        wall = super().pop(index)
+        self._untrack(wall)
+        return wall
+
+    def clear(self) -> None:
+        super().clear()
+        self._index.clear()
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+        old = self[index]
+        super().__setitem__(index, value)
+        for wall in (old if isinstance(index, slice) else [old]):
+            self._untrack(wall)
+        for wall in (value if isinstance(index, slice) else [value]):
+            self._track(wall)
+
+    def __delitem__(self, index) -> None:
+        old = self[index]
+        super().__delitem__(index)
+        for wall in (old if isinstance(index, slice) else [old]):
+            self._untrack(wall)
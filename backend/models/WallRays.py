@@ -0,0 +1,55 @@
+from bisect import bisect_right, insort
+from typing import Iterable, Optional
+from models.Wall import Wall
+from models.StateSpace import NORTH, EAST, SOUTH
+
+
+class WallRays:
+    """
+    Índice de paredes por fila y por columna para movimientos largos
+
+    `by_y[y]` tiene ordenadas las x con pared en esa y (los movimientos NORTH
+    y SOUTH cambian x), y `by_x[x]` las y con pared en esa x (EAST y WEST
+    cambian y). La distancia a la siguiente pared en cualquier dirección,
+    con wrap around, es una búsqueda binaria: O(log paredes de la línea).
+    """
+
+    def __init__(self, width: int, height: int, walls: Iterable[Wall] = ()):
+        self.width = width
+        self.height = height
+        self.by_x: dict[int, list[int]] = {}
+        self.by_y: dict[int, list[int]] = {}
+        self.count = 0
+        for wall in walls:
+            self.add(wall.x, wall.y)
+
+    def add(self, x: int, y: int) -> None:
+        """Añade una pared al índice"""
+        insort(self.by_x.setdefault(x, []), y)
+        insort(self.by_y.setdefault(y, []), x)
+        self.count += 1
+
+    def distance_to_wall(self, x: int, y: int, direction: int) -> Optional[int]:
+        """
+        Pasos desde (x, y) hasta la primera pared en `direction` (índice de
+        StateSpace), dando la vuelta por los bordes. None si no hay ninguna
+        pared en la línea.
+        """
+        if direction in (NORTH, SOUTH):
+            line, position, size = self.by_y.get(y), x, self.width
+        else:
+            line, position, size = self.by_x.get(x), y, self.height
+        if not line:
+            return None
+
+        if direction in (NORTH, EAST):
+            # Primera pared por encima de la posición; si no hay, la menor tras dar la vuelta
+            index = bisect_right(line, position)
+            target = line[index] if index < len(line) else line[0] + size
+            distance = target - position
+        else:
+            # Primera pared por debajo; si no hay, la mayor tras dar la vuelta
+            index = bisect_right(line, position - 1) - 1
+            target = line[index] if index >= 0 else line[-1] - size
+            distance = position - target
+        return distance
@@ -0,0 +1,174 @@
+import os
+import stat
+import tempfile
+import threading
+import time
+from typing import Optional, Union
+
+
+class AtomicFileWriter:
+    """
+    Escritura atómica de ficheros (fichero temporal + rename)
+
+    El fichero destino nunca queda a medio escribir: o tiene el contenido
+    anterior o el nuevo. La durabilidad frente a cortes de luz es configurable:
+
+      - 'none':  sin fsync. Atómico frente a caídas del proceso.
+      - 'write': fsync del fichero y del directorio en cada escritura.
+      - 'group': commit en grupo. Cada escritura hace fsync de su temporal y
+                 lo renombra en el momento (el fichero nunca apunta a datos
+                 sin sincronizar), pero el fsync del directorio que hace
+                 durable el rename se comparte: los directorios de las
+                 escrituras concurrentes dentro de `group_window` segundos se
+                 sincronizan una sola vez y todas las llamadas vuelven cuando
+                 el grupo es durable.
+
+    write() hace las dos cosas. Quien escribe bajo un bloqueo puede usar
+    write_visible() dentro del bloqueo y wait_durable() fuera, para no
+    retener el bloqueo durante la ventana del grupo.
+    """
+
+    DURABILITY_NONE = 'none'
+    DURABILITY_WRITE = 'write'
+    DURABILITY_GROUP = 'group'
+    VALID_DURABILITIES = [DURABILITY_NONE, DURABILITY_WRITE, DURABILITY_GROUP]
+
+    def __init__(self, durability: str = DURABILITY_NONE, group_window: float = 0.005):
+        if durability not in self.VALID_DURABILITIES:
+            raise ValueError(
+                f"Durabilidad '{durability}' no válida. Debe ser: {', '.join(self.VALID_DURABILITIES)}"
+            )
+        self.durability = durability
+        self.group_window = group_window
+
+        self._cond = threading.Condition()
+        # Directorios con renames pendientes de hacer durables
+        self._pending: set[str] = set()
+        self._batch = 0
+        self._committed = -1
+        self._leader_active = False
+        self._failures: dict[int, BaseException] = {}
+        self.commit_count = 0
+
+    def write(self, path: str, data: Union[str, bytes]) -> None:
+        """Reemplaza atómicamente el contenido de path"""
+        self.wait_durable(self.write_visible(path, data))
+
+    def write_visible(self, path: str, data: Union[str, bytes]) -> Optional[int]:
+        """
+        Reemplaza atómicamente path sin esperar al commit en grupo
+
+        Returns:
+            El grupo que hará durable la escritura (para wait_durable), o None
+            si ya lo es según la durabilidad configurada
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        if self.durability != self.DURABILITY_GROUP:
+            self._commit({path: data}, fsync=self.durability == self.DURABILITY_WRITE)
+            return None
+
+        directory = self._replace(path, data, fsync=True)
+        with self._cond:
+            self._pending.add(directory)
+            return self._batch
+
+    def wait_durable(self, batch: Optional[int]) -> None:
+        """Espera a que el grupo devuelto por write_visible sea durable"""
+        if batch is None:
+            return
+
+        with self._cond:
+            while self._committed < batch:
+                if not self._leader_active:
+                    # Nadie está recogiendo este grupo: esta llamada lo sincroniza
+                    self._leader_active = True
+                    break
+                self._cond.wait()
+            else:
+                self._raise_if_failed(batch)
+                return
+
+        # Se espera un poco para que otras escrituras se unan al grupo
+        time.sleep(self.group_window)
+        with self._cond:
+            pending, self._pending = self._pending, set()
+            batch = self._batch
+            self._batch += 1
+
+        error = None
+        try:
+            self._sync(pending)
+        except BaseException as e:
+            error = e
+
+        with self._cond:
+            self._committed = batch
+            if error is not None:
+                self._failures[batch] = error
+            # Solo se guardan los fallos recientes para los que aún esperan
+            for old in [b for b in self._failures if b < batch - 1000]:
+                del self._failures[old]
+            self._leader_active = False
+            self._cond.notify_all()
+
+        if error is not None:
+            raise error
+
+    # ==================== Commit en grupo ====================
+
+    def _raise_if_failed(self, batch: int) -> None:
+        error = self._failures.get(batch)
+        if error is not None:
+            raise error
+
+    # ==================== Escritura en disco ====================
+
+    def _commit(self, files: dict[str, bytes], fsync: bool) -> None:
+        """Escribe cada fichero en un temporal, lo renombra y sincroniza los directorios"""
+        directories = {self._replace(path, data, fsync) for path, data in files.items()}
+
+        if fsync:
+            for directory in directories:
+                self._fsync_directory(directory)
+        self.commit_count += 1
+
+    def _replace(self, path: str, data: bytes, fsync: bool) -> str:
+        """Escribe data en un temporal y lo renombra a path. Devuelve el directorio"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.' + os.path.basename(path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if os.path.exists(path):
+                    # mkstemp crea el fichero con permisos 0600: se conservan los del original
+                    os.fchmod(f.fileno(), stat.S_IMODE(os.stat(path).st_mode))
+                f.write(data)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return directory
+
+    def _sync(self, directories: set[str]) -> None:
+        """Sincroniza los directorios de los renames del grupo"""
+        for directory in directories:
+            self._fsync_directory(directory)
+        self.commit_count += 1
+
+    def _fsync_directory(self, directory: str) -> None:
+        """Hace durable el rename (no disponible en todos los sistemas)"""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
@@ -0,0 +1,176 @@
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from typing import Optional
+from models.Board import Board
+from models.Wall import Wall
+from models.WallBitmap import WallBitmap
+from repositories.IRepository import IRepository
+from repositories.AtomicFileWriter import AtomicFileWriter
+from repositories.BoardRepository import BoardRepository
+
+
+class BinaryBoardRepository(IRepository[Board]):
+    """
+    Repositorio del tablero en formato binario compacto
+
+    Cabecera fija de HEADER_SIZE bytes (little endian):
+
+        magic  4s   b'TRBD'
+        version  H  FORMAT_VERSION
+        layout   H  LAYOUT_BITMAP o LAYOUT_COORDINATES
+        width    I
+        height   I
+        walls    Q  número de paredes
+
+    seguida de las paredes:
+      - LAYOUT_BITMAP: el mapa de bits de WallBitmap (W·H/8 bytes). Se usa en
+        tableros densos y se carga con mmap sin copiarlo: has_wall_at lee
+        directamente las páginas del fichero, así que abrir un tablero de 100M
+        celdas es casi instantáneo.
+      - LAYOUT_COORDINATES: pares (x, y) uint32 en orden de inserción, para
+        tableros en lista o dispersos.
+
+    El fichero se mapea en solo lectura una vez por versión (inodo, tamaño y
+    fecha de modificación) y todos los tableros cargados de esa versión
+    comparten el mapeo. Cada tablero copia su mapa de bits la primera vez que
+    se modifica, así que añadir paredes en memoria no toca el fichero ni los
+    demás tableros hasta que se guarda (escritura atómica de un fichero nuevo).
+    Cuando el fichero cambia se cierra el mapeo anterior.
+    """
+
+    MAGIC = b'TRBD'
+    FORMAT_VERSION = 1
+    LAYOUT_BITMAP = 0
+    LAYOUT_COORDINATES = 1
+    HEADER = struct.Struct('<4sHHIIQ')
+    HEADER_SIZE = HEADER.size
+
+    def __init__(self, db_path: str = "data/board.bin", writer: Optional[AtomicFileWriter] = None):
+        self.db_path = db_path
+        self._writer = writer or AtomicFileWriter()
+        self._lock = threading.Lock()
+        # (firma del fichero, mmap) del último tablero cargado con mapa de bits
+        self._mapping: Optional[tuple[tuple[int, int, int], mmap.mmap]] = None
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def save(self, board: Board) -> None:
+        # El fichero completo ya incluye las paredes nuevas
+        board.pop_new_walls()
+
+        if board.storage == Board.STORAGE_DENSE:
+            layout = self.LAYOUT_BITMAP
+            payload = board.walls.buffer()
+        else:
+            layout = self.LAYOUT_COORDINATES
+            coordinates = array('I')
+            for wall in board.walls:
+                coordinates.append(wall.x)
+                coordinates.append(wall.y)
+            payload = coordinates.tobytes() if sys.byteorder == 'little' else self._to_little(coordinates)
+
+        header = self.HEADER.pack(
+            self.MAGIC, self.FORMAT_VERSION, layout, board.width, board.height, len(board.walls)
+        )
+        self._writer.write(self.db_path, b''.join((header, payload)))
+
+    def load(self) -> Optional[Board]:
+        if not os.path.exists(self.db_path):
+            return None
+
+        with open(self.db_path, 'rb') as f:
+            magic, version, layout, width, height, wall_count = self.HEADER.unpack(
+                f.read(self.HEADER_SIZE)
+            )
+            if magic != self.MAGIC or version != self.FORMAT_VERSION:
+                raise ValueError(f"{self.db_path} no es un tablero binario válido (versión {version})")
+
+            if layout == self.LAYOUT_BITMAP:
+                mapped = self._map(f)
+                size = WallBitmap.size_for(width, height)
+                buffer = memoryview(mapped)[self.HEADER_SIZE:self.HEADER_SIZE + size]
+                walls = WallBitmap(width, height, buffer=buffer, count=wall_count, copy_on_write=True)
+                return Board(width, height, storage=Board.STORAGE_DENSE, walls=walls)
+
+            coordinates = array('I')
+            coordinates.frombytes(f.read(wall_count * 2 * coordinates.itemsize))
+            if sys.byteorder != 'little':
+                coordinates.byteswap()
+
+        board = Board(width, height, expected_walls=wall_count)
+        for i in range(0, len(coordinates), 2):
+            board.walls.append(Wall(coordinates[i], coordinates[i + 1]))
+        return board
+
+    def delete(self) -> None:
+        """Elimina el tablero persistido"""
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        with self._lock:
+            self._release_mapping()
+
+    def exists(self) -> bool:
+        """Verifica si existe un tablero persistido"""
+        return os.path.exists(self.db_path)
+
+    def close(self) -> None:
+        """Cierra el mapeo del fichero"""
+        with self._lock:
+            self._release_mapping()
+
+    # ==================== Mapeo del fichero ====================
+
+    def _map(self, f) -> mmap.mmap:
+        """Mapeo de solo lectura del fichero abierto, reutilizado mientras no cambie"""
+        stat = os.fstat(f.fileno())
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if self._mapping is not None and self._mapping[0] == signature:
+                return self._mapping[1]
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._release_mapping()
+            self._mapping = (signature, mapped)
+            return mapped
+
+    def _release_mapping(self) -> None:
+        if self._mapping is None:
+            return
+        _, mapped = self._mapping
+        self._mapping = None
+        try:
+            mapped.close()
+        except BufferError:
+            # Algún tablero cargado aún lee de él: se cierra cuando se libere
+            pass
+
+    # ==================== Importar / exportar JSON ====================
+
+    def import_json(self, json_path: str) -> Optional[Board]:
+        """Convierte un tablero JSON (formato de BoardRepository) a binario"""
+        board = BoardRepository(json_path).load()
+        if board is None:
+            self.delete()
+        else:
+            self.save(board)
+        return board
+
+    def export_json(self, json_path: str) -> Optional[Board]:
+        """Escribe el tablero binario en formato JSON"""
+        board = self.load()
+        json_repository = BoardRepository(json_path)
+        # Se reemplaza el documento entero, sea cual sea su versión
+        json_repository.delete()
+        if board is not None:
+            json_repository.save(board)
+        return board
+
+    @staticmethod
+    def _to_little(coordinates: array) -> bytes:
+        swapped = array('I', coordinates)
+        swapped.byteswap()
+        return swapped.tobytes()
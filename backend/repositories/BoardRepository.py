@@ -4,53 +4,98 @@ from typing import Optional, Dict
 from models.Board import Board
 from models.Wall import Wall
 from repositories.IRepository import IRepository
+from repositories.AtomicFileWriter import AtomicFileWriter
+from repositories.JsonDocumentCache import JsonDocumentCache
+from repositories.FileLock import FileLock
+from exceptions import ConcurrentModificationException
 
 
 class BoardRepository(IRepository):
     """Repositorio para persistir el tablero del juego"""
     
-    def __init__(self, db_path: str = "data/board.json"):
+    def __init__(self, db_path: str = "data/board.json", writer: Optional[AtomicFileWriter] = None):
         self.db_path = db_path
+        # Escrituras atómicas: una caída nunca deja el JSON a medias
+        self._writer = writer or AtomicFileWriter()
+        # Lecturas sin re-parsear mientras el fichero no cambie (también entre procesos)
+        self._cache = JsonDocumentCache(self.db_path)
+        # Bloqueo entre procesos: compartido para leer, exclusivo para guardar
+        self._lock = FileLock(self.db_path + ".lock")
         self._ensure_db_exists()
     
     def _ensure_db_exists(self):
         """Asegura que el archivo de persistencia existe"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        if not os.path.exists(self.db_path):
-            with open(self.db_path, 'w') as f:
-                json.dump(None, f)
+        batch = None
+        with self._lock.exclusive():
+            if not os.path.exists(self.db_path):
+                batch = self._write(None)
+        self._writer.wait_durable(batch)
     
     def save(self, board: Board) -> None:
-        data = {
-            "width": board.width,
-            "height": board.height,
-            "walls": [{"x": wall.x, "y": wall.y} for wall in board.walls]  # ✅
-        }
-        with open(self.db_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        """
+        Persiste el tablero si nadie lo ha guardado desde que se cargó
+        
+        Raises:
+            ConcurrentModificationException: Si la versión en disco no es la del tablero
+        """
+        with self._lock.exclusive():
+            stored_version = self._stored_version()
+            if stored_version != board.version:
+                raise ConcurrentModificationException(
+                    f"El tablero fue modificado por otra petición (versión {stored_version}, "
+                    f"se esperaba {board.version})"
+                )
+            
+            data = {
+                "width": board.width,
+                "height": board.height,
+                "walls": [{"x": wall.x, "y": wall.y} for wall in board.walls],  # ✅
+                "version": board.version + 1
+            }
+            batch = self._write(data)
+        # El documento ya es visible para el siguiente que lo bloquee: el
+        # commit en grupo se espera sin retener el bloqueo
+        self._writer.wait_durable(batch)
+        # El documento completo ya incluye las paredes nuevas
+        board.pop_new_walls()
+        board.version += 1
     
     def load(self) -> Optional[Board]:
-        with open(self.db_path, 'r') as f:
-            data = json.load(f)
+        with self._lock.shared():
+            data = self._cache.read()
         
         if data is None:
             return None
         
-        board = Board(data["width"], data["height"])
+        walls = data.get("walls", [])
+        board = Board(data["width"], data["height"], expected_walls=len(walls))
         
-        for wall_data in data.get("walls", []):
+        for wall_data in walls:
             wall = Wall(wall_data["x"], wall_data["y"])
             board.walls.append(wall)
         
+        board.version = data.get("version", 0)
         return board
     
     def delete(self) -> None:
         """Elimina el tablero persistido"""
-        with open(self.db_path, 'w') as f:
-            json.dump(None, f)
+        with self._lock.exclusive():
+            batch = self._write(None)
+        self._writer.wait_durable(batch)
     
     def exists(self) -> bool:
         """Verifica si existe un tablero persistido"""
-        with open(self.db_path, 'r') as f:
-            data = json.load(f)
-        return data is not None
\ No newline at end of file
+        with self._lock.shared():
+            return self._cache.read() is not None
+    
+    def _stored_version(self) -> int:
+        """Versión del documento en disco (0 si no hay tablero)"""
+        data = self._cache.read()
+        return 0 if data is None else data.get("version", 0)
+    
+    def _write(self, data) -> Optional[int]:
+        """Reemplaza el documento de forma atómica (durable tras wait_durable)"""
+        batch = self._writer.write_visible(self.db_path, json.dumps(data, indent=2))
+        self._cache.invalidate()
+        return batch
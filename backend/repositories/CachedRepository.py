@@ -0,0 +1,180 @@
+import copy
+import logging
+import threading
+from typing import Optional, TypeVar
+from repositories.IRepository import IRepository
+from exceptions import ConcurrentModificationException
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+_NOT_LOADED = object()
+
+
+class CachedRepository(IRepository[T]):
+    """
+    Caché en memoria con escritura diferida (write-back)
+
+    Mantiene la entidad viva en memoria: solo la primera lectura toca el
+    repositorio real. Los save/delete marcan la entidad como sucia y se
+    vuelcan al repositorio real cuando:
+      - se acumulan `max_dirty` cambios sin volcar,
+      - pasan `flush_interval` segundos (hilo en segundo plano), o
+      - se llama a close() (por ejemplo al apagar el servidor).
+
+    La entidad cacheada nunca sale de la caché: load devuelve una copia y
+    save guarda una copia, así los servicios la modifican sin bloqueo
+    mientras el hilo de volcado serializa la suya, y los cambios de una
+    unidad de trabajo descartada no llegan a la caché. Las copias de un
+    Board no incluyen sus estructuras derivadas y comparten las paredes con
+    copy-on-write, así que cuestan O(1) en mapas de bits y no O(tablero).
+
+    La caché lleva su propia versión, que sube con cada save: un save cuya
+    entidad no tiene la versión actual de la caché (otra petición de este
+    proceso guardó antes) lanza ConcurrentModificationException, igual que
+    los repositorios reales. Los volcados no cambian esa versión, así que
+    volcar mientras una petición trabaja con su copia no la invalida; la
+    versión del repositorio real se guarda aparte y solo se usa al volcar.
+
+    Solo es válido cuando este proceso es el único que escribe en el
+    repositorio real.
+    """
+
+    def __init__(
+        self,
+        repository: IRepository[T],
+        flush_interval: Optional[float] = 1.0,
+        max_dirty: int = 100
+    ):
+        self._repository = repository
+        self._flush_interval = flush_interval
+        self._max_dirty = max_dirty
+        self._lock = threading.RLock()
+        self._entity = _NOT_LOADED
+        # Versión de la caché (la de las copias que entrega load) y versión
+        # del documento en el repositorio real
+        self._version = 0
+        self._stored_version = 0
+        self._dirty_count = 0
+        self._flush_count = 0
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        if flush_interval:
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    @property
+    def repository(self) -> IRepository[T]:
+        """Repositorio real al que se vuelcan los cambios"""
+        return self._repository
+
+    @property
+    def dirty_count(self) -> int:
+        """Cambios pendientes de volcar"""
+        return self._dirty_count
+
+    @property
+    def flush_count(self) -> int:
+        """Escrituras realizadas en el repositorio real"""
+        return self._flush_count
+
+    # ==================== IRepository ====================
+
+    def save(self, entity: T) -> None:
+        """
+        Guarda una copia de la entidad en la caché
+
+        Raises:
+            ConcurrentModificationException: Si la entidad no tiene la versión de la caché
+        """
+        with self._lock:
+            if self._entity is _NOT_LOADED:
+                # Sin nada cargado no hay con qué comparar: el repositorio
+                # real comprobará la versión de la entidad al volcarla
+                self._version = self._stored_version = entity.version
+            elif entity.version != self._version:
+                raise ConcurrentModificationException(
+                    f"La entidad fue modificada por otra petición (versión {self._version}, "
+                    f"se esperaba {entity.version})"
+                )
+
+            snapshot = copy.deepcopy(entity)
+            self._version += 1
+            snapshot.version = self._version
+            entity.version = self._version
+            self._entity = snapshot
+            self._mark_dirty()
+
+    def load(self) -> Optional[T]:
+        with self._lock:
+            self._ensure_loaded()
+            return copy.deepcopy(self._entity)
+
+    def delete(self) -> None:
+        with self._lock:
+            self._entity = None
+            self._version = 0
+            self._mark_dirty()
+
+    def exists(self) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            return self._entity is not None
+
+    def _ensure_loaded(self) -> None:
+        if self._entity is not _NOT_LOADED:
+            return
+        self._entity = self._repository.load()
+        self._version = self._stored_version = (
+            0 if self._entity is None else self._entity.version
+        )
+
+    # ==================== Volcado ====================
+
+    def flush(self) -> None:
+        """Vuelca la entidad al repositorio real si tiene cambios pendientes"""
+        with self._lock:
+            if self._dirty_count == 0:
+                return
+
+            entity = self._entity
+            if entity is None:
+                self._repository.delete()
+                self._stored_version = 0
+            else:
+                # El repositorio real compara y sube su propia versión; la
+                # entidad cacheada conserva la de la caché
+                entity.version = self._stored_version
+                try:
+                    self._repository.save(entity)
+                    self._stored_version = entity.version
+                finally:
+                    entity.version = self._version
+            self._dirty_count = 0
+            self._flush_count += 1
+
+    def close(self) -> None:
+        """Detiene el volcado periódico y vuelca los cambios pendientes"""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def _mark_dirty(self) -> None:
+        self._dirty_count += 1
+        if self._dirty_count >= self._max_dirty:
+            # El save ya está en la caché: un volcado fallido no lo deshace,
+            # se reintenta en el siguiente volcado
+            self._try_flush()
+
+    def _try_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("No se pudo volcar la caché al repositorio real")
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self._flush_interval):
+            self._try_flush()
@@ -0,0 +1,63 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueos entre procesos
+    fcntl = None
+
+
+class FileLock:
+    """
+    Bloqueo consultivo entre procesos sobre un fichero `.lock` auxiliar
+
+    Se bloquea un fichero aparte y no el documento porque la escritura atómica
+    reemplaza el documento por un inodo nuevo: un bloqueo sobre el fichero
+    antiguo no excluiría a quien abra el nuevo.
+
+    Usa flock(), cuyos bloqueos pertenecen al descriptor abierto: cada bloqueo
+    activo usa su propio descriptor, así que también se excluyen los hilos de
+    un mismo proceso (los bloqueos POSIX de lockf() son por proceso y no lo
+    harían). Los descriptores libres se reutilizan.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._free_fds: list[int] = []
+        self._fds_lock = threading.Lock()
+
+    def _acquire_fd(self) -> int:
+        with self._fds_lock:
+            if self._free_fds:
+                return self._free_fds.pop()
+        return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def _release_fd(self, fd: int) -> None:
+        with self._fds_lock:
+            self._free_fds.append(fd)
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+
+        fd = self._acquire_fd()
+        try:
+            fcntl.flock(fd, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            self._release_fd(fd)
+
+    def shared(self):
+        """Bloqueo compartido (lecturas)"""
+        return self._locked(fcntl.LOCK_SH if fcntl else 0)
+
+    def exclusive(self):
+        """Bloqueo exclusivo (leer-comprobar-escribir)"""
+        return self._locked(fcntl.LOCK_EX if fcntl else 0)
@@ -0,0 +1,109 @@
+import copy
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+
+
+class GameSession:
+    """
+    Estado en memoria de una partida: su tablero y su robot
+
+    Las peticiones de una misma partida se serializan con `lock`. `pins`
+    cuenta las peticiones que la están usando: GameSessionStore no expulsa
+    una sesión fijada. `dirty` indica si hay cambios que no están en disco,
+    `size` es la memoria estimada con que la cuenta el almacén, `deleted`
+    marca una partida eliminada mientras alguien la esperaba y `loaded` es
+    False mientras la sesión es solo la reserva de una partida que aún se
+    tiene que leer de disco.
+    """
+
+    # Coste aproximado de una partida sin tablero (objetos, candado y robot)
+    BASE_BYTES = 1024
+
+    def __init__(self, game_id: str, board: Optional[Board] = None, robot: Optional[Robot] = None):
+        self.game_id = game_id
+        self.board = board
+        self.robot = robot
+        self.dirty = False
+        self.pins = 0
+        self.size = 0
+        self.deleted = False
+        self.loaded = True
+        self.lock = threading.RLock()
+
+    def is_empty(self) -> bool:
+        """Indica si la partida no tiene ni tablero ni robot"""
+        return self.board is None and self.robot is None
+
+    def nbytes(self) -> int:
+        """Memoria aproximada de la partida"""
+        board = self.board
+        return self.BASE_BYTES + (0 if board is None else board.nbytes())
+
+    @contextmanager
+    def transaction(self) -> Iterator['GameSession']:
+        """
+        Deshace los cambios del bloque si termina con una excepción
+
+        Las peticiones de una partida trabajan sobre su tablero y su robot
+        vivos: si una falla a medias (un choque en mitad de una secuencia de
+        comandos, una validación después de añadir paredes) se restauran los
+        de antes del bloque, igual que la unidad de trabajo de las rutas
+        globales descarta sus cambios. La copia del tablero es copy-on-write.
+        """
+        board, robot, dirty = copy.deepcopy(self.board), copy.deepcopy(self.robot), self.dirty
+        try:
+            yield self
+        except BaseException:
+            self.board, self.robot, self.dirty = board, robot, dirty
+            raise
+
+    # ==================== Serialización ====================
+
+    def to_document(self) -> dict:
+        """Documento JSON de la partida"""
+        board = self.board
+        robot = self.robot
+        return {
+            "board": None if board is None else {
+                "width": board.width,
+                "height": board.height,
+                "walls": [[wall.x, wall.y] for wall in board.walls]
+            },
+            "robot": None if robot is None else {
+                "x": robot.x,
+                "y": robot.y,
+                "facing": robot.facing
+            }
+        }
+
+    @classmethod
+    def from_document(cls, game_id: str, document: dict) -> 'GameSession':
+        """Reconstruye la partida desde su documento JSON"""
+        session = cls(game_id)
+        session.restore(document)
+        return session
+
+    def restore(self, document: dict) -> None:
+        """Carga el tablero y el robot del documento JSON de la partida"""
+        board = None
+        board_data = document.get("board")
+        if board_data is not None:
+            walls = board_data["walls"]
+            board = Board(board_data["width"], board_data["height"], expected_walls=len(walls))
+            for x, y in walls:
+                board.walls.append(Wall(x, y))
+
+        robot = None
+        robot_data = document.get("robot")
+        if robot_data is not None:
+            robot = Robot()
+            robot.x = robot_data["x"]
+            robot.y = robot_data["y"]
+            robot.facing = robot_data["facing"]
+
+        self.board = board
+        self.robot = robot
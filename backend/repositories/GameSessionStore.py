@@ -0,0 +1,274 @@
+import json
+import os
+import re
+import threading
+import uuid
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from typing import Iterator, Optional
+from repositories.AtomicFileWriter import AtomicFileWriter
+from repositories.GameSession import GameSession
+from exceptions import GameNotFoundException
+
+
+class GameSessionStore:
+    """
+    Partidas en memoria con expulsión LRU a disco comprimido
+
+    Se mantienen en memoria como mucho `max_sessions` partidas que ocupen
+    en total unos `max_bytes` (GameSession.nbytes), más las que estén en uso
+    en ese momento, que no se pueden expulsar. Al superar cualquiera de los
+    dos límites se expulsan las usadas hace más tiempo: se sacan del índice
+    con el candado global y después, ya sin él, se escriben como JSON
+    comprimido con zlib en `<directory>/<game_id>.json.z` con el candado de
+    cada partida. Mientras se escribe, una partida expulsada sigue en
+    `_evicting` y si se vuelve a pedir se recupera de ahí; si no, se vuelve
+    a cargar de disco la próxima vez que se usa. Para cargarla se reserva
+    en el índice una sesión vacía con el candado global y se descomprime y
+    reconstruye después con el candado de la partida, así una carga lenta
+    no frena las peticiones de las demás partidas.
+
+    Las partidas se registran con create(): pedir una partida que no existe
+    ni en memoria ni en disco lanza GameNotFoundException.
+
+    Las partidas viven en la memoria de este proceso: con varios procesos
+    servidor, las peticiones de una partida deben ir siempre al mismo.
+    """
+
+    GAME_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+    COMPRESSION_LEVEL = 6
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        directory: str = "data/games",
+        max_sessions: int = 1000,
+        writer: Optional[AtomicFileWriter] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        if max_sessions < 1:
+            raise ValueError("max_sessions debe ser al menos 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes debe ser al menos 1")
+        self.directory = directory
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self._writer = writer or AtomicFileWriter()
+        self._sessions: OrderedDict[str, GameSession] = OrderedDict()
+        # Partidas expulsadas que aún se están escribiendo (fuera del candado global)
+        self._evicting: dict[str, GameSession] = {}
+        # Suma de GameSession.size de las partidas de _sessions
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.eviction_count = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        """Partidas cargadas en memoria"""
+        return len(self._sessions)
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria estimada de las partidas cargadas"""
+        return self._bytes
+
+    @staticmethod
+    def new_game_id() -> str:
+        """Genera un identificador de partida nuevo"""
+        return uuid.uuid4().hex
+
+    def validate_game_id(self, game_id: str) -> None:
+        """El identificador forma parte de una ruta de fichero: solo se aceptan caracteres seguros"""
+        if not self.GAME_ID_PATTERN.match(game_id):
+            raise ValueError(
+                "Identificador de partida no válido: 1-64 caracteres entre letras, dígitos, '-' y '_'"
+            )
+
+    def _path(self, game_id: str) -> str:
+        return os.path.join(self.directory, f"{game_id}.json.z")
+
+    # ==================== Acceso a las partidas ====================
+
+    def create(self) -> str:
+        """Registra una partida nueva vacía y devuelve su identificador"""
+        game_id = self.new_game_id()
+        with self.session(game_id, create=True):
+            pass
+        return game_id
+
+    @contextmanager
+    def session(self, game_id: str, create: bool = False) -> Iterator[GameSession]:
+        """
+        Usa la partida en exclusiva durante el bloque
+
+        Mientras dura el bloque la partida está fijada en memoria.
+
+        Raises:
+            GameNotFoundException: Si la partida no existe (o se elimina
+                mientras se esperaba su turno) y create es False
+        """
+        self.validate_game_id(game_id)
+        with self._lock:
+            session = self._sessions.get(game_id)
+            if session is None:
+                session = self._evicting.pop(game_id, None)
+                if session is None:
+                    if not create and not os.path.exists(self._path(game_id)):
+                        raise GameNotFoundException(f"No existe la partida {game_id}")
+                    # Reserva: se lee de disco ya sin el candado global
+                    session = GameSession(game_id)
+                    session.loaded = False
+                session.size = session.nbytes()
+                self._sessions[game_id] = session
+                self._bytes += session.size
+            else:
+                self._sessions.move_to_end(game_id)
+            session.pins += 1
+            victims = self._evict()
+        self._flush(victims)
+
+        size = session.size
+        try:
+            with session.lock:
+                if not session.loaded:
+                    self._load(session, create)
+                if session.deleted:
+                    raise GameNotFoundException(f"No existe la partida {game_id}")
+                try:
+                    yield session
+                finally:
+                    size = session.nbytes()
+        finally:
+            with self._lock:
+                session.pins -= 1
+                if self._sessions.get(game_id) is session:
+                    self._bytes += size - session.size
+                    session.size = size
+                victims = self._evict()
+            self._flush(victims)
+
+    def exists(self, game_id: str) -> bool:
+        """Indica si la partida está registrada (en memoria o en disco)"""
+        self.validate_game_id(game_id)
+        with self._lock:
+            if game_id in self._sessions or game_id in self._evicting:
+                return True
+            return os.path.exists(self._path(game_id))
+
+    def delete(self, game_id: str) -> None:
+        """
+        Elimina la partida de memoria y de disco
+
+        Espera a que termine la petición que la esté usando; las que
+        esperaban su turno reciben GameNotFoundException.
+        """
+        self.validate_game_id(game_id)
+        while True:
+            with self._lock:
+                session = self._sessions.get(game_id) or self._evicting.get(game_id)
+            with session.lock if session is not None else nullcontext():
+                with self._lock:
+                    current = self._sessions.get(game_id) or self._evicting.get(game_id)
+                    if current is not session:
+                        # Se cargó o se expulsó mientras se esperaba: otra vuelta
+                        continue
+                    if self._sessions.pop(game_id, None) is not None:
+                        self._bytes -= session.size
+                    self._evicting.pop(game_id, None)
+                    if session is not None:
+                        session.deleted = True
+                    if os.path.exists(self._path(game_id)):
+                        os.remove(self._path(game_id))
+                    return
+
+    def close(self) -> None:
+        """Escribe en disco todas las partidas con cambios"""
+        with self._lock:
+            sessions = list(self._sessions.values()) + list(self._evicting.values())
+        for session in sessions:
+            with session.lock:
+                if not session.deleted:
+                    self._write(session)
+
+    # ==================== Expulsión y disco ====================
+
+    def _over_limits(self) -> bool:
+        return len(self._sessions) > self.max_sessions or self._bytes > self.max_bytes
+
+    def _evict(self) -> list[GameSession]:
+        """
+        Saca del índice las partidas menos usadas (no fijadas) hasta respetar
+        los límites. Se llama con el candado global; las partidas devueltas
+        se escriben después con _flush, ya sin él.
+        """
+        victims = []
+        if not self._over_limits():
+            return victims
+
+        for game_id in list(self._sessions):
+            if not self._over_limits():
+                break
+            session = self._sessions[game_id]
+            if session.pins:
+                continue
+            del self._sessions[game_id]
+            self._bytes -= session.size
+            self._evicting[game_id] = session
+            victims.append(session)
+            self.eviction_count += 1
+        return victims
+
+    def _flush(self, victims: list[GameSession]) -> None:
+        """Escribe las partidas expulsadas con su candado y las olvida"""
+        for session in victims:
+            with session.lock:
+                if not session.deleted:
+                    self._write(session)
+            with self._lock:
+                if self._evicting.get(session.game_id) is session:
+                    del self._evicting[session.game_id]
+
+    def _write(self, session: GameSession) -> None:
+        if not session.dirty:
+            return
+
+        # También las partidas vacías: el fichero es el registro de que existen
+        document = json.dumps(session.to_document(), separators=(',', ':'))
+        self._writer.write(self._path(session.game_id), zlib.compress(document.encode('utf-8'), self.COMPRESSION_LEVEL))
+        session.dirty = False
+
+    def _load(self, session: GameSession, create: bool) -> None:
+        """Lee de disco una partida reservada. Se llama con el candado de la partida"""
+        try:
+            document = self._read(session.game_id)
+            if document is None and not create:
+                raise GameNotFoundException(f"No existe la partida {session.game_id}")
+        except BaseException:
+            # Las peticiones que esperan la reserva la verán eliminada
+            with self._lock:
+                session.deleted = True
+                if self._sessions.get(session.game_id) is session:
+                    del self._sessions[session.game_id]
+                    self._bytes -= session.size
+            raise
+
+        if document is None:
+            session.dirty = True
+        else:
+            session.restore(document)
+        session.loaded = True
+
+        size = session.nbytes()
+        with self._lock:
+            if self._sessions.get(session.game_id) is session:
+                self._bytes += size - session.size
+                session.size = size
+
+    def _read(self, game_id: str) -> Optional[dict]:
+        path = self._path(game_id)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'rb') as f:
+            return json.loads(zlib.decompress(f.read()))
@@ -0,0 +1,77 @@
+from typing import Optional
+from models.Board import Board
+from models.Wall import Wall
+from repositories.IRepository import IRepository
+from repositories.JournalStore import JournalStore
+
+
+class JournalBoardRepository(IRepository[Board]):
+    """
+    Repositorio del tablero sobre el diario de JournalStore
+
+    Guardar el tablero que ya está en el diario solo añade un registro por
+    cada pared nueva (Board.pending_walls), no reescribe las existentes.
+    Board.version guarda la revisión del diario de la que se cargó: si el
+    tablero del diario se eliminó o se reemplazó desde entonces, o si el
+    tablero tiene paredes que no están en el diario ni pendientes, se
+    escribe entero con un registro B para no perder ninguna.
+    """
+
+    def __init__(self, store: JournalStore):
+        self._store = store
+
+    def save(self, board: Board) -> None:
+        new_walls = board.pending_walls()
+        stored = self._store.board_state()
+
+        if (
+            stored is not None
+            and stored[:2] == (board.width, board.height)
+            and stored[3] == board.version
+            and self._has_base_walls(board, stored[2], new_walls)
+        ):
+            # Mismo tablero: solo las paredes añadidas desde la última carga
+            walls = new_walls
+            records = []
+        else:
+            walls = board.walls
+            records = [f"B {board.width} {board.height}"]
+
+        records.extend(f"W {wall.x} {wall.y}" for wall in walls)
+        if records:
+            self._store.append(*records)
+        # Solo se olvidan tras escribirlas: si append falla siguen pendientes
+        board.pop_new_walls()
+        stored = self._store.board_state()
+        if stored is not None:
+            board.version = stored[3]
+
+    @staticmethod
+    def _has_base_walls(board: Board, stored_walls: list[tuple[int, int]], new_walls: list[Wall]) -> bool:
+        """Indica si las paredes del tablero que no son nuevas ya están todas en el diario"""
+        if len(stored_walls) + len(new_walls) == len(board.walls):
+            return True
+        # Otra petición pudo añadir paredes desde la carga: se comprueba una a una
+        saved = set(stored_walls)
+        pending = {(w.x, w.y) for w in new_walls}
+        return all((w.x, w.y) in saved for w in board.walls if (w.x, w.y) not in pending)
+
+    def load(self) -> Optional[Board]:
+        stored = self._store.board_state()
+        if stored is None:
+            return None
+
+        width, height, walls, revision = stored
+        board = Board(width, height, expected_walls=len(walls))
+        for x, y in walls:
+            board.walls.append(Wall(x, y))
+        board.version = revision
+        return board
+
+    def delete(self) -> None:
+        """Elimina el tablero persistido"""
+        self._store.append("b")
+
+    def exists(self) -> bool:
+        """Verifica si existe un tablero persistido"""
+        return self._store.board_state() is not None
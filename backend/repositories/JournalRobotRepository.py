@@ -0,0 +1,36 @@
+from typing import Optional
+from models.Robot import Robot
+from repositories.IRepository import IRepository
+from repositories.JournalStore import JournalStore
+
+
+class JournalRobotRepository(IRepository[Robot]):
+    """Repositorio del robot sobre el diario de JournalStore"""
+
+    def __init__(self, store: JournalStore):
+        self._store = store
+
+    def save(self, robot: Robot) -> None:
+        """Persiste el robot como un registro de tamaño constante"""
+        x = '-' if robot.x is None else robot.x
+        y = '-' if robot.y is None else robot.y
+        facing = JournalStore.FACING_CODES.get(robot.facing, '-')
+        self._store.append(f"R {x} {y} {facing}")
+
+    def load(self) -> Optional[Robot]:
+        """Carga el robot desde el estado del diario"""
+        stored = self._store.robot_state()
+        if stored is None:
+            return None
+
+        robot = Robot()
+        robot.x, robot.y, robot.facing = stored
+        return robot
+
+    def delete(self) -> None:
+        """Elimina el robot persistido"""
+        self._store.append("r")
+
+    def exists(self) -> bool:
+        """Verifica si existe un robot persistido"""
+        return self._store.robot_state() is not None
@@ -0,0 +1,227 @@
+import glob
+import json
+import os
+import re
+import threading
+from typing import Optional
+
+
+class JournalStore:
+    """
+    Persistencia por diario (event sourcing) del tablero y el robot
+
+    Cada cambio se añade como un registro de texto corto al final del diario
+    activo, así que los bytes escritos por comando son pocos y constantes:
+
+        B <width> <height>   crea (o reemplaza) el tablero, sin paredes
+        W <x> <y>            añade una pared
+        b                    elimina el tablero
+        R <x> <y> <facing>   nuevo estado del robot (place / move / left / right)
+        r                    elimina el robot
+
+    El estado se reconstruye a partir de la última instantánea más los diarios
+    posteriores, y se mantiene materializado en memoria para las lecturas.
+    Cuando el diario activo supera `compact_threshold` bytes, un hilo en segundo
+    plano empieza un diario nuevo y escribe una instantánea del estado en ese
+    punto; después borra los diarios que ya incluye. Si el proceso cae a mitad,
+    la instantánea anterior y los diarios siguen siendo válidos.
+    """
+
+    FACING_CODES = {'NORTH': 'N', 'SOUTH': 'S', 'EAST': 'E', 'WEST': 'W'}
+    FACING_NAMES = {code: name for name, code in FACING_CODES.items()}
+    _LOG_NAME = re.compile(r'journal\.(\d+)\.log$')
+
+    def __init__(self, directory: str = "data/journal", compact_threshold: int = 1_000_000):
+        self.directory = directory
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._board: Optional[dict] = None
+        # Sube con cada tablero creado o eliminado (registros B y b)
+        self._board_revision = 0
+        self._robot: Optional[tuple] = None
+        self._generation = 0
+        self._log = None
+        self._log_size = 0
+        self._compact_requested = threading.Event()
+        self._closed = False
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._recover()
+        self._compactor = threading.Thread(target=self._compact_when_requested, daemon=True)
+        self._compactor.start()
+
+    # ==================== Rutas ====================
+
+    @property
+    def snapshot_path(self) -> str:
+        return os.path.join(self.directory, "snapshot.json")
+
+    def _log_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"journal.{generation}.log")
+
+    def _log_generations(self) -> list[int]:
+        generations = []
+        for path in glob.glob(os.path.join(self.directory, "journal.*.log")):
+            match = self._LOG_NAME.search(path)
+            if match:
+                generations.append(int(match.group(1)))
+        return sorted(generations)
+
+    # ==================== Lectura del estado ====================
+
+    def board_state(self) -> Optional[tuple[int, int, list[tuple[int, int]], int]]:
+        """
+        (width, height, paredes en orden de inserción, revisión) o None
+
+        La revisión cambia cada vez que el tablero se crea o se elimina, así
+        que dos lecturas con la misma revisión son del mismo tablero.
+        """
+        with self._lock:
+            if self._board is None:
+                return None
+            return (
+                self._board['width'], self._board['height'],
+                list(self._board['walls']), self._board_revision
+            )
+
+    def robot_state(self) -> Optional[tuple]:
+        """(x, y, facing) o None"""
+        with self._lock:
+            return self._robot
+
+    def log_size(self) -> int:
+        """Bytes del diario activo"""
+        return self._log_size
+
+    # ==================== Escritura ====================
+
+    def append(self, *records: str) -> None:
+        """Añade registros al diario activo y los aplica al estado en memoria"""
+        data = ''.join(record + '\n' for record in records)
+        with self._lock:
+            self._log.write(data)
+            self._log.flush()
+            self._log_size += len(data)
+            for record in records:
+                self._apply(record)
+
+        if self._log_size >= self.compact_threshold:
+            self._compact_requested.set()
+
+    def _apply(self, record: str) -> None:
+        kind, *args = record.split()
+        if kind == 'B':
+            self._board = {'width': int(args[0]), 'height': int(args[1]), 'walls': {}}
+            self._board_revision += 1
+        elif kind == 'W':
+            if self._board is not None:
+                self._board['walls'][(int(args[0]), int(args[1]))] = None
+        elif kind == 'b':
+            self._board = None
+            self._board_revision += 1
+        elif kind == 'R':
+            x, y, facing = args
+            self._robot = (
+                None if x == '-' else int(x),
+                None if y == '-' else int(y),
+                self.FACING_NAMES.get(facing)
+            )
+        elif kind == 'r':
+            self._robot = None
+        else:
+            raise ValueError(f"Registro de diario no válido: {record!r}")
+
+    # ==================== Recuperación y compactación ====================
+
+    def _recover(self) -> None:
+        """Reconstruye el estado: última instantánea + diarios posteriores"""
+        first_generation = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+            first_generation = snapshot['generation']
+            self._robot = tuple(snapshot['robot']) if snapshot['robot'] is not None else None
+            board = snapshot['board']
+            if board is not None:
+                self._board = {
+                    'width': board['width'],
+                    'height': board['height'],
+                    'walls': {tuple(wall): None for wall in board['walls']}
+                }
+                self._board_revision += 1
+
+        generations = [g for g in self._log_generations() if g >= first_generation]
+        for generation in generations:
+            path = self._log_path(generation)
+            valid_size = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    # Una línea sin '\n' es una escritura a medias de una caída
+                    if not line.endswith(b'\n'):
+                        break
+                    valid_size += len(line)
+                    if line.strip():
+                        self._apply(line.decode())
+            if valid_size < os.path.getsize(path):
+                # Se recorta para que el siguiente registro no se pegue al trozo
+                os.truncate(path, valid_size)
+
+        self._generation = generations[-1] if generations else first_generation
+        self._open_log()
+
+    def _open_log(self) -> None:
+        path = self._log_path(self._generation)
+        self._log = open(path, 'a')
+        self._log_size = os.path.getsize(path)
+
+    def compact(self) -> None:
+        """Escribe una instantánea del estado actual y borra los diarios que incluye"""
+        with self._compact_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        with self._lock:
+            # Se cambia de diario y se copia el estado en ese punto: las nuevas
+            # escrituras siguen en el diario nuevo mientras se escribe la instantánea
+            self._log.close()
+            self._generation += 1
+            self._open_log()
+            generation = self._generation
+            snapshot = {
+                'generation': generation,
+                'board': None if self._board is None else {
+                    'width': self._board['width'],
+                    'height': self._board['height'],
+                    'walls': list(self._board['walls'])
+                },
+                'robot': self._robot
+            }
+
+        temp_path = self.snapshot_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        for old_generation in self._log_generations():
+            if old_generation < generation:
+                os.remove(self._log_path(old_generation))
+
+    def _compact_when_requested(self) -> None:
+        while True:
+            self._compact_requested.wait()
+            self._compact_requested.clear()
+            if self._closed:
+                return
+            if self._log_size >= self.compact_threshold:
+                self.compact()
+
+    def close(self) -> None:
+        """Detiene el compactador y cierra el diario"""
+        self._closed = True
+        self._compact_requested.set()
+        self._compactor.join()
+        with self._lock:
+            self._log.close()
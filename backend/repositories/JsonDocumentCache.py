@@ -0,0 +1,68 @@
+import json
+import os
+import time
+from typing import Any, Optional
+
+
+class JsonDocumentCache:
+    """
+    Caché de lectura de un documento JSON validada con stat()
+
+    El documento parseado se guarda junto con la firma del fichero
+    (dispositivo, inodo, tamaño, mtime_ns, ctime_ns). Mientras la firma no
+    cambie, read() devuelve el documento cacheado con un único stat(); si otro
+    proceso lo reescribe, el rename atómico deja un inodo y una mtime nuevos y
+    la siguiente lectura vuelve a parsearlo.
+
+    Como hace git con el índice, un fichero modificado hace muy poco no se
+    cachea: otra escritura dentro de la misma marca de tiempo, con el mismo
+    tamaño y un inodo reutilizado, tendría la misma firma. La ventana depende
+    de la resolución de la mtime: RACY_WINDOW_NS con marcas de nanosegundos
+    (ext4, APFS, NTFS) y el doble de la resolución en sistemas de ficheros
+    con marcas más gruesas (segundos enteros, o 2 s en FAT). Así un
+    documento reescrito a menudo, como robot.json, sí se sirve de la caché.
+
+    El documento devuelto es compartido: quien lo lee no debe modificarlo.
+    """
+
+    RACY_WINDOW_NS = 10_000_000
+    MAX_TIMESTAMP_RESOLUTION_NS = 1_000_000_000
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entry: Optional[tuple[tuple, Any]] = None
+
+    @staticmethod
+    def _signature(st: os.stat_result) -> tuple:
+        return st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns
+
+    @classmethod
+    def _racy_window(cls, mtime_ns: int) -> int:
+        """Ventana de carrera según la resolución aparente de la mtime"""
+        # Mayor potencia de 10 que divide a la mtime: una mtime múltiplo de
+        # 1 s casi seguro viene de un sistema de ficheros con segundos enteros
+        resolution = 1
+        while resolution * 10 <= cls.MAX_TIMESTAMP_RESOLUTION_NS and mtime_ns % (resolution * 10) == 0:
+            resolution *= 10
+        return max(cls.RACY_WINDOW_NS, 2 * resolution)
+
+    def read(self) -> Any:
+        """Devuelve el documento, parseándolo solo si el fichero cambió"""
+        entry = self._entry
+        if entry is not None and entry[0] == self._signature(os.stat(self.path)):
+            return entry[1]
+
+        with open(self.path, 'rb') as f:
+            # La firma se toma del fichero abierto: es la del contenido que se lee
+            st = os.fstat(f.fileno())
+            data = json.loads(f.read())
+
+        if time.time_ns() - st.st_mtime_ns > self._racy_window(st.st_mtime_ns):
+            self._entry = (self._signature(st), data)
+        else:
+            self._entry = None
+        return data
+
+    def invalidate(self) -> None:
+        """Descarta el documento cacheado (p. ej. tras escribir el fichero)"""
+        self._entry = None
@@ -0,0 +1,109 @@
+import os
+import struct
+import tempfile
+from typing import Optional
+import numpy as np
+from repositories.IRepository import IRepository
+from models.Landmarks import Landmarks
+
+
+class LandmarkRepository(IRepository[Landmarks]):
+    """
+    Repositorio de los landmarks (ALT) del tablero, junto al fichero del tablero
+
+    Cabecera fija de HEADER_SIZE bytes (little endian):
+
+        magic        4s   b'TRLM'
+        version      H    FORMAT_VERSION
+        count        H    número de landmarks (k)
+        width        I
+        height       I
+        walls        Q    paredes del tablero al calcularlos
+        itemsize     B    2 (uint16) o 4 (uint32)
+        fingerprint  16s  Board.fingerprint del tablero
+
+    seguida de las k casillas de los landmarks (uint32) y de la matriz de
+    distancias (k, W·H). La matriz se carga con np.memmap en solo lectura:
+    abrir los landmarks de un tablero de decenas de millones de celdas no
+    copia nada y cada consulta solo lee las páginas que toca.
+
+    Son datos derivados: se escriben en un temporal y se renombran (sin
+    fsync, si se pierden se recalculan) por partes, sin construir el
+    fichero completo en memoria.
+    """
+
+    MAGIC = b'TRLM'
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct('<4sHHIIQB16s')
+    HEADER_SIZE = HEADER.size
+
+    def __init__(self, db_path: str = "data/board.landmarks"):
+        self.db_path = db_path
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def save(self, landmarks: Landmarks) -> None:
+        distances = landmarks.distances
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.FORMAT_VERSION,
+            len(landmarks),
+            landmarks.width,
+            landmarks.height,
+            landmarks.wall_count,
+            distances.dtype.itemsize,
+            landmarks.fingerprint
+        )
+
+        directory = os.path.dirname(self.db_path) or '.'
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.landmarks-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                landmarks.cells.astype('<u4').tofile(f)
+                for row in distances:
+                    row.astype(distances.dtype.newbyteorder('<'), copy=False).tofile(f)
+            os.replace(temp_path, self.db_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def load(self) -> Optional[Landmarks]:
+        """Landmarks guardados, o None si no hay o el fichero no es válido"""
+        if not os.path.exists(self.db_path):
+            return None
+
+        with open(self.db_path, 'rb') as f:
+            header = f.read(self.HEADER_SIZE)
+        if len(header) != self.HEADER_SIZE:
+            return None
+        magic, version, count, width, height, wall_count, itemsize, fingerprint = self.HEADER.unpack(header)
+        if magic != self.MAGIC or version != self.FORMAT_VERSION or itemsize not in (2, 4):
+            return None
+
+        dtype = np.dtype('<u2' if itemsize == 2 else '<u4')
+        cells_size = count * 4
+        if os.path.getsize(self.db_path) != self.HEADER_SIZE + cells_size + count * width * height * itemsize:
+            # Fichero truncado
+            return None
+
+        cells = np.fromfile(self.db_path, dtype='<u4', count=count, offset=self.HEADER_SIZE)
+        distances = np.memmap(
+            self.db_path,
+            dtype=dtype,
+            mode='r',
+            offset=self.HEADER_SIZE + cells_size,
+            shape=(count, width * height)
+        )
+        return Landmarks(width, height, cells, distances, fingerprint, wall_count)
+
+    def delete(self) -> None:
+        """Elimina los landmarks persistidos"""
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def exists(self) -> bool:
+        """Verifica si existen landmarks persistidos"""
+        return os.path.exists(self.db_path)
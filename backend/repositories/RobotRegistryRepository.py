@@ -0,0 +1,101 @@
+import json
+import os
+from typing import Optional
+from models.RobotRegistry import RobotRegistry
+from repositories.IRepository import IRepository
+from repositories.AtomicFileWriter import AtomicFileWriter
+from repositories.JsonDocumentCache import JsonDocumentCache
+from repositories.FileLock import FileLock
+from exceptions import ConcurrentModificationException
+
+
+class RobotRegistryRepository(IRepository[RobotRegistry]):
+    """
+    Repositorio para persistir todos los robots de /api/robots
+
+    Todos los robots se guardan en un único documento JSON versionado (en
+    lugar de un fichero por robot), así mover un robot es una escritura.
+    """
+    
+    def __init__(self, db_path: str = "data/robots.json", writer: Optional[AtomicFileWriter] = None):
+        self.db_path = db_path
+        # Escrituras atómicas: una caída nunca deja el JSON a medias
+        self._writer = writer or AtomicFileWriter()
+        # Lecturas sin re-parsear mientras el fichero no cambie (también entre procesos)
+        self._cache = JsonDocumentCache(self.db_path)
+        # Bloqueo entre procesos: compartido para leer, exclusivo para guardar
+        self._lock = FileLock(self.db_path + ".lock")
+        self._ensure_db_exists()
+    
+    def _ensure_db_exists(self):
+        """Asegura que el archivo de persistencia existe"""
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        batch = None
+        with self._lock.exclusive():
+            if not os.path.exists(self.db_path):
+                batch = self._write(None)
+        self._writer.wait_durable(batch)
+    
+    def save(self, registry: RobotRegistry) -> None:
+        """
+        Persiste los robots si nadie los ha guardado desde que se cargaron
+        
+        Raises:
+            ConcurrentModificationException: Si la versión en disco no es la del registro
+        """
+        with self._lock.exclusive():
+            stored_version = self._stored_version()
+            if stored_version != registry.version:
+                raise ConcurrentModificationException(
+                    f"Los robots fueron modificados por otra petición (versión {stored_version}, "
+                    f"se esperaba {registry.version})"
+                )
+            
+            data = {
+                "robots": [
+                    {"id": robot_id, "x": robot.x, "y": robot.y, "facing": robot.facing}
+                    for robot_id, robot in registry
+                ],
+                "version": registry.version + 1
+            }
+            batch = self._write(data)
+        # El documento ya es visible para el siguiente que lo bloquee: el
+        # commit en grupo se espera sin retener el bloqueo
+        self._writer.wait_durable(batch)
+        registry.version += 1
+    
+    def load(self) -> Optional[RobotRegistry]:
+        """Carga los robots desde la persistencia"""
+        with self._lock.shared():
+            data = self._cache.read()
+        
+        if data is None:
+            return None
+        
+        registry = RobotRegistry()
+        for robot in data["robots"]:
+            registry.place(robot["id"], robot["x"], robot["y"], robot["facing"])
+        registry.version = data.get("version", 0)
+        return registry
+    
+    def delete(self) -> None:
+        """Elimina todos los robots persistidos"""
+        with self._lock.exclusive():
+            batch = self._write(None)
+        self._writer.wait_durable(batch)
+    
+    def exists(self) -> bool:
+        """Verifica si existe un registro de robots persistido"""
+        with self._lock.shared():
+            return self._cache.read() is not None
+    
+    def _stored_version(self) -> int:
+        """Versión del documento en disco (0 si no hay registro)"""
+        data = self._cache.read()
+        return 0 if data is None else data.get("version", 0)
+    
+    def _write(self, data) -> Optional[int]:
+        """Reemplaza el documento de forma atómica (durable tras wait_durable)"""
+        batch = self._writer.write_visible(self.db_path, json.dumps(data, indent=2))
+        self._cache.invalidate()
+        return batch
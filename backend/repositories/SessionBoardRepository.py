@@ -0,0 +1,29 @@
+from typing import Optional
+from models.Board import Board
+from repositories.IRepository import IRepository
+from repositories.GameSession import GameSession
+
+
+class SessionBoardRepository(IRepository[Board]):
+    """Repositorio del tablero de una partida en memoria (GameSession)"""
+
+    def __init__(self, session: GameSession):
+        self._session = session
+
+    def save(self, board: Board) -> None:
+        # La sesión guarda el tablero completo: no hay paredes pendientes
+        board.pop_new_walls()
+        self._session.board = board
+        self._session.dirty = True
+
+    def load(self) -> Optional[Board]:
+        return self._session.board
+
+    def delete(self) -> None:
+        """Elimina el tablero de la partida"""
+        self._session.board = None
+        self._session.dirty = True
+
+    def exists(self) -> bool:
+        """Verifica si la partida tiene tablero"""
+        return self._session.board is not None
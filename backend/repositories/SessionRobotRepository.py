@@ -0,0 +1,29 @@
+from typing import Optional
+from models.Robot import Robot
+from repositories.IRepository import IRepository
+from repositories.GameSession import GameSession
+
+
+class SessionRobotRepository(IRepository[Robot]):
+    """Repositorio del robot de una partida en memoria (GameSession)"""
+
+    def __init__(self, session: GameSession):
+        self._session = session
+
+    def save(self, robot: Robot) -> None:
+        """Persiste el robot en la partida"""
+        self._session.robot = robot
+        self._session.dirty = True
+
+    def load(self) -> Optional[Robot]:
+        """Carga el robot de la partida"""
+        return self._session.robot
+
+    def delete(self) -> None:
+        """Elimina el robot de la partida"""
+        self._session.robot = None
+        self._session.dirty = True
+
+    def exists(self) -> bool:
+        """Verifica si la partida tiene robot"""
+        return self._session.robot is not None
@@ -0,0 +1,80 @@
+from typing import Optional
+from models.Board import Board
+from models.Wall import Wall
+from repositories.IRepository import IRepository
+from repositories.SqliteDatabase import SqliteDatabase
+
+
+class SqliteBoardRepository(IRepository[Board]):
+    """
+    Repositorio SQLite para el tablero del juego
+
+    Cada pared es una fila indexada por (x, y). Al guardar un tablero que ya
+    está en la base de datos solo se insertan las paredes nuevas
+    (Board.pending_walls), así que añadir una pared es un único INSERT. Si
+    las filas más las paredes nuevas no suman las del tablero se comprueba
+    que el resto de paredes esté guardado (otro proceso pudo añadir filas);
+    si no lo está (otro tablero del mismo tamaño o paredes añadidas
+    directamente a `walls`) se reescriben todas.
+    """
+
+    SELECT_BOARD = "SELECT width, height FROM board WHERE id = 1"
+    SELECT_WALL_COUNT = "SELECT COUNT(*) FROM walls"
+    SELECT_WALLS = "SELECT x, y FROM walls ORDER BY seq"
+    INSERT_BOARD = "INSERT OR REPLACE INTO board (id, width, height) VALUES (1, ?, ?)"
+    INSERT_WALL = "INSERT OR IGNORE INTO walls (x, y) VALUES (?, ?)"
+    DELETE_BOARD = "DELETE FROM board"
+    DELETE_WALLS = "DELETE FROM walls"
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    def save(self, board: Board) -> None:
+        new_walls = board.pending_walls()
+
+        with self._db.transaction() as connection:
+            stored = connection.execute(self.SELECT_BOARD).fetchone()
+            stored_walls = connection.execute(self.SELECT_WALL_COUNT).fetchone()[0]
+
+            if stored == (board.width, board.height) and self._has_base_walls(connection, board, stored_walls, new_walls):
+                # Mismo tablero: solo las paredes añadidas desde la última carga
+                connection.executemany(self.INSERT_WALL, ((w.x, w.y) for w in new_walls))
+            else:
+                # Otro tablero o paredes añadidas sin add_wall: se reescribe entero
+                connection.execute(self.DELETE_WALLS)
+                connection.execute(self.INSERT_BOARD, (board.width, board.height))
+                connection.executemany(self.INSERT_WALL, ((w.x, w.y) for w in board.walls))
+
+        # Solo se olvidan tras el commit: si la transacción falla siguen pendientes
+        board.pop_new_walls()
+
+    def _has_base_walls(self, connection, board: Board, stored_walls: int, new_walls: list[Wall]) -> bool:
+        """Indica si las paredes del tablero que no son nuevas ya están todas guardadas"""
+        if stored_walls + len(new_walls) == len(board.walls):
+            return True
+        # Otro proceso pudo añadir paredes desde la carga: se comprueba una a una
+        saved = set(connection.execute(self.SELECT_WALLS))
+        pending = {(w.x, w.y) for w in new_walls}
+        return all((w.x, w.y) in saved for w in board.walls if (w.x, w.y) not in pending)
+
+    def load(self) -> Optional[Board]:
+        connection = self._db.connection()
+        stored = connection.execute(self.SELECT_BOARD).fetchone()
+        if stored is None:
+            return None
+
+        wall_count = connection.execute(self.SELECT_WALL_COUNT).fetchone()[0]
+        board = Board(stored[0], stored[1], expected_walls=wall_count)
+        for x, y in connection.execute(self.SELECT_WALLS):
+            board.walls.append(Wall(x, y))
+        return board
+
+    def delete(self) -> None:
+        """Elimina el tablero persistido"""
+        with self._db.transaction() as connection:
+            connection.execute(self.DELETE_WALLS)
+            connection.execute(self.DELETE_BOARD)
+
+    def exists(self) -> bool:
+        """Verifica si existe un tablero persistido"""
+        return self._db.connection().execute(self.SELECT_BOARD).fetchone() is not None
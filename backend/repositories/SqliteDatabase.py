@@ -0,0 +1,83 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class SqliteDatabase:
+    """
+    Base de datos SQLite compartida por los repositorios SQLite
+
+    Usa el modo WAL (los lectores no bloquean al escritor) y una conexión
+    reutilizada por hilo. Las sentencias son constantes con parámetros, así
+    que el módulo sqlite3 las prepara una vez y las reutiliza desde su caché
+    de sentencias por conexión.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS board (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            width INTEGER NOT NULL,
+            height INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS walls (
+            seq INTEGER PRIMARY KEY,
+            x INTEGER NOT NULL,
+            y INTEGER NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS walls_position ON walls (x, y);
+        CREATE TABLE IF NOT EXISTS robot (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            x INTEGER,
+            y INTEGER,
+            facing TEXT
+        );
+    """
+
+    def __init__(self, db_path: str = "data/game.db"):
+        self.db_path = db_path
+        self._local = threading.local()
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection().executescript(self.SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        """Conexión del hilo actual (se crea la primera vez)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # isolation_level=None: las transacciones se abren explícitamente
+            connection = sqlite3.connect(self.db_path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Transacción de escritura (BEGIN IMMEDIATE ... COMMIT / ROLLBACK)
+
+        Si falla el propio COMMIT (SQLITE_BUSY, disco lleno...) también se
+        deshace: si no, la conexión del hilo se quedaría dentro de la
+        transacción y todos sus BEGIN siguientes fallarían.
+        """
+        connection = self.connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+            connection.execute("COMMIT")
+        except BaseException:
+            # SQLite puede haber deshecho ya la transacción por su cuenta
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        """Cierra la conexión del hilo actual"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
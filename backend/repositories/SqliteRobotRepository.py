@@ -0,0 +1,42 @@
+from typing import Optional
+from models.Robot import Robot
+from repositories.IRepository import IRepository
+from repositories.SqliteDatabase import SqliteDatabase
+
+
+class SqliteRobotRepository(IRepository[Robot]):
+    """Repositorio SQLite para el robot del juego"""
+
+    SELECT_ROBOT = "SELECT x, y, facing FROM robot WHERE id = 1"
+    UPSERT_ROBOT = (
+        "INSERT INTO robot (id, x, y, facing) VALUES (1, ?, ?, ?) "
+        "ON CONFLICT (id) DO UPDATE SET x = excluded.x, y = excluded.y, facing = excluded.facing"
+    )
+    DELETE_ROBOT = "DELETE FROM robot"
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    def save(self, robot: Robot) -> None:
+        """Persiste el robot"""
+        with self._db.transaction() as connection:
+            connection.execute(self.UPSERT_ROBOT, (robot.x, robot.y, robot.facing))
+
+    def load(self) -> Optional[Robot]:
+        """Carga el robot desde la persistencia"""
+        row = self._db.connection().execute(self.SELECT_ROBOT).fetchone()
+        if row is None:
+            return None
+
+        robot = Robot()
+        robot.x, robot.y, robot.facing = row
+        return robot
+
+    def delete(self) -> None:
+        """Elimina el robot persistido"""
+        with self._db.transaction() as connection:
+            connection.execute(self.DELETE_ROBOT)
+
+    def exists(self) -> bool:
+        """Verifica si existe un robot persistido"""
+        return self._db.connection().execute(self.SELECT_ROBOT).fetchone() is not None
@@ -0,0 +1,97 @@
+import threading
+from typing import Optional, TypeVar
+from repositories.IRepository import IRepository
+
+T = TypeVar('T')
+
+_NOT_LOADED = object()
+
+
+class _WorkState:
+    """Estado de la entidad dentro de la unidad de trabajo del hilo actual"""
+
+    __slots__ = ('entity', 'dirty')
+
+    def __init__(self):
+        self.entity = _NOT_LOADED
+        self.dirty = False
+
+
+class TrackingRepository(IRepository[T]):
+    """
+    Repositorio que actúa como mapa de identidad de una unidad de trabajo
+
+    Mientras hay una unidad de trabajo activa en el hilo actual, la entidad se
+    carga del repositorio real como mucho una vez y los save/delete se
+    acumulan hasta flush(). Sin unidad de trabajo activa delega directamente.
+    """
+
+    def __init__(self, repository: IRepository[T]):
+        self._repository = repository
+        self._local = threading.local()
+
+    @property
+    def repository(self) -> IRepository[T]:
+        """Repositorio real al que se delega"""
+        return self._repository
+
+    def _state(self) -> Optional[_WorkState]:
+        return getattr(self._local, 'state', None)
+
+    # ==================== Ciclo de la unidad de trabajo ====================
+
+    def begin(self) -> None:
+        """Empieza a registrar cargas y cambios en el hilo actual"""
+        self._local.state = _WorkState()
+
+    def flush(self) -> None:
+        """Persiste la entidad si ha cambiado desde que empezó la unidad de trabajo"""
+        state = self._state()
+        if state is None or not state.dirty:
+            return
+
+        if state.entity is None:
+            self._repository.delete()
+        else:
+            self._repository.save(state.entity)
+        state.dirty = False
+
+    def end(self) -> None:
+        """Descarta el estado de la unidad de trabajo del hilo actual"""
+        self._local.state = None
+
+    # ==================== IRepository ====================
+
+    def save(self, entity: T) -> None:
+        state = self._state()
+        if state is None:
+            self._repository.save(entity)
+            return
+
+        state.entity = entity
+        state.dirty = True
+
+    def load(self) -> Optional[T]:
+        state = self._state()
+        if state is None:
+            return self._repository.load()
+
+        if state.entity is _NOT_LOADED:
+            state.entity = self._repository.load()
+        return state.entity
+
+    def delete(self) -> None:
+        state = self._state()
+        if state is None:
+            self._repository.delete()
+            return
+
+        state.entity = None
+        state.dirty = True
+
+    def exists(self) -> bool:
+        state = self._state()
+        if state is None:
+            return self._repository.exists()
+
+        return self.load() is not None
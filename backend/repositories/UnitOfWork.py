@@ -0,0 +1,65 @@
+import threading
+from typing import Callable
+from repositories.TrackingRepository import TrackingRepository
+
+
+class UnitOfWork:
+    """
+    Unidad de trabajo sobre varios TrackingRepository
+
+    Dentro de un bloque `with unit_of_work:` cada agregado se lee como mucho
+    una vez y los cambios se escriben una sola vez al salir del bloque. Si el
+    bloque termina con una excepción los cambios se descartan. Los bloques
+    anidados en el mismo hilo se unen al más externo.
+
+    after_commit() aplaza un aviso hasta que los cambios estén guardados: si
+    la unidad de trabajo se descarta (o choca con otro proceso y se repite),
+    el aviso no llega a ejecutarse.
+    """
+
+    def __init__(self, *repositories: TrackingRepository):
+        self._repositories = repositories
+        self._local = threading.local()
+
+    @property
+    def active(self) -> bool:
+        """Indica si hay una unidad de trabajo abierta en el hilo actual"""
+        return getattr(self._local, 'depth', 0) > 0
+
+    def __enter__(self) -> 'UnitOfWork':
+        depth = getattr(self._local, 'depth', 0)
+        if depth == 0:
+            self._local.callbacks = []
+            for repository in self._repositories:
+                repository.begin()
+        self._local.depth = depth + 1
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+
+        callbacks, self._local.callbacks = self._local.callbacks, []
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            for repository in self._repositories:
+                repository.end()
+
+        if exc_type is None:
+            for callback in callbacks:
+                callback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Ejecuta callback tras guardar la unidad de trabajo del hilo (o ya, si no hay ninguna)"""
+        if not self.active:
+            callback()
+            return
+        self._local.callbacks.append(callback)
+
+    def commit(self) -> None:
+        """Persiste las entidades modificadas"""
+        for repository in self._repositories:
+            repository.flush()
@@ -1,16 +1,45 @@
 from repositories.BoardRepository import BoardRepository
 from models.Board import Board
 from models.Wall import Wall
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
 from exceptions import (
+    GameException,
     WallOutOfBoundsException,
     WallAlreadyExistsException,
 )
 
+# Oyente de cambios: (tablero, paredes añadidas) o (tablero/None, None) si se crea o se borra
+BoardListener = Callable[[Optional[Board], Optional[list[Wall]]], None]
+
 class BoardService:
-    def __init__(self, repository: BoardRepository):
+    def __init__(
+        self,
+        repository: BoardRepository,
+        after_commit: Optional[Callable[[Callable[[], None]], None]] = None
+    ):
         self._repository = repository
         self._board = None
+        self._listeners: list[BoardListener] = []
+        # Con una unidad de trabajo (UnitOfWork.after_commit) los oyentes se
+        # avisan cuando el cambio está guardado, no al pedir el save
+        self._after_commit = after_commit
+    
+    def add_listener(self, listener: BoardListener) -> None:
+        """Registra un oyente que se avisa tras añadir paredes o crear/borrar el tablero"""
+        self._listeners.append(listener)
+    
+    def _notify(self, board: Optional[Board], walls: Optional[list[Wall]]) -> None:
+        if not self._listeners:
+            return
+        
+        def notify():
+            for listener in self._listeners:
+                listener(board, walls)
+        
+        if self._after_commit is None:
+            notify()
+        else:
+            self._after_commit(notify)
     
     def create_or_get_board(self, width: int, height: int) -> Board:
         """Crea un nuevo tablero o devuelve el existente"""
@@ -20,6 +49,7 @@ class BoardService:
         if self._board is None:
             self._board = Board(width, height)
             self._repository.save(self._board)
+            self._notify(self._board, None)
         
         return self._board
     
@@ -38,10 +68,29 @@ class BoardService:
         # ⬅️ Ya NO hay try-except, las excepciones suben automáticamente
         board.add_wall(wall)  # Si falla aquí, la excepción sube hasta el error handler
         self._repository.save(board)
+        self._notify(board, [wall])
+    
+    def add_walls(self, walls: list[Wall]) -> tuple[list[Wall], list[tuple[Wall, GameException]]]:
+        """
+        Añade varias paredes validándolas en una sola pasada y persiste una única vez
+        
+        Returns:
+            (paredes añadidas, [(pared rechazada, motivo)])
+        """
+        board = self.get_board()
+        if board is None:
+            raise ValueError("No hay tablero inicializado")
+        
+        added, rejected = board.add_walls(walls)
+        if added:
+            self._repository.save(board)
+            self._notify(board, added)
+        return added, rejected
 
     
     def delete_board(self) -> bool:
         """Elimina el tablero"""
         self._board = None
         self._repository.delete()
+        self._notify(None, None)
         return True
\ No newline at end of file
@@ -0,0 +1,120 @@
+import re
+from typing import Optional, Union
+
+
+class Command:
+    """Comando ya interpretado de un script del robot"""
+
+    __slots__ = ('name', 'args', 'source', 'error')
+
+    def __init__(self, name: Optional[str], args: tuple = (), source: str = '', error: Optional[str] = None):
+        self.name = name
+        self.args = args
+        # Texto original, para los mensajes de error
+        self.source = source
+        # Motivo por el que no se pudo interpretar (None si es válido)
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"Command({self.name!r}, {self.args!r})"
+
+
+class CommandParser:
+    """
+    Interpreta scripts del robot de juguete
+
+    Acepta el formato clásico, un comando por línea:
+
+        PLACE 1,1,NORTH
+        MOVE
+        MOVE 5
+        LEFT
+        DASH
+        REPORT
+
+    o una lista JSON de comandos, cada uno como texto ("MOVE", "PLACE 1,1,NORTH")
+    o como objeto ({"command": "PLACE", "x": 1, "y": 1, "facing": "NORTH"},
+    {"command": "MOVE", "steps": 5}). MOVE n avanza hasta n celdas y DASH
+    avanza hasta la siguiente pared.
+    Las líneas vacías y las que empiezan por '#' se ignoran. Un comando mal
+    escrito no aborta el script: se devuelve con `error` para que el
+    ejecutor lo informe en su posición.
+    """
+
+    PLACE = 'PLACE'
+    MOVE = 'MOVE'
+    LEFT = 'LEFT'
+    RIGHT = 'RIGHT'
+    REPORT = 'REPORT'
+    DASH = 'DASH'
+    SIMPLE_COMMANDS = [MOVE, LEFT, RIGHT, REPORT, DASH]
+
+    _PLACE_ARGS = re.compile(r'^\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*([A-Za-z]+)\s*$')
+
+    @classmethod
+    def parse(cls, script: Union[str, list]) -> list[Command]:
+        """Interpreta un script de texto o una lista JSON de comandos"""
+        if isinstance(script, str):
+            return [
+                cls.parse_line(line)
+                for line in script.splitlines()
+                if line.strip() and not line.lstrip().startswith('#')
+            ]
+        if isinstance(script, list):
+            return [cls._parse_item(item) for item in script]
+        raise ValueError('El script debe ser texto o una lista de comandos')
+
+    @classmethod
+    def parse_line(cls, line: str) -> Command:
+        """Interpreta un comando de texto"""
+        source = line.strip()
+        name, _, rest = source.partition(' ')
+        name = name.upper()
+
+        if name == cls.PLACE:
+            match = cls._PLACE_ARGS.match(rest)
+            if match is None:
+                return Command(None, source=source, error='PLACE requiere X,Y,F')
+            x, y, facing = match.groups()
+            return Command(name, (int(x), int(y), facing.upper()), source)
+
+        if name == cls.MOVE and rest.strip():
+            return cls._parse_move_steps(rest.strip(), source)
+
+        if name in cls.SIMPLE_COMMANDS:
+            if rest.strip():
+                return Command(None, source=source, error=f'{name} no admite argumentos')
+            return Command(name, (), source)
+
+        return Command(None, source=source, error=f"Comando '{name}' desconocido")
+
+    @classmethod
+    def _parse_move_steps(cls, steps, source: str) -> Command:
+        """MOVE n: n entero positivo"""
+        try:
+            steps = int(steps)
+        except (TypeError, ValueError):
+            return Command(None, source=source, error='MOVE solo admite un número de pasos')
+        if steps < 1:
+            return Command(None, source=source, error='El número de pasos de MOVE debe ser positivo')
+        return Command(cls.MOVE, (steps,), source)
+
+    @classmethod
+    def _parse_item(cls, item) -> Command:
+        if isinstance(item, str):
+            return cls.parse_line(item)
+
+        if isinstance(item, dict):
+            name = str(item.get('command', '')).upper()
+            source = str(item)
+            if name == cls.MOVE and item.get('steps') is not None:
+                return cls._parse_move_steps(item['steps'], source)
+            if name != cls.PLACE:
+                return cls.parse_line(name) if name else Command(None, source=source, error='Falta command')
+            try:
+                x, y, facing = int(item['x']), int(item['y']), str(item['facing']).upper()
+            except (KeyError, TypeError, ValueError):
+                return Command(None, source=source, error='PLACE requiere x, y y facing')
+            return Command(name, (x, y, facing), source)
+
+        return Command(None, source=str(item), error='Cada comando debe ser texto o un objeto')
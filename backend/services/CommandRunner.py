@@ -0,0 +1,197 @@
+from typing import Optional, Sequence
+from models.Board import Board
+from models.Robot import Robot
+from models.StateSpace import StateSpace
+from services.CommandParser import Command, CommandParser
+
+
+class CommandRunner:
+    """
+    Ejecuta en memoria un script de comandos sobre un tablero y un robot
+
+    Cada comando produce un código de resultado en lugar de lanzar una
+    excepción, así un movimiento bloqueado no interrumpe el resto del script.
+    Las reglas son las de RobotService: wrap around en los bordes y, mientras
+    el robot no está colocado, los comandos distintos de PLACE no lo mueven y
+    terminan con el código NOT_PLACED.
+    MOVE n y DASH calculan dónde se detienen con el índice de paredes por
+    fila y columna del tablero (Board.free_steps), sin avanzar celda a celda.
+
+    Los scripts largos (o los tableros que ya tienen sus tablas) se ejecutan
+    sobre el estado empaquetado de StateSpace: cada MOVE/LEFT/RIGHT es una
+    consulta a una tabla y el robot solo se actualiza al final.
+    """
+
+    OK = 'OK'
+    WALL_COLLISION = 'WALL_COLLISION'
+    NOT_PLACED = 'NOT_PLACED'
+    OUT_OF_BOUNDS = 'OUT_OF_BOUNDS'
+    INVALID_DIRECTION = 'INVALID_DIRECTION'
+    INVALID_COMMAND = 'INVALID_COMMAND'
+    NO_WALL = 'NO_WALL'
+
+    # Construir las tablas cuesta del orden de un comando por cada dos celdas:
+    # solo se construyen si el script tiene al menos celdas / TABLE_CELLS_PER_COMMAND comandos
+    TABLE_CELLS_PER_COMMAND = 2
+
+    def __init__(self, board: Board, robot: Robot):
+        self.board = board
+        self.robot = robot
+        self.reports: list[tuple[int, int, str]] = []
+        # [(índice del comando, comando, código, mensaje)]
+        self.errors: list[tuple[int, Command, str, str]] = []
+        self.executed = 0
+        # Indica si el robot ha cambiado y hay que persistirlo
+        self.changed = False
+
+    def run(self, commands: Sequence[Command]) -> 'CommandRunner':
+        """Ejecuta los comandos en orden y acumula informes y errores"""
+        space = self._state_space(len(commands))
+        if space is not None:
+            return self._run_packed(commands, space)
+
+        for index, command in enumerate(commands):
+            self.executed += 1
+            if command.error is not None:
+                self.errors.append((index, command, self.INVALID_COMMAND, command.error))
+                continue
+
+            code, message = self.execute(command)
+            if code != self.OK:
+                self.errors.append((index, command, code, message))
+        return self
+
+    def _state_space(self, command_count: int) -> Optional[StateSpace]:
+        board = self.board
+        worth_building = command_count * self.TABLE_CELLS_PER_COMMAND >= board.width * board.height
+        return board.state_space(build=worth_building)
+
+    def execute(self, command: Command) -> tuple[str, str]:
+        """Ejecuta un comando y devuelve (código, mensaje)"""
+        board = self.board
+        robot = self.robot
+        name = command.name
+
+        if name == CommandParser.PLACE:
+            x, y, facing = command.args
+            code, message = self._check_place(x, y, facing)
+            if code == self.OK:
+                robot.place(x, y, facing)
+                self.changed = True
+            return code, message
+
+        if not robot.is_placed():
+            return self.NOT_PLACED, "El robot no ha sido colocado en el tablero"
+
+        if command.args or name == CommandParser.DASH:
+            code, message, position = self._long_move(robot.x, robot.y, robot.facing, command)
+            if position is not None:
+                robot.x, robot.y = position
+                self.changed = True
+            return code, message
+
+        if name == CommandParser.MOVE:
+            next_x, next_y = board.wrap_position(*robot.get_next_position())
+            if board.has_wall_at(next_x, next_y):
+                return self.WALL_COLLISION, f"No se puede mover: hay una pared en ({next_x}, {next_y})"
+            robot.x = next_x
+            robot.y = next_y
+            self.changed = True
+        elif name == CommandParser.LEFT:
+            robot.turn_left()
+            self.changed = True
+        elif name == CommandParser.RIGHT:
+            robot.turn_right()
+            self.changed = True
+        elif name == CommandParser.REPORT:
+            self.reports.append(robot.get_position())
+        else:
+            return self.INVALID_COMMAND, f"Comando '{name}' desconocido"
+        return self.OK, ''
+
+    def _check_place(self, x: int, y: int, facing: str) -> tuple[str, str]:
+        """Valida un PLACE con las mismas reglas y el mismo orden que RobotService.place"""
+        board = self.board
+        if board.has_wall_at(x, y):
+            return self.WALL_COLLISION, f"No se puede colocar el robot en ({x}, {y}): hay una pared"
+        if not board.is_inside(x, y):
+            return self.OUT_OF_BOUNDS, "El robot no puede estar fuera de los limites del tablero"
+        if facing not in Robot.VALID_DIRECTIONS:
+            return self.INVALID_DIRECTION, (
+                f"Dirección '{facing}' no válida. Debe ser: {', '.join(Robot.VALID_DIRECTIONS)}"
+            )
+        return self.OK, ''
+
+    def _long_move(self, x: int, y: int, facing: str, command: Command):
+        """
+        MOVE n (hasta n celdas) o DASH (hasta la siguiente pared)
+
+        Returns:
+            (código, mensaje, nueva posición o None si no se mueve)
+        """
+        board = self.board
+        limit = command.args[0] if command.args else None
+        steps = board.free_steps(x, y, facing, limit)
+        if steps is None:
+            return self.NO_WALL, f"No hay ninguna pared mirando a {facing}: DASH no se detendría", None
+        if steps == 0:
+            wall_x, wall_y = board.advance(x, y, facing, 1)
+            return self.WALL_COLLISION, f"No se puede mover: hay una pared en ({wall_x}, {wall_y})", None
+        return self.OK, '', board.advance(x, y, facing, steps)
+
+    def _run_packed(self, commands: Sequence[Command], space: StateSpace) -> 'CommandRunner':
+        """Mismo comportamiento que execute(), sobre el estado empaquetado"""
+        robot = self.robot
+        forward, left, right, blocked = space.forward, space.left, space.right, space.blocked
+        errors = self.errors
+        state = robot.to_state(space) if robot.is_placed() else None
+        changed = False
+
+        for index, command in enumerate(commands):
+            name = command.name
+            if command.error is not None:
+                errors.append((index, command, self.INVALID_COMMAND, command.error))
+            elif name == CommandParser.PLACE:
+                x, y, facing = command.args
+                code, message = self._check_place(x, y, facing)
+                if code == self.OK:
+                    state = space.encode(x, y, facing)
+                    changed = True
+                else:
+                    errors.append((index, command, code, message))
+            elif state is None:
+                errors.append((index, command, self.NOT_PLACED, "El robot no ha sido colocado en el tablero"))
+            elif command.args or name == CommandParser.DASH:
+                x, y, facing = space.decode(state)
+                code, message, position = self._long_move(x, y, facing, command)
+                if position is not None:
+                    state = space.encode(*position, facing)
+                    changed = True
+                else:
+                    errors.append((index, command, code, message))
+            elif name == CommandParser.MOVE:
+                if blocked[state]:
+                    next_x, next_y = space.blocked_target(state)
+                    errors.append((
+                        index, command, self.WALL_COLLISION,
+                        f"No se puede mover: hay una pared en ({next_x}, {next_y})"
+                    ))
+                else:
+                    state = forward[state]
+                    changed = True
+            elif name == CommandParser.LEFT:
+                state = left[state]
+                changed = True
+            elif name == CommandParser.RIGHT:
+                state = right[state]
+                changed = True
+            elif name == CommandParser.REPORT:
+                self.reports.append(space.decode(state))
+            else:
+                errors.append((index, command, self.INVALID_COMMAND, f"Comando '{name}' desconocido"))
+
+        self.executed += len(commands)
+        if changed:
+            robot.set_state(space, state)
+            self.changed = True
+        return self
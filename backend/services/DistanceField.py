@@ -0,0 +1,135 @@
+from typing import Optional
+import numpy as np
+from models.Board import Board
+from models.StateSpace import StateSpace, DIRECTION_INDEX, LEFT_OF, RIGHT_OF, DELTAS
+from services.CommandParser import CommandParser
+
+
+class DistanceField:
+    """
+    Distancia en comandos desde cada estado (x, y, orientación) hasta una casilla
+
+    Se calcula con una BFS hacia atrás desde el objetivo sobre todo el
+    espacio de estados empaquetado de StateSpace, nivel a nivel y con NumPy:
+    los predecesores de un estado son los dos giros y el paso hacia atrás
+    (con wrap around) si la casilla de origen no es una pared. El resultado
+    es un array compacto (uint16 o uint32 según el tamaño) en el que
+    `UNREACHABLE` marca los estados que no llegan al objetivo.
+
+    Con el campo calculado, el camino óptimo desde cualquier estado se
+    obtiene bajando por el gradiente en O(longitud del camino).
+    """
+
+    _DX = np.array([dx for dx, _ in DELTAS], dtype=np.int64)
+    _DY = np.array([dy for _, dy in DELTAS], dtype=np.int64)
+    _LEFT_OF = np.array(LEFT_OF, dtype=np.int64)
+    _RIGHT_OF = np.array(RIGHT_OF, dtype=np.int64)
+
+    def __init__(self, board: Board, x: int, y: int, facing: Optional[str] = None):
+        """
+        Raises:
+            ValueError: Si el tablero es demasiado grande o el objetivo no es una casilla libre
+        """
+        if not StateSpace.fits(board.width, board.height):
+            raise ValueError(
+                f"El tablero es demasiado grande para campos de distancias (máximo {StateSpace.MAX_CELLS} celdas)"
+            )
+        if not board.is_inside(x, y) or board.has_wall_at(x, y):
+            raise ValueError(f"El objetivo ({x}, {y}) debe ser una casilla libre del tablero")
+
+        self.width = board.width
+        self.height = board.height
+        self.target = (x, y, facing)
+        walls = board.wall_grid()
+        # Board.fingerprint del tablero con que se calculó (DistanceFieldCache
+        # la avanza si las paredes añadidas después no cambian el campo, still_valid_after)
+        self.fingerprint = board.grid_fingerprint(walls)
+
+        size = self.width * self.height * 4
+        self.dtype = np.uint16 if size < np.iinfo(np.uint16).max else np.uint32
+        self.UNREACHABLE = np.iinfo(self.dtype).max
+        self.distances = self._search(walls.ravel())
+
+    @property
+    def nbytes(self) -> int:
+        return self.distances.nbytes
+
+    def _search(self, walls: np.ndarray) -> np.ndarray:
+        width, height = self.width, self.height
+        x, y, facing = self.target
+        distances = np.full(width * height * 4, self.UNREACHABLE, dtype=self.dtype)
+
+        cell = (x - 1) * height + (y - 1)
+        if facing is None:
+            frontier = np.arange(cell * 4, cell * 4 + 4, dtype=np.int64)
+        else:
+            frontier = np.array([cell * 4 + DIRECTION_INDEX[facing]], dtype=np.int64)
+        distances[frontier] = 0
+
+        level = 0
+        while len(frontier):
+            level += 1
+            cells, directions = np.divmod(frontier, 4)
+            cell_x, cell_y = np.divmod(cells, height)
+
+            # Quien acaba aquí tras LEFT miraba a RIGHT_OF y al revés
+            after_left = cells * 4 + self._RIGHT_OF[directions]
+            after_right = cells * 4 + self._LEFT_OF[directions]
+            # Quien acaba aquí tras MOVE venía de la casilla anterior con la misma orientación
+            previous = ((cell_x - self._DX[directions]) % width) * height + (cell_y - self._DY[directions]) % height
+            after_move = (previous * 4 + directions)[~walls[previous]]
+
+            candidates = np.concatenate((after_left, after_right, after_move))
+            candidates = np.unique(candidates[distances[candidates] == self.UNREACHABLE])
+            distances[candidates] = level
+            frontier = candidates
+        return distances
+
+    # ==================== Consultas ====================
+
+    def distance(self, x: int, y: int, facing: str) -> Optional[int]:
+        """Comandos hasta el objetivo desde (x, y, facing), o None si no se puede llegar"""
+        value = self.distances[self._encode(x, y, DIRECTION_INDEX[facing])]
+        return None if value == self.UNREACHABLE else int(value)
+
+    def path(self, x: int, y: int, facing: str) -> Optional[list[str]]:
+        """Comandos óptimos siguiendo el gradiente, o None si no se puede llegar"""
+        distances = self.distances
+        direction = DIRECTION_INDEX[facing]
+        remaining = distances[self._encode(x, y, direction)]
+        if remaining == self.UNREACHABLE:
+            return None
+
+        commands = []
+        while remaining:
+            dx, dy = DELTAS[direction]
+            next_x = (x - 1 + dx) % self.width + 1
+            next_y = (y - 1 + dy) % self.height + 1
+            # Los estados sobre paredes nunca tienen distancia, así que un MOVE bloqueado no se elige
+            if distances[self._encode(next_x, next_y, direction)] == remaining - 1:
+                x, y = next_x, next_y
+                commands.append(CommandParser.MOVE)
+            elif distances[self._encode(x, y, LEFT_OF[direction])] == remaining - 1:
+                direction = LEFT_OF[direction]
+                commands.append(CommandParser.LEFT)
+            else:
+                direction = RIGHT_OF[direction]
+                commands.append(CommandParser.RIGHT)
+            remaining -= 1
+        return commands
+
+    def _encode(self, x: int, y: int, direction: int) -> int:
+        return ((x - 1) * self.height + (y - 1)) * 4 + direction
+
+    # ==================== Invalidación ====================
+
+    def still_valid_after(self, x: int, y: int) -> bool:
+        """
+        Indica si el campo sigue siendo exacto tras añadir una pared en (x, y)
+
+        Una pared nueva solo elimina transiciones hacia su casilla. Si ningún
+        estado de esa casilla llegaba al objetivo, ningún camino óptimo pasaba
+        por ella y las distancias del resto de estados no cambian.
+        """
+        cell = (x - 1) * self.height + (y - 1)
+        return bool((self.distances[cell * 4:cell * 4 + 4] == self.UNREACHABLE).all())
@@ -0,0 +1,115 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+from models.Board import Board
+from models.Wall import Wall
+from services.DistanceField import DistanceField
+
+
+class DistanceFieldCache:
+    """
+    Campos de distancias por objetivo (x, y, facing) con expulsión LRU por memoria
+
+    Los campos se guardan mientras quepan en `max_bytes`; al superarlo se
+    expulsan los menos usados y un campo que por sí solo no cabe se
+    devuelve sin guardarlo. Un campo solo se reutiliza si el tablero tiene
+    la misma huella (Board.fingerprint) con que se calculó, así que un
+    cambio que no se avisó (p. ej. de otro proceso) nunca da un campo viejo.
+
+    Registrado como oyente de BoardService (on_board_changed), al añadir
+    paredes conserva los campos a los que no afectan (still_valid_after)
+    avanzando su huella y descarta el resto; al crear o borrar el tablero
+    los descarta todos.
+    """
+
+    # 64 MB: unos 8 campos de un tablero de un millón de celdas
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._fields: 'OrderedDict[tuple[int, int, Optional[str]], DistanceField]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Estadísticas de uso
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, board: Board, x: int, y: int, facing: Optional[str] = None) -> DistanceField:
+        """
+        Campo de distancias hasta (x, y) (y facing si se indica), calculándolo si hace falta
+
+        Raises:
+            ValueError: Si el tablero es demasiado grande o el objetivo no es una casilla libre
+        """
+        key = (x, y, facing)
+        fingerprint = board.fingerprint()
+        with self._lock:
+            field = self._fields.get(key)
+            if field is not None and field.fingerprint == fingerprint:
+                self._fields.move_to_end(key)
+                self.hits += 1
+                return field
+            if field is not None:
+                self._discard(key)
+            self.misses += 1
+
+        field = DistanceField(board, x, y, facing)
+        with self._lock:
+            self._store(key, field)
+        return field
+
+    def _store(self, key: tuple[int, int, Optional[str]], field: DistanceField) -> None:
+        if key in self._fields:
+            self._discard(key)
+        if field.nbytes > self.max_bytes:
+            return
+        self._fields[key] = field
+        self._bytes += field.nbytes
+        while self._bytes > self.max_bytes:
+            self._discard(next(iter(self._fields)))
+
+    def _discard(self, key: tuple[int, int, Optional[str]]) -> None:
+        self._bytes -= self._fields.pop(key).nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fields.clear()
+            self._bytes = 0
+
+    # ==================== Cambios del tablero ====================
+
+    def on_board_changed(self, board: Optional[Board], walls: Optional[list[Wall]]) -> None:
+        """
+        Oyente de BoardService: `walls` son las paredes añadidas a `board`, o
+        None si el tablero se creó o se borró
+        """
+        if walls is None:
+            self.clear()
+            return
+
+        with self._lock:
+            if not self._fields:
+                return
+            grid = board.wall_grid()
+            fingerprint = board.grid_fingerprint(grid)
+            for wall in walls:
+                grid[wall.x - 1, wall.y - 1] = False
+            # Solo se reparan campos al día justo antes de estas paredes
+            previous = board.grid_fingerprint(grid)
+
+            for key, field in list(self._fields.items()):
+                repairable = (
+                    field.fingerprint == previous
+                    and all(field.still_valid_after(wall.x, wall.y) for wall in walls)
+                )
+                if repairable:
+                    field.fingerprint = fingerprint
+                else:
+                    self._discard(key)
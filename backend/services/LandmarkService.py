@@ -0,0 +1,54 @@
+import threading
+from typing import Optional
+from models.Board import Board
+from models.Wall import Wall
+from models.Landmarks import Landmarks
+from repositories.LandmarkRepository import LandmarkRepository
+
+
+class LandmarkService:
+    """
+    Preprocesado ALT del tablero: landmarks calculados bajo demanda y persistidos
+
+    get() devuelve la copia en memoria o la del repositorio si su huella
+    coincide con Board.fingerprint del tablero, y si no los calcula (y los
+    guarda). Como oyente de BoardService (on_board_changed) solo olvida la
+    copia en memoria al añadir paredes: el recálculo se hace en la siguiente
+    consulta, no en cada pared. Al borrar el tablero se borra el fichero.
+    """
+
+    def __init__(self, repository: LandmarkRepository, count: int = Landmarks.DEFAULT_COUNT):
+        self._repository = repository
+        self.count = count
+        self._landmarks: Optional[Landmarks] = None
+        self._lock = threading.Lock()
+        # Veces que se calcularon los landmarks
+        self.builds = 0
+
+    def get(self, board: Board) -> Landmarks:
+        """
+        Landmarks al día para el tablero
+
+        Raises:
+            ValueError: Si el tablero no tiene casillas libres
+        """
+        fingerprint = board.fingerprint()
+        with self._lock:
+            landmarks = self._landmarks
+            if landmarks is not None and landmarks.fingerprint == fingerprint:
+                return landmarks
+
+            landmarks = self._repository.load()
+            if landmarks is None or landmarks.fingerprint != fingerprint:
+                landmarks = Landmarks.build(board, self.count)
+                self.builds += 1
+                self._repository.save(landmarks)
+            self._landmarks = landmarks
+            return landmarks
+
+    def on_board_changed(self, board: Optional[Board], walls: Optional[list[Wall]]) -> None:
+        """Oyente de BoardService: las paredes nuevas dejan los landmarks pendientes de recalcular"""
+        with self._lock:
+            self._landmarks = None
+            if board is None:
+                self._repository.delete()
@@ -0,0 +1,159 @@
+import heapq
+from typing import Optional
+from models.Board import Board
+from models.StateSpace import DIRECTIONS, DIRECTION_INDEX, LEFT_OF, RIGHT_OF, DELTAS
+from services.CommandParser import CommandParser
+from models.Landmarks import Landmarks
+from exceptions import PathNotFoundException
+
+
+class PathFinder:
+    """
+    Camino más corto en comandos (MOVE, LEFT, RIGHT) hasta una casilla
+
+    A* sobre los estados (x, y, orientación) con coste 1 por comando, así
+    que un giro cuesta lo mismo que un paso. El tablero es un toro (wrap
+    around en los bordes, como RobotService) y las paredes no se pueden
+    pisar. La heurística es admisible:
+
+        distancia en x en el toro + distancia en y en el toro + giros mínimos
+
+    donde los giros mínimos son 1 si hay que avanzar en los dos ejes o en un
+    eje al que el robot no mira, o si ya está en la casilla y debe acabar
+    con otra orientación. La búsqueda termina al sacar el objetivo de la
+    cola y se aborta si expande más de `max_nodes` estados.
+
+    Con `landmarks` (ALT) la parte de los pasos es el máximo entre la
+    distancia en el toro y la cota de los landmarks, que sí tiene en cuenta
+    las paredes; si los landmarks demuestran que no hay camino la búsqueda
+    termina sin expandir nada.
+    """
+
+    # Estados que puede expandir una búsqueda antes de rendirse
+    DEFAULT_MAX_NODES = 500_000
+
+    def __init__(self, board: Board, max_nodes: int = DEFAULT_MAX_NODES, landmarks: Optional[Landmarks] = None):
+        """
+        Raises:
+            ValueError: Si los landmarks no se calcularon para este tablero
+        """
+        if landmarks is not None and (
+            (landmarks.width, landmarks.height, landmarks.wall_count)
+            != (board.width, board.height, len(board.walls))
+        ):
+            raise ValueError("Los landmarks no corresponden al tablero actual")
+        self.board = board
+        self.max_nodes = max_nodes
+        self.landmarks = landmarks
+        # Estados expandidos en la última búsqueda
+        self.expanded = 0
+
+    def find(self, start: tuple[int, int, str], x: int, y: int, facing: Optional[str] = None) -> list[str]:
+        """
+        Comandos óptimos para ir desde start hasta (x, y), acabando mirando a
+        facing si se indica
+
+        Raises:
+            PathNotFoundException: Si no hay camino o se agota el presupuesto
+        """
+        board = self.board
+        width, height = board.width, board.height
+        if board.has_wall_at(x, y):
+            raise PathNotFoundException(f"No se puede llegar a ({x}, {y}): hay una pared")
+
+        goal_direction = None if facing is None else DIRECTION_INDEX[facing]
+        start_x, start_y, start_facing = start
+        start_state = self._encode(start_x, start_y, DIRECTION_INDEX[start_facing])
+        self.expanded = 0
+
+        lower_bound = None if self.landmarks is None else self.landmarks.lower_bound_to(x, y)
+        if lower_bound is not None and lower_bound(start_x, start_y) is None:
+            raise PathNotFoundException(f"No hay ningún camino hasta ({x}, {y})")
+
+        def heuristic(state_x: int, state_y: int, direction: int) -> int:
+            dx = abs(state_x - x)
+            dx = min(dx, width - dx)
+            dy = abs(state_y - y)
+            dy = min(dy, height - dy)
+            steps = dx + dy
+            if lower_bound is not None:
+                # Los vecinos están en la misma zona que el inicio: la cota nunca es None
+                steps = max(steps, lower_bound(state_x, state_y))
+            # NORTH/SOUTH avanzan en x, EAST/WEST en y
+            along_x = direction % 2 == 0
+            if dx and dy:
+                turns = 1
+            elif dx:
+                turns = 0 if along_x else 1
+            elif dy:
+                turns = 1 if along_x else 0
+            else:
+                turns = 0 if goal_direction is None or goal_direction == direction else 1
+            return steps + turns
+
+        # cola: (f, h, g, estado); a igual f se prefiere el más cercano al objetivo
+        open_heap = [(heuristic(start_x, start_y, DIRECTION_INDEX[start_facing]), 0, 0, start_state)]
+        cost = {start_state: 0}
+        came_from: dict[int, tuple[int, str]] = {}
+
+        while open_heap:
+            _, _, state_cost, state = heapq.heappop(open_heap)
+            if state_cost > cost[state]:
+                # Entrada obsoleta: el estado ya se alcanzó con menos coste
+                continue
+            cell, direction = divmod(state, 4)
+            state_x, state_y = cell // height + 1, cell % height + 1
+            if state_x == x and state_y == y and (goal_direction is None or goal_direction == direction):
+                return self._commands(came_from, state)
+
+            self.expanded += 1
+            if self.expanded > self.max_nodes:
+                raise PathNotFoundException(
+                    f"No se encontró camino a ({x}, {y}) tras explorar {self.max_nodes} estados"
+                )
+
+            dx, dy = DELTAS[direction]
+            next_x = (state_x - 1 + dx) % width + 1
+            next_y = (state_y - 1 + dy) % height + 1
+            neighbours = [
+                (state_x, state_y, LEFT_OF[direction], CommandParser.LEFT),
+                (state_x, state_y, RIGHT_OF[direction], CommandParser.RIGHT)
+            ]
+            if not board.has_wall_at(next_x, next_y):
+                neighbours.append((next_x, next_y, direction, CommandParser.MOVE))
+
+            next_cost = state_cost + 1
+            for neighbour_x, neighbour_y, neighbour_direction, command in neighbours:
+                neighbour = self._encode(neighbour_x, neighbour_y, neighbour_direction)
+                if next_cost < cost.get(neighbour, next_cost + 1):
+                    cost[neighbour] = next_cost
+                    came_from[neighbour] = (state, command)
+                    h = heuristic(neighbour_x, neighbour_y, neighbour_direction)
+                    heapq.heappush(open_heap, (next_cost + h, h, next_cost, neighbour))
+
+        raise PathNotFoundException(f"No hay ningún camino hasta ({x}, {y})")
+
+    def _encode(self, x: int, y: int, direction: int) -> int:
+        return ((x - 1) * self.board.height + (y - 1)) * 4 + direction
+
+    @staticmethod
+    def _commands(came_from: dict[int, tuple[int, str]], state: int) -> list[str]:
+        commands = []
+        while state in came_from:
+            state, command = came_from[state]
+            commands.append(command)
+        commands.reverse()
+        return commands
+
+    def final_position(self, start: tuple[int, int, str], commands: list[str]) -> tuple[int, int, str]:
+        """Posición tras ejecutar los comandos (ya comprobados por find) desde start"""
+        x, y, facing = start
+        direction = DIRECTION_INDEX[facing]
+        for command in commands:
+            if command == CommandParser.LEFT:
+                direction = LEFT_OF[direction]
+            elif command == CommandParser.RIGHT:
+                direction = RIGHT_OF[direction]
+            else:
+                x, y = self.board.advance(x, y, DIRECTIONS[direction], 1)
+        return x, y, DIRECTIONS[direction]
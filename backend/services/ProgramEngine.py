@@ -0,0 +1,173 @@
+from typing import Sequence
+import numpy as np
+from models.Board import Board
+from models.StateSpace import StateSpace
+from services.CommandParser import Command, CommandParser
+
+
+class ProgramEngine:
+    """
+    Ejecuta un programa de comandos k veces en O(W·H·log k)
+
+    Sobre un tablero fijo, un programa de MOVE/LEFT/RIGHT es una función del
+    espacio finito de estados (W·H·4, ver StateSpace). compile() la construye
+    como un array de NumPy `programa[estado] = estado tras ejecutarlo`
+    componiendo las tablas de cada comando, y repeat() aplica el programa k
+    veces con elevación binaria: se recorren los bits de k elevando el
+    programa al cuadrado (programa[programa]) en cada paso.
+
+    Como el espacio de estados es finito, repetir un programa desde un estado
+    acaba siempre en un ciclo: orbit() mide su preperiodo y su periodo con el
+    algoritmo de Brent, en memoria O(1) y sin guardar los estados visitados.
+
+    Un MOVE contra una pared no mueve al robot, igual que en CommandRunner,
+    así que MOVE n es la tabla de MOVE elevada a n. DASH no se admite: sin
+    una pared en la línea no terminaría.
+    """
+
+    PROGRAM_COMMANDS = [CommandParser.MOVE, CommandParser.LEFT, CommandParser.RIGHT]
+
+    def __init__(self, space: StateSpace):
+        self.space = space
+        self._tables = {
+            name: np.frombuffer(space.table(name), dtype=np.uint32)
+            for name in self.PROGRAM_COMMANDS
+        }
+
+    @classmethod
+    def for_board(cls, board: Board) -> 'ProgramEngine':
+        """
+        Raises:
+            ValueError: Si el tablero es demasiado grande para las tablas de estados
+        """
+        space = board.state_space()
+        if space is None:
+            raise ValueError(
+                f"El tablero es demasiado grande para ejecutar programas (máximo {StateSpace.MAX_CELLS} celdas)"
+            )
+        return cls(space)
+
+    def compile(self, commands: Sequence[Command]) -> np.ndarray:
+        """
+        Convierte el programa en su función de estados
+
+        Raises:
+            ValueError: Si el programa tiene comandos inválidos o distintos de MOVE/LEFT/RIGHT
+        """
+        program = np.arange(self.space.size, dtype=np.uint32)
+        for command in commands:
+            # Ejecutar el comando después del programa acumulado
+            program = self._command_table(command)[program]
+        return program
+
+    def _command_table(self, command: Command) -> np.ndarray:
+        if command.error is not None:
+            raise ValueError(f"Comando '{command.source}' no válido: {command.error}")
+        table = self._tables.get(command.name)
+        if table is None:
+            raise ValueError(
+                f"Un programa solo puede contener {', '.join(self.PROGRAM_COMMANDS)} ({command.source})"
+            )
+        if command.args:
+            # MOVE n
+            table = self._power(table, command.args[0])
+        return table
+
+    @staticmethod
+    def _power(table: np.ndarray, times: int) -> np.ndarray:
+        """La función de estados `table` aplicada `times` veces"""
+        result = np.arange(len(table), dtype=table.dtype)
+        while times:
+            if times & 1:
+                result = table[result]
+            times >>= 1
+            if times:
+                table = table[table]
+        return result
+
+    @staticmethod
+    def repeat(program: np.ndarray, times: int, state: int) -> int:
+        """Estado tras aplicar el programa `times` veces desde `state`"""
+        if times < 0:
+            raise ValueError("times no puede ser negativo")
+
+        while times:
+            if times & 1:
+                state = int(program[state])
+            times >>= 1
+            if times:
+                program = program[program]
+        return state
+
+    # ==================== Órbitas ====================
+
+    @staticmethod
+    def orbit(program: np.ndarray, state: int) -> tuple[int, int]:
+        """
+        Preperiodo y periodo de la órbita de `state` bajo el programa
+        (algoritmo de Brent)
+
+        Returns:
+            (preperiodo, periodo): tras `preperiodo` repeticiones el robot
+            entra en el ciclo y vuelve al mismo estado cada `periodo`
+        """
+        # Periodo: la liebre avanza y la tortuga salta a ella en cada potencia de 2
+        power = period = 1
+        tortoise = state
+        hare = int(program[state])
+        while tortoise != hare:
+            if power == period:
+                tortoise = hare
+                power *= 2
+                period = 0
+            hare = int(program[hare])
+            period += 1
+
+        # Preperiodo: dos punteros separados `periodo` pasos se encuentran al entrar al ciclo
+        tortoise = hare = state
+        for _ in range(period):
+            hare = int(program[hare])
+        pre_period = 0
+        while tortoise != hare:
+            tortoise = int(program[tortoise])
+            hare = int(program[hare])
+            pre_period += 1
+        return pre_period, period
+
+    @staticmethod
+    def iterate(program: np.ndarray, state: int, times: int) -> int:
+        """Estado tras aplicar el programa `times` veces, paso a paso"""
+        for _ in range(times):
+            state = int(program[state])
+        return state
+
+    def cycle_cells(self, commands: Sequence[Command], program: np.ndarray, state: int, period: int) -> list[tuple[int, int]]:
+        """
+        Celdas por las que pasa el robot durante el ciclo que empieza en
+        `state`, contando las intermedias de cada comando del programa
+
+        El programa ya debe estar compilado a partir de `commands`.
+        """
+        states = np.empty(period, dtype=np.uint32)
+        for index in range(period):
+            states[index] = state
+            state = int(program[state])
+
+        height = self.space.height
+        visited = np.zeros(self.space.size // 4, dtype=bool)
+        visited[states // 4] = True
+        # Un MOVE n recorre como mucho una línea completa antes de repetir celdas
+        line = max(self.space.width, height)
+        for command in commands:
+            table = self._tables[command.name]
+            if command.args:
+                start = states
+                for _ in range(min(command.args[0], line)):
+                    states = table[states]
+                    visited[states // 4] = True
+                states = self._command_table(command)[start]
+            else:
+                states = table[states]
+                visited[states // 4] = True
+
+        return [(int(cell) // height + 1, int(cell) % height + 1) for cell in np.flatnonzero(visited)]
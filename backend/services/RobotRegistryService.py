@@ -0,0 +1,146 @@
+from models.Board import Board
+from models.RobotRegistry import RobotRegistry
+from repositories.RobotRegistryRepository import RobotRegistryRepository
+from services.BoardService import BoardService
+from exceptions import (
+    WallCollisionException,
+    RobotOutOfBoundsException
+)
+
+
+class RobotRegistryService:
+    """
+    Servicio para gestionar varios robots sobre el mismo tablero
+
+    Cada robot se bloquea con las paredes y con los demás robots; las
+    colisiones entre robots se comprueban con el índice de posiciones del
+    registro (RobotRegistry) sin recorrer todos los robots.
+    """
+    
+    def __init__(self, repository: RobotRegistryRepository, board_service: BoardService):
+        self._repository = repository
+        self._board_service = board_service
+    
+    def list_robots(self) -> list[tuple[str, int, int, str]]:
+        """Retorna (id, x, y, facing) de todos los robots"""
+        registry = self._repository.load()
+        if registry is None:
+            return []
+        return [(robot_id, *robot.get_position()) for robot_id, robot in registry]
+    
+    def create(self, x: int, y: int, facing: str) -> tuple[str, tuple[int, int, str]]:
+        """
+        Crea un robot con un identificador nuevo y lo coloca
+        
+        Returns:
+            (id, (x, y, facing))
+        """
+        robot_id = RobotRegistry.new_robot_id()
+        return robot_id, self.place(robot_id, x, y, facing)
+    
+    def place(self, robot_id: str, x: int, y: int, facing: str) -> tuple[int, int, str]:
+        """
+        Coloca un robot (lo crea si no existe) o lo reposiciona
+        
+        Raises:
+            ValueError: Si no existe un tablero creado o el id no es válido
+            InvalidDirectionException: Si la dirección no es válida
+            WallCollisionException: Si hay una pared en esa posición
+            RobotCollisionException: Si otro robot ocupa esa posición
+        """
+        board = self._get_board()
+        
+        if board.has_wall_at(x, y):
+            raise WallCollisionException(
+                f"No se puede colocar el robot en ({x}, {y}): hay una pared"
+            )
+        
+        if not board.is_inside(x, y):
+            raise RobotOutOfBoundsException(
+                "El robot no puede estar fuera de los limites del tablero"
+            )
+        
+        registry = self._load_registry()
+        robot = registry.place(robot_id, x, y, facing)
+        self._repository.save(registry)
+        return robot.get_position()
+    
+    def move(self, robot_id: str) -> tuple[int, int, str]:
+        """
+        Mueve un robot hacia adelante con wrap around en los bordes
+        
+        Raises:
+            ValueError: Si no existe un tablero creado
+            RobotNotFoundException: Si no existe el robot
+            WallCollisionException: Si hay una pared en la siguiente posición
+            RobotCollisionException: Si otro robot ocupa la siguiente posición
+        """
+        board = self._get_board()
+        registry = self._load_registry()
+        robot = registry.get(robot_id)
+        
+        next_x, next_y = board.wrap_position(*robot.get_next_position())
+        if board.has_wall_at(next_x, next_y):
+            raise WallCollisionException(
+                f"No se puede mover: hay una pared en ({next_x}, {next_y})"
+            )
+        
+        registry.move_to(robot_id, next_x, next_y)
+        self._repository.save(registry)
+        return robot.get_position()
+    
+    def left(self, robot_id: str) -> tuple[int, int, str]:
+        """
+        Gira un robot 90 grados a la izquierda
+        
+        Raises:
+            RobotNotFoundException: Si no existe el robot
+        """
+        registry = self._load_registry()
+        robot = registry.get(robot_id)
+        robot.turn_left()
+        self._repository.save(registry)
+        return robot.get_position()
+    
+    def right(self, robot_id: str) -> tuple[int, int, str]:
+        """
+        Gira un robot 90 grados a la derecha
+        
+        Raises:
+            RobotNotFoundException: Si no existe el robot
+        """
+        registry = self._load_registry()
+        robot = registry.get(robot_id)
+        robot.turn_right()
+        self._repository.save(registry)
+        return robot.get_position()
+    
+    def report(self, robot_id: str) -> tuple[int, int, str]:
+        """
+        Obtiene la posición y orientación de un robot
+        
+        Raises:
+            RobotNotFoundException: Si no existe el robot
+        """
+        return self._load_registry().get(robot_id).get_position()
+    
+    def delete(self, robot_id: str) -> None:
+        """
+        Elimina un robot
+        
+        Raises:
+            RobotNotFoundException: Si no existe el robot
+        """
+        registry = self._load_registry()
+        registry.remove(robot_id)
+        self._repository.save(registry)
+    
+    def _get_board(self) -> Board:
+        board = self._board_service.get_board()
+        if board is None:
+            raise ValueError("No existe un tablero creado")
+        return board
+    
+    def _load_registry(self) -> RobotRegistry:
+        registry = self._repository.load()
+        return registry if registry is not None else RobotRegistry()
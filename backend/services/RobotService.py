@@ -1,25 +1,48 @@
 from typing import Optional
+from models.Board import Board
 from models.Robot import Robot
+from models.StateSpace import StateSpace
 from repositories.RobotRepository import RobotRepository
 from services.BoardService import BoardService
+from services.CommandParser import Command
+from services.CommandRunner import CommandRunner
+from services.ProgramEngine import ProgramEngine
+from services.PathFinder import PathFinder
+from services.DistanceFieldCache import DistanceFieldCache
+from services.LandmarkService import LandmarkService
 from exceptions import (
+    PathNotFoundException,
     RobotNotPlacedException,
     WallCollisionException,
-    RobotOutOfBoundsException
+    RobotOutOfBoundsException,
+    InvalidDirectionException
 )
 
 
 class RobotService:
     """Servicio para gestionar el robot del juego"""
     
-    def __init__(self, robot_repository: RobotRepository, board_service: BoardService):
+    def __init__(
+        self,
+        robot_repository: RobotRepository,
+        board_service: BoardService,
+        distance_fields: Optional[DistanceFieldCache] = None,
+        landmarks: Optional[LandmarkService] = None
+    ):
         self._repository = robot_repository
         self._board_service = board_service
+        # Campos de distancias para goto (sin caché se usa A* en cada petición)
+        self._distance_fields = distance_fields
+        # Landmarks ALT para el A* de goto en los tableros sin campos de distancias
+        self._landmarks = landmarks
     
-    def place(self, x: int, y: int, facing: str) -> None:
+    def place(self, x: int, y: int, facing: str) -> tuple[int, int, str]:
         """
         Coloca el robot en una posición (o lo reposiciona si ya existe)
         
+        Returns:
+            (x, y, facing) tras colocarlo
+        
         Raises:
             ValueError: Si no existe un tablero creado
             InvalidDirectionException: Si la dirección no es válida
@@ -49,12 +72,16 @@ class RobotService:
         
         # Persistir
         self._repository.save(robot)
+        return robot.get_position()
     
-    def move(self) -> None:
+    def move(self) -> tuple[int, int, str]:
         """
         Mueve el robot hacia adelante según su orientación
         Con wrap around en los bordes del tablero
         
+        Returns:
+            (x, y, facing) tras el movimiento
+        
         Raises:
             ValueError: Si no existe un tablero creado
             RobotNotPlacedException: Si el robot no ha sido colocado
@@ -94,10 +121,67 @@ class RobotService:
         
         # Persistir
         self._repository.save(robot)
+        return robot.get_position()
+    
+    def move_steps(self, steps: int) -> tuple[int, int, str]:
+        """
+        Avanza hasta `steps` celdas y se detiene antes de la primera pared
+        
+        Returns:
+            (x, y, facing) tras el movimiento
+        
+        Raises:
+            ValueError: Si no existe un tablero creado o steps no es positivo
+            RobotNotPlacedException: Si el robot no ha sido colocado
+            WallCollisionException: Si hay una pared en la siguiente posición
+        """
+        if steps < 1:
+            raise ValueError("El número de pasos debe ser positivo")
+        return self._advance(steps)
     
-    def left(self) -> None:
+    def dash(self) -> tuple[int, int, str]:
+        """
+        Avanza hasta la casilla anterior a la siguiente pared
+        
+        Returns:
+            (x, y, facing) tras el movimiento
+        
+        Raises:
+            ValueError: Si no existe un tablero creado o no hay pared en esa dirección
+            RobotNotPlacedException: Si el robot no ha sido colocado
+            WallCollisionException: Si hay una pared en la siguiente posición
+        """
+        return self._advance(None)
+    
+    def _advance(self, limit: Optional[int]) -> tuple[int, int, str]:
+        """Movimiento largo con el índice de paredes del tablero (Board.free_steps)"""
+        board = self._board_service.get_board()
+        if board is None:
+            raise ValueError("No existe un tablero creado")
+        
+        robot = self._repository.load()
+        if robot is None or not robot.is_placed():
+            raise RobotNotPlacedException("El robot no ha sido colocado en el tablero")
+        
+        steps = board.free_steps(robot.x, robot.y, robot.facing, limit)
+        if steps is None:
+            raise ValueError(f"No hay ninguna pared mirando a {robot.facing}")
+        if steps == 0:
+            wall_x, wall_y = board.advance(robot.x, robot.y, robot.facing, 1)
+            raise WallCollisionException(
+                f"No se puede mover: hay una pared en ({wall_x}, {wall_y})"
+            )
+        
+        robot.x, robot.y = board.advance(robot.x, robot.y, robot.facing, steps)
+        self._repository.save(robot)
+        return robot.get_position()
+    
+    def left(self) -> tuple[int, int, str]:
         """
         Gira el robot 90 grados a la izquierda
+        
+        Returns:
+            (x, y, facing) tras el giro
 
         RobotNotPlacedException: Si el robot no ha sido colocado
         """
@@ -107,11 +191,15 @@ class RobotService:
         
         robot.turn_left()
         self._repository.save(robot)
+        return robot.get_position()
     
-    def right(self) -> None:
+    def right(self) -> tuple[int, int, str]:
         """
         Gira el robot 90 grados a la derecha
         
+        Returns:
+            (x, y, facing) tras el giro
+        
         RobotNotPlacedException: Si el robot no ha sido colocado
         """
         robot = self._repository.load()
@@ -120,6 +208,7 @@ class RobotService:
         
         robot.turn_right()
         self._repository.save(robot)
+        return robot.get_position()
     
     def report(self) -> Optional[tuple[int, int, str]]:
         """
@@ -134,6 +223,188 @@ class RobotService:
         
         return robot.get_position()
     
+    def run_commands(self, commands: list[Command]) -> CommandRunner:
+        """
+        Ejecuta un script completo cargando el tablero y el robot una vez
+        y persistiendo el robot una sola vez al final (si ha cambiado)
+        
+        Returns:
+            El CommandRunner con los informes, los errores y el robot final
+        
+        Raises:
+            ValueError: Si no existe un tablero creado
+        """
+        board = self._board_service.get_board()
+        if board is None:
+            raise ValueError("No existe un tablero creado")
+        
+        robot = self._repository.load()
+        if robot is None:
+            robot = Robot()
+        
+        runner = CommandRunner(board, robot).run(commands)
+        if runner.changed:
+            self._repository.save(robot)
+        return runner
+    
+    def repeat_program(self, commands: list[Command], times: int) -> tuple[int, int, str]:
+        """
+        Ejecuta un programa de MOVE/LEFT/RIGHT `times` veces en O(W·H·log times)
+        y persiste la posición final
+        
+        Returns:
+            (x, y, facing) tras las repeticiones
+        
+        Raises:
+            ValueError: Si no hay tablero, el programa no es válido o times es negativo
+            RobotNotPlacedException: Si el robot no ha sido colocado
+        """
+        board = self._board_service.get_board()
+        if board is None:
+            raise ValueError("No existe un tablero creado")
+        
+        robot = self._repository.load()
+        if robot is None or not robot.is_placed():
+            raise RobotNotPlacedException("El robot no ha sido colocado en el tablero")
+        
+        engine = ProgramEngine.for_board(board)
+        program = engine.compile(commands)
+        state = engine.repeat(program, times, robot.to_state(engine.space))
+        
+        robot.set_state(engine.space, state)
+        self._repository.save(robot)
+        return robot.get_position()
+    
+    def goto(
+        self,
+        x: int,
+        y: int,
+        facing: Optional[str] = None,
+        execute: bool = False
+    ) -> tuple[list[str], tuple[int, int, str]]:
+        """
+        Calcula la secuencia de comandos más corta hasta (x, y) (y facing si
+        se indica) y, si execute es True, la aplica con un único guardado
+        
+        Returns:
+            (comandos, posición final)
+        
+        Raises:
+            ValueError: Si no existe un tablero creado
+            RobotNotPlacedException: Si el robot no ha sido colocado
+            InvalidDirectionException: Si la orientación de destino no es válida
+            RobotOutOfBoundsException: Si el destino está fuera del tablero
+            PathNotFoundException: Si no hay camino o la búsqueda agota su presupuesto
+        """
+        board = self._board_service.get_board()
+        if board is None:
+            raise ValueError("No existe un tablero creado")
+        
+        robot = self._repository.load()
+        if robot is None or not robot.is_placed():
+            raise RobotNotPlacedException("El robot no ha sido colocado en el tablero")
+        
+        if facing is not None and facing not in Robot.VALID_DIRECTIONS:
+            raise InvalidDirectionException(
+                f"Dirección '{facing}' no válida. Debe ser: {', '.join(Robot.VALID_DIRECTIONS)}"
+            )
+        if not board.is_inside(x, y):
+            raise RobotOutOfBoundsException(
+                "El robot no puede estar fuera de los limites del tablero"
+            )
+        
+        start = robot.get_position()
+        if self._distance_fields is not None and StateSpace.fits(board.width, board.height):
+            finder = PathFinder(board)
+            commands = self._cached_path(board, start, x, y, facing)
+        else:
+            landmarks = None if self._landmarks is None else self._landmarks.get(board)
+            finder = PathFinder(board, landmarks=landmarks)
+            commands = finder.find(start, x, y, facing)
+        position = finder.final_position(start, commands)
+        
+        if execute and commands:
+            robot.x, robot.y, robot.facing = position
+            self._repository.save(robot)
+        return commands, position
+    
+    def _cached_path(
+        self,
+        board: Board,
+        start: tuple[int, int, str],
+        x: int,
+        y: int,
+        facing: Optional[str]
+    ) -> list[str]:
+        """Camino óptimo bajando por el campo de distancias cacheado del objetivo"""
+        if board.has_wall_at(x, y):
+            raise PathNotFoundException(f"No se puede llegar a ({x}, {y}): hay una pared")
+        
+        field = self._distance_fields.get(board, x, y, facing)
+        commands = field.path(*start)
+        if commands is None:
+            raise PathNotFoundException(f"No hay ningún camino hasta ({x}, {y})")
+        return commands
+    
+    def analyze_orbit(
+        self,
+        commands: list[Command],
+        start: Optional[tuple[int, int, str]] = None,
+        times: Optional[int] = None
+    ) -> tuple[int, int, list[tuple[int, int]], Optional[tuple[int, int, str]]]:
+        """
+        Analiza la órbita de un programa de MOVE/LEFT/RIGHT repetido sin fin
+        desde `start` (o desde la posición del robot). No mueve el robot.
+        
+        Returns:
+            (preperiodo, periodo, celdas del ciclo, posición tras `times`
+            repeticiones o None si no se pide)
+        
+        Raises:
+            ValueError: Si no hay tablero, el programa o el inicio no son válidos o times es negativo
+            RobotNotPlacedException: Si no se da inicio y el robot no ha sido colocado
+            InvalidDirectionException: Si la dirección de inicio no es válida
+            WallCollisionException: Si hay una pared en la posición de inicio
+        """
+        board = self._board_service.get_board()
+        if board is None:
+            raise ValueError("No existe un tablero creado")
+        
+        if start is None:
+            robot = self._repository.load()
+            if robot is None or not robot.is_placed():
+                raise RobotNotPlacedException("El robot no ha sido colocado en el tablero")
+        else:
+            x, y, facing = start
+            if not board.is_inside(x, y):
+                raise RobotOutOfBoundsException(
+                    "El robot no puede estar fuera de los limites del tablero"
+                )
+            if board.has_wall_at(x, y):
+                raise WallCollisionException(f"No se puede empezar en ({x}, {y}): hay una pared")
+            # El dominio valida la dirección
+            robot = Robot()
+            robot.place(x, y, facing)
+        
+        if times is not None and times < 0:
+            raise ValueError("times no puede ser negativo")
+        
+        engine = ProgramEngine.for_board(board)
+        program = engine.compile(commands)
+        state = robot.to_state(engine.space)
+        pre_period, period = engine.orbit(program, state)
+        
+        cycle_start = engine.iterate(program, state, pre_period)
+        cells = engine.cycle_cells(commands, program, cycle_start, period)
+        
+        position = None
+        if times is not None:
+            # Dentro del ciclo solo importa el resto módulo el periodo
+            if times > pre_period:
+                times = pre_period + (times - pre_period) % period
+            position = engine.space.decode(engine.iterate(program, state, times))
+        return pre_period, period, cells, position
+    
     def robot_exists(self) -> bool:
         """Verifica si existe un robot persistido"""
         return self._repository.exists()
@@ -150,8 +421,4 @@ class RobotService:
         Ejemplo: si coordinate = 0 y max_value = 5 → retorna 5
                  si coordinate = 6 y max_value = 5 → retorna 1
         """
-        if coordinate < 1:
-            return max_value
-        elif coordinate > max_value:
-            return 1
-        return coordinate
\ No newline at end of file
+        return Board.wrap_coordinate(coordinate, max_value)
@@ -0,0 +1,268 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Optional
+from models.Board import Board
+from models.Wall import Wall
+from models.WallBitmap import WallBitmap
+from services.BoardService import BoardService
+from services.SimulationWorker import SimulationWorker
+
+
+class SimulationBatch:
+    """Estado de un lote de simulaciones enviado al pool"""
+
+    def __init__(self, batch_id: str, total: int):
+        self.id = batch_id
+        self.total = total
+        self.completed = 0
+        # Resultado de cada trabajo en el orden de la petición (None si está pendiente)
+        self.results: list[Optional[dict]] = [None] * total
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self.pending_tasks = 0
+        self.memory: list[shared_memory.SharedMemory] = []
+
+    @property
+    def done(self) -> bool:
+        return self.finished is not None
+
+
+class SimulationService:
+    """
+    Ejecuta lotes de simulaciones (tablero, inicio, programa) fuera del hilo
+    de la petición, repartidos entre los núcleos con un ProcessPoolExecutor
+
+    Cada tablero del lote se copia una sola vez a un bloque de memoria
+    compartida con el formato de WallBitmap; las tareas solo llevan el
+    nombre del bloque y los procesos reconstruyen el tablero sobre él
+    (SimulationWorker). Los trabajos se envían en tandas de JOBS_PER_TASK
+    para no pagar la comunicación entre procesos por cada trabajo. Los
+    bloques se liberan cuando termina la última tanda del lote.
+    """
+
+    # Trabajos por tarea del pool
+    JOBS_PER_TASK = 64
+    # Trabajos por lote
+    MAX_JOBS = 10_000
+    # Tableros por lote y celdas por tablero
+    MAX_BOARDS = 16
+    MAX_BOARD_CELLS = 10_000_000
+
+    def __init__(self, board_service: BoardService, max_workers: Optional[int] = None, max_batches: int = 100):
+        self._board_service = board_service
+        self._max_workers = max_workers or os.cpu_count() or 1
+        # Lotes que se conservan; al superarlo se olvidan los terminados más antiguos
+        self._max_batches = max_batches
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._batches: 'OrderedDict[str, SimulationBatch]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """El pool se crea con el primer lote, no al arrancar el servidor"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._executor
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Olvida un pool roto (murió un proceso) para que el siguiente lote cree otro"""
+        with self._lock:
+            if self._executor is pool:
+                self._executor = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # ==================== Lotes ====================
+
+    def submit(self, boards: Optional[list[dict]], jobs: list[dict]) -> str:
+        """
+        Valida el lote, lo envía al pool y devuelve su id sin esperar
+
+        `boards` es una lista de {width, height, walls: [{x, y}]} (o None para
+        usar el tablero actual) y cada trabajo {board?, start: {x, y, facing},
+        program, times?}, donde board es el índice en `boards` (0 por defecto).
+
+        Raises:
+            ValueError: Si el lote, algún tablero o algún trabajo no son válidos
+        """
+        if not jobs:
+            raise ValueError('Se requiere al menos un trabajo')
+        if len(jobs) > self.MAX_JOBS:
+            raise ValueError(f'Como máximo {self.MAX_JOBS} trabajos por lote')
+
+        board_list = self._boards(boards)
+        tasks: dict[int, list[tuple[int, dict]]] = {}
+        for index, job in enumerate(jobs):
+            board_index, worker_job = self._job(index, job, len(board_list))
+            tasks.setdefault(board_index, []).append((index, worker_job))
+
+        batch = SimulationBatch(uuid.uuid4().hex, len(jobs))
+        specs = {}
+        try:
+            for board_index in tasks:
+                memory, spec = self._share(board_list[board_index])
+                batch.memory.append(memory)
+                specs[board_index] = spec
+        except BaseException:
+            self._release(batch)
+            raise
+
+        chunks = [
+            (board_index, entries[start:start + self.JOBS_PER_TASK])
+            for board_index, entries in tasks.items()
+            for start in range(0, len(entries), self.JOBS_PER_TASK)
+        ]
+        batch.pending_tasks = len(chunks)
+
+        pool = self._pool()
+        futures = []
+        try:
+            for board_index, chunk in chunks:
+                futures.append(pool.submit(SimulationWorker.run_jobs, specs[board_index], [job for _, job in chunk]))
+        except BaseException as error:
+            # El lote no llega a existir: sus tandas no terminarían nunca
+            for future in futures:
+                future.cancel()
+            self._release(batch)
+            if isinstance(error, BrokenProcessPool):
+                self._discard_pool(pool)
+            raise
+
+        self._remember(batch)
+        for future, (_, chunk) in zip(futures, chunks):
+            future.add_done_callback(
+                lambda future, batch=batch, indexes=[index for index, _ in chunk]: self._collect(batch, indexes, future)
+            )
+        return batch.id
+
+    def get(self, batch_id: str) -> Optional[SimulationBatch]:
+        """Lote con ese id, o None si no existe o ya se olvidó"""
+        with self._lock:
+            return self._batches.get(batch_id)
+
+    def close(self) -> None:
+        """Detiene el pool y libera la memoria compartida de los lotes pendientes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            batches = list(self._batches.values())
+        for batch in batches:
+            self._release(batch)
+
+    # ==================== Validación ====================
+
+    def _boards(self, boards: Optional[list[dict]]) -> list[Board]:
+        if boards is None:
+            board = self._board_service.get_board()
+            if board is None:
+                raise ValueError('No existe un tablero creado: indica boards en la petición')
+            return [board]
+
+        if not isinstance(boards, list) or not boards:
+            raise ValueError('boards debe ser una lista de tableros')
+        if len(boards) > self.MAX_BOARDS:
+            raise ValueError(f'Como máximo {self.MAX_BOARDS} tableros por lote')
+
+        result = []
+        for index, data in enumerate(boards):
+            try:
+                width, height = int(data['width']), int(data['height'])
+                walls = [Wall(int(wall['x']), int(wall['y'])) for wall in data.get('walls', [])]
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f'Tablero {index}: se requieren width, height y walls [{{x, y}}]')
+            if width < 1 or height < 1 or width * height > self.MAX_BOARD_CELLS:
+                raise ValueError(f'Tablero {index}: entre 1 y {self.MAX_BOARD_CELLS} celdas')
+
+            board = Board(width, height, storage=Board.STORAGE_DENSE)
+            _, rejected = board.add_walls(walls)
+            if rejected:
+                raise ValueError(f'Tablero {index}: {rejected[0][1]}')
+            result.append(board)
+        return result
+
+    @staticmethod
+    def _job(index: int, job: dict, board_count: int) -> tuple[int, dict]:
+        if not isinstance(job, dict):
+            raise ValueError(f'Trabajo {index}: debe ser un objeto')
+        start = job.get('start')
+        program = job.get('program')
+        if not isinstance(start, dict) or program is None:
+            raise ValueError(f'Trabajo {index}: se requieren start {{x, y, facing}} y program')
+
+        try:
+            board_index = int(job.get('board', 0))
+            x, y, facing = int(start['x']), int(start['y']), str(start['facing']).upper()
+            times = None if job.get('times') is None else int(job['times'])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f'Trabajo {index}: board, start y times deben ser números')
+        if not 0 <= board_index < board_count:
+            raise ValueError(f'Trabajo {index}: no existe el tablero {board_index}')
+        if times is not None and times < 0:
+            raise ValueError(f'Trabajo {index}: times no puede ser negativo')
+        if not isinstance(program, (str, list)):
+            raise ValueError(f'Trabajo {index}: program debe ser texto o una lista de comandos')
+
+        return board_index, {'start': (x, y, facing), 'program': program, 'times': times}
+
+    # ==================== Memoria compartida ====================
+
+    @staticmethod
+    def _share(board: Board) -> tuple[shared_memory.SharedMemory, tuple[str, int, int, int]]:
+        """Copia las paredes del tablero a un bloque compartido con el formato de WallBitmap"""
+        walls = board.walls
+        if not isinstance(walls, WallBitmap):
+            walls = WallBitmap(board.width, board.height, walls)
+        bits = walls.buffer()
+
+        memory = shared_memory.SharedMemory(create=True, size=len(bits))
+        memory.buf[:len(bits)] = bits
+        return memory, (memory.name, board.width, board.height, len(walls))
+
+    @staticmethod
+    def _release(batch: SimulationBatch) -> None:
+        memory_blocks, batch.memory = batch.memory, []
+        for memory in memory_blocks:
+            memory.close()
+            try:
+                memory.unlink()
+            except FileNotFoundError:
+                pass
+
+    # ==================== Resultados ====================
+
+    def _remember(self, batch: SimulationBatch) -> None:
+        with self._lock:
+            self._batches[batch.id] = batch
+            if len(self._batches) > self._max_batches:
+                for batch_id, old in list(self._batches.items()):
+                    if len(self._batches) <= self._max_batches:
+                        break
+                    if old.done:
+                        del self._batches[batch_id]
+
+    def _collect(self, batch: SimulationBatch, indexes: list[int], future: Future) -> None:
+        """Guarda los resultados de una tanda (se llama desde el hilo del pool)"""
+        if future.cancelled():
+            results = [{'error': 'Simulación cancelada'}] * len(indexes)
+        elif future.exception() is not None:
+            results = [{'error': f'Error en la simulación: {future.exception()}'}] * len(indexes)
+        else:
+            results = future.result()
+
+        with self._lock:
+            for index, result in zip(indexes, results):
+                batch.results[index] = result
+            batch.completed += len(indexes)
+            batch.pending_tasks -= 1
+            finished = batch.pending_tasks == 0
+            if finished:
+                batch.finished = time.time()
+        if finished:
+            self._release(batch)
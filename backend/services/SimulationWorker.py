@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import Optional
+from models.Board import Board
+from models.Robot import Robot
+from models.WallBitmap import WallBitmap
+from services.CommandParser import Command, CommandParser
+from services.CommandRunner import CommandRunner
+from services.ProgramEngine import ProgramEngine
+
+
+class SimulationWorker:
+    """
+    Código que ejecutan los procesos del pool de simulaciones
+
+    Los tableros llegan como memoria compartida con el mapa de bits de
+    WallBitmap: cada proceso se conecta a un bloque la primera vez que lo
+    ve y reconstruye el Board sobre él sin copiarlo (buffer=). Los tableros
+    conectados se conservan entre tareas, así sus tablas de estados se
+    construyen una vez por proceso y no una por trabajo.
+    """
+
+    # Tableros conectados que conserva cada proceso
+    MAX_ATTACHED_BOARDS = 8
+
+    # nombre del bloque -> (SharedMemory, Board), solo dentro de cada proceso
+    _attached: 'OrderedDict[str, tuple[shared_memory.SharedMemory, Board]]' = OrderedDict()
+
+    @classmethod
+    def run_jobs(cls, board_spec: tuple[str, int, int, int], jobs: list[dict]) -> list[dict]:
+        """Ejecuta una tanda de trabajos sobre el mismo tablero"""
+        board = cls._board(*board_spec)
+        return [cls.run_job(board, job) for job in jobs]
+
+    @classmethod
+    def _board(cls, name: str, width: int, height: int, wall_count: int) -> Board:
+        attached = cls._attached.get(name)
+        if attached is not None:
+            cls._attached.move_to_end(name)
+            return attached[1]
+
+        memory = shared_memory.SharedMemory(name=name)
+        bits = memory.buf[:WallBitmap.size_for(width, height)]
+        walls = WallBitmap(width, height, buffer=bits, count=wall_count)
+        board = Board(width, height, storage=Board.STORAGE_DENSE, walls=walls)
+
+        cls._attached[name] = (memory, board)
+        while len(cls._attached) > cls.MAX_ATTACHED_BOARDS:
+            _, (old_memory, old_board) = cls._attached.popitem(last=False)
+            del old_board
+            try:
+                old_memory.close()
+            except BufferError:
+                # Aún hay vistas vivas del bloque: se libera al recogerlas
+                pass
+        return board
+
+    @staticmethod
+    def run_job(board: Board, job: dict) -> dict:
+        """
+        Ejecuta un trabajo {start: (x, y, facing), program, times?}
+
+        Sin `times` el programa se ejecuta una vez con CommandRunner y se
+        devuelven sus informes y errores; con `times` se repite con
+        ProgramEngine. Los fallos se devuelven como {"error": mensaje}.
+        """
+        x, y, facing = job['start']
+        try:
+            commands = CommandParser.parse(job['program'])
+            runner = CommandRunner(board, Robot())
+            code, message = runner.execute(Command(CommandParser.PLACE, (x, y, facing)))
+            if code != CommandRunner.OK:
+                return {'error': message}
+
+            times: Optional[int] = job.get('times')
+            if times is None:
+                runner.run(commands)
+                return {
+                    'position': SimulationWorker._position(runner.robot.get_position()),
+                    'reports': [SimulationWorker._position(report) for report in runner.reports],
+                    'errors': [
+                        {'index': index, 'command': command.source, 'code': code, 'message': message}
+                        for index, command, code, message in runner.errors
+                    ]
+                }
+
+            engine = ProgramEngine.for_board(board)
+            program = engine.compile(commands)
+            state = engine.repeat(program, times, runner.robot.to_state(engine.space))
+            return {'position': SimulationWorker._position(engine.space.decode(state))}
+        except ValueError as e:
+            return {'error': str(e)}
+
+    @staticmethod
+    def _position(position: tuple[int, int, str]) -> dict:
+        x, y, facing = position
+        return {'x': x, 'y': y, 'facing': facing}
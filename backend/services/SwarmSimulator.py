@@ -0,0 +1,197 @@
+import time
+from collections import deque
+from typing import Iterable, Sequence, Union
+import numpy as np
+from models.Board import Board
+from models.Robot import Robot
+from models.StateSpace import DIRECTIONS, DIRECTION_INDEX, LEFT_OF, RIGHT_OF, DELTAS
+from services.CommandParser import CommandParser
+from exceptions import (
+    InvalidDirectionException,
+    WallCollisionException,
+    RobotOutOfBoundsException
+)
+
+
+class SwarmSimulator:
+    """
+    Simula miles de robots a la vez con las reglas de Robot/RobotService
+
+    Los robots se guardan como estructura de arrays (x, y y orientación en
+    arrays de NumPy) y cada tick aplica un comando a todos los robots en una
+    única operación vectorizada: MOVE avanza con wrap around salvo que la
+    celda siguiente sea una pared (el robot se queda donde está) y LEFT/RIGHT
+    giran con las mismas tablas que Robot. Las paredes se consultan en un
+    mapa de bits W x H del tablero.
+
+    Los robots no chocan entre sí, igual que el robot de /api/robot, que
+    solo se bloquea con las paredes.
+
+    Cada tick registra (robots, segundos, bloqueados) en `history`, de donde
+    salen las cifras de rendimiento (comandos de robot por segundo).
+    """
+
+    # Códigos de comando para los ticks con un comando distinto por robot
+    MOVE, LEFT, RIGHT = range(3)
+    COMMAND_CODES = {CommandParser.MOVE: MOVE, CommandParser.LEFT: LEFT, CommandParser.RIGHT: RIGHT}
+
+    # Ticks que se conservan en `history`
+    HISTORY_SIZE = 1000
+
+    _DX = np.array([dx for dx, _ in DELTAS], dtype=np.int32)
+    _DY = np.array([dy for _, dy in DELTAS], dtype=np.int32)
+    _LEFT_OF = np.array(LEFT_OF, dtype=np.int8)
+    _RIGHT_OF = np.array(RIGHT_OF, dtype=np.int8)
+
+    def __init__(self, board: Board, x, y, facing):
+        """
+        Raises:
+            ValueError: Si los arrays no tienen la misma longitud
+            InvalidDirectionException: Si alguna orientación no es válida
+            RobotOutOfBoundsException: Si algún robot está fuera del tablero
+            WallCollisionException: Si algún robot está sobre una pared
+        """
+        self.width = board.width
+        self.height = board.height
+        self.walls = board.wall_grid()
+
+        self.x = np.array(x, dtype=np.int32)
+        self.y = np.array(y, dtype=np.int32)
+        self.direction = self._direction_array(facing)
+        if not (self.x.shape == self.y.shape == self.direction.shape) or self.x.ndim != 1:
+            raise ValueError("x, y y facing deben ser listas de la misma longitud")
+        self._validate_positions()
+
+        self.ticks = 0
+        self.history: deque[tuple[int, float, int]] = deque(maxlen=self.HISTORY_SIZE)
+
+    @classmethod
+    def from_positions(cls, board: Board, positions: Iterable[tuple[int, int, str]]) -> 'SwarmSimulator':
+        """Crea el simulador a partir de posiciones (x, y, facing)"""
+        positions = list(positions)
+        return cls(
+            board,
+            [x for x, _, _ in positions],
+            [y for _, y, _ in positions],
+            [facing for _, _, facing in positions]
+        )
+
+    def _direction_array(self, facing) -> np.ndarray:
+        facing = list(facing)
+        invalid = [name for name in facing if name not in DIRECTION_INDEX]
+        if invalid:
+            raise InvalidDirectionException(
+                f"Dirección '{invalid[0]}' no válida. Debe ser: {', '.join(Robot.VALID_DIRECTIONS)}"
+            )
+        return np.array([DIRECTION_INDEX[name] for name in facing], dtype=np.int8)
+
+    def _validate_positions(self) -> None:
+        outside = (self.x < 1) | (self.x > self.width) | (self.y < 1) | (self.y > self.height)
+        if outside.any():
+            raise RobotOutOfBoundsException(
+                f"El robot no puede estar fuera de los limites del tablero (robot {int(np.argmax(outside))})"
+            )
+        on_wall = self.walls[self.x - 1, self.y - 1]
+        if on_wall.any():
+            index = int(np.argmax(on_wall))
+            raise WallCollisionException(
+                f"No se puede colocar el robot en ({self.x[index]}, {self.y[index]}): hay una pared"
+            )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    # ==================== Simulación ====================
+
+    def step(self, commands: Union[str, Sequence[int], np.ndarray]) -> int:
+        """
+        Ejecuta un tick: un comando para todos los robots (MOVE, LEFT o
+        RIGHT) o un array con el código de comando de cada robot
+
+        Returns:
+            Número de robots que no se movieron por una pared
+        """
+        start = time.perf_counter()
+        if isinstance(commands, str):
+            blocked = self._apply(self._command_code(commands), slice(None))
+        else:
+            codes = np.asarray(commands)
+            if codes.shape != self.x.shape:
+                raise ValueError(f"Se esperaba un comando por robot ({len(self)})")
+            blocked = 0
+            for code in (self.MOVE, self.LEFT, self.RIGHT):
+                selected = np.flatnonzero(codes == code)
+                if len(selected):
+                    blocked += self._apply(code, selected)
+
+        self.ticks += 1
+        self.history.append((len(self), time.perf_counter() - start, blocked))
+        return blocked
+
+    def run(self, program: Iterable[str], times: int = 1) -> int:
+        """
+        Ejecuta el programa (un comando por tick para todos los robots) `times` veces
+
+        Returns:
+            Número total de movimientos bloqueados por paredes
+        """
+        program = list(program)
+        for command in program:
+            # Validar el programa completo antes de ejecutar ningún tick
+            self._command_code(command)
+
+        blocked = 0
+        for _ in range(times):
+            for command in program:
+                blocked += self.step(command)
+        return blocked
+
+    def _command_code(self, command: str) -> int:
+        code = self.COMMAND_CODES.get(command.upper())
+        if code is None:
+            raise ValueError(
+                f"Comando '{command}' no válido. Debe ser: {', '.join(self.COMMAND_CODES)}"
+            )
+        return code
+
+    def _apply(self, code: int, selected) -> int:
+        """Aplica un comando a los robots seleccionados (slice o índices)"""
+        direction = self.direction[selected]
+        if code == self.LEFT:
+            self.direction[selected] = self._LEFT_OF[direction]
+            return 0
+        if code == self.RIGHT:
+            self.direction[selected] = self._RIGHT_OF[direction]
+            return 0
+
+        x = self.x[selected]
+        y = self.y[selected]
+        # Wrap around: del borde se pasa a la casilla 1 y de la 1 al borde
+        next_x = (x - 1 + self._DX[direction]) % self.width + 1
+        next_y = (y - 1 + self._DY[direction]) % self.height + 1
+        blocked = self.walls[next_x - 1, next_y - 1]
+        self.x[selected] = np.where(blocked, x, next_x)
+        self.y[selected] = np.where(blocked, y, next_y)
+        return int(np.count_nonzero(blocked))
+
+    # ==================== Resultados ====================
+
+    def positions(self) -> list[tuple[int, int, str]]:
+        """(x, y, facing) de cada robot"""
+        return [
+            (int(x), int(y), DIRECTIONS[direction])
+            for x, y, direction in zip(self.x, self.y, self.direction)
+        ]
+
+    def last_tick_rate(self) -> float:
+        """Comandos de robot por segundo del último tick"""
+        if not self.history:
+            return 0.0
+        robots, seconds, _ = self.history[-1]
+        return robots / seconds if seconds > 0 else float('inf')
+
+    def throughput(self) -> float:
+        """Comandos de robot por segundo de los ticks de `history`"""
+        robots = sum(robots for robots, _, _ in self.history)
+        seconds = sum(seconds for _, seconds, _ in self.history)
+        return robots / seconds if seconds > 0 else 0.0
@@ -6,6 +6,7 @@ from werkzeug.exceptions import BadRequest
 from controllers.BoardController import BoardController
 from models.Board import Board
 from models.Wall import Wall
+from exceptions import WallOutOfBoundsException, WallAlreadyExistsException
 
 
 @pytest.fixture
@@ -260,4 +261,154 @@ class TestBoardControllerAddWallUnit:
         
         # Assert
         assert status_code == 201
-        mock_board_service.add_wall.assert_called_once()
\ No newline at end of file
+        mock_board_service.add_wall.assert_called_once()
+
+class TestBoardControllerAddWallsUnit:
+    """Tests unitarios para POST /walls"""
+    
+    def test_add_walls_with_coordinates(self, app, board_controller, mock_board_service):
+        """Debe añadir una lista de coordenadas en una sola llamada al servicio"""
+        # Arrange
+        mock_board_service.add_walls.side_effect = lambda walls: (walls, [])
+        
+        # Act
+        with app.test_request_context(
+            '/api/board/walls',
+            method='POST',
+            json={'walls': [[1, 2], {'x': 3, 'y': 4}]},
+            content_type='application/json'
+        ):
+            response, status_code = board_controller.add_walls()
+        
+        # Assert
+        assert status_code == 201
+        data = response.get_json()
+        assert data['success'] is True
+        assert data['added'] == 2
+        assert data['rejected'] == []
+        mock_board_service.add_walls.assert_called_once()
+        walls = mock_board_service.add_walls.call_args[0][0]
+        assert [(w.x, w.y) for w in walls] == [(1, 2), (3, 4)]
+    
+    def test_add_walls_accepts_top_level_list(self, app, board_controller, mock_board_service):
+        """Debe aceptar directamente una lista de coordenadas"""
+        # Arrange
+        mock_board_service.add_walls.side_effect = lambda walls: (walls, [])
+        
+        # Act
+        with app.test_request_context(
+            '/api/board/walls',
+            method='POST',
+            json=[[1, 1], [2, 2]],
+            content_type='application/json'
+        ):
+            response, status_code = board_controller.add_walls()
+        
+        # Assert
+        assert status_code == 201
+        assert response.get_json()['added'] == 2
+    
+    def test_add_walls_expands_rectangles(self, app, board_controller, mock_board_service):
+        """Debe expandir rectángulos y segmentos en paredes"""
+        # Arrange
+        mock_board_service.add_walls.side_effect = lambda walls: (walls, [])
+        
+        # Act
+        with app.test_request_context(
+            '/api/board/walls',
+            method='POST',
+            json={'rects': [{'x1': 1, 'y1': 1, 'x2': 2, 'y2': 3}, {'x1': 5, 'y1': 5, 'x2': 5, 'y2': 6}]},
+            content_type='application/json'
+        ):
+            response, status_code = board_controller.add_walls()
+        
+        # Assert
+        walls = mock_board_service.add_walls.call_args[0][0]
+        assert len(walls) == 8
+        assert (walls[-1].x, walls[-1].y) == (5, 6)
+    
+    def test_add_walls_reports_rejected_entries(self, app, board_controller, mock_board_service):
+        """Debe informar de cada pared rechazada"""
+        # Arrange
+        def add_walls(walls):
+            return walls[:1], [(walls[1], WallOutOfBoundsException('fuera del tablero'))]
+        mock_board_service.add_walls.side_effect = add_walls
+        
+        # Act
+        with app.test_request_context(
+            '/api/board/walls',
+            method='POST',
+            json={'walls': [[1, 1], [99, 99]]},
+            content_type='application/json'
+        ):
+            response, status_code = board_controller.add_walls()
+        
+        # Assert
+        assert status_code == 201
+        data = response.get_json()
+        assert data['added'] == 1
+        assert data['rejected'] == [{
+            'x': 99,
+            'y': 99,
+            'error': 'WallOutOfBoundsException',
+            'message': 'fuera del tablero'
+        }]
+    
+    def test_add_walls_returns_400_when_all_rejected(self, app, board_controller, mock_board_service):
+        """Debe devolver 400 si no se añade ninguna pared"""
+        # Arrange
+        mock_board_service.add_walls.side_effect = lambda walls: (
+            [], [(w, WallAlreadyExistsException('Ya existe una pared')) for w in walls]
+        )
+        
+        # Act
+        with app.test_request_context(
+            '/api/board/walls',
+            method='POST',
+            json={'walls': [[1, 1]]},
+            content_type='application/json'
+        ):
+            response, status_code = board_controller.add_walls()
+        
+        # Assert
+        assert status_code == 400
+        assert response.get_json()['success'] is False
+    
+    def test_add_walls_with_empty_json(self, app, board_controller, mock_board_service):
+        """Debe lanzar ValueError si el JSON está vacío"""
+        with app.test_request_context(
+            '/api/board/walls',
+            method='POST',
+            json={},
+            content_type='application/json'
+        ):
+            with pytest.raises(ValueError, match='Body JSON requerido'):
+                board_controller.add_walls()
+        
+        mock_board_service.add_walls.assert_not_called()
+    
+    def test_add_walls_with_invalid_rect(self, app, board_controller, mock_board_service):
+        """Debe lanzar ValueError si un rectángulo está incompleto"""
+        with app.test_request_context(
+            '/api/board/walls',
+            method='POST',
+            json={'rects': [{'x1': 1, 'y1': 1}]},
+            content_type='application/json'
+        ):
+            with pytest.raises(ValueError, match='x1, y1, x2 e y2 son requeridos'):
+                board_controller.add_walls()
+    
+    def test_add_walls_rejects_too_many_cells(self, app, board_controller, mock_board_service):
+        """Debe limitar el número de paredes por petición"""
+        board_controller.MAX_BULK_WALLS = 10
+        
+        with app.test_request_context(
+            '/api/board/walls',
+            method='POST',
+            json={'rects': [{'x1': 1, 'y1': 1, 'x2': 5, 'y2': 5}]},
+            content_type='application/json'
+        ):
+            with pytest.raises(ValueError, match='Como máximo 10 paredes'):
+                board_controller.add_walls()
+        
+        mock_board_service.add_walls.assert_not_called()
@@ -0,0 +1,66 @@
+# tests/unit/controllers/test_game_controller.py
+import pytest
+from unittest.mock import Mock
+from flask import Flask
+from controllers.GameController import GameController
+
+
+@pytest.fixture
+def app():
+    """Crea una app Flask mínima para el contexto"""
+    app = Flask(__name__)
+    return app
+
+
+@pytest.fixture
+def mock_game_store():
+    return Mock()
+
+
+@pytest.fixture
+def game_controller(mock_game_store):
+    return GameController(mock_game_store)
+
+
+class TestGameControllerUnit:
+    """Tests unitarios del controlador de partidas"""
+    
+    def test_create_game_returns_new_id(self, app, game_controller, mock_game_store):
+        """Debe devolver el identificador de la partida nueva"""
+        # Arrange
+        mock_game_store.create.return_value = 'abc123'
+        
+        # Act
+        with app.test_request_context('/api/games', method='POST'):
+            response, status_code = game_controller.create()
+        
+        # Assert
+        assert status_code == 201
+        assert response.get_json()['game_id'] == 'abc123'
+        mock_game_store.create.assert_called_once_with()
+    
+    def test_delete_game_success(self, app, game_controller, mock_game_store):
+        """Debe eliminar una partida existente"""
+        # Arrange
+        mock_game_store.exists.return_value = True
+        
+        # Act
+        with app.test_request_context('/api/games/abc123', method='DELETE'):
+            response, status_code = game_controller.delete('abc123')
+        
+        # Assert
+        assert status_code == 200
+        mock_game_store.delete.assert_called_once_with('abc123')
+    
+    def test_delete_missing_game_returns_404(self, app, game_controller, mock_game_store):
+        """Debe devolver 404 si la partida no existe"""
+        # Arrange
+        mock_game_store.exists.return_value = False
+        
+        # Act
+        with app.test_request_context('/api/games/abc123', method='DELETE'):
+            response, status_code = game_controller.delete('abc123')
+        
+        # Assert
+        assert status_code == 404
+        mock_game_store.delete.assert_not_called()
@@ -4,6 +4,10 @@ from unittest.mock import Mock
 from flask import Flask
 from werkzeug.exceptions import BadRequest
 from controllers.RobotController import RobotController
+from models.Board import Board
+from models.Robot import Robot
+from services.CommandParser import Command
+from services.CommandRunner import CommandRunner
 
 
 @pytest.fixture
@@ -150,7 +154,7 @@ class TestRobotControllerMove:
     def test_move_robot_success(self, app, robot_controller, mock_robot_service):
         """Debe mover el robot exitosamente"""
         # Arrange
-        mock_robot_service.report.return_value = (3, 4, 'NORTH')
+        mock_robot_service.move.return_value = (3, 4, 'NORTH')
         
         # Act
         with app.test_request_context('/api/robot/move', method='POST'):
@@ -165,7 +169,42 @@ class TestRobotControllerMove:
         assert data['position']['y'] == 4
         assert data['position']['facing'] == 'NORTH'
         mock_robot_service.move.assert_called_once()
-        mock_robot_service.report.assert_called_once()
+        mock_robot_service.report.assert_not_called()
+    
+    def test_move_robot_with_steps(self, app, robot_controller, mock_robot_service):
+        """Con {"steps": n} debe avanzar varias celdas"""
+        # Arrange
+        mock_robot_service.move_steps.return_value = (7, 4, 'NORTH')
+        
+        # Act
+        with app.test_request_context('/api/robot/move', method='POST', json={'steps': 4}):
+            response, status_code = robot_controller.move()
+        
+        # Assert
+        assert status_code == 200
+        assert response.get_json()['position']['x'] == 7
+        mock_robot_service.move_steps.assert_called_once_with(4)
+        mock_robot_service.move.assert_not_called()
+
+
+class TestRobotControllerDash:
+    """Tests para POST /api/robot/dash"""
+    
+    def test_dash_robot_success(self, app, robot_controller, mock_robot_service):
+        """Debe avanzar hasta la siguiente pared"""
+        # Arrange
+        mock_robot_service.dash.return_value = (9, 4, 'NORTH')
+        
+        # Act
+        with app.test_request_context('/api/robot/dash', method='POST'):
+            response, status_code = robot_controller.dash()
+        
+        # Assert
+        assert status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+        assert data['position'] == {'x': 9, 'y': 4, 'facing': 'NORTH'}
+        mock_robot_service.dash.assert_called_once()
 
 
 class TestRobotControllerLeft:
@@ -174,7 +213,7 @@ class TestRobotControllerLeft:
     def test_left_robot_success(self, app, robot_controller, mock_robot_service):
         """Debe girar el robot a la izquierda exitosamente"""
         # Arrange
-        mock_robot_service.report.return_value = (2, 3, 'WEST')
+        mock_robot_service.left.return_value = (2, 3, 'WEST')
         
         # Act
         with app.test_request_context('/api/robot/left', method='POST'):
@@ -189,7 +228,7 @@ class TestRobotControllerLeft:
         assert data['position']['y'] == 3
         assert data['position']['facing'] == 'WEST'
         mock_robot_service.left.assert_called_once()
-        mock_robot_service.report.assert_called_once()
+        mock_robot_service.report.assert_not_called()
 
 
 class TestRobotControllerRight:
@@ -198,7 +237,7 @@ class TestRobotControllerRight:
     def test_right_robot_success(self, app, robot_controller, mock_robot_service):
         """Debe girar el robot a la derecha exitosamente"""
         # Arrange
-        mock_robot_service.report.return_value = (1, 2, 'EAST')
+        mock_robot_service.right.return_value = (1, 2, 'EAST')
         
         # Act
         with app.test_request_context('/api/robot/right', method='POST'):
@@ -213,7 +252,7 @@ class TestRobotControllerRight:
         assert data['position']['y'] == 2
         assert data['position']['facing'] == 'EAST'
         mock_robot_service.right.assert_called_once()
-        mock_robot_service.report.assert_called_once()
+        mock_robot_service.report.assert_not_called()
 
 
 class TestRobotControllerReport:
@@ -269,4 +308,177 @@ class TestRobotControllerDelete:
         data = response.get_json()
         assert data['success'] is True
         assert data['message'] == 'Robot eliminado exitosamente'
-        mock_robot_service.delete_robot.assert_called_once()
\ No newline at end of file
+        mock_robot_service.delete_robot.assert_called_once()
+
+class TestRobotControllerCommands:
+    """Tests para POST /api/robot/commands"""
+    
+    @pytest.fixture
+    def runner(self):
+        """Resultado de ejecutar un script"""
+        robot = Robot()
+        robot.place(2, 1, 'NORTH')
+        runner = CommandRunner(Board(5, 5), robot)
+        runner.executed = 3
+        runner.reports = [(2, 1, 'NORTH')]
+        runner.errors = [(1, Command('MOVE', (), 'MOVE'), CommandRunner.WALL_COLLISION, 'pared')]
+        return runner
+    
+    def test_run_text_script(self, app, robot_controller, mock_robot_service, runner):
+        """Debe aceptar un script de texto plano"""
+        # Arrange
+        mock_robot_service.run_commands.return_value = runner
+        
+        # Act
+        with app.test_request_context(
+            '/api/robot/commands',
+            method='POST',
+            data='PLACE 2,1,NORTH\nMOVE\nREPORT',
+            content_type='text/plain'
+        ):
+            response, status_code = robot_controller.run_commands()
+        
+        # Assert
+        assert status_code == 200
+        commands = mock_robot_service.run_commands.call_args[0][0]
+        assert [c.name for c in commands] == ['PLACE', 'MOVE', 'REPORT']
+        data = response.get_json()
+        assert data['success'] is False
+        assert data['reports'] == [{'x': 2, 'y': 1, 'facing': 'NORTH'}]
+        assert data['errors'] == [
+            {'index': 1, 'command': 'MOVE', 'code': 'WALL_COLLISION', 'message': 'pared'}
+        ]
+        assert data['position'] == {'x': 2, 'y': 1, 'facing': 'NORTH'}
+    
+    def test_run_json_list(self, app, robot_controller, mock_robot_service, runner):
+        """Debe aceptar una lista JSON de comandos"""
+        # Arrange
+        mock_robot_service.run_commands.return_value = runner
+        
+        # Act
+        with app.test_request_context('/api/robot/commands', method='POST', json=['MOVE', 'LEFT']):
+            robot_controller.run_commands()
+        
+        # Assert
+        commands = mock_robot_service.run_commands.call_args[0][0]
+        assert [c.name for c in commands] == ['MOVE', 'LEFT']
+    
+    def test_run_empty_script_raises(self, app, robot_controller, mock_robot_service):
+        """Debe rechazar un script vacío"""
+        with app.test_request_context(
+            '/api/robot/commands', method='POST', data='', content_type='text/plain'
+        ):
+            with pytest.raises(ValueError):
+                robot_controller.run_commands()
+        
+        mock_robot_service.run_commands.assert_not_called()
+
+
+class TestRobotControllerRepeatProgram:
+    """Tests para POST /api/robot/program/repeat"""
+    
+    def test_repeat_program_success(self, app, robot_controller, mock_robot_service):
+        """Debe ejecutar el programa y devolver la posición final"""
+        # Arrange
+        mock_robot_service.repeat_program.return_value = (3, 4, 'WEST')
+        
+        # Act
+        with app.test_request_context(
+            '/api/robot/program/repeat',
+            method='POST',
+            json={'program': 'MOVE\nLEFT', 'times': 1000}
+        ):
+            response, status_code = robot_controller.repeat_program()
+        
+        # Assert
+        assert status_code == 200
+        commands, times = mock_robot_service.repeat_program.call_args[0]
+        assert [c.name for c in commands] == ['MOVE', 'LEFT']
+        assert times == 1000
+        assert response.get_json()['position'] == {'x': 3, 'y': 4, 'facing': 'WEST'}
+    
+    def test_repeat_program_requires_times(self, app, robot_controller, mock_robot_service):
+        """Debe exigir program y times"""
+        with app.test_request_context(
+            '/api/robot/program/repeat', method='POST', json={'program': 'MOVE'}
+        ):
+            with pytest.raises(ValueError):
+                robot_controller.repeat_program()
+
+
+class TestRobotControllerGoto:
+    """Tests para POST /api/robot/goto"""
+    
+    def test_goto_success(self, app, robot_controller, mock_robot_service):
+        """Debe devolver los comandos y la posición final"""
+        # Arrange
+        mock_robot_service.goto.return_value = (['MOVE', 'LEFT'], (2, 1, 'WEST'))
+        
+        # Act
+        with app.test_request_context(
+            '/api/robot/goto', method='POST', json={'x': 2, 'y': 1, 'facing': 'west', 'execute': True}
+        ):
+            response, status_code = robot_controller.goto()
+        
+        # Assert
+        assert status_code == 200
+        data = response.get_json()
+        assert data['commands'] == ['MOVE', 'LEFT']
+        assert data['executed'] is True
+        assert data['position'] == {'x': 2, 'y': 1, 'facing': 'WEST'}
+        mock_robot_service.goto.assert_called_once_with(2, 1, 'WEST', True)
+    
+    def test_goto_requires_coordinates(self, app, robot_controller, mock_robot_service):
+        """Debe rechazar una petición sin x e y"""
+        with app.test_request_context('/api/robot/goto', method='POST', json={'x': 2}):
+            with pytest.raises(ValueError):
+                robot_controller.goto()
+        
+        mock_robot_service.goto.assert_not_called()
+    
+    def test_goto_rejects_non_text_facing(self, app, robot_controller, mock_robot_service):
+        """Una dirección que no es texto es un error de validación, no un 500"""
+        with app.test_request_context(
+            '/api/robot/goto', method='POST', json={'x': 2, 'y': 1, 'facing': 5}
+        ):
+            with pytest.raises(ValueError, match='facing'):
+                robot_controller.goto()
+        
+        mock_robot_service.goto.assert_not_called()
+
+
+class TestRobotControllerOrbit:
+    """Tests para POST /api/analysis/orbit"""
+    
+    def test_orbit_success(self, app, robot_controller, mock_robot_service):
+        """Debe devolver preperiodo, periodo, celdas del ciclo y posición"""
+        # Arrange
+        mock_robot_service.analyze_orbit.return_value = (2, 3, [(1, 1), (1, 2)], (1, 2, 'EAST'))
+        
+        # Act
+        with app.test_request_context(
+            '/api/analysis/orbit',
+            method='POST',
+            json={'program': ['MOVE', 'LEFT'], 'start': {'x': 1, 'y': 1, 'facing': 'east'}, 'times': 10 ** 12}
+        ):
+            response, status_code = robot_controller.orbit()
+        
+        # Assert
+        assert status_code == 200
+        commands, start, times = mock_robot_service.analyze_orbit.call_args[0]
+        assert [c.name for c in commands] == ['MOVE', 'LEFT']
+        assert start == (1, 1, 'EAST')
+        assert times == 10 ** 12
+        data = response.get_json()
+        assert data['pre_period'] == 2
+        assert data['period'] == 3
+        assert data['cycle_cells'] == [{'x': 1, 'y': 1}, {'x': 1, 'y': 2}]
+        assert data['position'] == {'x': 1, 'y': 2, 'facing': 'EAST'}
+    
+    def test_orbit_requires_program(self, app, robot_controller, mock_robot_service):
+        """Debe rechazar una petición sin programa"""
+        with app.test_request_context('/api/analysis/orbit', method='POST', json={'times': 3}):
+            with pytest.raises(ValueError):
+                robot_controller.orbit()
+        
+        mock_robot_service.analyze_orbit.assert_not_called()
@@ -0,0 +1,73 @@
+import pytest
+from unittest.mock import Mock
+from flask import Flask
+from controllers.RobotRegistryController import RobotRegistryController
+
+
+@pytest.fixture
+def app():
+    """Crea una app Flask mínima para el contexto"""
+    app = Flask(__name__)
+    return app
+
+
+@pytest.fixture
+def mock_registry_service():
+    return Mock()
+
+
+@pytest.fixture
+def registry_controller(mock_registry_service):
+    return RobotRegistryController(mock_registry_service)
+
+
+class TestRobotRegistryController:
+    """Tests para /api/robots"""
+    
+    def test_create_robot(self, app, registry_controller, mock_registry_service):
+        """Debe crear el robot y devolver su id"""
+        # Arrange
+        mock_registry_service.create.return_value = ('abc', (1, 2, 'NORTH'))
+        
+        # Act
+        with app.test_request_context('/api/robots', method='POST', json={'x': 1, 'y': 2, 'facing': 'north'}):
+            response, status_code = registry_controller.create()
+        
+        # Assert
+        assert status_code == 201
+        data = response.get_json()
+        assert data['id'] == 'abc'
+        assert data['position'] == {'x': 1, 'y': 2, 'facing': 'NORTH'}
+        mock_registry_service.create.assert_called_once_with(1, 2, 'NORTH')
+    
+    def test_create_requires_coordinates(self, app, registry_controller, mock_registry_service):
+        """Debe rechazar un cuerpo sin x, y y facing"""
+        with app.test_request_context('/api/robots', method='POST', json={'x': 1}):
+            with pytest.raises(ValueError):
+                registry_controller.create()
+        
+        mock_registry_service.create.assert_not_called()
+    
+    def test_move_robot(self, app, registry_controller, mock_registry_service):
+        """Debe mover el robot indicado"""
+        # Arrange
+        mock_registry_service.move.return_value = (2, 2, 'NORTH')
+        
+        # Act
+        with app.test_request_context('/api/robots/abc/move', method='POST'):
+            response, status_code = registry_controller.move('abc')
+        
+        # Assert
+        assert status_code == 200
+        assert response.get_json()['position'] == {'x': 2, 'y': 2, 'facing': 'NORTH'}
+        mock_registry_service.move.assert_called_once_with('abc')
+    
+    def test_list_robots(self, app, registry_controller, mock_registry_service):
+        """Debe listar todos los robots"""
+        mock_registry_service.list_robots.return_value = [('a', 1, 1, 'NORTH')]
+        
+        with app.test_request_context('/api/robots'):
+            response, status_code = registry_controller.list()
+        
+        assert status_code == 200
+        assert response.get_json()['robots'] == [{'id': 'a', 'x': 1, 'y': 1, 'facing': 'NORTH'}]
@@ -0,0 +1,77 @@
+import pytest
+from unittest.mock import Mock
+from flask import Flask
+from controllers.SimulationController import SimulationController
+from services.SimulationService import SimulationBatch
+
+
+@pytest.fixture
+def app():
+    """Crea una app Flask mínima para el contexto"""
+    app = Flask(__name__)
+    return app
+
+
+@pytest.fixture
+def mock_simulation_service():
+    return Mock()
+
+
+@pytest.fixture
+def simulation_controller(mock_simulation_service):
+    return SimulationController(mock_simulation_service)
+
+
+class TestSimulationController:
+    """Tests para /api/simulations"""
+    
+    def test_create_returns_batch_id(self, app, simulation_controller, mock_simulation_service):
+        """Debe encolar el lote y devolver 202 con su id"""
+        # Arrange
+        mock_simulation_service.submit.return_value = 'abc'
+        jobs = [{'start': {'x': 1, 'y': 1, 'facing': 'NORTH'}, 'program': 'MOVE'}]
+        
+        # Act
+        with app.test_request_context('/api/simulations', method='POST', json={'jobs': jobs}):
+            response, status_code = simulation_controller.create()
+        
+        # Assert
+        assert status_code == 202
+        assert response.get_json()['id'] == 'abc'
+        mock_simulation_service.submit.assert_called_once_with(None, jobs)
+    
+    def test_create_requires_jobs(self, app, simulation_controller, mock_simulation_service):
+        """Debe rechazar una petición sin lista de trabajos"""
+        with app.test_request_context('/api/simulations', method='POST', json={'boards': []}):
+            with pytest.raises(ValueError):
+                simulation_controller.create()
+        
+        mock_simulation_service.submit.assert_not_called()
+    
+    def test_get_reports_progress(self, app, simulation_controller, mock_simulation_service):
+        """Debe devolver el progreso y los resultados parciales"""
+        # Arrange
+        batch = SimulationBatch('abc', 4)
+        batch.completed = 1
+        batch.results[0] = {'position': {'x': 1, 'y': 1, 'facing': 'NORTH'}}
+        mock_simulation_service.get.return_value = batch
+        
+        # Act
+        with app.test_request_context('/api/simulations/abc'):
+            response, status_code = simulation_controller.get('abc')
+        
+        # Assert
+        assert status_code == 200
+        data = response.get_json()
+        assert data['status'] == 'running'
+        assert data['progress'] == 0.25
+        assert data['results'][1] is None
+    
+    def test_get_unknown_batch(self, app, simulation_controller, mock_simulation_service):
+        """Un lote desconocido devuelve 404"""
+        mock_simulation_service.get.return_value = None
+        
+        with app.test_request_context('/api/simulations/nada'):
+            _, status_code = simulation_controller.get('nada')
+        
+        assert status_code == 404
@@ -1,6 +1,10 @@
+import copy
+import pickle
+
 import pytest
 from models.Board import Board
 from models.Wall import Wall
+from models.WallList import WallList
 from exceptions import WallOutOfBoundsException, WallAlreadyExistsException
 
 
@@ -229,3 +233,197 @@ class TestBoard:
         small_board.add_wall(wall4)
         
         assert len(small_board.walls) == 4
+
+
+    # ==================== Tests de add_walls ====================
+
+    @pytest.mark.parametrize('storage', Board.VALID_STORAGES)
+    def test_add_walls_reports_each_rejection(self, storage):
+        """Debe añadir las válidas en orden y rechazar el resto con su motivo"""
+        # Arrange
+        board = Board(10, 10, storage=storage)
+        board.add_wall(Wall(5, 5))
+        walls = [Wall(3, 3), Wall(0, 1), Wall(5, 5), Wall(1, 2), Wall(3, 3), Wall(11, 1), Wall(10, 10)]
+
+        # Act
+        added, rejected = board.add_walls(walls)
+
+        # Assert
+        assert [(w.x, w.y) for w in added] == [(3, 3), (1, 2), (10, 10)]
+        assert [(w.x, w.y, type(e)) for w, e in rejected] == [
+            (0, 1, WallOutOfBoundsException),
+            (5, 5, WallAlreadyExistsException),
+            (3, 3, WallAlreadyExistsException),
+            (11, 1, WallOutOfBoundsException),
+        ]
+        assert len(board.walls) == 4
+        assert board.pending_walls()[1:] == added
+
+    def test_add_walls_rejects_huge_coordinates(self, board):
+        """Coordenadas que no caben en un entero de 64 bits se rechazan sin fallar"""
+        added, rejected = board.add_walls([Wall(10**30, 1), Wall(2, 2)])
+
+        assert [(w.x, w.y) for w in added] == [(2, 2)]
+        assert isinstance(rejected[0][1], WallOutOfBoundsException)
+
+    def test_add_walls_in_bulk_on_dense_board(self):
+        """Debe marcar de una vez las paredes del lote en el mapa de bits"""
+        # Arrange
+        board = Board(1000, 1000, storage=Board.STORAGE_DENSE)
+        walls = [Wall(x, y) for x in range(1, 1001) for y in range(1, 101)]
+
+        # Act
+        added, rejected = board.add_walls(walls + [Wall(1, 1)])
+
+        # Assert
+        assert len(added) == 100_000
+        assert [(w.x, w.y) for w, _ in rejected] == [(1, 1)]
+        assert len(board.walls) == 100_000
+        assert board.has_wall_at(1000, 100) and not board.has_wall_at(1000, 101)
+
+    def test_add_walls_keeps_derived_structures_up_to_date(self):
+        """Las tablas de transición y el índice por filas siguen al día"""
+        # Arrange
+        board = Board(10, 10)
+        board.state_space()
+        board.wall_rays()
+
+        # Act
+        board.add_walls([Wall(1, 5), Wall(20, 20)])
+
+        # Assert
+        assert board.state_space(build=False) is not None
+        assert board.free_steps(1, 1, 'EAST') == 3
+
+
+    # ==================== Tests de fingerprint ====================
+
+    def test_fingerprint_changes_with_walls(self):
+        """La huella depende de las paredes y las dimensiones"""
+        board = Board(10, 10)
+        empty = board.fingerprint()
+        board.add_wall(Wall(3, 3))
+
+        assert board.fingerprint() != empty
+        assert Board(10, 10).fingerprint() == empty
+        assert Board(5, 20).fingerprint() != empty
+
+    @pytest.mark.parametrize('storage', Board.VALID_STORAGES)
+    def test_fingerprint_does_not_depend_on_storage(self, storage):
+        """Las mismas paredes dan la misma huella con cualquier almacenamiento"""
+        board = Board(9, 7, storage=storage)
+        board.add_walls([Wall(1, 1), Wall(9, 7), Wall(4, 2)])
+        expected = Board(9, 7, storage=Board.STORAGE_LIST)
+        expected.add_walls([Wall(4, 2), Wall(1, 1), Wall(9, 7)])
+
+        assert board.fingerprint() == expected.fingerprint()
+        assert board.fingerprint() == board.grid_fingerprint(board.wall_grid())
+
+
+    # ==================== Tests de copia ====================
+
+    @pytest.mark.parametrize('storage', Board.VALID_STORAGES)
+    def test_deepcopy_is_independent(self, storage):
+        """Las copias comparten paredes hasta que una de ellas se modifica"""
+        board = Board(100, 100, storage=storage)
+        board.add_walls([Wall(1, 1), Wall(70, 70)])
+
+        clone = copy.deepcopy(board)
+        clone.add_wall(Wall(2, 2))
+        board.add_wall(Wall(71, 70))
+
+        assert clone.has_wall_at(2, 2) and not board.has_wall_at(2, 2)
+        assert board.has_wall_at(71, 70) and not clone.has_wall_at(71, 70)
+        assert clone.has_wall_at(70, 70) and len(clone.walls) == 3
+        assert clone.version == board.version
+
+    def test_deepcopy_skips_derived_structures(self):
+        """La copia no arrastra las tablas de transición ni el índice de filas"""
+        board = Board(10, 10)
+        board.add_wall(Wall(5, 5))
+        board.state_space()
+        board.wall_rays()
+
+        clone = copy.deepcopy(board)
+
+        assert clone._state_space is None and clone._wall_rays is None
+        assert clone.free_steps(1, 5, 'NORTH') == 3
+
+
+class TestWallList:
+    """Tests unitarios para el índice de paredes de WallList"""
+
+    def test_wall_list_is_a_list(self):
+        """Debe seguir comportándose como una lista"""
+        walls = WallList([Wall(x=1, y=2)])
+
+        assert isinstance(walls, list)
+        assert len(walls) == 1
+        assert walls.has(1, 2) is True
+
+    def test_wall_list_keeps_insertion_order(self):
+        """Debe iterar las paredes en el orden de inserción"""
+        walls = WallList()
+        walls.append(Wall(x=3, y=3))
+        walls.append(Wall(x=1, y=1))
+        walls.append(Wall(x=2, y=2))
+
+        assert [(w.x, w.y) for w in walls] == [(3, 3), (1, 1), (2, 2)]
+
+    def test_wall_list_supports_tuple_membership(self):
+        """Debe permitir comprobar pertenencia por coordenadas"""
+        walls = WallList([Wall(x=4, y=5)])
+
+        assert (4, 5) in walls
+        assert (5, 4) not in walls
+
+    def test_wall_list_region_outside_board_is_empty(self):
+        """Una región fuera del tablero no devuelve paredes"""
+        walls = WallList([Wall(x=10, y=10)])
+
+        assert list(walls.walls_in_region(20, 20, 30, 30)) == []
+        assert list(walls.walls_in_region(30, 30, 20, 20)) == []
+        assert [(w.x, w.y) for w in walls.walls_in_region(12, 12, 5, 5)] == [(10, 10)]
+
+    def test_wall_list_updates_index_on_removal(self):
+        """Debe actualizar el índice al eliminar paredes"""
+        walls = WallList([Wall(x=1, y=1), Wall(x=2, y=2), Wall(x=3, y=3)])
+
+        walls.pop()
+        del walls[0]
+
+        assert walls.has(1, 1) is False
+        assert walls.has(2, 2) is True
+        assert walls.has(3, 3) is False
+
+    def test_wall_list_counts_duplicate_coordinates(self):
+        """Debe mantener la pared mientras quede alguna en esa coordenada"""
+        first = Wall(x=1, y=1)
+        walls = WallList([first, Wall(x=1, y=1)])
+
+        walls.remove(first)
+
+        assert walls.has(1, 1) is True
+
+    def test_wall_list_updates_index_on_setitem_and_clear(self):
+        """Debe actualizar el índice al reemplazar y vaciar"""
+        walls = WallList([Wall(x=1, y=1)])
+
+        walls[0] = Wall(x=2, y=2)
+        assert walls.has(1, 1) is False
+        assert walls.has(2, 2) is True
+
+        walls.clear()
+        assert walls.has(2, 2) is False
+
+    def test_wall_list_survives_pickle_and_deepcopy(self):
+        """Debe reconstruir el índice al serializar y copiar"""
+        walls = WallList([Wall(x=1, y=1), Wall(x=2, y=3)])
+
+        for clone in (pickle.loads(pickle.dumps(walls)), copy.deepcopy(walls)):
+            assert isinstance(clone, WallList)
+            assert [(w.x, w.y) for w in clone] == [(1, 1), (2, 3)]
+            assert clone.has(2, 3) is True
+            clone.remove(clone[0])
+            assert clone.has(1, 1) is False
+            assert walls.has(1, 1) is True
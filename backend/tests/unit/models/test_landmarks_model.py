@@ -0,0 +1,106 @@
+import random
+from collections import deque
+import numpy as np
+import pytest
+from models.Board import Board
+from models.Wall import Wall
+from models.Landmarks import Landmarks
+
+
+class TestLandmarks:
+    """Tests unitarios para el preprocesado ALT de Landmarks"""
+
+    def _cell_distances(self, board, x, y):
+        """Pasos de referencia desde (x, y) con BFS sobre las casillas"""
+        distances = {(x, y): 0}
+        queue = deque([(x, y)])
+        while queue:
+            cell_x, cell_y = queue.popleft()
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                following = board.wrap_position(cell_x + dx, cell_y + dy)
+                if following not in distances and not board.has_wall_at(*following):
+                    distances[following] = distances[(cell_x, cell_y)] + 1
+                    queue.append(following)
+        return distances
+
+
+    # ==================== Tests de construcción ====================
+
+    def test_distances_match_breadth_first_search(self):
+        """Cada fila debe tener las distancias exactas desde su landmark"""
+        rng = random.Random(3)
+        for _ in range(10):
+            # Arrange
+            width, height = rng.randint(2, 9), rng.randint(2, 9)
+            board = Board(width, height)
+            board.add_walls([Wall(rng.randint(1, width), rng.randint(1, height)) for _ in range(width * height // 4)])
+            if len(board.walls) == width * height:
+                continue
+
+            # Act
+            landmarks = Landmarks.build(board, 3)
+
+            # Assert
+            for cell, row in zip(landmarks.cells, landmarks.distances):
+                expected = self._cell_distances(board, int(cell) // height + 1, int(cell) % height + 1)
+                for x in range(1, width + 1):
+                    for y in range(1, height + 1):
+                        value = row[(x - 1) * height + (y - 1)]
+                        if (x, y) in expected:
+                            assert value == expected[(x, y)]
+                        else:
+                            assert value == landmarks.UNREACHABLE
+
+    def test_picks_spread_out_landmarks(self):
+        """El segundo landmark debe ser el punto más lejano del primero"""
+        landmarks = Landmarks.build(Board(20, 1), 2)
+
+        first, second = landmarks.distances
+        assert second[landmarks.cells[0]] == first.max() == 10
+
+    def test_never_picks_isolated_cells(self):
+        """Los huecos aislados por paredes no se eligen como landmarks"""
+        # Arrange: (1, 1) está encerrada
+        board = Board(10, 10)
+        board.add_walls([Wall(1, 2), Wall(2, 1), Wall(1, 10), Wall(10, 1)])
+
+        # Act
+        landmarks = Landmarks.build(board, 4)
+
+        # Assert
+        assert 0 not in landmarks.cells
+        assert len(landmarks) == 4
+
+    def test_uses_compact_dtype(self):
+        """Tableros pequeños usan uint16 y grandes uint32"""
+        assert Landmarks.build(Board(10, 10), 1).distances.dtype == np.uint16
+        assert Landmarks.dtype_for(300, 300) == np.uint32
+
+    def test_rejects_invalid_count(self):
+        """Se requiere al menos un landmark"""
+        with pytest.raises(ValueError):
+            Landmarks.build(Board(5, 5), 0)
+
+
+    # ==================== Tests de cotas ====================
+
+    def test_lower_bound_never_overestimates(self):
+        """La cota nunca supera la distancia real"""
+        # Arrange
+        rng = random.Random(4)
+        board = Board(12, 12)
+        board.add_walls([Wall(rng.randint(1, 12), rng.randint(1, 12)) for _ in range(40)])
+        landmarks = Landmarks.build(board, 4)
+        free = [(x, y) for x in range(1, 13) for y in range(1, 13) if not board.has_wall_at(x, y)]
+        target = free[len(free) // 2]
+        real = self._cell_distances(board, *target)
+
+        # Act
+        bound = landmarks.lower_bound_to(*target)
+
+        # Assert
+        for cell in free:
+            if cell in real:
+                assert bound(*cell) <= real[cell]
+            else:
+                assert bound(*cell) is None
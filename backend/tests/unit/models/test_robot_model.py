@@ -1,5 +1,6 @@
 import pytest
 from models.Robot import Robot
+from models.StateSpace import StateSpace
 from exceptions import InvalidDirectionException
 
 
@@ -239,3 +240,26 @@ class TestRobot:
         
         assert placed_robot.x == original_x
         assert placed_robot.y == original_y
+
+
+    # ==================== Tests del estado empaquetado ====================
+    
+    def test_facing_setter_rejects_invalid_direction(self, robot):
+        """Asignar una orientación no válida debe lanzar excepción"""
+        with pytest.raises(InvalidDirectionException):
+            robot.facing = 'UP'
+    
+    def test_to_state_and_set_state_roundtrip(self, placed_robot):
+        """El estado empaquetado debe conservar posición y orientación"""
+        # Arrange
+        space = StateSpace(10, 10)
+        placed_robot.turn_right()
+        
+        # Act
+        state = placed_robot.to_state(space)
+        other = Robot()
+        other.set_state(space, state)
+        
+        # Assert
+        assert state == space.encode(5, 5, 'EAST')
+        assert other.get_position() == (5, 5, 'EAST')
@@ -0,0 +1,82 @@
+import pytest
+from models.RobotRegistry import RobotRegistry
+from exceptions import InvalidDirectionException, RobotCollisionException, RobotNotFoundException
+
+
+class TestRobotRegistry:
+    """Tests unitarios para el registro de robots y su índice de posiciones"""
+
+    @pytest.fixture
+    def registry(self):
+        """Registro con los robots 'a' en (1, 1) y 'b' en (2, 1)"""
+        registry = RobotRegistry()
+        registry.place('a', 1, 1, 'NORTH')
+        registry.place('b', 2, 1, 'SOUTH')
+        return registry
+
+
+    # ==================== Tests de place ====================
+
+    def test_place_indexes_position(self, registry):
+        """Cada robot colocado debe quedar en el índice"""
+        assert registry.occupant(1, 1) == 'a'
+        assert registry.occupant(2, 1) == 'b'
+        assert registry.occupant(3, 3) is None
+        assert len(registry) == 2
+
+    def test_place_on_other_robot_raises(self, registry):
+        """No se puede colocar un robot donde está otro"""
+        with pytest.raises(RobotCollisionException):
+            registry.place('c', 2, 1, 'EAST')
+
+        assert len(registry) == 2
+
+    def test_replace_moves_index_entry(self, registry):
+        """Reposicionar un robot libera su celda anterior"""
+        registry.place('a', 3, 3, 'WEST')
+
+        assert registry.occupant(1, 1) is None
+        assert registry.occupant(3, 3) == 'a'
+        assert registry.get('a').get_position() == (3, 3, 'WEST')
+
+    def test_invalid_direction_leaves_registry_unchanged(self, registry):
+        """Una dirección inválida no debe registrar el robot ni tocar el índice"""
+        with pytest.raises(InvalidDirectionException):
+            registry.place('c', 4, 4, 'UP')
+        with pytest.raises(InvalidDirectionException):
+            registry.place('a', 4, 4, 'UP')
+
+        assert registry.occupant(4, 4) is None
+        assert registry.occupant(1, 1) == 'a'
+        assert len(registry) == 2
+
+    def test_place_rejects_invalid_id(self, registry):
+        """El identificador solo admite caracteres seguros"""
+        with pytest.raises(ValueError):
+            registry.place('../x', 4, 4, 'NORTH')
+
+
+    # ==================== Tests de move_to y remove ====================
+
+    def test_move_to_updates_index(self, registry):
+        """move_to mueve la entrada del índice junto con el robot"""
+        registry.move_to('a', 1, 2)
+
+        assert registry.occupant(1, 1) is None
+        assert registry.occupant(1, 2) == 'a'
+        assert registry.get('a').get_position() == (1, 2, 'NORTH')
+
+    def test_move_to_occupied_cell_raises(self, registry):
+        """Un robot no puede entrar en la celda de otro"""
+        with pytest.raises(RobotCollisionException):
+            registry.move_to('a', 2, 1)
+
+        assert registry.get('a').get_position() == (1, 1, 'NORTH')
+
+    def test_remove_frees_cell(self, registry):
+        """Eliminar un robot libera su celda"""
+        registry.remove('b')
+
+        assert registry.occupant(2, 1) is None
+        with pytest.raises(RobotNotFoundException):
+            registry.get('b')
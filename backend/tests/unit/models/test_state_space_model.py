@@ -0,0 +1,100 @@
+import pytest
+from models.Board import Board
+from models.StateSpace import StateSpace, DIRECTIONS
+from models.Wall import Wall
+
+
+class TestStateSpace:
+    """Tests unitarios para las tablas de transición de StateSpace"""
+
+    @pytest.fixture
+    def space(self):
+        """Tablas de un tablero 4x3 sin paredes"""
+        return StateSpace(4, 3)
+
+
+    # ==================== Tests de codificación ====================
+
+    def test_encode_decode_roundtrip(self, space):
+        """Todo estado debe decodificarse a la posición que lo generó"""
+        for x in range(1, 5):
+            for y in range(1, 4):
+                for facing in DIRECTIONS:
+                    assert space.decode(space.encode(x, y, facing)) == (x, y, facing)
+
+    def test_states_are_dense(self, space):
+        """Los estados ocupan exactamente 0..W·H·4-1"""
+        states = {space.encode(x, y, f) for x in range(1, 5) for y in range(1, 4) for f in DIRECTIONS}
+
+        assert states == set(range(space.size))
+
+
+    # ==================== Tests de las tablas ====================
+
+    def test_rotation_tables(self, space):
+        """LEFT y RIGHT solo cambian la orientación"""
+        state = space.encode(2, 3, 'NORTH')
+
+        assert space.decode(space.left[state]) == (2, 3, 'WEST')
+        assert space.decode(space.right[state]) == (2, 3, 'EAST')
+
+    @pytest.mark.parametrize("x, y, facing, expected", [
+        (2, 2, 'NORTH', (3, 2)),
+        (4, 2, 'NORTH', (1, 2)),
+        (1, 2, 'SOUTH', (4, 2)),
+        (2, 3, 'EAST', (2, 1)),
+        (2, 1, 'WEST', (2, 3)),
+    ])
+    def test_forward_applies_wrap_around(self, space, x, y, facing, expected):
+        """MOVE avanza con el mismo wrap around que RobotService"""
+        state = space.forward[space.encode(x, y, facing)]
+
+        assert space.decode(state) == (*expected, facing)
+
+    def test_wall_blocks_forward(self, space):
+        """Un paso contra una pared deja el estado igual y lo marca bloqueado"""
+        # Arrange
+        state = space.encode(4, 2, 'NORTH')
+
+        # Act
+        space.add_wall(1, 2)
+
+        # Assert
+        assert space.forward[state] == state
+        assert space.blocked[state] == 1
+        assert space.blocked_target(state) == (1, 2)
+
+    def test_rejects_boards_too_large(self):
+        """No debe construir tablas por encima de MAX_CELLS"""
+        with pytest.raises(ValueError):
+            StateSpace(StateSpace.MAX_CELLS + 1, 1)
+
+
+    # ==================== Tests de Board.state_space ====================
+
+    def test_board_updates_tables_on_add_wall(self):
+        """add_wall debe actualizar las tablas ya construidas"""
+        # Arrange
+        board = Board(5, 5)
+        space = board.state_space()
+
+        # Act
+        board.add_wall(Wall(3, 3))
+
+        # Assert
+        assert board.state_space() is space
+        assert space.blocked[space.encode(2, 3, 'NORTH')] == 1
+
+    def test_board_rebuilds_tables_after_direct_append(self):
+        """Las paredes añadidas directamente a walls obligan a reconstruir"""
+        board = Board(5, 5)
+        space = board.state_space()
+
+        board.walls.append(Wall(3, 3))
+
+        assert board.state_space() is not space
+        assert board.state_space().blocked[space.encode(3, 2, 'EAST')] == 1
+
+    def test_board_without_tables_and_no_build(self):
+        """Con build=False no se construyen tablas"""
+        assert Board(5, 5).state_space(build=False) is None
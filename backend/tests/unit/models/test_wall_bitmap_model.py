@@ -0,0 +1,189 @@
+import pytest
+from models.Board import Board
+from models.Wall import Wall
+from models.WallBitmap import WallBitmap
+from exceptions import WallOutOfBoundsException, WallAlreadyExistsException
+
+
+class TestWallBitmap:
+    """Tests unitarios para el almacenamiento denso de paredes"""
+
+    @pytest.fixture
+    def bitmap(self):
+        """Mapa de bits de 10x7 (tamaño no múltiplo de 8)"""
+        return WallBitmap(width=10, height=7)
+
+
+    # ==================== Tests de has / add ====================
+
+    def test_bitmap_starts_empty(self, bitmap):
+        """Debe empezar sin paredes"""
+        assert len(bitmap) == 0
+        assert list(bitmap) == []
+        assert bitmap.has(1, 1) is False
+
+    def test_bitmap_memory_is_one_bit_per_cell(self):
+        """Debe ocupar W·H/8 bytes"""
+        bitmap = WallBitmap(width=1000, height=1000)
+
+        assert bitmap.nbytes() == 125_000
+
+    def test_add_and_has(self, bitmap):
+        """Debe marcar y consultar paredes"""
+        assert bitmap.add(3, 4) is True
+        assert bitmap.add(3, 4) is False
+
+        assert bitmap.has(3, 4) is True
+        assert bitmap.has(4, 3) is False
+        assert (3, 4) in bitmap
+        assert len(bitmap) == 1
+
+    def test_has_returns_false_outside_board(self, bitmap):
+        """Debe devolver False fuera del tablero en lugar de fallar"""
+        assert bitmap.has(0, 1) is False
+        assert bitmap.has(11, 1) is False
+        assert bitmap.has(1, 8) is False
+
+    def test_add_raises_outside_board(self, bitmap):
+        """Debe lanzar ValueError al marcar fuera del tablero"""
+        with pytest.raises(ValueError, match="fuera del tablero"):
+            bitmap.add(11, 1)
+
+    def test_iterates_walls_in_cell_order(self, bitmap):
+        """Debe iterar las paredes ordenadas por celda"""
+        bitmap.append(Wall(x=10, y=7))
+        bitmap.append(Wall(x=1, y=1))
+        bitmap.append(Wall(x=2, y=3))
+
+        assert [(w.x, w.y) for w in bitmap] == [(1, 1), (2, 3), (10, 7)]
+
+    def test_discard_removes_wall(self, bitmap):
+        """Debe quitar una pared existente"""
+        bitmap.add(5, 5)
+
+        assert bitmap.discard(5, 5) is True
+        assert bitmap.discard(5, 5) is False
+        assert len(bitmap) == 0
+
+
+    # ==================== Tests de operaciones en bloque ====================
+
+    def test_set_many_counts_only_new_walls(self, bitmap):
+        """Debe añadir en bloque y contar solo las nuevas"""
+        bitmap.add(1, 1)
+
+        added = bitmap.set_many([(1, 1), (2, 2), (3, 3), (2, 2)])
+
+        assert added == 2
+        assert len(bitmap) == 3
+
+    def test_set_many_sets_bits_sharing_a_byte(self, bitmap):
+        """Debe marcar varias paredes que caen en el mismo byte"""
+        added = bitmap.set_many([(1, 1), (1, 2), (1, 3), (2, 1)])
+
+        assert added == 4
+        assert [(w.x, w.y) for w in bitmap] == [(1, 1), (1, 2), (1, 3), (2, 1)]
+        assert WallBitmap(10, 7, buffer=bytearray(bitmap.buffer())).count() == 4
+
+    def test_set_many_rejects_positions_outside_board(self, bitmap):
+        """Debe lanzar ValueError sin marcar ninguna pared"""
+        with pytest.raises(ValueError, match=r"\(11, 1\) fuera del tablero"):
+            bitmap.set_many([(1, 1), (11, 1)])
+
+        assert len(bitmap) == 0
+
+    def test_set_region_fills_rectangle(self, bitmap):
+        """Debe marcar todo un rectángulo"""
+        added = bitmap.set_region(2, 2, 4, 6)
+
+        assert added == 15
+        assert len(bitmap) == 15
+        assert bitmap.has(2, 2) and bitmap.has(4, 6) and bitmap.has(3, 4)
+        assert not bitmap.has(1, 2)
+        assert not bitmap.has(2, 7)
+        assert not bitmap.has(5, 6)
+
+    def test_set_region_full_columns(self, bitmap):
+        """Debe marcar columnas completas como un único rango"""
+        added = bitmap.set_region(2, 1, 9, 7)
+
+        assert added == 56
+        assert sum(1 for _ in bitmap) == 56
+
+    def test_clear_region_removes_walls(self, bitmap):
+        """Debe quitar las paredes de un rectángulo"""
+        bitmap.set_region(1, 1, 10, 7)
+
+        removed = bitmap.clear_region(3, 3, 5, 5)
+
+        assert removed == 9
+        assert len(bitmap) == 70 - 9
+        assert not bitmap.has(4, 4)
+        assert bitmap.has(2, 4)
+
+    def test_clear_empties_bitmap(self, bitmap):
+        """Debe vaciar todas las paredes"""
+        bitmap.set_region(1, 1, 10, 7)
+
+        bitmap.clear()
+
+        assert len(bitmap) == 0
+        assert list(bitmap) == []
+
+
+class TestBoardDenseStorage:
+    """Tests del modo de almacenamiento denso de Board"""
+
+    def test_small_board_uses_list_storage(self):
+        """Debe usar la lista en tableros pequeños"""
+        assert Board(width=10, height=10).storage == Board.STORAGE_LIST
+
+    def test_large_board_uses_dense_storage(self):
+        """Debe usar el mapa de bits en tableros grandes con muchas paredes"""
+        board = Board(width=10_000, height=10_000, expected_walls=1_000_000)
+
+        assert board.storage == Board.STORAGE_DENSE
+        assert isinstance(board.walls, WallBitmap)
+
+    def test_dense_walls_select_dense_storage(self):
+        """Debe usar el mapa de bits si la lista ocuparía más memoria"""
+        assert Board.choose_storage(500, 500, expected_walls=0) == Board.STORAGE_LIST
+        assert Board.choose_storage(500, 500, expected_walls=10_000) == Board.STORAGE_DENSE
+
+    def test_dense_storage_region_iteration(self):
+        """Debe iterar solo las paredes de la región pedida"""
+        board = Board(width=20, height=20, storage=Board.STORAGE_DENSE)
+        for x, y in [(1, 1), (5, 5), (6, 7), (15, 15)]:
+            board.add_wall(Wall(x=x, y=y))
+
+        walls = board.walls_in_region(4, 4, 10, 10)
+
+        assert sorted((w.x, w.y) for w in walls) == [(5, 5), (6, 7)]
+
+    def test_dense_storage_region_outside_board_is_empty(self):
+        """Una región fuera del tablero no devuelve paredes ni falla"""
+        board = Board(width=10, height=10, storage=Board.STORAGE_DENSE)
+        board.add_wall(Wall(x=10, y=10))
+
+        assert list(board.walls_in_region(20, 20, 30, 30)) == []
+        assert list(board.walls_in_region(30, 30, 20, 20)) == []
+        assert [(w.x, w.y) for w in board.walls_in_region(12, 12, 5, 5)] == [(10, 10)]
+
+    def test_invalid_storage_raises(self):
+        """Debe rechazar modos de almacenamiento desconocidos"""
+        with pytest.raises(ValueError, match="no válido"):
+            Board(width=5, height=5, storage='unknown')
+
+    def test_dense_board_keeps_board_api(self):
+        """Debe mantener la API y excepciones de Board"""
+        board = Board(width=5, height=5, storage=Board.STORAGE_DENSE)
+
+        board.add_wall(Wall(x=2, y=3))
+
+        assert board.has_wall_at(2, 3) is True
+        assert board.is_valid_position(2, 3) is False
+        assert len(board.walls) == 1
+        with pytest.raises(WallAlreadyExistsException):
+            board.add_wall(Wall(x=2, y=3))
+        with pytest.raises(WallOutOfBoundsException):
+            board.add_wall(Wall(x=6, y=1))
@@ -0,0 +1,117 @@
+import pytest
+from models.Board import Board
+from models.Wall import Wall
+from models.WallChunks import WallChunks
+from exceptions import WallAlreadyExistsException
+
+
+class TestWallChunks:
+    """Tests unitarios para el almacenamiento disperso por bloques"""
+
+    @pytest.fixture
+    def chunks(self):
+        """Tablero enorme de 100000x100000 celdas"""
+        return WallChunks(width=100_000, height=100_000)
+
+
+    # ==================== Tests de has / add ====================
+
+    def test_chunks_start_without_memory(self, chunks):
+        """No debe reservar bloques mientras no haya paredes"""
+        assert len(chunks) == 0
+        assert chunks.chunk_count() == 0
+        assert chunks.nbytes() == 0
+
+    def test_add_and_has(self, chunks):
+        """Debe marcar y consultar paredes"""
+        assert chunks.add(70_000, 3) is True
+        assert chunks.add(70_000, 3) is False
+
+        assert chunks.has(70_000, 3) is True
+        assert chunks.has(3, 70_000) is False
+        assert (70_000, 3) in chunks
+        assert len(chunks) == 1
+
+    def test_memory_grows_with_wall_count(self, chunks):
+        """Debe reservar solo los bloques con paredes"""
+        chunks.add(1, 1)
+        chunks.add(2, 2)
+        chunks.add(99_999, 99_999)
+
+        assert chunks.chunk_count() == 2
+        assert chunks.nbytes() == 2 * WallChunks.CHUNK_BYTES
+
+    def test_has_returns_false_outside_board(self, chunks):
+        """Debe devolver False fuera del tablero"""
+        assert chunks.has(0, 1) is False
+        assert chunks.has(100_001, 1) is False
+
+    def test_add_raises_outside_board(self, chunks):
+        """Debe lanzar ValueError al marcar fuera del tablero"""
+        with pytest.raises(ValueError, match="fuera del tablero"):
+            chunks.add(100_001, 1)
+
+    def test_discard_frees_empty_chunk(self, chunks):
+        """Debe liberar el bloque al quitar su última pared"""
+        chunks.add(500, 500)
+
+        assert chunks.discard(500, 500) is True
+        assert chunks.discard(500, 500) is False
+        assert chunks.chunk_count() == 0
+
+    def test_iterates_all_walls(self, chunks):
+        """Debe iterar todas las paredes"""
+        coordinates = {(1, 1), (64, 64), (65, 1), (50_000, 12)}
+        chunks.set_many(coordinates)
+
+        assert {(w.x, w.y) for w in chunks} == coordinates
+
+
+    # ==================== Tests de walls_in_region ====================
+
+    def test_walls_in_region_filters_by_rectangle(self, chunks):
+        """Debe devolver solo las paredes de la región"""
+        chunks.set_many([(10, 10), (100, 100), (130, 60), (5_000, 5_000)])
+
+        walls = chunks.walls_in_region(50, 50, 200, 200)
+
+        assert sorted((w.x, w.y) for w in walls) == [(100, 100), (130, 60)]
+
+    def test_walls_in_region_with_large_region(self, chunks):
+        """Debe funcionar cuando la región abarca más bloques de los reservados"""
+        chunks.set_many([(1, 1), (99_999, 99_999)])
+
+        walls = chunks.walls_in_region(1, 1, 100_000, 100_000)
+
+        assert sorted((w.x, w.y) for w in walls) == [(1, 1), (99_999, 99_999)]
+
+    def test_walls_in_region_outside_board_is_empty(self):
+        """Una región fuera del tablero no devuelve la pared del borde"""
+        chunks = WallChunks(width=10, height=10)
+        chunks.set_many([(10, 10)])
+
+        assert list(chunks.walls_in_region(20, 20, 30, 30)) == []
+        assert list(chunks.walls_in_region(30, 30, 20, 20)) == []
+        assert [(w.x, w.y) for w in chunks.walls_in_region(12, 12, 5, 5)] == [(10, 10)]
+
+
+class TestBoardSparseStorage:
+    """Tests del modo de almacenamiento disperso de Board"""
+
+    def test_huge_empty_board_uses_sparse_storage(self):
+        """Debe usar bloques en tableros enormes con pocas paredes"""
+        board = Board(width=100_000, height=100_000, expected_walls=1_000)
+
+        assert board.storage == Board.STORAGE_SPARSE
+        assert isinstance(board.walls, WallChunks)
+
+    def test_sparse_board_keeps_board_api(self):
+        """Debe mantener la API y excepciones de Board"""
+        board = Board(width=100_000, height=100_000, storage=Board.STORAGE_SPARSE)
+
+        board.add_wall(Wall(x=12_345, y=67_890))
+
+        assert board.has_wall_at(12_345, 67_890) is True
+        assert board.is_valid_position(12_345, 67_890) is False
+        with pytest.raises(WallAlreadyExistsException):
+            board.add_wall(Wall(x=12_345, y=67_890))
@@ -0,0 +1,86 @@
+import random
+import pytest
+from models.Board import Board
+from models.StateSpace import DIRECTIONS, DIRECTION_INDEX
+from models.Wall import Wall
+from models.WallRays import WallRays
+
+
+class TestWallRays:
+    """Tests unitarios para el índice de paredes por fila y columna"""
+
+    @pytest.fixture
+    def board(self):
+        """Tablero 6x5 con paredes en (4, 2) y (2, 5)"""
+        board = Board(6, 5)
+        board.add_wall(Wall(4, 2))
+        board.add_wall(Wall(2, 5))
+        return board
+
+
+    # ==================== Tests de distance_to_wall ====================
+
+    @pytest.mark.parametrize("x, y, facing, expected", [
+        (1, 2, 'NORTH', 3),
+        (5, 2, 'NORTH', 5),
+        (6, 2, 'SOUTH', 2),
+        (2, 1, 'WEST', 1),
+        (2, 3, 'EAST', 2),
+        (1, 1, 'EAST', None),
+    ])
+    def test_distance_with_wrap_around(self, x, y, facing, expected):
+        """La distancia a la primera pared debe dar la vuelta por los bordes"""
+        rays = WallRays(6, 5, [Wall(4, 2), Wall(2, 5)])
+
+        assert rays.distance_to_wall(x, y, DIRECTION_INDEX[facing]) == expected
+
+    def test_matches_step_by_step_walk(self):
+        """Debe coincidir con avanzar celda a celda en un tablero aleatorio"""
+        # Arrange
+        rng = random.Random(7)
+        board = Board(9, 7)
+        for _ in range(15):
+            x, y = rng.randint(1, 9), rng.randint(1, 7)
+            if not board.has_wall_at(x, y):
+                board.add_wall(Wall(x, y))
+        rays = board.wall_rays()
+
+        for x in range(1, 10):
+            for y in range(1, 8):
+                for facing in DIRECTIONS:
+                    # Act: recorrido de referencia, una vuelta como mucho
+                    expected = None
+                    for steps in range(1, 10):
+                        if board.has_wall_at(*board.advance(x, y, facing, steps)):
+                            expected = steps
+                            break
+
+                    # Assert
+                    assert rays.distance_to_wall(x, y, DIRECTION_INDEX[facing]) == expected
+
+
+    # ==================== Tests de Board ====================
+
+    def test_free_steps_stops_before_wall(self, board):
+        """free_steps cuenta las celdas libres antes de la pared"""
+        assert board.free_steps(1, 2, 'NORTH') == 2
+        assert board.free_steps(1, 2, 'NORTH', limit=1) == 1
+        assert board.free_steps(3, 2, 'NORTH') == 0
+
+    def test_free_steps_without_wall_in_line(self, board):
+        """Sin pared en la línea devuelve el límite (None si no hay)"""
+        assert board.free_steps(1, 1, 'EAST') is None
+        assert board.free_steps(1, 1, 'EAST', limit=12) == 12
+
+    def test_index_follows_added_walls(self, board):
+        """add_wall debe actualizar el índice ya construido"""
+        board.wall_rays()
+
+        board.add_wall(Wall(1, 4))
+
+        assert board.free_steps(1, 1, 'EAST') == 2
+
+    def test_advance_wraps_around(self, board):
+        """advance aplica el wrap around a cualquier número de pasos"""
+        assert board.advance(5, 2, 'NORTH', 3) == (2, 2)
+        assert board.advance(1, 1, 'WEST', 11) == (1, 5)
@@ -0,0 +1,166 @@
+import json
+import os
+import threading
+import pytest
+from unittest.mock import patch
+from repositories.AtomicFileWriter import AtomicFileWriter
+from repositories.RobotRepository import RobotRepository
+from models.Robot import Robot
+
+
+class TestAtomicFileWriter:
+    """Tests unitarios para las escrituras atómicas y el commit en grupo"""
+    
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / "data.json")
+
+
+    # ==================== Tests de escritura atómica ====================
+    
+    @pytest.mark.parametrize('durability', AtomicFileWriter.VALID_DURABILITIES)
+    def test_write_replaces_content(self, path, durability):
+        """Debe reemplazar el contenido con cualquier durabilidad"""
+        writer = AtomicFileWriter(durability, group_window=0)
+        
+        writer.write(path, "uno")
+        writer.write(path, "dos")
+        
+        with open(path) as f:
+            assert f.read() == "dos"
+        assert os.listdir(os.path.dirname(path)) == ["data.json"]
+    
+    def test_invalid_durability_raises(self):
+        """Debe rechazar durabilidades desconocidas"""
+        with pytest.raises(ValueError, match="no válida"):
+            AtomicFileWriter('always')
+    
+    def test_failed_write_keeps_previous_content(self, path):
+        """Un fallo a mitad de escritura no debe corromper el fichero"""
+        writer = AtomicFileWriter()
+        writer.write(path, "original")
+        
+        with patch('repositories.AtomicFileWriter.os.replace', side_effect=OSError("disco lleno")):
+            with pytest.raises(OSError):
+                writer.write(path, "nuevo")
+        
+        with open(path) as f:
+            assert f.read() == "original"
+        assert os.listdir(os.path.dirname(path)) == ["data.json"]
+    
+    def test_per_write_durability_fsyncs(self, path):
+        """La durabilidad 'write' debe hacer fsync en cada escritura"""
+        writer = AtomicFileWriter(AtomicFileWriter.DURABILITY_WRITE)
+        
+        with patch('repositories.AtomicFileWriter.os.fsync') as fsync:
+            writer.write(path, "x")
+        
+        assert fsync.call_count == 2  # fichero y directorio
+    
+    def test_none_durability_does_not_fsync(self, path):
+        """La durabilidad 'none' no debe hacer fsync"""
+        writer = AtomicFileWriter(AtomicFileWriter.DURABILITY_NONE)
+        
+        with patch('repositories.AtomicFileWriter.os.fsync') as fsync:
+            writer.write(path, "x")
+        
+        fsync.assert_not_called()
+
+
+    # ==================== Tests de commit en grupo ====================
+    
+    def test_concurrent_writes_are_coalesced(self, tmp_path):
+        """Las escrituras concurrentes dentro de la ventana deben agruparse"""
+        writer = AtomicFileWriter(AtomicFileWriter.DURABILITY_GROUP, group_window=0.05)
+        paths = [str(tmp_path / "robot.json")] * 10 + [str(tmp_path / "board.json")] * 10
+        threads = [
+            threading.Thread(target=writer.write, args=(path, str(i)))
+            for i, path in enumerate(paths)
+        ]
+        
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert writer.commit_count < len(paths)
+        assert sorted(os.listdir(tmp_path)) == ["board.json", "robot.json"]
+    
+    def test_group_write_is_visible_when_call_returns(self, path):
+        """Cuando write vuelve, el contenido ya está escrito"""
+        writer = AtomicFileWriter(AtomicFileWriter.DURABILITY_GROUP, group_window=0)
+        
+        writer.write(path, "durable")
+        
+        with open(path) as f:
+            assert f.read() == "durable"
+    
+    def test_group_write_syncs_data_before_rename(self, path):
+        """El commit en grupo nunca renombra un temporal sin sincronizar"""
+        writer = AtomicFileWriter(AtomicFileWriter.DURABILITY_GROUP, group_window=0)
+        calls = []
+        fsync, replace = os.fsync, os.replace
+        
+        def tracked_fsync(fd):
+            calls.append('fsync')
+            fsync(fd)
+        
+        def tracked_replace(source, target):
+            calls.append('replace')
+            replace(source, target)
+        
+        with patch('repositories.AtomicFileWriter.os.fsync', side_effect=tracked_fsync), \
+                patch('repositories.AtomicFileWriter.os.replace', side_effect=tracked_replace):
+            writer.write(path, "x")
+        
+        assert calls == ['fsync', 'replace', 'fsync']  # temporal, rename, directorio
+    
+    def test_group_write_propagates_errors(self, path):
+        """Debe propagar el error de escritura del grupo"""
+        writer = AtomicFileWriter(AtomicFileWriter.DURABILITY_GROUP, group_window=0)
+        
+        with patch('repositories.AtomicFileWriter.os.replace', side_effect=OSError("disco lleno")):
+            with pytest.raises(OSError):
+                writer.write(path, "x")
+
+
+    # ==================== Integración con los repositorios JSON ====================
+    
+    def test_json_repository_uses_writer(self, path):
+        """Los repositorios JSON deben escribir con el escritor atómico"""
+        writer = AtomicFileWriter(AtomicFileWriter.DURABILITY_GROUP, group_window=0)
+        repository = RobotRepository(path, writer=writer)
+        robot = Robot()
+        robot.place(1, 2, 'EAST')
+        
+        repository.save(robot)
+        
+        with open(path) as f:
+            assert json.load(f) == {"x": 1, "y": 2, "facing": "EAST", "version": 1}
+        assert repository.load().get_position() == (1, 2, 'EAST')
+        assert writer.commit_count == 2
+    
+    def test_json_repository_does_not_hold_lock_during_group_window(self, path):
+        """Los guardados del mismo documento deben unirse al mismo grupo"""
+        # Arrange
+        writer = AtomicFileWriter(AtomicFileWriter.DURABILITY_GROUP, group_window=0)
+        repository = RobotRepository(path, writer=writer)
+        other = RobotRepository(path, writer=writer)
+        writer.group_window = 0.5
+        robot = Robot()
+        robot.place(1, 2, 'EAST')
+        
+        # Act: el primer guardado espera la ventana del grupo en otro hilo
+        thread = threading.Thread(target=repository.save, args=(robot,))
+        thread.start()
+        loaded = None
+        while thread.is_alive() and (loaded is None or loaded.version == 0):
+            loaded = repository.load()
+        assert thread.is_alive()
+        loaded.x = 5
+        other.save(loaded)
+        thread.join()
+        
+        # Assert
+        assert other.load().version == 2
+        assert writer.commit_count == 2  # creación del documento y un único grupo
@@ -0,0 +1,150 @@
+import pytest
+from models.Board import Board
+from models.Wall import Wall
+from models.WallBitmap import WallBitmap
+from repositories.BinaryBoardRepository import BinaryBoardRepository
+from repositories.BoardRepository import BoardRepository
+
+
+class TestBinaryBoardRepository:
+    """Tests del repositorio binario del tablero contra un fichero temporal"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        return BinaryBoardRepository(str(tmp_path / "board.bin"))
+
+
+    # ==================== Tests de guardar y cargar ====================
+
+    def test_load_returns_none_when_missing(self, repository):
+        """Debe devolver None si no hay tablero"""
+        assert repository.load() is None
+        assert repository.exists() is False
+
+    def test_save_and_load_coordinates_layout(self, repository):
+        """Un tablero en lista se guarda como coordenadas en orden de inserción"""
+        # Arrange
+        board = Board(5, 4)
+        board.add_wall(Wall(3, 3))
+        board.add_wall(Wall(1, 2))
+
+        # Act
+        repository.save(board)
+        loaded = repository.load()
+
+        # Assert
+        assert (loaded.width, loaded.height) == (5, 4)
+        assert [(w.x, w.y) for w in loaded.walls] == [(3, 3), (1, 2)]
+        assert loaded.has_wall_at(1, 2) is True
+
+    def test_save_and_load_bitmap_layout(self, repository):
+        """Un tablero denso se carga como un WallBitmap sobre el fichero mapeado"""
+        # Arrange
+        board = Board(100, 80, storage=Board.STORAGE_DENSE)
+        board.add_walls([Wall(1, 1), Wall(50, 40), Wall(100, 80)])
+
+        # Act
+        repository.save(board)
+        loaded = repository.load()
+
+        # Assert
+        assert loaded.storage == Board.STORAGE_DENSE
+        assert isinstance(loaded.walls, WallBitmap)
+        assert len(loaded.walls) == 3
+        assert loaded.has_wall_at(50, 40) is True
+        assert loaded.has_wall_at(50, 41) is False
+
+    def test_file_size_of_bitmap_layout(self, repository):
+        """El fichero ocupa la cabecera más un bit por celda"""
+        board = Board(64, 64, storage=Board.STORAGE_DENSE)
+
+        repository.save(board)
+
+        with open(repository.db_path, 'rb') as f:
+            assert len(f.read()) == BinaryBoardRepository.HEADER_SIZE + 64 * 64 // 8
+
+    def test_mapped_board_changes_do_not_touch_file(self, repository):
+        """Las paredes añadidas tras cargar no llegan al fichero hasta guardar"""
+        # Arrange
+        repository.save(Board(32, 32, storage=Board.STORAGE_DENSE))
+        loaded = repository.load()
+
+        # Act
+        loaded.add_wall(Wall(2, 3))
+
+        # Assert
+        assert repository.load().has_wall_at(2, 3) is False
+        repository.save(loaded)
+        assert repository.load().has_wall_at(2, 3) is True
+
+    def test_loads_share_one_mapping_per_file_version(self, repository):
+        """Las cargas del mismo fichero reutilizan el mapeo y se cierra al cambiar"""
+        # Arrange
+        repository.save(Board(32, 32, storage=Board.STORAGE_DENSE))
+        first = repository.load()
+        second = repository.load()
+        mapped = repository._mapping[1]
+
+        # Act
+        first.add_wall(Wall(1, 1))
+        second.add_wall(Wall(2, 2))
+        del first, second
+        repository.save(Board(16, 16, storage=Board.STORAGE_DENSE))
+        reloaded = repository.load()
+
+        # Assert
+        assert mapped.closed is True
+        assert repository._mapping[1] is not mapped
+        assert (reloaded.width, len(reloaded.walls)) == (16, 0)
+
+    def test_mapping_in_use_is_not_closed_under_a_loaded_board(self, repository):
+        """Un tablero cargado sigue leyendo su mapeo aunque el fichero cambie"""
+        # Arrange
+        board = Board(32, 32, storage=Board.STORAGE_DENSE)
+        board.add_wall(Wall(5, 5))
+        repository.save(board)
+        loaded = repository.load()
+
+        # Act
+        repository.save(Board(32, 32, storage=Board.STORAGE_DENSE))
+        repository.load()
+
+        # Assert
+        assert loaded.has_wall_at(5, 5) is True
+        assert repository.load().has_wall_at(5, 5) is False
+
+    def test_load_rejects_invalid_file(self, repository):
+        """Debe rechazar un fichero sin la cabecera del formato"""
+        with open(repository.db_path, 'wb') as f:
+            f.write(b'\x00' * BinaryBoardRepository.HEADER_SIZE)
+
+        with pytest.raises(ValueError):
+            repository.load()
+
+    def test_delete(self, repository):
+        """Debe eliminar el fichero del tablero"""
+        repository.save(Board(5, 5))
+
+        repository.delete()
+
+        assert repository.exists() is False
+
+
+    # ==================== Tests de importar / exportar JSON ====================
+
+    def test_import_and_export_json(self, repository, tmp_path):
+        """Debe convertir un tablero JSON a binario y de vuelta"""
+        # Arrange
+        source = BoardRepository(str(tmp_path / "board.json"))
+        board = Board(6, 6)
+        board.add_wall(Wall(4, 5))
+        source.save(board)
+
+        # Act
+        repository.import_json(source.db_path)
+        exported = repository.export_json(str(tmp_path / "exported.json"))
+
+        # Assert
+        reloaded = BoardRepository(str(tmp_path / "exported.json")).load()
+        assert exported.has_wall_at(4, 5) is True
+        assert [(w.x, w.y) for w in reloaded.walls] == [(4, 5)]
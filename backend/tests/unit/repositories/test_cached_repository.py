@@ -0,0 +1,198 @@
+import pytest
+from unittest.mock import Mock
+from repositories.IRepository import IRepository
+from repositories.BoardRepository import BoardRepository
+from repositories.CachedRepository import CachedRepository
+from models.Robot import Robot
+from models.Board import Board
+from models.Wall import Wall
+from models.WallBitmap import WallBitmap
+from exceptions import ConcurrentModificationException
+
+
+class TestCachedRepository:
+    """Tests unitarios para la caché con escritura diferida"""
+    
+    @pytest.fixture
+    def inner_repository(self):
+        """Mock del repositorio real"""
+        repository = Mock(spec=IRepository)
+        repository.load.return_value = Robot()
+        return repository
+    
+    @pytest.fixture
+    def repository(self, inner_repository):
+        """Caché sin volcado periódico y con umbral de 3 cambios"""
+        return CachedRepository(inner_repository, flush_interval=None, max_dirty=3)
+
+
+    # ==================== Tests de lectura ====================
+    
+    def test_reads_from_disk_only_once(self, repository, inner_repository):
+        """Solo la primera lectura debe tocar el repositorio real"""
+        repository.load()
+        repository.load()
+        
+        assert repository.exists() is True
+        inner_repository.load.assert_called_once()
+        inner_repository.exists.assert_not_called()
+    
+    def test_reads_after_save_do_not_touch_disk(self, repository, inner_repository):
+        """Tras un save la lectura debe salir de memoria"""
+        robot = Robot()
+        robot.place(2, 3, 'EAST')
+        
+        repository.save(robot)
+        
+        assert repository.load().get_position() == (2, 3, 'EAST')
+        inner_repository.load.assert_not_called()
+    
+    def test_load_returns_a_copy(self, repository):
+        """Modificar la entidad cargada no debe cambiar la caché sin un save"""
+        # Arrange
+        robot = Robot()
+        robot.place(2, 3, 'EAST')
+        repository.save(robot)
+        
+        # Act
+        loaded = repository.load()
+        loaded.place(4, 4, 'NORTH')
+        robot.place(5, 5, 'SOUTH')
+        
+        # Assert
+        assert loaded is not robot
+        assert repository.load().get_position() == (2, 3, 'EAST')
+    
+    def test_copies_boards_over_external_buffers(self, inner_repository):
+        """Un tablero sobre un buffer externo (mmap) se copia a memoria propia"""
+        # Arrange
+        buffer = bytearray(WallBitmap.size_for(8, 8))
+        board = Board(8, 8, storage=Board.STORAGE_DENSE, walls=WallBitmap(8, 8, buffer=memoryview(buffer)))
+        board.add_wall(Wall(2, 2))
+        inner_repository.load.return_value = board
+        repository = CachedRepository(inner_repository, flush_interval=None)
+        
+        # Act
+        loaded = repository.load()
+        loaded.add_wall(Wall(3, 3))
+        
+        # Assert
+        assert loaded.has_wall_at(2, 2) is True
+        assert board.has_wall_at(3, 3) is False
+
+
+    # ==================== Tests de escritura ====================
+    
+    def test_save_is_deferred(self, repository, inner_repository):
+        """No debe escribir en cada save"""
+        robot = Robot()
+        repository.save(robot)
+        repository.save(robot)
+        
+        inner_repository.save.assert_not_called()
+        assert repository.dirty_count == 2
+    
+    def test_flushes_on_dirty_threshold(self, repository, inner_repository):
+        """Debe volcar al alcanzar el umbral de cambios"""
+        robot = Robot()
+        
+        for _ in range(7):
+            repository.save(robot)
+        
+        assert inner_repository.save.call_count == 2
+        assert repository.dirty_count == 1
+    
+    def test_close_flushes_pending_changes(self, repository, inner_repository):
+        """Debe volcar los cambios pendientes al cerrar"""
+        robot = Robot()
+        robot.place(1, 2, 'WEST')
+        repository.save(robot)
+        
+        repository.close()
+        
+        inner_repository.save.assert_called_once()
+        assert inner_repository.save.call_args.args[0].get_position() == (1, 2, 'WEST')
+        assert repository.dirty_count == 0
+    
+    def test_flush_without_changes_does_nothing(self, repository, inner_repository):
+        """No debe escribir si no hay cambios"""
+        repository.load()
+        
+        repository.flush()
+        
+        inner_repository.save.assert_not_called()
+        assert repository.flush_count == 0
+    
+    def test_delete_is_flushed_as_delete(self, repository, inner_repository):
+        """Debe volcar un borrado como delete en el repositorio real"""
+        repository.delete()
+        
+        assert repository.load() is None
+        repository.flush()
+        
+        inner_repository.delete.assert_called_once()
+        inner_repository.save.assert_not_called()
+    
+    def test_periodic_flush(self, inner_repository):
+        """Debe volcar periódicamente en segundo plano"""
+        repository = CachedRepository(inner_repository, flush_interval=0.01, max_dirty=10_000)
+        
+        repository.save(Robot())
+        repository._closed.wait(0.2)
+        
+        inner_repository.save.assert_called_once()
+        repository.close()
+
+    def test_periodic_flush_survives_failures(self, inner_repository):
+        """Un volcado fallido no debe detener el hilo de volcado"""
+        inner_repository.save.side_effect = [OSError("disco lleno"), None]
+        repository = CachedRepository(inner_repository, flush_interval=0.01, max_dirty=10_000)
+        
+        repository.save(Robot())
+        for _ in range(100):
+            if repository.flush_count:
+                break
+            repository._closed.wait(0.01)
+        
+        assert inner_repository.save.call_count == 2
+        assert repository.dirty_count == 0
+        repository.close()
+
+
+    # ==================== Tests de versiones ====================
+    
+    def test_stale_save_is_rejected(self, repository):
+        """Un save sobre una copia anterior a otro save debe fallar"""
+        # Arrange
+        repository.load()
+        first = repository.load()
+        second = repository.load()
+        first.place(1, 1, 'NORTH')
+        repository.save(first)
+        
+        # Act & Assert
+        second.place(2, 2, 'SOUTH')
+        with pytest.raises(ConcurrentModificationException):
+            repository.save(second)
+        assert repository.load().get_position() == (1, 1, 'NORTH')
+    
+    def test_flush_between_load_and_save(self, tmp_path):
+        """Volcar mientras una petición tiene su copia no debe invalidarla"""
+        # Arrange
+        path = str(tmp_path / "board.json")
+        repository = CachedRepository(BoardRepository(path), flush_interval=None)
+        repository.save(Board(5, 5))
+        
+        for x in range(1, 4):
+            # Act: load -> flush -> save
+            board = repository.load()
+            repository.flush()
+            board.add_wall(Wall(x, x))
+            repository.save(board)
+        repository.flush()
+        
+        # Assert
+        stored = BoardRepository(path).load()
+        assert [(w.x, w.y) for w in stored.walls] == [(1, 1), (2, 2), (3, 3)]
+        assert stored.version == 4
+        assert repository.flush_count == 4
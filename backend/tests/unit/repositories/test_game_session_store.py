@@ -0,0 +1,367 @@
+import os
+import threading
+import pytest
+from unittest.mock import Mock
+from exceptions import GameNotFoundException
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from repositories.GameSession import GameSession
+from repositories.GameSessionStore import GameSessionStore
+from repositories.SessionBoardRepository import SessionBoardRepository
+from repositories.SessionRobotRepository import SessionRobotRepository
+
+
+def _create_game(store, game_id, walls=()):
+    """Crea en la partida un tablero 5x5 con paredes y un robot colocado"""
+    with store.session(game_id, create=True) as session:
+        board = Board(5, 5)
+        for x, y in walls:
+            board.add_wall(Wall(x, y))
+        SessionBoardRepository(session).save(board)
+        robot = Robot()
+        robot.place(2, 3, 'EAST')
+        SessionRobotRepository(session).save(robot)
+
+
+class TestGameSessionStore:
+    """Tests de las partidas en memoria con expulsión LRU"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return GameSessionStore(str(tmp_path / "games"), max_sessions=2)
+
+
+    # ==================== Tests de las sesiones ====================
+
+    def test_sessions_are_independent(self, store):
+        """Cada partida tiene su propio tablero y robot"""
+        # Arrange
+        _create_game(store, 'a', walls=[(1, 1)])
+
+        # Act
+        with store.session('b', create=True) as session:
+            board = SessionBoardRepository(session).load()
+
+        # Assert
+        assert board is None
+        with store.session('a') as session:
+            assert SessionBoardRepository(session).load().has_wall_at(1, 1) is True
+
+    def test_memory_is_bounded_by_max_sessions(self, store):
+        """No debe haber más partidas en memoria que el límite"""
+        for game_id in ['a', 'b', 'c', 'd']:
+            _create_game(store, game_id)
+
+        assert len(store) == 2
+        assert store.eviction_count == 2
+
+    def test_evicted_session_is_compressed_and_reloaded(self, store):
+        """Una partida expulsada se escribe comprimida y se recarga al usarla"""
+        # Arrange
+        _create_game(store, 'a', walls=[(4, 4)])
+        _create_game(store, 'b')
+        _create_game(store, 'c')
+
+        # Act
+        with store.session('a') as session:
+            board = SessionBoardRepository(session).load()
+            robot = SessionRobotRepository(session).load()
+
+        # Assert
+        assert os.path.exists(os.path.join(store.directory, 'a.json.z'))
+        assert board.has_wall_at(4, 4) is True
+        assert robot.get_position() == (2, 3, 'EAST')
+
+    def test_least_recently_used_session_is_evicted(self, store):
+        """Se expulsa la partida usada hace más tiempo"""
+        # Arrange
+        _create_game(store, 'a')
+        _create_game(store, 'b')
+        with store.session('a'):
+            pass
+
+        # Act
+        _create_game(store, 'c')
+
+        # Assert
+        assert os.path.exists(os.path.join(store.directory, 'b.json.z'))
+        assert not os.path.exists(os.path.join(store.directory, 'a.json.z'))
+
+    def test_session_in_use_is_not_evicted(self, tmp_path):
+        """Una partida en uso no se expulsa aunque se supere el límite"""
+        store = GameSessionStore(str(tmp_path / "games"), max_sessions=1)
+
+        with store.session('a', create=True) as first:
+            with store.session('b', create=True) as second:
+                assert len(store) == 2
+                assert (first.pins, second.pins) == (1, 1)
+
+        assert len(store) == 1
+
+    def test_unchanged_session_is_not_written(self, store):
+        """Una partida sin cambios no se escribe al expulsarla"""
+        # Arrange
+        _create_game(store, 'a')
+        _create_game(store, 'b')
+        store.close()
+        store._writer = Mock(wraps=store._writer)
+
+        # Act
+        with store.session('a'):
+            pass
+        with store.session('b'):
+            pass
+        _create_game(store, 'c')
+
+        # Assert
+        assert store.eviction_count == 1
+        store._writer.write.assert_not_called()
+
+    def test_memory_is_bounded_by_bytes(self, tmp_path):
+        """Las partidas en memoria no deben superar max_bytes"""
+        # Arrange
+        store = GameSessionStore(str(tmp_path / "games"), max_bytes=3 * GameSession.BASE_BYTES)
+
+        # Act
+        for game_id in ['a', 'b', 'c', 'd', 'e']:
+            _create_game(store, game_id)
+
+        # Assert
+        assert store.nbytes <= store.max_bytes
+        assert len(store) < 5
+        with store.session('a') as session:
+            assert SessionRobotRepository(session).load().get_position() == (2, 3, 'EAST')
+
+    def test_size_follows_the_board_structures(self, tmp_path):
+        """El tamaño de la partida se recalcula al terminar cada petición"""
+        # Arrange
+        store = GameSessionStore(str(tmp_path / "games"))
+        _create_game(store, 'a')
+        before = store.nbytes
+
+        # Act
+        with store.session('a') as session:
+            session.board.state_space()
+
+        # Assert
+        assert store.nbytes == before + session.board.state_space().nbytes()
+
+    def test_eviction_writes_outside_the_global_lock(self, store):
+        """La compresión y la escritura de una expulsión no bloquean al resto de partidas"""
+        # Arrange
+        held = []
+        store._writer = Mock()
+        store._writer.write.side_effect = lambda path, data: held.append(store._lock.locked())
+        _create_game(store, 'a')
+        _create_game(store, 'b')
+
+        # Act
+        _create_game(store, 'c')
+
+        # Assert
+        assert held == [False]
+
+    def test_cold_load_runs_outside_the_global_lock(self, store):
+        """Descomprimir una partida expulsada no bloquea al resto de partidas"""
+        # Arrange
+        for game_id in ['a', 'b', 'c']:
+            _create_game(store, game_id, walls=[(1, 1)])
+        held = []
+        read = store._read
+
+        def tracked_read(game_id):
+            held.append(store._lock.locked())
+            return read(game_id)
+
+        store._read = tracked_read
+
+        # Act
+        with store.session('a') as session:
+            board = SessionBoardRepository(session).load()
+
+        # Assert
+        assert held == [False]
+        assert board.has_wall_at(1, 1) is True
+        assert store.nbytes == sum(session.nbytes() for session in store._sessions.values())
+
+    def test_concurrent_requests_share_one_cold_load(self, store):
+        """Las peticiones que esperan una partida en carga usan la sesión ya leída"""
+        # Arrange
+        for game_id in ['a', 'b', 'c']:
+            _create_game(store, game_id, walls=[(1, 1)])
+        reads = []
+        read = store._read
+        store._read = lambda game_id: reads.append(game_id) or read(game_id)
+        results = []
+
+        def request():
+            with store.session('a') as session:
+                results.append(SessionBoardRepository(session).load().has_wall_at(1, 1))
+
+        # Act
+        threads = [threading.Thread(target=request) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert results == [True] * 4
+        assert reads == ['a']
+
+    def test_evicted_session_is_recovered_while_being_written(self, store):
+        """Una partida expulsada que aún se está escribiendo se recupera de memoria"""
+        # Arrange
+        _create_game(store, 'a', walls=[(1, 1)])
+        _create_game(store, 'b')
+        recovered = []
+
+        def write(path, data):
+            if not path.endswith('a.json.z'):
+                return
+            # Se pide la partida antes de que su fichero exista
+            with store.session('a') as session:
+                recovered.append(SessionBoardRepository(session).load().has_wall_at(1, 1))
+
+        store._writer = Mock()
+        store._writer.write.side_effect = write
+
+        # Act
+        _create_game(store, 'c')
+
+        # Assert
+        assert recovered == [True]
+
+    def test_failed_request_rolls_back_the_session(self, store):
+        """Una petición que falla a medias no deja sus cambios en la partida"""
+        # Arrange
+        _create_game(store, 'a', walls=[(1, 1)])
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with store.session('a') as session, session.transaction():
+                SessionBoardRepository(session).load().add_wall(Wall(4, 4))
+                SessionRobotRepository(session).load().turn_right()
+                raise RuntimeError("fallo a mitad de la petición")
+
+        # Assert
+        with store.session('a') as session, session.transaction():
+            board = SessionBoardRepository(session).load()
+            robot = SessionRobotRepository(session).load()
+            assert board.has_wall_at(4, 4) is False
+            assert board.has_wall_at(1, 1) is True
+            assert robot.get_position() == (2, 3, 'EAST')
+            board.add_wall(Wall(5, 5))
+        with store.session('a') as session:
+            assert SessionBoardRepository(session).load().has_wall_at(5, 5) is True
+
+    # ==================== Tests del registro de partidas ====================
+
+    def test_unknown_game_is_not_created(self, store):
+        """Pedir una partida que no existe no debe crearla"""
+        with pytest.raises(GameNotFoundException):
+            with store.session('missing'):
+                pass
+
+        assert len(store) == 0
+        assert store.exists('missing') is False
+
+    def test_created_game_exists_while_empty(self, store):
+        """Una partida creada existe aunque no tenga tablero ni robot, también tras expulsarla"""
+        # Arrange
+        game_id = store.create()
+
+        # Act
+        _create_game(store, 'a')
+        _create_game(store, 'b')
+
+        # Assert
+        assert store.exists(game_id) is True
+        with store.session(game_id) as session:
+            assert session.is_empty() is True
+
+    def test_delete_removes_memory_and_disk(self, store):
+        """Debe eliminar la partida de memoria y de disco"""
+        # Arrange
+        _create_game(store, 'a')
+        store.close()
+
+        # Act
+        store.delete('a')
+
+        # Assert
+        assert store.exists('a') is False
+        assert os.listdir(store.directory) == []
+
+    def test_delete_waits_for_the_session_in_use(self, store):
+        """delete() espera a la petición en curso y las que esperaban reciben 404"""
+        # Arrange
+        _create_game(store, 'a')
+        deleted = threading.Event()
+        errors = []
+
+        def waiting_request():
+            try:
+                with store.session('a'):
+                    pass
+            except GameNotFoundException as error:
+                errors.append(error)
+
+        # Act
+        with store.session('a') as session:
+            deleter = threading.Thread(target=lambda: (store.delete('a'), deleted.set()))
+            deleter.start()
+            waiter = threading.Thread(target=waiting_request)
+            waiter.start()
+            assert deleted.wait(0.1) is False
+            session.dirty = True
+        deleter.join()
+        waiter.join()
+        store.close()
+
+        # Assert
+        assert deleted.is_set()
+        assert store.exists('a') is False
+        assert os.listdir(store.directory) == []
+
+    def test_close_writes_dirty_sessions(self, store, tmp_path):
+        """close() debe escribir las partidas con cambios"""
+        _create_game(store, 'a', walls=[(3, 3)])
+
+        store.close()
+
+        reopened = GameSessionStore(store.directory)
+        with reopened.session('a') as session:
+            assert SessionBoardRepository(session).load().has_wall_at(3, 3) is True
+
+    def test_rejects_unsafe_game_id(self, store):
+        """Debe rechazar identificadores que no sean seguros como nombre de fichero"""
+        with pytest.raises(ValueError):
+            with store.session('../board'):
+                pass
+
+    def test_requests_to_same_game_are_serialized(self, store):
+        """Las peticiones concurrentes a una partida no pierden cambios"""
+        # Arrange
+        _create_game(store, 'a')
+
+        def turn():
+            for _ in range(100):
+                with store.session('a') as session:
+                    repository = SessionRobotRepository(session)
+                    robot = repository.load()
+                    robot.x = robot.x % 5 + 1
+                    robot.turn_right()
+                    repository.save(robot)
+
+        # Act
+        threads = [threading.Thread(target=turn) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert: 400 giros a la derecha vuelven a la orientación inicial
+        with store.session('a') as session:
+            assert SessionRobotRepository(session).load().facing == 'EAST'
@@ -0,0 +1,271 @@
+import os
+import time
+import pytest
+from unittest.mock import Mock
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from repositories.JournalStore import JournalStore
+from repositories.JournalBoardRepository import JournalBoardRepository
+from repositories.JournalRobotRepository import JournalRobotRepository
+
+
+class TestJournalRepositories:
+    """Tests de la persistencia por diario con instantáneas"""
+    
+    @pytest.fixture
+    def directory(self, tmp_path):
+        return str(tmp_path / "journal")
+    
+    @pytest.fixture
+    def store(self, directory):
+        store = JournalStore(directory, compact_threshold=10_000_000)
+        yield store
+        store.close()
+    
+    @pytest.fixture
+    def board_repository(self, store):
+        return JournalBoardRepository(store)
+    
+    @pytest.fixture
+    def robot_repository(self, store):
+        return JournalRobotRepository(store)
+    
+    def _reopen(self, store, directory):
+        """Cierra el almacén y reconstruye el estado desde disco"""
+        store.close()
+        return JournalStore(directory, compact_threshold=10_000_000)
+
+
+    # ==================== Tests de escritura ====================
+    
+    def test_empty_store_has_no_state(self, board_repository, robot_repository):
+        """Debe empezar sin tablero ni robot"""
+        assert board_repository.load() is None
+        assert robot_repository.load() is None
+        assert board_repository.exists() is False
+    
+    def test_adding_a_wall_appends_a_constant_size_record(self, store, board_repository):
+        """Añadir una pared debe escribir un registro corto, no el tablero entero"""
+        board = Board(50, 50)
+        for x in range(1, 41):
+            board.add_wall(Wall(x, 1))
+        board_repository.save(board)
+        
+        board = board_repository.load()
+        board.add_wall(Wall(45, 45))
+        size_before = store.log_size()
+        board_repository.save(board)
+        
+        assert store.log_size() - size_before == len("W 45 45\n")
+    
+    def test_failed_append_keeps_pending_walls(self, store, board_repository, monkeypatch):
+        """Si no se puede escribir en el diario las paredes nuevas no se pierden"""
+        # Arrange
+        board_repository.save(Board(5, 5))
+        board = board_repository.load()
+        board.add_wall(Wall(2, 2))
+        append = store.append
+        monkeypatch.setattr(store, 'append', Mock(side_effect=OSError("disco lleno")))
+        
+        # Act
+        with pytest.raises(OSError):
+            board_repository.save(board)
+        monkeypatch.setattr(store, 'append', append)
+        board_repository.save(board)
+        
+        # Assert
+        assert board.pending_walls() == []
+        assert board_repository.load().has_wall_at(2, 2) is True
+
+    def test_stale_board_is_rewritten_after_recreate(self, board_repository):
+        """Un tablero cargado antes de un borrado y recreado no pierde sus paredes"""
+        # Arrange
+        board = Board(5, 5)
+        board.add_walls([Wall(1, 1), Wall(2, 2)])
+        board_repository.save(board)
+        stale = board_repository.load()
+        board_repository.delete()
+        recreated = Board(5, 5)
+        recreated.add_wall(Wall(3, 3))
+        board_repository.save(recreated)
+
+        # Act
+        stale.add_wall(Wall(4, 4))
+        board_repository.save(stale)
+
+        # Assert
+        loaded = board_repository.load()
+        assert sorted((w.x, w.y) for w in loaded.walls) == [(1, 1), (2, 2), (4, 4)]
+
+    def test_concurrent_wall_additions_are_merged(self, board_repository):
+        """Dos tableros cargados a la vez solo añaden sus paredes nuevas"""
+        # Arrange
+        board_repository.save(Board(5, 5))
+        first = board_repository.load()
+        second = board_repository.load()
+        first.add_wall(Wall(1, 1))
+        second.add_wall(Wall(2, 2))
+
+        # Act
+        board_repository.save(first)
+        board_repository.save(second)
+
+        # Assert
+        loaded = board_repository.load()
+        assert sorted((w.x, w.y) for w in loaded.walls) == [(1, 1), (2, 2)]
+
+    def test_walls_added_directly_are_written(self, board_repository):
+        """Las paredes añadidas sin add_wall se escriben reescribiendo el tablero"""
+        # Arrange
+        board_repository.save(Board(5, 5))
+        board = board_repository.load()
+        board.walls.append(Wall(3, 3))
+
+        # Act
+        board_repository.save(board)
+
+        # Assert
+        assert board_repository.load().has_wall_at(3, 3) is True
+
+    def test_robot_commands_append_constant_size_records(self, store, robot_repository):
+        """Cada cambio del robot debe escribir un registro de tamaño constante"""
+        robot = Robot()
+        robot.place(3, 4, 'NORTH')
+        robot_repository.save(robot)
+        size_before = store.log_size()
+        
+        robot.turn_left()
+        robot_repository.save(robot)
+        
+        assert store.log_size() - size_before == len("R 3 4 W\n")
+        assert robot_repository.load().get_position() == (3, 4, 'WEST')
+
+
+    # ==================== Tests de recuperación ====================
+    
+    def test_state_is_rebuilt_from_log(self, store, directory, board_repository, robot_repository):
+        """Debe reconstruir el estado reproduciendo el diario"""
+        board = Board(6, 6)
+        board.add_wall(Wall(2, 2))
+        board_repository.save(board)
+        board = board_repository.load()
+        board.add_wall(Wall(1, 5))
+        board_repository.save(board)
+        robot = Robot()
+        robot.place(4, 4, 'EAST')
+        robot_repository.save(robot)
+        
+        reopened = self._reopen(store, directory)
+        try:
+            board = JournalBoardRepository(reopened).load()
+            robot = JournalRobotRepository(reopened).load()
+        finally:
+            reopened.close()
+        
+        assert (board.width, board.height) == (6, 6)
+        assert [(w.x, w.y) for w in board.walls] == [(2, 2), (1, 5)]
+        assert robot.get_position() == (4, 4, 'EAST')
+    
+    def test_deletes_are_replayed(self, store, directory, board_repository, robot_repository):
+        """Debe reproducir los borrados"""
+        board_repository.save(Board(3, 3))
+        robot = Robot()
+        robot.place(1, 1, 'NORTH')
+        robot_repository.save(robot)
+        board_repository.delete()
+        robot_repository.delete()
+        
+        reopened = self._reopen(store, directory)
+        try:
+            assert JournalBoardRepository(reopened).load() is None
+            assert JournalRobotRepository(reopened).load() is None
+        finally:
+            reopened.close()
+    
+    def test_torn_last_record_is_ignored(self, store, directory, robot_repository):
+        """Debe ignorar un último registro escrito a medias"""
+        robot = Robot()
+        robot.place(2, 2, 'SOUTH')
+        robot_repository.save(robot)
+        store.close()
+        with open(os.path.join(directory, "journal.0.log"), 'a') as f:
+            f.write("R 9 9")
+        
+        reopened = JournalStore(directory)
+        try:
+            assert JournalRobotRepository(reopened).load().get_position() == (2, 2, 'SOUTH')
+        finally:
+            reopened.close()
+    
+    def test_torn_last_record_is_truncated_before_appending(self, store, directory, board_repository):
+        """Tras una escritura a medias, los registros nuevos deben sobrevivir a otro reinicio"""
+        # Arrange
+        board = Board(5, 5)
+        board.add_wall(Wall(1, 1))
+        board_repository.save(board)
+        store.close()
+        with open(os.path.join(directory, "journal.0.log"), 'a') as f:
+            f.write("W 2")
+        
+        # Act
+        reopened = JournalStore(directory)
+        board = JournalBoardRepository(reopened).load()
+        board.add_wall(Wall(3, 3))
+        JournalBoardRepository(reopened).save(board)
+        reopened = self._reopen(reopened, directory)
+        
+        # Assert
+        try:
+            walls = JournalBoardRepository(reopened).load().walls
+            assert [(w.x, w.y) for w in walls] == [(1, 1), (3, 3)]
+        finally:
+            reopened.close()
+
+
+    # ==================== Tests de compactación ====================
+    
+    def test_compact_writes_snapshot_and_removes_old_logs(
+        self, store, directory, board_repository, robot_repository
+    ):
+        """Debe escribir una instantánea y borrar los diarios incluidos"""
+        board = Board(5, 5)
+        board.add_wall(Wall(3, 3))
+        board_repository.save(board)
+        
+        store.compact()
+        robot = Robot()
+        robot.place(1, 2, 'WEST')
+        robot_repository.save(robot)
+        
+        assert os.path.exists(store.snapshot_path)
+        assert sorted(os.listdir(directory)) == ["journal.1.log", "snapshot.json"]
+        
+        reopened = self._reopen(store, directory)
+        try:
+            board = JournalBoardRepository(reopened).load()
+            robot = JournalRobotRepository(reopened).load()
+        finally:
+            reopened.close()
+        assert board.has_wall_at(3, 3) is True
+        assert robot.get_position() == (1, 2, 'WEST')
+    
+    def test_background_compaction_on_threshold(self, directory):
+        """Debe compactar en segundo plano al superar el umbral"""
+        store = JournalStore(directory, compact_threshold=100)
+        repository = JournalRobotRepository(store)
+        robot = Robot()
+        robot.place(1, 1, 'NORTH')
+        try:
+            for _ in range(30):
+                robot.turn_right()
+                repository.save(robot)
+            for _ in range(100):
+                if os.path.exists(store.snapshot_path):
+                    break
+                time.sleep(0.01)
+            
+            assert os.path.exists(store.snapshot_path)
+            assert repository.load().get_position() == (1, 1, 'SOUTH')
+        finally:
+            store.close()
@@ -0,0 +1,143 @@
+import json
+import os
+import time
+import pytest
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from repositories.BoardRepository import BoardRepository
+from repositories.JsonDocumentCache import JsonDocumentCache
+from repositories.RobotRepository import RobotRepository
+
+
+def _age_file(path, seconds=10):
+    """Retrasa la mtime del fichero para que quede fuera de la ventana de carrera"""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _replace_from_other_process(path, data):
+    """Reescribe el fichero como lo haría otro proceso (temporal + rename)"""
+    temp_path = path + '.other'
+    with open(temp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+class TestJsonDocumentCache:
+    """Tests de la caché de lectura de documentos JSON"""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = str(tmp_path / "doc.json")
+        with open(path, 'w') as f:
+            json.dump({"value": 1}, f)
+        _age_file(path)
+        return path
+
+
+    # ==================== Tests de la caché ====================
+
+    def test_returns_cached_document_when_unchanged(self, path):
+        """Debe devolver el mismo documento sin volver a parsearlo"""
+        cache = JsonDocumentCache(path)
+
+        first = cache.read()
+        second = cache.read()
+
+        assert first == {"value": 1}
+        assert second is first
+
+    def test_detects_replacement_by_other_process(self, path):
+        """Debe releer el fichero si otro proceso lo reemplaza"""
+        # Arrange
+        cache = JsonDocumentCache(path)
+        cache.read()
+
+        # Act
+        _replace_from_other_process(path, {"value": 2})
+
+        # Assert
+        assert cache.read() == {"value": 2}
+
+    def test_recently_modified_file_is_not_cached(self, tmp_path):
+        """Un fichero recién escrito se parsea en cada lectura"""
+        path = str(tmp_path / "fresh.json")
+        with open(path, 'w') as f:
+            json.dump([1], f)
+        cache = JsonDocumentCache(path)
+
+        assert cache.read() is not cache.read()
+
+    def test_frequently_rewritten_file_is_cached_after_short_window(self, tmp_path):
+        """Con marcas de nanosegundos basta con que pasen unos milisegundos"""
+        # Arrange: mtime de hace 50 ms con resolución de nanosegundos
+        path = str(tmp_path / "robot.json")
+        with open(path, 'w') as f:
+            json.dump([1], f)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, time.time_ns() - 50_000_000 + 1))
+        cache = JsonDocumentCache(path)
+
+        # Act / Assert
+        assert cache.read() is cache.read()
+
+    def test_coarse_timestamps_use_a_wider_window(self):
+        """Una mtime en segundos enteros exige esperar el doble de la resolución"""
+        assert JsonDocumentCache._racy_window(1_700_000_000_123_456_789) == JsonDocumentCache.RACY_WINDOW_NS
+        assert JsonDocumentCache._racy_window(1_700_000_000_000_000_000) == 2_000_000_000
+
+    def test_invalidate(self, path):
+        """Debe descartar el documento cacheado"""
+        cache = JsonDocumentCache(path)
+        first = cache.read()
+
+        cache.invalidate()
+
+        assert cache.read() is not first
+
+
+    # ==================== Tests de los repositorios JSON ====================
+
+    def test_board_repository_sees_external_changes(self, tmp_path):
+        """El repositorio del tablero debe ver los cambios de otro proceso"""
+        # Arrange
+        repository = BoardRepository(str(tmp_path / "board.json"))
+        repository.save(Board(5, 5))
+        _age_file(repository.db_path)
+        assert repository.load().walls == []
+
+        # Act
+        _replace_from_other_process(
+            repository.db_path, {"width": 5, "height": 5, "walls": [{"x": 2, "y": 3}]}
+        )
+
+        # Assert
+        assert repository.load().has_wall_at(2, 3) is True
+
+    def test_board_repository_returns_independent_boards(self, tmp_path):
+        """Cada carga devuelve un tablero nuevo aunque el documento esté cacheado"""
+        repository = BoardRepository(str(tmp_path / "board.json"))
+        repository.save(Board(5, 5))
+        _age_file(repository.db_path)
+
+        first = repository.load()
+        first.add_wall(Wall(1, 1))
+
+        assert repository.load().has_wall_at(1, 1) is False
+
+    def test_robot_repository_save_invalidates_cache(self, tmp_path):
+        """Guardar el robot debe reflejarse en las lecturas siguientes"""
+        # Arrange
+        repository = RobotRepository(str(tmp_path / "robot.json"))
+        _age_file(repository.db_path)
+        assert repository.exists() is False
+        robot = Robot()
+        robot.place(1, 2, 'EAST')
+
+        # Act
+        repository.save(robot)
+
+        # Assert
+        assert repository.exists() is True
+        assert repository.load().facing == 'EAST'
@@ -0,0 +1,149 @@
+import threading
+import pytest
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from repositories.BoardRepository import BoardRepository
+from repositories.FileLock import FileLock
+from repositories.RobotRepository import RobotRepository
+from exceptions import ConcurrentModificationException
+
+
+class TestJsonVersioning:
+    """Tests del bloqueo optimista (versiones) de los repositorios JSON"""
+
+    @pytest.fixture
+    def robot_path(self, tmp_path):
+        return str(tmp_path / "robot.json")
+
+    @pytest.fixture
+    def board_path(self, tmp_path):
+        return str(tmp_path / "board.json")
+
+
+    # ==================== Tests de versiones ====================
+
+    def test_save_increments_version(self, robot_path):
+        """Cada guardado debe incrementar la versión del documento"""
+        # Arrange
+        repository = RobotRepository(robot_path)
+        robot = Robot()
+        robot.place(1, 1, 'NORTH')
+
+        # Act
+        repository.save(robot)
+        repository.save(robot)
+
+        # Assert
+        assert robot.version == 2
+        assert repository.load().version == 2
+
+    def test_stale_robot_save_is_rejected(self, robot_path):
+        """Guardar un robot cargado antes de otro guardado debe fallar"""
+        # Arrange: dos procesos con su propio repositorio sobre el mismo fichero
+        worker_a = RobotRepository(robot_path)
+        worker_b = RobotRepository(robot_path)
+        robot = Robot()
+        robot.place(1, 1, 'NORTH')
+        worker_a.save(robot)
+
+        robot_a = worker_a.load()
+        robot_b = worker_b.load()
+        robot_a.x = 2
+        worker_a.save(robot_a)
+
+        # Act & Assert
+        robot_b.y = 2
+        with pytest.raises(ConcurrentModificationException):
+            worker_b.save(robot_b)
+        assert (worker_b.load().x, worker_b.load().y) == (2, 1)
+
+    def test_stale_board_save_is_rejected(self, board_path):
+        """Guardar un tablero desactualizado debe fallar sin perder paredes"""
+        # Arrange
+        worker_a = BoardRepository(board_path)
+        worker_b = BoardRepository(board_path)
+        worker_a.save(Board(5, 5))
+        board_a = worker_a.load()
+        board_b = worker_b.load()
+        board_a.add_wall(Wall(1, 1))
+        worker_a.save(board_a)
+
+        # Act & Assert
+        board_b.add_wall(Wall(2, 2))
+        with pytest.raises(ConcurrentModificationException):
+            worker_b.save(board_b)
+        assert [(w.x, w.y) for w in board_b.pop_new_walls()] == [(2, 2)]
+        assert worker_b.load().has_wall_at(1, 1) is True
+
+    def test_new_entity_can_replace_deleted_document(self, robot_path):
+        """Tras eliminar el documento, un robot nuevo se puede guardar"""
+        repository = RobotRepository(robot_path)
+        robot = Robot()
+        robot.place(1, 1, 'NORTH')
+        repository.save(robot)
+
+        repository.delete()
+
+        repository.save(Robot())
+        assert repository.load().version == 1
+
+    def test_compare_and_swap_does_not_lose_updates(self, robot_path):
+        """Con reintentos, los incrementos concurrentes no se pierden"""
+        # Arrange
+        robot = Robot()
+        robot.place(1, 1, 'NORTH')
+        RobotRepository(robot_path).save(robot)
+        threads_count, moves = 4, 25
+
+        def worker():
+            repository = RobotRepository(robot_path)
+            for _ in range(moves):
+                while True:
+                    current = repository.load()
+                    current.x += 1
+                    try:
+                        repository.save(current)
+                        break
+                    except ConcurrentModificationException:
+                        continue
+
+        # Act
+        threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        final = RobotRepository(robot_path).load()
+        assert final.x == 1 + threads_count * moves
+        assert final.version == 1 + threads_count * moves
+
+
+    # ==================== Tests del bloqueo de ficheros ====================
+
+    def test_exclusive_lock_excludes_other_threads(self, tmp_path):
+        """Un bloqueo exclusivo debe excluir a otro hilo hasta liberarse"""
+        # Arrange
+        lock = FileLock(str(tmp_path / "doc.lock"))
+        events = []
+        holding = threading.Event()
+
+        def other():
+            holding.wait()
+            with lock.shared():
+                events.append('other')
+
+        thread = threading.Thread(target=other)
+        thread.start()
+
+        # Act
+        with lock.exclusive():
+            holding.set()
+            thread.join(0.1)
+            events.append('owner')
+        thread.join()
+
+        # Assert
+        assert events == ['owner', 'other']
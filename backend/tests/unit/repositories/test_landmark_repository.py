@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from models.Board import Board
+from models.Wall import Wall
+from repositories.LandmarkRepository import LandmarkRepository
+from models.Landmarks import Landmarks
+
+
+class TestLandmarkRepository:
+    """Tests del repositorio binario de landmarks contra un fichero temporal"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        return LandmarkRepository(str(tmp_path / "board.landmarks"))
+
+
+    # ==================== Tests de guardar y cargar ====================
+
+    def test_load_returns_none_when_missing(self, repository):
+        """Debe devolver None si no hay landmarks"""
+        assert repository.load() is None
+        assert repository.exists() is False
+
+    def test_save_and_load_round_trip(self, repository):
+        """Los landmarks cargados son iguales a los guardados y están mapeados"""
+        # Arrange
+        board = Board(12, 7)
+        board.add_walls([Wall(3, 3), Wall(8, 2)])
+        landmarks = Landmarks.build(board, 3)
+
+        # Act
+        repository.save(landmarks)
+        loaded = repository.load()
+
+        # Assert
+        assert (loaded.width, loaded.height, loaded.wall_count) == (12, 7, 2)
+        assert loaded.fingerprint == landmarks.fingerprint
+        assert list(loaded.cells) == list(landmarks.cells)
+        assert np.array_equal(loaded.distances, landmarks.distances)
+        assert isinstance(loaded.distances, np.memmap)
+
+    def test_round_trip_uint32(self, repository):
+        """Los tableros grandes se guardan con distancias uint32"""
+        landmarks = Landmarks.build(Board(300, 300, storage=Board.STORAGE_DENSE), 1)
+
+        repository.save(landmarks)
+        loaded = repository.load()
+
+        assert loaded.distances.dtype.itemsize == 4
+        assert np.array_equal(loaded.distances, landmarks.distances)
+
+    def test_invalid_or_truncated_file_loads_none(self, repository):
+        """Un fichero corrupto se trata como ausente y se recalcula"""
+        repository.save(Landmarks.build(Board(10, 10), 2))
+        with open(repository.db_path, 'r+b') as f:
+            f.truncate(100)
+
+        assert repository.load() is None
+
+    def test_delete(self, repository):
+        """Debe eliminar el fichero"""
+        repository.save(Landmarks.build(Board(5, 5), 1))
+
+        repository.delete()
+
+        assert repository.exists() is False
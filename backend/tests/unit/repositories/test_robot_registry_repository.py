@@ -0,0 +1,52 @@
+import pytest
+from models.RobotRegistry import RobotRegistry
+from repositories.RobotRegistryRepository import RobotRegistryRepository
+from exceptions import ConcurrentModificationException
+
+
+class TestRobotRegistryRepository:
+    """Tests para la persistencia de todos los robots en un documento"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        return RobotRegistryRepository(str(tmp_path / "robots.json"))
+
+
+    # ==================== Tests de persistencia ====================
+
+    def test_save_and_load_roundtrip(self, repository):
+        """Los robots y su índice deben reconstruirse al cargar"""
+        # Arrange
+        registry = RobotRegistry()
+        registry.place('a', 1, 1, 'NORTH')
+        registry.place('b', 4, 2, 'WEST')
+
+        # Act
+        repository.save(registry)
+        loaded = repository.load()
+
+        # Assert
+        assert [(robot_id, robot.get_position()) for robot_id, robot in loaded] == [
+            ('a', (1, 1, 'NORTH')), ('b', (4, 2, 'WEST'))
+        ]
+        assert loaded.occupant(4, 2) == 'b'
+        assert loaded.version == 1
+
+    def test_load_without_document_returns_none(self, repository):
+        """Sin robots guardados load devuelve None"""
+        assert repository.load() is None
+        assert repository.exists() is False
+
+    def test_stale_save_raises(self, repository):
+        """Guardar un registro cargado antes de otro guardado debe fallar"""
+        # Arrange
+        repository.save(RobotRegistry())
+        first = repository.load()
+        second = repository.load()
+        first.place('a', 1, 1, 'NORTH')
+        repository.save(first)
+
+        # Act / Assert
+        second.place('b', 2, 2, 'NORTH')
+        with pytest.raises(ConcurrentModificationException):
+            repository.save(second)
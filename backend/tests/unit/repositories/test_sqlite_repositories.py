@@ -0,0 +1,224 @@
+import pytest
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from repositories.BoardRepository import BoardRepository
+from repositories.RobotRepository import RobotRepository
+from repositories.SqliteDatabase import SqliteDatabase
+from repositories.SqliteBoardRepository import SqliteBoardRepository
+from repositories.SqliteRobotRepository import SqliteRobotRepository
+
+
+class TestSqliteRepositories:
+    """Tests de los repositorios SQLite contra una base de datos temporal"""
+    
+    @pytest.fixture
+    def database(self, tmp_path):
+        """Base de datos SQLite temporal"""
+        database = SqliteDatabase(str(tmp_path / "game.db"))
+        yield database
+        database.close()
+    
+    @pytest.fixture
+    def board_repository(self, database):
+        return SqliteBoardRepository(database)
+    
+    @pytest.fixture
+    def robot_repository(self, database):
+        return SqliteRobotRepository(database)
+
+
+    # ==================== Tests de la base de datos ====================
+    
+    def test_database_uses_wal_mode(self, database):
+        """Debe activar el modo WAL"""
+        mode = database.connection().execute("PRAGMA journal_mode").fetchone()[0]
+        
+        assert mode == 'wal'
+    
+    def test_connection_is_reused_per_thread(self, database):
+        """Debe reutilizar la conexión dentro del mismo hilo"""
+        assert database.connection() is database.connection()
+
+    def test_failed_commit_rolls_back(self, database):
+        """Si falla el COMMIT la conexión no se queda dentro de la transacción"""
+        # Arrange: una clave ajena diferida solo se comprueba en el COMMIT
+        connection = database.connection()
+        connection.execute("PRAGMA foreign_keys=ON")
+        connection.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        connection.execute(
+            "CREATE TABLE child (parent_id INTEGER REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED)"
+        )
+
+        # Act
+        with pytest.raises(Exception):
+            with database.transaction() as transaction:
+                transaction.execute("INSERT INTO child VALUES (1)")
+
+        # Assert
+        assert connection.in_transaction is False
+        with database.transaction() as transaction:
+            transaction.execute("INSERT INTO parent VALUES (1)")
+        assert connection.execute("SELECT COUNT(*) FROM child").fetchone()[0] == 0
+
+
+    # ==================== Tests del tablero ====================
+    
+    def test_load_returns_none_when_empty(self, board_repository):
+        """Debe devolver None si no hay tablero"""
+        assert board_repository.load() is None
+        assert board_repository.exists() is False
+    
+    def test_save_and_load_board(self, board_repository):
+        """Debe guardar y cargar el tablero con sus paredes en orden"""
+        board = Board(5, 4)
+        board.add_wall(Wall(3, 3))
+        board.add_wall(Wall(1, 2))
+        
+        board_repository.save(board)
+        loaded = board_repository.load()
+        
+        assert (loaded.width, loaded.height) == (5, 4)
+        assert [(w.x, w.y) for w in loaded.walls] == [(3, 3), (1, 2)]
+        assert board_repository.exists() is True
+    
+    def test_adding_a_wall_inserts_only_the_new_row(self, board_repository, database):
+        """Añadir una pared a un tablero guardado debe ser un único INSERT"""
+        board = Board(5, 5)
+        board_repository.save(board)
+        board = board_repository.load()
+        board.add_wall(Wall(2, 2))
+        
+        statements = []
+        database.connection().set_trace_callback(statements.append)
+        board_repository.save(board)
+        database.connection().set_trace_callback(None)
+        
+        inserts = [s for s in statements if s.startswith("INSERT")]
+        assert inserts == ["INSERT OR IGNORE INTO walls (x, y) VALUES (2, 2)"]
+        assert not any(s.startswith("DELETE") for s in statements)
+        assert board_repository.load().has_wall_at(2, 2) is True
+    
+    def test_concurrent_wall_additions_are_merged(self, board_repository):
+        """Dos copias del tablero que añaden paredes distintas no deben pisarse"""
+        board_repository.save(Board(5, 5))
+        first, second = board_repository.load(), board_repository.load()
+        first.add_wall(Wall(1, 1))
+        second.add_wall(Wall(2, 2))
+        
+        board_repository.save(first)
+        board_repository.save(second)
+        
+        loaded = board_repository.load()
+        assert loaded.has_wall_at(1, 1) and loaded.has_wall_at(2, 2)
+    
+    def test_same_size_board_with_other_walls_is_rewritten(self, board_repository):
+        """Otro tablero del mismo tamaño o paredes añadidas sin add_wall se guardan enteros"""
+        # Arrange
+        board = Board(5, 5)
+        board.add_wall(Wall(1, 1))
+        board_repository.save(board)
+        other = Board(5, 5)
+        other.walls.append(Wall(3, 3))
+        other.walls.append(Wall(5, 5))
+        other.add_wall(Wall(4, 4))
+        
+        # Act
+        board_repository.save(other)
+        
+        # Assert
+        loaded = board_repository.load()
+        assert sorted((w.x, w.y) for w in loaded.walls) == [(3, 3), (4, 4), (5, 5)]
+    
+    def test_failed_save_keeps_pending_walls(self, board_repository, database):
+        """Si la transacción falla las paredes nuevas se guardan en el siguiente intento"""
+        # Arrange
+        board_repository.save(Board(5, 5))
+        board = board_repository.load()
+        board.add_wall(Wall(2, 2))
+        database.connection().execute("CREATE TRIGGER fail BEFORE INSERT ON walls BEGIN SELECT RAISE(ABORT, 'fallo'); END")
+        
+        # Act
+        with pytest.raises(Exception):
+            board_repository.save(board)
+        database.connection().execute("DROP TRIGGER fail")
+        board_repository.save(board)
+        
+        # Assert
+        assert board.pending_walls() == []
+        assert board_repository.load().has_wall_at(2, 2) is True
+    
+    def test_saving_a_different_board_replaces_walls(self, board_repository):
+        """Un tablero de otras dimensiones debe reemplazar al anterior"""
+        board = Board(5, 5)
+        board.add_wall(Wall(1, 1))
+        board_repository.save(board)
+        
+        board_repository.save(Board(8, 8))
+        
+        loaded = board_repository.load()
+        assert (loaded.width, loaded.height) == (8, 8)
+        assert len(loaded.walls) == 0
+    
+    def test_delete_board(self, board_repository):
+        """Debe eliminar el tablero y sus paredes"""
+        board = Board(5, 5)
+        board.add_wall(Wall(1, 1))
+        board_repository.save(board)
+        
+        board_repository.delete()
+        
+        assert board_repository.load() is None
+
+
+    # ==================== Tests del robot ====================
+    
+    def test_save_and_load_robot(self, robot_repository):
+        """Debe guardar, actualizar y cargar el robot"""
+        robot = Robot()
+        robot.place(2, 3, 'EAST')
+        robot_repository.save(robot)
+        robot.turn_left()
+        robot_repository.save(robot)
+        
+        loaded = robot_repository.load()
+        
+        assert loaded.get_position() == (2, 3, 'NORTH')
+        assert robot_repository.exists() is True
+    
+    def test_delete_robot(self, robot_repository):
+        """Debe eliminar el robot"""
+        robot = Robot()
+        robot.place(1, 1, 'NORTH')
+        robot_repository.save(robot)
+        
+        robot_repository.delete()
+        
+        assert robot_repository.load() is None
+        assert robot_repository.exists() is False
+
+
+    # ==================== Equivalencia con el backend JSON ====================
+    
+    def test_results_match_json_backend(self, board_repository, robot_repository, tmp_path):
+        """Debe producir el mismo estado que los repositorios JSON"""
+        json_board_repository = BoardRepository(str(tmp_path / "board.json"))
+        json_robot_repository = RobotRepository(str(tmp_path / "robot.json"))
+        
+        for boards, robots in [
+            (json_board_repository, json_robot_repository),
+            (board_repository, robot_repository),
+        ]:
+            boards.save(Board(6, 6))
+            for x, y in [(4, 4), (1, 6), (2, 5)]:
+                board = boards.load()
+                board.add_wall(Wall(x, y))
+                boards.save(board)
+            robot = Robot()
+            robot.place(3, 3, 'SOUTH')
+            robots.save(robot)
+        
+        json_board, sqlite_board = json_board_repository.load(), board_repository.load()
+        assert (json_board.width, json_board.height) == (sqlite_board.width, sqlite_board.height)
+        assert [(w.x, w.y) for w in json_board.walls] == [(w.x, w.y) for w in sqlite_board.walls]
+        assert json_robot_repository.load().get_position() == robot_repository.load().get_position()
@@ -0,0 +1,144 @@
+import pytest
+from unittest.mock import Mock
+from repositories.IRepository import IRepository
+from repositories.TrackingRepository import TrackingRepository
+from repositories.UnitOfWork import UnitOfWork
+from models.Robot import Robot
+
+
+class TestUnitOfWork:
+    """Tests unitarios para TrackingRepository y UnitOfWork"""
+    
+    @pytest.fixture
+    def inner_repository(self):
+        """Mock del repositorio real"""
+        repository = Mock(spec=IRepository)
+        repository.load.return_value = Robot()
+        return repository
+    
+    @pytest.fixture
+    def repository(self, inner_repository):
+        """Repositorio con seguimiento sobre el mock"""
+        return TrackingRepository(inner_repository)
+    
+    @pytest.fixture
+    def unit_of_work(self, repository):
+        """Unidad de trabajo sobre el repositorio con seguimiento"""
+        return UnitOfWork(repository)
+
+
+    # ==================== Tests sin unidad de trabajo ====================
+    
+    def test_delegates_when_no_unit_of_work(self, repository, inner_repository):
+        """Debe delegar directamente si no hay unidad de trabajo activa"""
+        robot = Robot()
+        
+        repository.load()
+        repository.load()
+        repository.save(robot)
+        
+        assert inner_repository.load.call_count == 2
+        inner_repository.save.assert_called_once_with(robot)
+
+
+    # ==================== Tests dentro de la unidad de trabajo ====================
+    
+    def test_loads_at_most_once(self, repository, inner_repository, unit_of_work):
+        """Debe cargar la entidad una sola vez por unidad de trabajo"""
+        with unit_of_work:
+            first = repository.load()
+            second = repository.load()
+            assert repository.exists() is True
+        
+        assert first is second
+        inner_repository.load.assert_called_once()
+        inner_repository.exists.assert_not_called()
+    
+    def test_saves_once_on_commit(self, repository, inner_repository, unit_of_work):
+        """Debe escribir una sola vez al terminar"""
+        with unit_of_work:
+            robot = repository.load()
+            repository.save(robot)
+            repository.save(robot)
+            inner_repository.save.assert_not_called()
+        
+        inner_repository.save.assert_called_once_with(robot)
+    
+    def test_does_not_save_clean_entities(self, repository, inner_repository, unit_of_work):
+        """No debe escribir si no se ha guardado nada"""
+        with unit_of_work:
+            repository.load()
+        
+        inner_repository.save.assert_not_called()
+        inner_repository.delete.assert_not_called()
+    
+    def test_delete_is_deferred(self, repository, inner_repository, unit_of_work):
+        """Debe diferir el borrado y ver la entidad como eliminada"""
+        with unit_of_work:
+            repository.delete()
+            assert repository.load() is None
+            inner_repository.delete.assert_not_called()
+        
+        inner_repository.delete.assert_called_once()
+        inner_repository.save.assert_not_called()
+    
+    def test_discards_changes_on_exception(self, repository, inner_repository, unit_of_work):
+        """Debe descartar los cambios si hay una excepción"""
+        with pytest.raises(RuntimeError):
+            with unit_of_work:
+                repository.save(Robot())
+                raise RuntimeError("fallo")
+        
+        inner_repository.save.assert_not_called()
+        assert unit_of_work.active is False
+    
+    def test_nested_units_join_outer(self, repository, inner_repository, unit_of_work):
+        """Los bloques anidados deben unirse al externo"""
+        with unit_of_work:
+            with unit_of_work:
+                repository.save(Robot())
+            inner_repository.save.assert_not_called()
+        
+        inner_repository.save.assert_called_once()
+    
+    def test_state_is_reset_between_units(self, repository, inner_repository, unit_of_work):
+        """Cada unidad de trabajo debe volver a cargar la entidad"""
+        with unit_of_work:
+            repository.load()
+        with unit_of_work:
+            repository.load()
+        
+        assert inner_repository.load.call_count == 2
+    
+    def test_after_commit_runs_once_changes_are_saved(self, repository, inner_repository, unit_of_work):
+        """Los avisos aplazados deben ejecutarse tras guardar, no antes"""
+        saved = []
+        
+        with unit_of_work:
+            repository.save(Robot())
+            unit_of_work.after_commit(lambda: saved.append(inner_repository.save.called))
+            assert saved == []
+        
+        assert saved == [True]
+    
+    def test_after_commit_is_dropped_when_commit_fails(self, repository, inner_repository, unit_of_work):
+        """Si el guardado falla (p. ej. por un conflicto de versiones) no se avisa"""
+        inner_repository.save.side_effect = RuntimeError("conflicto")
+        callback = Mock()
+        
+        with pytest.raises(RuntimeError):
+            with unit_of_work:
+                repository.save(Robot())
+                unit_of_work.after_commit(callback)
+        with unit_of_work:
+            pass
+        
+        callback.assert_not_called()
+    
+    def test_after_commit_runs_immediately_without_unit_of_work(self, unit_of_work):
+        """Sin unidad de trabajo activa el aviso se ejecuta en el momento"""
+        callback = Mock()
+        
+        unit_of_work.after_commit(callback)
+        
+        callback.assert_called_once()
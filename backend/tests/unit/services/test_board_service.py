@@ -177,4 +177,115 @@ class TestBoardService:
         
         assert result is True
         assert service._board is None
-        mock_repository.delete.assert_called_once()
\ No newline at end of file
+        mock_repository.delete.assert_called_once()
+
+    # # ==================== Tests de add_walls ====================
+    
+    def test_add_walls_persists_once(
+        self, service, mock_repository, sample_board
+    ):
+        """Debe añadir todas las paredes y guardar una sola vez"""
+        mock_repository.load.return_value = sample_board
+        walls = [Wall(x=1, y=1), Wall(x=2, y=2), Wall(x=3, y=3)]
+        
+        added, rejected = service.add_walls(walls)
+        
+        assert added == walls
+        assert rejected == []
+        assert sample_board.has_wall_at(2, 2) is True
+        mock_repository.save.assert_called_once_with(sample_board)
+    
+    def test_add_walls_reports_rejected(
+        self, service, mock_repository, sample_board
+    ):
+        """Debe devolver las paredes rechazadas con su motivo"""
+        sample_board.add_wall(Wall(x=1, y=1))
+        mock_repository.load.return_value = sample_board
+        duplicate, outside, repeated = Wall(x=1, y=1), Wall(x=11, y=1), Wall(x=2, y=2)
+        
+        added, rejected = service.add_walls([duplicate, outside, Wall(x=2, y=2), repeated])
+        
+        assert len(added) == 1
+        assert [w for w, _ in rejected] == [duplicate, outside, repeated]
+        assert isinstance(rejected[0][1], WallAlreadyExistsException)
+        assert isinstance(rejected[1][1], WallOutOfBoundsException)
+        assert isinstance(rejected[2][1], WallAlreadyExistsException)
+        mock_repository.save.assert_called_once_with(sample_board)
+    
+    def test_add_walls_does_not_save_when_all_rejected(
+        self, service, mock_repository, sample_board
+    ):
+        """No debe persistir si no se añade ninguna pared"""
+        mock_repository.load.return_value = sample_board
+        
+        added, rejected = service.add_walls([Wall(x=0, y=0)])
+        
+        assert added == []
+        assert len(rejected) == 1
+        mock_repository.save.assert_not_called()
+    
+    def test_add_walls_raises_when_no_board(
+        self, service, mock_repository
+    ):
+        """Debe lanzar ValueError cuando no hay tablero inicializado"""
+        mock_repository.load.return_value = None
+        with pytest.raises(ValueError, match="No hay tablero inicializado"):
+            service.add_walls([Wall(x=1, y=1)])
+    
+    # ==================== Tests de oyentes ====================
+    
+    def test_listener_receives_added_walls(
+        self, service, mock_repository, sample_board
+    ):
+        """Los oyentes deben recibir el tablero y las paredes añadidas tras guardar"""
+        mock_repository.load.return_value = sample_board
+        listener = Mock()
+        service.add_listener(listener)
+        
+        wall = Wall(x=1, y=1)
+        service.add_wall(wall)
+        added, _ = service.add_walls([Wall(x=2, y=2), Wall(x=0, y=0)])
+        
+        assert listener.call_args_list[0].args == (sample_board, [wall])
+        assert listener.call_args_list[1].args == (sample_board, added)
+    
+    def test_listener_not_called_when_nothing_added(
+        self, service, mock_repository, sample_board
+    ):
+        """No se debe avisar si no se añade ninguna pared"""
+        mock_repository.load.return_value = sample_board
+        listener = Mock()
+        service.add_listener(listener)
+        
+        service.add_walls([Wall(x=0, y=0)])
+        
+        listener.assert_not_called()
+    
+    def test_listener_notified_on_create_and_delete(
+        self, service, mock_repository
+    ):
+        """Crear o borrar el tablero se avisa con walls None"""
+        mock_repository.load.return_value = None
+        listener = Mock()
+        service.add_listener(listener)
+        
+        board = service.create_or_get_board(5, 5)
+        service.delete_board()
+        
+        assert listener.call_args_list[0].args == (board, None)
+        assert listener.call_args_list[1].args == (None, None)
+    
+    def test_listener_waits_for_commit(self, mock_repository, sample_board):
+        """Con after_commit los oyentes se avisan cuando se confirma el cambio"""
+        mock_repository.load.return_value = sample_board
+        pending = []
+        service = BoardService(mock_repository, pending.append)
+        listener = Mock()
+        service.add_listener(listener)
+        
+        wall = Wall(x=1, y=1)
+        service.add_wall(wall)
+        listener.assert_not_called()
+        
+        pending[0]()
+        listener.assert_called_once_with(sample_board, [wall])
@@ -0,0 +1,81 @@
+import pytest
+from services.CommandParser import CommandParser
+
+
+class TestCommandParser:
+    """Tests unitarios para CommandParser"""
+
+    # ==================== Tests del formato de texto ====================
+
+    def test_parse_text_script(self):
+        """Debe interpretar un script clásico, un comando por línea"""
+        # Act
+        commands = CommandParser.parse("PLACE 1,2,NORTH\nMOVE\nleft\nRIGHT\nREPORT")
+
+        # Assert
+        assert [c.name for c in commands] == ['PLACE', 'MOVE', 'LEFT', 'RIGHT', 'REPORT']
+        assert commands[0].args == (1, 2, 'NORTH')
+        assert all(c.error is None for c in commands)
+
+    def test_parse_skips_blank_lines_and_comments(self):
+        """Debe ignorar las líneas vacías y los comentarios"""
+        commands = CommandParser.parse("# inicio\n\nMOVE\n   \n")
+
+        assert [c.name for c in commands] == ['MOVE']
+
+    def test_parse_place_allows_spaces(self):
+        """PLACE admite espacios alrededor de las comas"""
+        command = CommandParser.parse_line("place 3 , 4 , east")
+
+        assert command.args == (3, 4, 'EAST')
+
+    def test_invalid_commands_are_returned_with_error(self):
+        """Un comando mal escrito se devuelve con error sin abortar el script"""
+        # Act
+        commands = CommandParser.parse("JUMP\nPLACE 1,NORTH\nMOVE x\nREPORT")
+
+        # Assert
+        assert [c.error is not None for c in commands] == [True, True, True, False]
+        assert commands[0].source == 'JUMP'
+
+
+    # ==================== Tests del formato JSON ====================
+
+    def test_parse_json_list_of_strings_and_objects(self):
+        """Debe aceptar comandos como texto o como objetos"""
+        # Act
+        commands = CommandParser.parse([
+            {"command": "place", "x": 2, "y": 3, "facing": "south"},
+            "MOVE",
+            {"command": "REPORT"}
+        ])
+
+        # Assert
+        assert [c.name for c in commands] == ['PLACE', 'MOVE', 'REPORT']
+        assert commands[0].args == (2, 3, 'SOUTH')
+
+    def test_json_place_without_coordinates_has_error(self):
+        """PLACE en objeto sin coordenadas debe devolver error"""
+        commands = CommandParser.parse([{"command": "PLACE", "x": 1}, 42])
+
+        assert all(c.error is not None for c in commands)
+
+    def test_parse_move_steps_and_dash(self):
+        """MOVE n (texto u objeto) lleva los pasos como argumento y DASH no tiene"""
+        # Act
+        commands = CommandParser.parse(["MOVE 5", {"command": "move", "steps": 3}, "dash", "MOVE"])
+
+        # Assert
+        assert [(c.name, c.args) for c in commands] == [
+            ('MOVE', (5,)), ('MOVE', (3,)), ('DASH', ()), ('MOVE', ())
+        ]
+
+    @pytest.mark.parametrize("line", ["MOVE 0", "MOVE -2", "MOVE 1,2", "DASH 3"])
+    def test_invalid_move_steps_have_error(self, line):
+        """Los pasos de MOVE deben ser un entero positivo y DASH no admite argumentos"""
+        assert CommandParser.parse_line(line).error is not None
+
+    def test_parse_rejects_other_types(self):
+        """Debe rechazar scripts que no sean texto ni lista"""
+        with pytest.raises(ValueError):
+            CommandParser.parse({"script": "MOVE"})
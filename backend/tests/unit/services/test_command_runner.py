@@ -0,0 +1,168 @@
+import pytest
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from services.CommandParser import CommandParser
+from services.CommandRunner import CommandRunner
+
+
+class TestCommandRunner:
+    """Tests unitarios para CommandRunner"""
+
+    @pytest.fixture
+    def board(self):
+        """Tablero 5x5 con una pared en (3, 1)"""
+        board = Board(5, 5)
+        board.add_wall(Wall(3, 1))
+        return board
+
+    def _run(self, board, script, robot=None):
+        return CommandRunner(board, robot or Robot()).run(CommandParser.parse(script))
+
+
+    # ==================== Tests de ejecución ====================
+
+    def test_runs_script_and_collects_reports(self, board):
+        """Debe ejecutar el script y acumular los REPORT"""
+        # Act
+        runner = self._run(board, "PLACE 1,2,NORTH\nMOVE\nREPORT\nRIGHT\nREPORT")
+
+        # Assert
+        assert runner.reports == [(2, 2, 'NORTH'), (2, 2, 'EAST')]
+        assert runner.errors == []
+        assert runner.executed == 5
+        assert runner.changed is True
+
+    def test_blocked_move_returns_code_and_continues(self, board):
+        """Un movimiento bloqueado se informa con un código y el script sigue"""
+        # Act
+        runner = self._run(board, "PLACE 2,1,NORTH\nMOVE\nLEFT\nREPORT")
+
+        # Assert
+        assert [(index, code) for index, _, code, _ in runner.errors] == [
+            (1, CommandRunner.WALL_COLLISION)
+        ]
+        assert runner.reports == [(2, 1, 'WEST')]
+
+    def test_commands_before_place_are_not_placed(self, board):
+        """Los comandos anteriores a PLACE devuelven NOT_PLACED"""
+        runner = self._run(board, "MOVE\nREPORT")
+
+        assert [code for _, _, code, _ in runner.errors] == [CommandRunner.NOT_PLACED] * 2
+        assert runner.changed is False
+
+    def test_move_wraps_around_edges(self, board):
+        """MOVE aplica wrap around como RobotService"""
+        runner = self._run(board, "PLACE 5,5,EAST\nMOVE\nREPORT")
+
+        assert runner.reports == [(5, 1, 'EAST')]
+
+    def test_invalid_place_codes(self, board):
+        """PLACE inválido devuelve el código del motivo"""
+        # Act
+        runner = self._run(board, "PLACE 3,1,NORTH\nPLACE 9,9,NORTH\nPLACE 1,1,UP\nFLY")
+
+        # Assert
+        assert [code for _, _, code, _ in runner.errors] == [
+            CommandRunner.WALL_COLLISION,
+            CommandRunner.OUT_OF_BOUNDS,
+            CommandRunner.INVALID_DIRECTION,
+            CommandRunner.INVALID_COMMAND
+        ]
+
+    def test_invalid_place_reports_the_same_reason_as_robot_service(self, board):
+        """Con varios motivos, PLACE informa el primero en el orden de RobotService.place"""
+        # Act: pared y dirección no válida; fuera del tablero y dirección no válida
+        runner = self._run(board, "PLACE 3,1,UP\nPLACE 9,9,UP")
+
+        # Assert
+        assert [code for _, _, code, _ in runner.errors] == [
+            CommandRunner.WALL_COLLISION,
+            CommandRunner.OUT_OF_BOUNDS
+        ]
+
+    def test_runs_on_existing_robot(self, board):
+        """Debe continuar desde el robot cargado"""
+        robot = Robot()
+        robot.place(1, 1, 'EAST')
+
+        runner = self._run(board, "MOVE\nREPORT", robot)
+
+        assert runner.reports == [(1, 2, 'EAST')]
+        assert robot.get_position() == (1, 2, 'EAST')
+
+
+    # ==================== Tests de MOVE n y DASH ====================
+
+    def test_move_n_stops_before_wall(self, board):
+        """MOVE n avanza hasta n celdas y se detiene antes de la pared"""
+        runner = self._run(board, "PLACE 1,1,NORTH\nMOVE 4\nREPORT\nPLACE 1,2,NORTH\nMOVE 7\nREPORT")
+
+        assert runner.reports == [(2, 1, 'NORTH'), (3, 2, 'NORTH')]
+        assert runner.errors == []
+
+    def test_move_n_against_adjacent_wall_is_collision(self, board):
+        """Si la pared está justo delante MOVE n no se mueve"""
+        runner = self._run(board, "PLACE 2,1,NORTH\nMOVE 3\nREPORT")
+
+        assert runner.reports == [(2, 1, 'NORTH')]
+        assert [code for _, _, code, _ in runner.errors] == [CommandRunner.WALL_COLLISION]
+
+    def test_dash_runs_to_the_wall_with_wrap_around(self, board):
+        """DASH avanza hasta la casilla anterior a la pared dando la vuelta"""
+        runner = self._run(board, "PLACE 4,1,NORTH\nDASH\nREPORT")
+
+        assert runner.reports == [(2, 1, 'NORTH')]
+
+    def test_dash_without_wall_in_line(self, board):
+        """Sin pared en la línea DASH no se mueve y devuelve NO_WALL"""
+        runner = self._run(board, "PLACE 1,2,EAST\nDASH\nREPORT")
+
+        assert runner.reports == [(1, 2, 'EAST')]
+        assert [code for _, _, code, _ in runner.errors] == [CommandRunner.NO_WALL]
+
+    def test_long_moves_match_on_packed_state(self, board):
+        """MOVE n y DASH dan el mismo resultado con y sin tablas"""
+        # Arrange
+        commands = CommandParser.parse("PLACE 1,1,NORTH\nDASH\nREPORT\nRIGHT\nMOVE 7\nDASH\nREPORT\nLEFT\nMOVE 2\nREPORT")
+        slow = CommandRunner(board, Robot())
+        slow.TABLE_CELLS_PER_COMMAND = 0
+
+        # Act
+        slow.run(commands)
+        board.state_space()
+        packed = CommandRunner(board, Robot()).run(commands)
+
+        # Assert
+        assert packed.reports == slow.reports
+        assert [(i, code) for i, _, code, _ in packed.errors] == [(i, code) for i, _, code, _ in slow.errors]
+
+
+    # ==================== Tests del estado empaquetado ====================
+
+    def test_packed_execution_matches_step_by_step(self, board):
+        """Con las tablas el resultado debe ser el mismo que paso a paso"""
+        # Arrange
+        script = "MOVE\nPLACE 1,1,NORTH\nMOVE\nMOVE\nRIGHT\nMOVE\nREPORT\nLEFT\nLEFT\nMOVE\nJUMP\nREPORT\n" * 3
+        commands = CommandParser.parse(script)
+        slow = CommandRunner(board, Robot())
+        slow.TABLE_CELLS_PER_COMMAND = 0
+
+        # Act
+        slow.run(commands)
+        board.state_space()
+        packed = CommandRunner(board, Robot()).run(commands)
+
+        # Assert
+        assert packed.reports == slow.reports
+        assert [(i, code, msg) for i, _, code, msg in packed.errors] == \
+            [(i, code, msg) for i, _, code, msg in slow.errors]
+        assert packed.robot.get_position() == slow.robot.get_position()
+        assert packed.executed == slow.executed
+
+    def test_long_script_builds_tables(self, board):
+        """Un script con muchos comandos por celda usa las tablas"""
+        runner = self._run(board, "PLACE 1,1,EAST\n" + "MOVE\n" * 20 + "REPORT")
+
+        assert board.state_space(build=False) is not None
+        assert runner.reports == [(1, 1, 'EAST')]
@@ -0,0 +1,107 @@
+import random
+from collections import deque
+import pytest
+from models.Board import Board
+from models.StateSpace import StateSpace, DIRECTIONS
+from models.Wall import Wall
+from services.DistanceField import DistanceField
+from services.PathFinder import PathFinder
+
+
+class TestDistanceField:
+    """Tests unitarios para los campos de distancias de DistanceField"""
+
+    def _bfs_length(self, board, start, x, y, facing):
+        """Longitud óptima de referencia con BFS hacia delante sobre StateSpace"""
+        space = StateSpace(board.width, board.height, board.walls)
+        first = space.encode(*start)
+        distance = {first: 0}
+        queue = deque([first])
+        while queue:
+            state = queue.popleft()
+            state_x, state_y, state_facing = space.decode(state)
+            if (state_x, state_y) == (x, y) and facing in (None, state_facing):
+                return distance[state]
+            for table in (space.forward, space.left, space.right):
+                following = table[state]
+                if following not in distance:
+                    distance[following] = distance[state] + 1
+                    queue.append(following)
+        return None
+
+
+    # ==================== Tests de distancias ====================
+
+    def test_matches_breadth_first_search(self):
+        """Las distancias y los caminos del gradiente deben coincidir con BFS"""
+        rng = random.Random(11)
+        for _ in range(30):
+            # Arrange
+            width, height = rng.randint(1, 8), rng.randint(1, 8)
+            board = Board(width, height)
+            board.add_walls([Wall(rng.randint(1, width), rng.randint(1, height)) for _ in range(width * height // 3)])
+            free = [(x, y) for x in range(1, width + 1) for y in range(1, height + 1) if not board.has_wall_at(x, y)]
+            x, y = rng.choice(free)
+            facing = rng.choice([None, *DIRECTIONS])
+
+            # Act
+            field = DistanceField(board, x, y, facing)
+
+            # Assert
+            for _ in range(5):
+                start = (*rng.choice(free), rng.choice(DIRECTIONS))
+                expected = self._bfs_length(board, start, x, y, facing)
+                commands = field.path(*start)
+                assert field.distance(*start) == expected
+                if expected is None:
+                    assert commands is None
+                else:
+                    assert len(commands) == expected
+                    final = PathFinder(board).final_position(start, commands)
+                    assert final[:2] == (x, y)
+                    assert facing in (None, final[2])
+
+    def test_target_distance_is_zero(self):
+        """El propio objetivo está a distancia 0 con un camino vacío"""
+        field = DistanceField(Board(5, 5), 3, 3, 'EAST')
+
+        assert field.distance(3, 3, 'EAST') == 0
+        assert field.distance(3, 3, 'NORTH') == 1
+        assert field.path(3, 3, 'EAST') == []
+
+    def test_uses_compact_dtype(self):
+        """Tableros pequeños deben usar uint16 y grandes uint32"""
+        assert DistanceField(Board(10, 10), 1, 1).nbytes == 10 * 10 * 4 * 2
+        assert DistanceField(Board(200, 200), 1, 1).distances.itemsize == 4
+
+
+    # ==================== Tests de validación ====================
+
+    def test_rejects_wall_target(self):
+        """El objetivo no puede ser una pared"""
+        board = Board(5, 5)
+        board.add_wall(Wall(2, 2))
+
+        with pytest.raises(ValueError):
+            DistanceField(board, 2, 2)
+
+    def test_rejects_board_too_large(self):
+        """Tableros por encima de StateSpace.MAX_CELLS no se admiten"""
+        board = Board(StateSpace.MAX_CELLS + 1, 1, storage=Board.STORAGE_SPARSE)
+
+        with pytest.raises(ValueError, match="demasiado grande"):
+            DistanceField(board, 1, 1)
+
+
+    # ==================== Tests de invalidación ====================
+
+    def test_still_valid_after_unreachable_wall(self):
+        """Una pared en una casilla que no llega al objetivo no cambia el campo"""
+        # Arrange: (1, 1) queda encerrada y no llega a (5, 5)
+        board = Board(5, 5)
+        board.add_walls([Wall(1, 2), Wall(2, 1), Wall(1, 5), Wall(5, 1)])
+        field = DistanceField(board, 3, 3)
+
+        # Act / Assert
+        assert field.still_valid_after(1, 1) is True
+        assert field.still_valid_after(4, 4) is False
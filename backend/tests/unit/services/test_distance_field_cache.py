@@ -0,0 +1,135 @@
+from models.Board import Board
+from models.Wall import Wall
+from services.DistanceFieldCache import DistanceFieldCache
+
+
+class TestDistanceFieldCache:
+    """Tests unitarios para la caché LRU de DistanceFieldCache"""
+
+    # Bytes de un campo de un tablero 10 x 10 (uint16)
+    FIELD_BYTES = 10 * 10 * 4 * 2
+
+
+    # ==================== Tests de get ====================
+
+    def test_reuses_field_for_same_target(self):
+        """El mismo objetivo sobre el mismo tablero debe salir de la caché"""
+        # Arrange
+        cache = DistanceFieldCache()
+        board = Board(10, 10)
+
+        # Act
+        first = cache.get(board, 3, 3)
+        second = cache.get(board, 3, 3)
+
+        # Assert
+        assert first is second
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_rebuilds_when_board_changed(self):
+        """Si el tablero tiene otras paredes el campo se recalcula"""
+        # Arrange
+        cache = DistanceFieldCache()
+        board = Board(10, 10)
+        first = cache.get(board, 3, 3)
+        board.add_wall(Wall(5, 5))
+
+        # Act
+        second = cache.get(board, 3, 3)
+
+        # Assert
+        assert second is not first
+        assert len(cache) == 1
+
+    def test_rebuilds_when_walls_differ_with_same_count(self):
+        """Un tablero con el mismo número de paredes en otras casillas no reutiliza el campo"""
+        # Arrange
+        cache = DistanceFieldCache()
+        board = Board(10, 10)
+        board.add_wall(Wall(1, 1))
+        first = cache.get(board, 3, 3)
+        other = Board(10, 10)
+        other.add_wall(Wall(3, 4))
+
+        # Act
+        second = cache.get(other, 3, 3)
+
+        # Assert
+        assert second is not first
+        assert first.distance(3, 4, 'NORTH') is not None
+        assert second.distance(3, 4, 'NORTH') is None  # (3, 4) es pared en el tablero nuevo
+        assert cache.misses == 2
+
+    def test_evicts_least_recently_used(self):
+        """Al superar la memoria se expulsa el campo menos usado"""
+        # Arrange
+        cache = DistanceFieldCache(max_bytes=2 * self.FIELD_BYTES)
+        board = Board(10, 10)
+        first = cache.get(board, 1, 1)
+        cache.get(board, 2, 2)
+        cache.get(board, 1, 1)
+
+        # Act
+        cache.get(board, 3, 3)
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.nbytes == 2 * self.FIELD_BYTES
+        assert cache.get(board, 1, 1) is first
+        assert cache.misses == 3
+
+    def test_does_not_store_field_larger_than_budget(self):
+        """Un campo que no cabe se devuelve sin guardarlo"""
+        cache = DistanceFieldCache(max_bytes=self.FIELD_BYTES - 1)
+
+        field = cache.get(Board(10, 10), 1, 1)
+
+        assert field.distance(1, 1, 'NORTH') == 0
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+
+    # ==================== Tests de on_board_changed ====================
+
+    def test_keeps_fields_not_affected_by_new_wall(self):
+        """Una pared en una casilla que no llegaba al objetivo conserva el campo"""
+        # Arrange: (1, 1) está encerrada
+        cache = DistanceFieldCache()
+        board = Board(10, 10)
+        board.add_walls([Wall(1, 2), Wall(2, 1), Wall(1, 10), Wall(10, 1)])
+        field = cache.get(board, 5, 5)
+        wall = Wall(1, 1)
+        board.add_wall(wall)
+
+        # Act
+        cache.on_board_changed(board, [wall])
+
+        # Assert
+        assert cache.get(board, 5, 5) is field
+        assert field.fingerprint == board.fingerprint()
+
+    def test_discards_fields_affected_by_new_wall(self):
+        """Una pared en el camino descarta el campo"""
+        # Arrange
+        cache = DistanceFieldCache()
+        board = Board(10, 10)
+        field = cache.get(board, 5, 5)
+        wall = Wall(4, 5)
+        board.add_wall(wall)
+
+        # Act
+        cache.on_board_changed(board, [wall])
+
+        # Assert
+        assert len(cache) == 0
+        assert cache.get(board, 5, 5) is not field
+
+    def test_clears_when_board_replaced(self):
+        """Crear o borrar el tablero descarta todos los campos"""
+        cache = DistanceFieldCache()
+        cache.get(Board(10, 10), 1, 1)
+
+        cache.on_board_changed(None, None)
+
+        assert len(cache) == 0
+        assert cache.nbytes == 0
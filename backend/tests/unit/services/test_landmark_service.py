@@ -0,0 +1,110 @@
+import pytest
+from models.Board import Board
+from models.Wall import Wall
+from repositories.LandmarkRepository import LandmarkRepository
+from services.LandmarkService import LandmarkService
+
+
+class TestLandmarkService:
+    """Tests de LandmarkService contra un fichero temporal"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        return LandmarkRepository(str(tmp_path / "board.landmarks"))
+
+    @pytest.fixture
+    def service(self, repository):
+        return LandmarkService(repository, count=2)
+
+
+    # ==================== Tests de get ====================
+
+    def test_builds_once_and_persists(self, service, repository):
+        """La primera consulta calcula y guarda; las siguientes reutilizan"""
+        board = Board(10, 10)
+
+        first = service.get(board)
+        second = service.get(board)
+
+        assert first is second
+        assert service.builds == 1
+        assert repository.exists() is True
+
+    def test_loads_persisted_landmarks(self, repository):
+        """Otro proceso con el mismo tablero carga el fichero sin recalcular"""
+        # Arrange
+        board = Board(10, 10)
+        LandmarkService(repository, count=2).get(board)
+        service = LandmarkService(repository, count=2)
+
+        # Act
+        landmarks = service.get(Board(10, 10))
+
+        # Assert
+        assert service.builds == 0
+        assert len(landmarks) == 2
+
+    def test_rebuilds_when_fingerprint_differs(self, repository):
+        """Un fichero de otro tablero con las mismas dimensiones se recalcula"""
+        # Arrange: mismas dimensiones y número de paredes, otra pared
+        saved = Board(10, 10)
+        saved.add_wall(Wall(5, 5))
+        LandmarkService(repository, count=2).get(saved)
+        board = Board(10, 10)
+        board.add_wall(Wall(6, 6))
+        service = LandmarkService(repository, count=2)
+
+        # Act
+        landmarks = service.get(board)
+
+        # Assert
+        assert service.builds == 1
+        assert repository.load().fingerprint == landmarks.fingerprint
+
+
+    def test_in_memory_copy_is_checked_against_fingerprint(self, service):
+        """Sin aviso de cambios, otro tablero con el mismo número de paredes se recalcula"""
+        # Arrange: mismas dimensiones y número de paredes, otra pared
+        board = Board(10, 10)
+        board.add_wall(Wall(5, 5))
+        first = service.get(board)
+        other = Board(10, 10)
+        other.add_wall(Wall(6, 6))
+
+        # Act
+        second = service.get(other)
+
+        # Assert
+        assert second is not first
+        assert second.fingerprint == other.fingerprint()
+        assert service.builds == 2
+
+
+    # ==================== Tests de on_board_changed ====================
+
+    def test_rebuilds_lazily_after_new_wall(self, service):
+        """Añadir una pared no recalcula hasta la siguiente consulta"""
+        # Arrange
+        board = Board(10, 10)
+        first = service.get(board)
+        wall = Wall(5, 5)
+        board.add_wall(wall)
+
+        # Act
+        service.on_board_changed(board, [wall])
+        builds_after_wall = service.builds
+        second = service.get(board)
+
+        # Assert
+        assert builds_after_wall == 1
+        assert second is not first
+        assert service.builds == 2
+        assert second.wall_count == 1
+
+    def test_deletes_file_with_board(self, service, repository):
+        """Borrar el tablero borra los landmarks persistidos"""
+        service.get(Board(10, 10))
+
+        service.on_board_changed(None, None)
+
+        assert repository.exists() is False
@@ -0,0 +1,172 @@
+import random
+from collections import deque
+import pytest
+from models.Board import Board
+from models.StateSpace import StateSpace, DIRECTIONS
+from models.Wall import Wall
+from models.Landmarks import Landmarks
+from services.PathFinder import PathFinder
+from exceptions import PathNotFoundException
+
+
+class TestPathFinder:
+    """Tests unitarios para el A* de PathFinder"""
+
+    def _bfs_length(self, board, start, x, y, facing):
+        """Longitud óptima de referencia con BFS sobre las tablas de StateSpace"""
+        space = StateSpace(board.width, board.height, board.walls)
+        first = space.encode(*start)
+        distance = {first: 0}
+        queue = deque([first])
+        while queue:
+            state = queue.popleft()
+            state_x, state_y, state_facing = space.decode(state)
+            if (state_x, state_y) == (x, y) and facing in (None, state_facing):
+                return distance[state]
+            for table in (space.forward, space.left, space.right):
+                following = table[state]
+                if following not in distance:
+                    distance[following] = distance[state] + 1
+                    queue.append(following)
+        return None
+
+
+    # ==================== Tests de optimalidad ====================
+
+    def test_matches_breadth_first_search(self):
+        """A* debe encontrar caminos de la misma longitud que BFS"""
+        rng = random.Random(5)
+        for _ in range(30):
+            # Arrange
+            width, height = rng.randint(1, 8), rng.randint(1, 8)
+            board = Board(width, height)
+            board.add_walls([Wall(rng.randint(1, width), rng.randint(1, height)) for _ in range(width * height // 3)])
+            free = [(x, y) for x in range(1, width + 1) for y in range(1, height + 1) if not board.has_wall_at(x, y)]
+            start = (*rng.choice(free), rng.choice(DIRECTIONS))
+            x, y = rng.choice(free)
+            facing = rng.choice([None, *DIRECTIONS])
+            expected = self._bfs_length(board, start, x, y, facing)
+            finder = PathFinder(board)
+
+            # Act
+            try:
+                commands = finder.find(start, x, y, facing)
+            except PathNotFoundException:
+                commands = None
+
+            # Assert
+            if expected is None:
+                assert commands is None
+            else:
+                assert len(commands) == expected
+                end_x, end_y, end_facing = finder.final_position(start, commands)
+                assert (end_x, end_y) == (x, y)
+                assert facing in (None, end_facing)
+
+    def test_landmarks_keep_paths_optimal(self):
+        """Con landmarks (ALT) A* debe seguir encontrando caminos de longitud óptima"""
+        rng = random.Random(8)
+        for _ in range(30):
+            # Arrange
+            width, height = rng.randint(2, 8), rng.randint(2, 8)
+            board = Board(width, height)
+            board.add_walls([Wall(rng.randint(1, width), rng.randint(1, height)) for _ in range(width * height // 3)])
+            free = [(x, y) for x in range(1, width + 1) for y in range(1, height + 1) if not board.has_wall_at(x, y)]
+            if len(free) < 2:
+                continue
+            start = (*rng.choice(free), rng.choice(DIRECTIONS))
+            x, y = rng.choice(free)
+            facing = rng.choice([None, *DIRECTIONS])
+            expected = self._bfs_length(board, start, x, y, facing)
+            finder = PathFinder(board, landmarks=Landmarks.build(board, 3))
+
+            # Act
+            try:
+                commands = finder.find(start, x, y, facing)
+            except PathNotFoundException:
+                commands = None
+
+            # Assert
+            if expected is None:
+                assert commands is None
+            else:
+                assert len(commands) == expected
+
+    def test_landmarks_expand_fewer_states_around_walls(self):
+        """Un objetivo encerrado con la salida al otro lado se resuelve sin inundar la caja"""
+        # Arrange: caja de paredes alrededor del objetivo, abierta solo por el lado opuesto
+        board = Board(60, 60)
+        walls = []
+        for i in range(20, 41):
+            walls += [Wall(20, i), Wall(40, i), Wall(i, 20)]
+            if i != 30:
+                walls.append(Wall(i, 40))
+        board.add_walls(walls)
+        plain = PathFinder(board)
+        alt = PathFinder(board, landmarks=Landmarks.build(board, 4))
+
+        # Act
+        expected = plain.find((30, 10, 'EAST'), 30, 25)
+        commands = alt.find((30, 10, 'EAST'), 30, 25)
+
+        # Assert
+        assert len(commands) == len(expected)
+        assert alt.expanded * 10 < plain.expanded
+
+    def test_rejects_stale_landmarks(self):
+        """Los landmarks de otro tablero (o con menos paredes) no se aceptan"""
+        board = Board(10, 10)
+        landmarks = Landmarks.build(board, 2)
+        board.add_wall(Wall(5, 5))
+
+        with pytest.raises(ValueError):
+            PathFinder(board, landmarks=landmarks)
+
+    def test_uses_wrap_around(self):
+        """Cruzar el borde es más corto que recorrer el tablero"""
+        finder = PathFinder(Board(10, 10))
+
+        assert finder.find((10, 5, 'NORTH'), 2, 5) == ['MOVE', 'MOVE']
+
+    def test_turns_cost_like_moves(self):
+        """Dar la vuelta cuesta dos comandos"""
+        finder = PathFinder(Board(5, 5))
+
+        assert finder.find((3, 3, 'NORTH'), 3, 3, 'SOUTH') in (['LEFT', 'LEFT'], ['RIGHT', 'RIGHT'])
+
+
+    # ==================== Tests de fallos ====================
+
+    def test_goal_on_wall_raises(self):
+        """No se puede ir a una pared"""
+        board = Board(5, 5)
+        board.add_wall(Wall(2, 2))
+
+        with pytest.raises(PathNotFoundException):
+            PathFinder(board).find((1, 1, 'NORTH'), 2, 2)
+
+    def test_enclosed_goal_raises(self):
+        """Un destino rodeado de paredes es inalcanzable"""
+        board = Board(5, 5)
+        board.add_walls([Wall(2, 3), Wall(4, 3), Wall(3, 2), Wall(3, 4)])
+
+        with pytest.raises(PathNotFoundException):
+            PathFinder(board).find((1, 1, 'NORTH'), 3, 3)
+
+    def test_landmarks_detect_unreachable_goal_without_expanding(self):
+        """Si los landmarks demuestran que no hay camino no se expande nada"""
+        board = Board(10, 10)
+        board.add_walls([Wall(1, 2), Wall(2, 1), Wall(1, 10), Wall(10, 1)])
+        finder = PathFinder(board, landmarks=Landmarks.build(board, 2))
+
+        with pytest.raises(PathNotFoundException):
+            finder.find((5, 5, 'NORTH'), 1, 1)
+        assert finder.expanded == 0
+
+    def test_budget_stops_search(self):
+        """La búsqueda se aborta al superar max_nodes"""
+        finder = PathFinder(Board(200, 200), max_nodes=10)
+
+        with pytest.raises(PathNotFoundException):
+            finder.find((1, 1, 'NORTH'), 100, 100)
+        assert finder.expanded == 11
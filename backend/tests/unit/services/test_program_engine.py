@@ -0,0 +1,138 @@
+import pytest
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from services.CommandParser import CommandParser
+from services.CommandRunner import CommandRunner
+from services.ProgramEngine import ProgramEngine
+
+
+class TestProgramEngine:
+    """Tests unitarios para ProgramEngine"""
+
+    PROGRAM = "MOVE\nMOVE\nRIGHT\nMOVE\nLEFT\nMOVE"
+
+    @pytest.fixture
+    def board(self):
+        """Tablero 7x5 con paredes"""
+        board = Board(7, 5)
+        board.add_walls([Wall(3, 2), Wall(5, 5), Wall(6, 1)])
+        return board
+
+    @pytest.fixture
+    def engine(self, board):
+        return ProgramEngine.for_board(board)
+
+    def _simulate(self, board, program, times, start):
+        """Ejecuta el programa times veces comando a comando"""
+        robot = Robot()
+        robot.place(*start)
+        CommandRunner(board, robot).run(CommandParser.parse(program) * times)
+        return robot.get_position()
+
+
+    # ==================== Tests de repeat ====================
+
+    @pytest.mark.parametrize("times", [0, 1, 2, 3, 7, 16, 37, 100])
+    def test_repeat_matches_step_by_step(self, board, engine, times):
+        """Repetir el programa debe coincidir con ejecutarlo paso a paso"""
+        # Arrange
+        start = (1, 1, 'NORTH')
+        program = engine.compile(CommandParser.parse(self.PROGRAM))
+
+        # Act
+        state = engine.repeat(program, times, engine.space.encode(*start))
+
+        # Assert
+        assert engine.space.decode(state) == self._simulate(board, self.PROGRAM, times, start)
+
+    def test_repeat_handles_huge_times(self, engine):
+        """Debe resolver un número de repeticiones enorme sin simularlas"""
+        program = engine.compile(CommandParser.parse("MOVE"))
+
+        state = engine.repeat(program, 10 ** 18, engine.space.encode(1, 1, 'EAST'))
+
+        # Fila x = 1 sin paredes: 10^18 mod 5 = 0 pasos netos
+        assert engine.space.decode(state) == (1, 1, 'EAST')
+
+    def test_repeat_rejects_negative_times(self, engine):
+        """times negativo debe lanzar ValueError"""
+        program = engine.compile([])
+
+        with pytest.raises(ValueError):
+            engine.repeat(program, -1, 0)
+
+
+    # ==================== Tests de compile ====================
+
+    def test_compile_move_n_equals_repeated_move(self, engine):
+        """MOVE n debe compilar igual que n MOVE seguidos"""
+        program = engine.compile(CommandParser.parse("MOVE 7\nLEFT\nMOVE 3"))
+        expected = engine.compile(CommandParser.parse("MOVE\n" * 7 + "LEFT\n" + "MOVE\n" * 3))
+
+        assert (program == expected).all()
+
+    def test_compile_rejects_dash(self, engine):
+        """DASH no es una función del programa repetible"""
+        with pytest.raises(ValueError):
+            engine.compile(CommandParser.parse("DASH"))
+
+    def test_compile_rejects_non_program_commands(self, engine):
+        """Solo se admiten MOVE, LEFT y RIGHT"""
+        with pytest.raises(ValueError):
+            engine.compile(CommandParser.parse("MOVE\nREPORT"))
+
+    def test_compile_rejects_invalid_commands(self, engine):
+        """Un comando mal escrito debe lanzar ValueError"""
+        with pytest.raises(ValueError):
+            engine.compile(CommandParser.parse("JUMP"))
+
+    def test_for_board_rejects_boards_too_large(self):
+        """Un tablero sin tablas de estados no admite programas"""
+        with pytest.raises(ValueError):
+            ProgramEngine.for_board(Board(2000, 2000))
+
+
+    # ==================== Tests de órbitas ====================
+
+    def test_orbit_matches_state_hashing(self, engine):
+        """Brent debe coincidir con guardar todos los estados visitados"""
+        program = engine.compile(CommandParser.parse(self.PROGRAM))
+
+        for state in range(0, engine.space.size, 7):
+            # Arrange: referencia con un diccionario estado -> repetición
+            seen = {}
+            current, step = state, 0
+            while current not in seen:
+                seen[current] = step
+                current = int(program[current])
+                step += 1
+
+            # Act
+            pre_period, period = engine.orbit(program, state)
+
+            # Assert
+            assert pre_period == seen[current]
+            assert period == step - seen[current]
+
+    def test_orbit_of_fixed_point(self, engine):
+        """Un programa que no mueve el robot tiene periodo 1"""
+        program = engine.compile(CommandParser.parse("LEFT\nRIGHT"))
+
+        assert engine.orbit(program, 5) == (0, 1)
+
+    def test_cycle_cells_include_intermediate_cells(self):
+        """Las celdas del ciclo incluyen las que se cruzan con MOVE n"""
+        # Arrange: fila x = 1 de un tablero 3x6 sin paredes
+        engine = ProgramEngine.for_board(Board(3, 6))
+        commands = CommandParser.parse("MOVE 4")
+        program = engine.compile(commands)
+        state = engine.space.encode(1, 1, 'EAST')
+
+        # Act
+        pre_period, period = engine.orbit(program, state)
+        cells = engine.cycle_cells(commands, program, state, period)
+
+        # Assert: 4 pasos por repetición en una fila de 6 -> vuelve en 3
+        assert (pre_period, period) == (0, 3)
+        assert cells == [(1, y) for y in range(1, 7)]
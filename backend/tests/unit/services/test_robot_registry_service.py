@@ -0,0 +1,121 @@
+import pytest
+from unittest.mock import Mock
+from models.Board import Board
+from models.RobotRegistry import RobotRegistry
+from models.Wall import Wall
+from repositories.RobotRegistryRepository import RobotRegistryRepository
+from services.BoardService import BoardService
+from services.RobotRegistryService import RobotRegistryService
+from exceptions import (
+    RobotCollisionException,
+    RobotNotFoundException,
+    RobotOutOfBoundsException,
+    WallCollisionException
+)
+
+
+class TestRobotRegistryService:
+    """Tests unitarios para RobotRegistryService"""
+    
+    @pytest.fixture
+    def mock_repository(self):
+        """Mock del repositorio de robots con un registro vacío"""
+        repository = Mock(spec=RobotRegistryRepository)
+        repository.load.return_value = RobotRegistry()
+        return repository
+    
+    @pytest.fixture
+    def mock_board_service(self):
+        """Tablero 5x5 con una pared en (3, 3)"""
+        board = Board(5, 5)
+        board.add_wall(Wall(3, 3))
+        board_service = Mock(spec=BoardService)
+        board_service.get_board.return_value = board
+        return board_service
+    
+    @pytest.fixture
+    def service(self, mock_repository, mock_board_service):
+        return RobotRegistryService(mock_repository, mock_board_service)
+    
+    
+    # ==================== Tests de place ====================
+    
+    def test_create_generates_id_and_saves(self, service, mock_repository):
+        """Debe crear un robot con id nuevo y persistir el registro"""
+        # Act
+        robot_id, position = service.create(1, 1, 'NORTH')
+        
+        # Assert
+        assert position == (1, 1, 'NORTH')
+        registry = mock_repository.save.call_args[0][0]
+        assert registry.occupant(1, 1) == robot_id
+    
+    def test_place_on_wall_raises(self, service, mock_repository):
+        """No se puede colocar un robot sobre una pared"""
+        with pytest.raises(WallCollisionException):
+            service.place('a', 3, 3, 'NORTH')
+        mock_repository.save.assert_not_called()
+    
+    def test_place_outside_board_raises(self, service):
+        """No se puede colocar un robot fuera del tablero"""
+        with pytest.raises(RobotOutOfBoundsException):
+            service.place('a', 6, 1, 'NORTH')
+    
+    def test_place_without_board_raises(self, service, mock_board_service):
+        """Sin tablero debe lanzar ValueError"""
+        mock_board_service.get_board.return_value = None
+        
+        with pytest.raises(ValueError):
+            service.place('a', 1, 1, 'NORTH')
+    
+    
+    # ==================== Tests de move ====================
+    
+    def test_move_with_wrap_around(self, service, mock_repository):
+        """Debe mover el robot con wrap around y guardar"""
+        service.place('a', 5, 1, 'NORTH')
+        
+        assert service.move('a') == (1, 1, 'NORTH')
+        assert mock_repository.save.call_args[0][0].occupant(1, 1) == 'a'
+    
+    def test_move_into_robot_raises(self, service):
+        """Un robot bloquea a otro"""
+        service.place('a', 1, 1, 'NORTH')
+        service.place('b', 2, 1, 'SOUTH')
+        
+        with pytest.raises(RobotCollisionException):
+            service.move('a')
+        assert service.report('a') == (1, 1, 'NORTH')
+    
+    def test_move_into_wall_raises(self, service):
+        """Las paredes también bloquean a los robots del registro"""
+        service.place('a', 2, 3, 'NORTH')
+        
+        with pytest.raises(WallCollisionException):
+            service.move('a')
+    
+    def test_unknown_robot_raises(self, service):
+        """Un id desconocido debe lanzar RobotNotFoundException"""
+        with pytest.raises(RobotNotFoundException):
+            service.move('nadie')
+    
+    
+    # ==================== Tests de giros, listado y borrado ====================
+    
+    def test_turns_and_list(self, service):
+        """Los giros cambian la orientación y list_robots devuelve todos"""
+        service.place('a', 1, 1, 'NORTH')
+        service.place('b', 2, 2, 'EAST')
+        
+        service.left('a')
+        service.right('b')
+        
+        assert service.list_robots() == [('a', 1, 1, 'WEST'), ('b', 2, 2, 'SOUTH')]
+    
+    def test_delete_frees_cell(self, service):
+        """Eliminar un robot libera su celda para otro"""
+        service.place('a', 1, 1, 'NORTH')
+        
+        service.delete('a')
+        
+        assert service.place('b', 1, 1, 'NORTH') == (1, 1, 'NORTH')
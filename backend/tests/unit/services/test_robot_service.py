@@ -5,7 +5,13 @@ from repositories.RobotRepository import RobotRepository
 from services.BoardService import BoardService
 from models.Robot import Robot
 from models.Board import Board
+from models.Wall import Wall
+from services.CommandParser import CommandParser
+from services.DistanceFieldCache import DistanceFieldCache
+from services.LandmarkService import LandmarkService
+from repositories.LandmarkRepository import LandmarkRepository
 from exceptions import (
+    PathNotFoundException,
     RobotNotPlacedException,
     WallCollisionException,
     RobotOutOfBoundsException,
@@ -464,4 +470,286 @@ class TestRobotService:
     def test_wrap_coordinate_wraps_when_above_maximum(self, service):
         """Debe hacer wrap cuando está por encima del máximo"""
         assert service._wrap_coordinate(11, 10) == 1
-        assert service._wrap_coordinate(15, 10) == 1
\ No newline at end of file
+        assert service._wrap_coordinate(15, 10) == 1
+
+    # ==================== Tests de run_commands ====================
+    
+    def test_run_commands_saves_robot_once(self, service, mock_robot_repository, mock_board_service):
+        """Debe cargar una vez y persistir una sola vez todo el script"""
+        # Arrange
+        mock_board_service.get_board.return_value = Board(10, 10)
+        mock_robot_repository.load.return_value = None
+        commands = CommandParser.parse("PLACE 1,1,NORTH\nMOVE\nMOVE\nLEFT\nREPORT")
+        
+        # Act
+        runner = service.run_commands(commands)
+        
+        # Assert
+        assert runner.reports == [(3, 1, 'WEST')]
+        mock_robot_repository.load.assert_called_once()
+        mock_robot_repository.save.assert_called_once_with(runner.robot)
+    
+    def test_run_commands_does_not_save_when_unchanged(self, service, mock_robot_repository, mock_board_service, sample_robot):
+        """No debe persistir si el script no cambia el robot"""
+        # Arrange
+        mock_board_service.get_board.return_value = Board(10, 10)
+        mock_robot_repository.load.return_value = sample_robot
+        
+        # Act
+        runner = service.run_commands(CommandParser.parse("REPORT"))
+        
+        # Assert
+        assert runner.reports == [(5, 5, 'NORTH')]
+        mock_robot_repository.save.assert_not_called()
+    
+    def test_run_commands_raises_when_no_board(self, service, mock_board_service):
+        """Debe lanzar ValueError si no hay tablero"""
+        mock_board_service.get_board.return_value = None
+        
+        with pytest.raises(ValueError):
+            service.run_commands(CommandParser.parse("MOVE"))
+    
+    
+    # ==================== Tests de move_steps y dash ====================
+    
+    @pytest.fixture
+    def wall_board(self):
+        """Tablero 10x10 real con una pared en (9, 5)"""
+        board = Board(10, 10)
+        board.add_wall(Wall(9, 5))
+        return board
+    
+    def test_move_steps_stops_before_wall(
+        self, service, mock_robot_repository, mock_board_service, sample_robot, wall_board
+    ):
+        """Debe avanzar hasta n celdas deteniéndose antes de la pared"""
+        # Arrange
+        mock_board_service.get_board.return_value = wall_board
+        mock_robot_repository.load.return_value = sample_robot
+        
+        # Act
+        position = service.move_steps(6)
+        
+        # Assert
+        assert position == (8, 5, 'NORTH')
+        mock_robot_repository.save.assert_called_once_with(sample_robot)
+    
+    def test_move_steps_raises_when_wall_is_adjacent(
+        self, service, mock_robot_repository, mock_board_service, wall_board
+    ):
+        """Debe lanzar WallCollisionException si no puede avanzar ninguna celda"""
+        robot = Robot()
+        robot.place(8, 5, 'NORTH')
+        mock_board_service.get_board.return_value = wall_board
+        mock_robot_repository.load.return_value = robot
+        
+        with pytest.raises(WallCollisionException):
+            service.move_steps(3)
+        mock_robot_repository.save.assert_not_called()
+    
+    def test_move_steps_rejects_non_positive_steps(self, service):
+        """steps debe ser positivo"""
+        with pytest.raises(ValueError):
+            service.move_steps(0)
+    
+    def test_dash_moves_to_wall_with_wrap_around(
+        self, service, mock_robot_repository, mock_board_service, wall_board
+    ):
+        """DASH debe avanzar hasta la casilla anterior a la pared"""
+        robot = Robot()
+        robot.place(2, 5, 'SOUTH')
+        mock_board_service.get_board.return_value = wall_board
+        mock_robot_repository.load.return_value = robot
+        
+        assert service.dash() == (10, 5, 'SOUTH')
+    
+    def test_dash_raises_without_wall_in_line(
+        self, service, mock_robot_repository, mock_board_service, sample_robot
+    ):
+        """DASH sin pared en la línea debe lanzar ValueError"""
+        mock_board_service.get_board.return_value = Board(10, 10)
+        mock_robot_repository.load.return_value = sample_robot
+        
+        with pytest.raises(ValueError):
+            service.dash()
+        mock_robot_repository.save.assert_not_called()
+    
+    
+    # ==================== Tests de repeat_program ====================
+    
+    def test_repeat_program_moves_and_saves_robot(self, service, mock_robot_repository, mock_board_service):
+        """Debe aplicar el programa times veces y persistir una vez"""
+        # Arrange
+        mock_board_service.get_board.return_value = Board(10, 10)
+        robot = Robot()
+        robot.place(1, 1, 'EAST')
+        mock_robot_repository.load.return_value = robot
+        
+        # Act
+        position = service.repeat_program(CommandParser.parse("MOVE\nMOVE"), 1_000_001)
+        
+        # Assert: 2_000_002 pasos en una fila de 10 celdas = 2 pasos netos
+        assert position == (1, 3, 'EAST')
+        mock_robot_repository.save.assert_called_once_with(robot)
+    
+    def test_repeat_program_raises_when_not_placed(self, service, mock_robot_repository, mock_board_service):
+        """Debe lanzar RobotNotPlacedException si el robot no está colocado"""
+        mock_board_service.get_board.return_value = Board(10, 10)
+        mock_robot_repository.load.return_value = None
+        
+        with pytest.raises(RobotNotPlacedException):
+            service.repeat_program(CommandParser.parse("MOVE"), 3)
+    
+    
+    # ==================== Tests de goto ====================
+    
+    def test_goto_returns_commands_without_moving(
+        self, service, mock_robot_repository, mock_board_service, sample_robot
+    ):
+        """Sin execute debe devolver el camino sin guardar el robot"""
+        # Arrange
+        mock_board_service.get_board.return_value = Board(10, 10)
+        mock_robot_repository.load.return_value = sample_robot
+        
+        # Act
+        commands, position = service.goto(7, 5)
+        
+        # Assert
+        assert commands == ['MOVE', 'MOVE']
+        assert position == (7, 5, 'NORTH')
+        assert sample_robot.get_position() == (5, 5, 'NORTH')
+        mock_robot_repository.save.assert_not_called()
+    
+    def test_goto_executes_in_one_save(
+        self, service, mock_robot_repository, mock_board_service, sample_robot
+    ):
+        """Con execute debe aplicar el camino y guardar una vez"""
+        # Arrange
+        board = Board(10, 10)
+        board.add_wall(Wall(6, 5))
+        mock_board_service.get_board.return_value = board
+        mock_robot_repository.load.return_value = sample_robot
+        
+        # Act
+        commands, position = service.goto(7, 5, 'EAST', execute=True)
+        
+        # Assert
+        # Rodear la pared: LEFT, MOVE, RIGHT, MOVE, MOVE, RIGHT, MOVE
+        assert len(commands) == 7
+        assert position == (7, 5, 'EAST')
+        assert sample_robot.get_position() == (7, 5, 'EAST')
+        mock_robot_repository.save.assert_called_once_with(sample_robot)
+    
+    def test_goto_rejects_destination_outside_board(
+        self, service, mock_robot_repository, mock_board_service, sample_robot
+    ):
+        """El destino debe estar dentro del tablero"""
+        mock_board_service.get_board.return_value = Board(10, 10)
+        mock_robot_repository.load.return_value = sample_robot
+        
+        with pytest.raises(RobotOutOfBoundsException):
+            service.goto(11, 5)
+    
+    def test_goto_with_distance_fields_reuses_field(
+        self, mock_robot_repository, mock_board_service, sample_robot
+    ):
+        """Con caché de campos debe dar caminos óptimos y reutilizar el campo del destino"""
+        # Arrange
+        board = Board(10, 10)
+        board.add_wall(Wall(6, 5))
+        mock_board_service.get_board.return_value = board
+        mock_robot_repository.load.return_value = sample_robot
+        cache = DistanceFieldCache()
+        service = RobotService(mock_robot_repository, mock_board_service, cache)
+        
+        # Act
+        commands, position = service.goto(7, 5, 'EAST')
+        service.goto(7, 5, 'EAST')
+        
+        # Assert
+        assert len(commands) == 7
+        assert position == (7, 5, 'EAST')
+        assert (cache.misses, cache.hits) == (1, 1)
+    
+    def test_goto_with_landmarks(
+        self, mock_robot_repository, mock_board_service, sample_robot, tmp_path
+    ):
+        """Sin campos de distancias goto usa A* con los landmarks del tablero"""
+        # Arrange
+        board = Board(10, 10)
+        board.add_wall(Wall(6, 5))
+        mock_board_service.get_board.return_value = board
+        mock_robot_repository.load.return_value = sample_robot
+        landmarks = LandmarkService(LandmarkRepository(str(tmp_path / "board.landmarks")), count=2)
+        service = RobotService(mock_robot_repository, mock_board_service, landmarks=landmarks)
+        
+        # Act
+        commands, position = service.goto(7, 5, 'EAST')
+        
+        # Assert
+        assert len(commands) == 7
+        assert position == (7, 5, 'EAST')
+        assert landmarks.builds == 1
+    
+    def test_goto_with_distance_fields_unreachable(
+        self, mock_robot_repository, mock_board_service, sample_robot
+    ):
+        """Un destino encerrado entre paredes debe lanzar PathNotFoundException"""
+        board = Board(10, 10)
+        board.add_walls([Wall(1, 2), Wall(2, 1), Wall(1, 10), Wall(10, 1)])
+        mock_board_service.get_board.return_value = board
+        mock_robot_repository.load.return_value = sample_robot
+        service = RobotService(mock_robot_repository, mock_board_service, DistanceFieldCache())
+        
+        with pytest.raises(PathNotFoundException):
+            service.goto(1, 1)
+    
+    
+    # ==================== Tests de analyze_orbit ====================
+    
+    def test_analyze_orbit_from_robot_position(self, service, mock_robot_repository, mock_board_service):
+        """Debe medir el ciclo desde el robot sin moverlo ni persistirlo"""
+        # Arrange: el robot da vueltas a una fila de 10 celdas
+        mock_board_service.get_board.return_value = Board(10, 10)
+        robot = Robot()
+        robot.place(3, 1, 'EAST')
+        mock_robot_repository.load.return_value = robot
+        
+        # Act
+        pre_period, period, cells, position = service.analyze_orbit(
+            CommandParser.parse("MOVE\nMOVE"), times=10 ** 12 + 1
+        )
+        
+        # Assert
+        assert (pre_period, period) == (0, 5)
+        assert cells == [(3, y) for y in range(1, 11)]
+        assert position == (3, 3, 'EAST')
+        assert robot.get_position() == (3, 1, 'EAST')
+        mock_robot_repository.save.assert_not_called()
+    
+    def test_analyze_orbit_with_pre_period(self, service, mock_robot_repository, mock_board_service):
+        """Un robot que acaba parado contra una pared tiene preperiodo y periodo 1"""
+        # Arrange
+        board = Board(10, 10)
+        board.add_wall(Wall(6, 2))
+        mock_board_service.get_board.return_value = board
+        
+        # Act
+        pre_period, period, cells, position = service.analyze_orbit(
+            CommandParser.parse("MOVE"), start=(2, 2, 'NORTH'), times=100
+        )
+        
+        # Assert
+        assert (pre_period, period) == (3, 1)
+        assert cells == [(5, 2)]
+        assert position == (5, 2, 'NORTH')
+        mock_robot_repository.load.assert_not_called()
+    
+    def test_analyze_orbit_rejects_start_on_wall(self, service, mock_board_service):
+        """No se puede empezar sobre una pared"""
+        board = Board(10, 10)
+        board.add_wall(Wall(2, 2))
+        mock_board_service.get_board.return_value = board
+        
+        with pytest.raises(WallCollisionException):
+            service.analyze_orbit(CommandParser.parse("MOVE"), start=(2, 2, 'NORTH'))
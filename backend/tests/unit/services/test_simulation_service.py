@@ -0,0 +1,145 @@
+import time
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from unittest.mock import Mock
+from models.Board import Board
+from models.Wall import Wall
+from services.BoardService import BoardService
+from services.SimulationService import SimulationService
+from services.SimulationWorker import SimulationWorker
+
+
+class TestSimulationService:
+    """Tests para los lotes de simulaciones en el pool de procesos"""
+
+    BOARDS = [
+        {'width': 5, 'height': 5, 'walls': [{'x': 3, 'y': 1}]},
+        {'width': 4, 'height': 6, 'walls': [{'x': 1, 'y': 3}]}
+    ]
+
+    @pytest.fixture
+    def service(self):
+        service = SimulationService(Mock(spec=BoardService), max_workers=2)
+        yield service
+        service.close()
+
+    def _wait(self, service, batch_id):
+        deadline = time.time() + 30
+        batch = service.get(batch_id)
+        while not batch.done and time.time() < deadline:
+            time.sleep(0.01)
+            batch = service.get(batch_id)
+        assert batch.done
+        return batch
+
+
+    # ==================== Tests del pool ====================
+
+    def test_batch_runs_jobs_on_shared_boards(self, service):
+        """Los trabajos de varios tableros deben volver en el orden de la petición"""
+        # Arrange
+        jobs = [
+            {'start': {'x': 1, 'y': 1, 'facing': 'NORTH'}, 'program': 'MOVE\nMOVE\nREPORT'},
+            {'board': 1, 'start': {'x': 1, 'y': 1, 'facing': 'EAST'}, 'program': ['MOVE'], 'times': 5},
+            {'start': {'x': 1, 'y': 2, 'facing': 'NORTH'}, 'program': 'MOVE\nMOVE', 'times': 1_000_001},
+        ] * 50
+
+        # Act
+        batch = self._wait(service, service.submit(self.BOARDS, jobs))
+
+        # Assert
+        assert batch.completed == batch.total == 150
+        assert batch.results[0]['position'] == {'x': 2, 'y': 1, 'facing': 'NORTH'}
+        assert batch.results[0]['errors'][0]['code'] == 'WALL_COLLISION'
+        assert batch.results[1] == {'position': {'x': 1, 'y': 2, 'facing': 'EAST'}}
+        # 2_000_002 pasos en una columna de 5 celdas = 2 pasos netos
+        assert batch.results[2] == {'position': {'x': 3, 'y': 2, 'facing': 'NORTH'}}
+        assert batch.results[-1] == batch.results[2]
+        assert batch.memory == []
+
+    def test_uses_current_board_without_boards(self, service):
+        """Sin boards se simula sobre el tablero actual"""
+        board = Board(3, 3)
+        board.add_wall(Wall(2, 1))
+        service._board_service.get_board.return_value = board
+
+        batch = self._wait(service, service.submit(None, [
+            {'start': {'x': 2, 'y': 1, 'facing': 'NORTH'}, 'program': 'MOVE'}
+        ]))
+
+        assert batch.results == [{'error': 'No se puede colocar el robot en (2, 1): hay una pared'}]
+
+    def test_broken_pool_releases_batch_and_is_replaced(self, service, monkeypatch):
+        """Si el pool está roto el lote se descarta y el siguiente crea otro pool"""
+        # Arrange
+        shared = []
+        share = SimulationService._share
+        monkeypatch.setattr(SimulationService, '_share', staticmethod(lambda board: shared.append(share(board)) or shared[-1]))
+        broken = Mock()
+        broken.submit.side_effect = [Mock(), BrokenProcessPool('murió un proceso')]
+        service._executor = broken
+        jobs = [
+            {'start': {'x': 1, 'y': 1, 'facing': 'NORTH'}, 'program': 'MOVE'},
+            {'board': 1, 'start': {'x': 1, 'y': 1, 'facing': 'EAST'}, 'program': 'MOVE'},
+        ]
+
+        # Act
+        with pytest.raises(BrokenProcessPool):
+            service.submit(self.BOARDS, jobs)
+        batch = self._wait(service, service.submit(self.BOARDS, jobs))
+
+        # Assert
+        broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert service._executor is not broken
+        assert list(service._batches) == [batch.id]
+        assert batch.completed == 2
+        for memory, _ in shared[:2]:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=memory.name)
+
+
+    # ==================== Tests de validación ====================
+
+    @pytest.mark.parametrize("boards, jobs", [
+        (BOARDS, []),
+        (BOARDS, [{'board': 2, 'start': {'x': 1, 'y': 1, 'facing': 'NORTH'}, 'program': 'MOVE'}]),
+        (BOARDS, [{'start': {'x': 1}, 'program': 'MOVE'}]),
+        ([{'width': 2, 'height': 2, 'walls': [{'x': 5, 'y': 5}]}], [{'start': {'x': 1, 'y': 1, 'facing': 'N'}, 'program': 'MOVE'}]),
+    ])
+    def test_invalid_batches_raise_before_submitting(self, service, boards, jobs):
+        """Los lotes mal formados se rechazan sin arrancar el pool"""
+        with pytest.raises(ValueError):
+            service.submit(boards, jobs)
+
+        assert service._executor is None
+
+
+    # ==================== Tests del worker ====================
+
+    def test_worker_rebuilds_board_from_shared_memory(self):
+        """El worker reconstruye el tablero sobre el bloque compartido"""
+        # Arrange
+        board = Board(4, 6)
+        board.add_wall(Wall(1, 3))
+        memory, spec = SimulationService._share(board)
+        try:
+            # Act
+            results = SimulationWorker.run_jobs(spec, [
+                {'start': (1, 1, 'EAST'), 'program': 'MOVE\nMOVE\nMOVE', 'times': None}
+            ])
+
+            # Assert
+            assert results[0]['position'] == {'x': 1, 'y': 2, 'facing': 'EAST'}
+            assert SimulationWorker._attached[spec[0]][1].has_wall_at(1, 3)
+        finally:
+            attached = SimulationWorker._attached.pop(spec[0])
+            del attached
+            memory.close()
+            memory.unlink()
+
+    def test_worker_reports_program_errors(self):
+        """Un programa repetido con comandos no admitidos devuelve un error"""
+        result = SimulationWorker.run_job(Board(3, 3), {'start': (1, 1, 'NORTH'), 'program': 'REPORT', 'times': 3})
+
+        assert 'error' in result
@@ -0,0 +1,111 @@
+import random
+import numpy as np
+import pytest
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from services.CommandParser import CommandParser
+from services.CommandRunner import CommandRunner
+from services.SwarmSimulator import SwarmSimulator
+from exceptions import InvalidDirectionException, WallCollisionException, RobotOutOfBoundsException
+
+
+class TestSwarmSimulator:
+    """Tests unitarios para SwarmSimulator"""
+
+    @pytest.fixture
+    def board(self):
+        """Tablero 5x4 con una pared en (3, 2)"""
+        board = Board(5, 4)
+        board.add_wall(Wall(3, 2))
+        return board
+
+
+    # ==================== Tests de reglas ====================
+
+    def test_move_wraps_and_is_blocked_by_walls(self, board):
+        """MOVE aplica el wrap around y se detiene ante las paredes"""
+        # Arrange
+        simulator = SwarmSimulator.from_positions(board, [(5, 1, 'NORTH'), (2, 2, 'NORTH'), (1, 1, 'WEST')])
+
+        # Act
+        blocked = simulator.step('MOVE')
+
+        # Assert
+        assert blocked == 1
+        assert simulator.positions() == [(1, 1, 'NORTH'), (2, 2, 'NORTH'), (1, 4, 'WEST')]
+
+    def test_per_robot_commands(self, board):
+        """Cada robot puede ejecutar un comando distinto en el mismo tick"""
+        simulator = SwarmSimulator.from_positions(board, [(1, 1, 'NORTH'), (1, 1, 'NORTH'), (1, 1, 'NORTH')])
+
+        simulator.step(np.array([SwarmSimulator.MOVE, SwarmSimulator.LEFT, SwarmSimulator.RIGHT]))
+
+        assert simulator.positions() == [(2, 1, 'NORTH'), (1, 1, 'WEST'), (1, 1, 'EAST')]
+
+    @pytest.mark.parametrize("storage", [Board.STORAGE_LIST, Board.STORAGE_DENSE, Board.STORAGE_SPARSE])
+    def test_matches_command_runner(self, storage):
+        """Cada robot debe acabar donde lo dejaría CommandRunner"""
+        # Arrange
+        rng = random.Random(11)
+        board = Board(13, 9, storage=storage)
+        board.add_walls([Wall(rng.randint(1, 13), rng.randint(1, 9)) for _ in range(25)])
+        positions = []
+        while len(positions) < 50:
+            x, y = rng.randint(1, 13), rng.randint(1, 9)
+            if not board.has_wall_at(x, y):
+                positions.append((x, y, rng.choice(Robot.VALID_DIRECTIONS)))
+        program = [rng.choice(['MOVE', 'MOVE', 'LEFT', 'RIGHT']) for _ in range(40)]
+        simulator = SwarmSimulator.from_positions(board, positions)
+
+        # Act
+        simulator.run(program, times=2)
+
+        # Assert
+        for start, position in zip(positions, simulator.positions()):
+            robot = Robot()
+            robot.place(*start)
+            CommandRunner(board, robot).run(CommandParser.parse(program * 2))
+            assert robot.get_position() == position
+
+
+    # ==================== Tests de validación ====================
+
+    def test_rejects_robot_on_wall(self, board):
+        """Un robot no puede empezar sobre una pared"""
+        with pytest.raises(WallCollisionException):
+            SwarmSimulator.from_positions(board, [(3, 2, 'NORTH')])
+
+    def test_rejects_robot_outside_board(self, board):
+        """Un robot no puede empezar fuera del tablero"""
+        with pytest.raises(RobotOutOfBoundsException):
+            SwarmSimulator.from_positions(board, [(6, 1, 'NORTH')])
+
+    def test_rejects_invalid_direction(self, board):
+        """Las orientaciones se validan como en Robot"""
+        with pytest.raises(InvalidDirectionException):
+            SwarmSimulator.from_positions(board, [(1, 1, 'UP')])
+
+    def test_run_validates_program_before_running(self, board):
+        """Un comando no válido no debe ejecutar ningún tick"""
+        simulator = SwarmSimulator.from_positions(board, [(1, 1, 'NORTH')])
+
+        with pytest.raises(ValueError):
+            simulator.run(['MOVE', 'REPORT'])
+
+        assert simulator.ticks == 0
+        assert simulator.positions() == [(1, 1, 'NORTH')]
+
+
+    # ==================== Tests de rendimiento ====================
+
+    def test_records_per_tick_stats(self, board):
+        """Cada tick debe quedar en history con los robots y los bloqueados"""
+        simulator = SwarmSimulator.from_positions(board, [(2, 2, 'NORTH'), (1, 1, 'NORTH')])
+
+        simulator.run(['MOVE', 'LEFT'])
+
+        assert simulator.ticks == 2
+        assert [(robots, blocked) for robots, _, blocked in simulator.history] == [(2, 1), (2, 0)]
+        assert simulator.throughput() > 0
+        assert simulator.last_tick_rate() > 0
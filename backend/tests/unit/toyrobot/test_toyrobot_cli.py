@@ -0,0 +1,94 @@
+import io
+import os
+import subprocess
+import sys
+from models.Board import Board
+from models.Wall import Wall
+from toyrobot.__main__ import main, read_commands, run
+
+BACKEND_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class TestToyRobotCli:
+    """Tests unitarios para python -m toyrobot"""
+
+    SCRIPT = "PLACE 1,1,NORTH\nMOVE\nREPORT\n# comentario\n\nJUMP\nRIGHT\nMOVE 9\nREPORT\n"
+
+
+    # ==================== Tests del pipeline ====================
+
+    def test_read_commands_keeps_line_numbers(self):
+        """Debe saltar vacías y comentarios conservando el número de línea"""
+        commands = list(read_commands(io.StringIO(self.SCRIPT)))
+
+        assert [(line, command.name) for line, command in commands] == [
+            (1, 'PLACE'), (2, 'MOVE'), (3, 'REPORT'), (6, None), (7, 'RIGHT'), (8, 'MOVE'), (9, 'REPORT')
+        ]
+
+    def test_run_streams_reports_and_errors(self):
+        """Los informes van a out y los errores a err con su línea, bloque a bloque"""
+        # Arrange
+        board = Board(5, 5)
+        board.add_wall(Wall(2, 4))
+        out, err = io.StringIO(), io.StringIO()
+
+        # Act: bloques de 2 comandos para cruzar varios bloques
+        executed, errors = run(io.StringIO(self.SCRIPT), board, out, err, chunk_size=2)
+
+        # Assert
+        assert out.getvalue() == "2,1,NORTH\n2,3,EAST\n"
+        assert err.getvalue().startswith("línea 6: INVALID_COMMAND JUMP")
+        assert (executed, errors) == (7, 1)
+
+    def test_cli_does_not_import_flask_or_repositories(self):
+        """El CLI no debe depender de Flask ni de los repositorios"""
+        # Act: importar el módulo en un intérprete limpio
+        result = subprocess.run(
+            [sys.executable, '-c', 'import sys, toyrobot.__main__; print(sorted(sys.modules))'],
+            cwd=BACKEND_DIRECTORY, capture_output=True, text=True, check=True
+        )
+
+        # Assert
+        modules = result.stdout
+        assert "'flask'" not in modules
+        assert "'repositories" not in modules
+
+
+    # ==================== Tests de main ====================
+
+    def test_main_prints_summary(self, tmp_path, capsys):
+        """main debe ejecutar el fichero e imprimir el resumen en stderr"""
+        # Arrange
+        script = tmp_path / 'commands.txt'
+        script.write_text("PLACE 5,5,EAST\nMOVE\nREPORT\n", encoding='utf-8')
+
+        # Act
+        code = main(['run', str(script), '--width', '5', '--height', '5'])
+
+        # Assert
+        captured = capsys.readouterr()
+        assert code == 0
+        assert captured.out == "5,1,EAST\n"
+        assert "3 comandos" in captured.err
+        assert "comandos/s" in captured.err
+
+    def test_main_rejects_wall_outside_board(self, tmp_path, capsys):
+        """Una pared fuera del tablero es un error de uso"""
+        script = tmp_path / 'commands.txt'
+        script.write_text("REPORT\n", encoding='utf-8')
+
+        assert main(['run', str(script), '--wall', '9,9']) == 2
+
+    def test_main_does_not_close_stdin(self, monkeypatch, capsys):
+        """Con '-' se lee de stdin sin cerrarlo al terminar"""
+        # Arrange
+        stdin = io.StringIO("PLACE 1,1,NORTH\nREPORT\n")
+        monkeypatch.setattr(sys, 'stdin', stdin)
+
+        # Act
+        code = main(['run', '-'])
+
+        # Assert
+        assert code == 0
+        assert capsys.readouterr().out == "1,1,NORTH\n"
+        assert stdin.closed is False
@@ -0,0 +1,4 @@
+"""
+Ejecución de scripts del robot desde la línea de comandos, sin Flask ni
+repositorios: python -m toyrobot run commands.txt
+"""
@@ -0,0 +1,126 @@
+"""
+python -m toyrobot run commands.txt [--width W] [--height H] [--wall X,Y ...]
+
+Reproduce un registro de comandos (uno por línea, el formato de
+CommandParser) sobre un tablero en memoria. La entrada se procesa como una
+cadena de generadores (líneas -> comandos -> bloques) y cada bloque se
+ejecuta con CommandRunner, así la memoria no crece con el tamaño del
+fichero. Los REPORT se escriben en stdout según se producen y los errores y
+el resumen de rendimiento en stderr. Usar '-' como fichero lee de stdin.
+"""
+import argparse
+import sys
+import time
+from contextlib import nullcontext
+from itertools import islice
+from typing import Iterable, Iterator, TextIO
+from models.Board import Board
+from models.Robot import Robot
+from models.Wall import Wall
+from services.CommandParser import Command, CommandParser
+from services.CommandRunner import CommandRunner
+
+# Comandos que se ejecutan de una vez: con bloques grandes CommandRunner
+# usa las tablas de estados y los informes pendientes siguen siendo pocos
+CHUNK_SIZE = 10_000
+
+
+def read_commands(lines: Iterable[str]) -> Iterator[tuple[int, Command]]:
+    """(número de línea, comando) de cada línea que no está vacía ni es un comentario"""
+    for line_number, line in enumerate(lines, start=1):
+        stripped = line.strip()
+        if stripped and not stripped.startswith('#'):
+            yield line_number, CommandParser.parse_line(stripped)
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """Agrupa un iterable en listas de como mucho `size` elementos"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(
+    lines: Iterable[str],
+    board: Board,
+    out: TextIO,
+    err: TextIO,
+    chunk_size: int = CHUNK_SIZE
+) -> tuple[int, int]:
+    """
+    Ejecuta el script bloque a bloque escribiendo los informes y los errores
+
+    Returns:
+        (comandos ejecutados, errores)
+    """
+    runner = CommandRunner(board, Robot())
+    error_count = 0
+    for chunk in chunked(read_commands(lines), chunk_size):
+        runner.run([command for _, command in chunk])
+
+        out.writelines(f"{x},{y},{facing}\n" for x, y, facing in runner.reports)
+        for index, command, code, message in runner.errors:
+            err.write(f"línea {chunk[index][0]}: {code} {command.source}: {message}\n")
+        error_count += len(runner.errors)
+        runner.reports.clear()
+        runner.errors.clear()
+
+    return runner.executed, error_count
+
+
+def parse_wall(value: str) -> Wall:
+    try:
+        x, y = (int(part) for part in value.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Pared '{value}' no válida: debe ser X,Y")
+    return Wall(x, y)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m toyrobot', description='Robot de juguete sin servidor')
+    commands = parser.add_subparsers(dest='action', required=True)
+
+    run_parser = commands.add_parser('run', help='Ejecuta un fichero de comandos')
+    run_parser.add_argument('file', help="Fichero de comandos ('-' para stdin)")
+    run_parser.add_argument('--width', type=int, default=5, help='Ancho del tablero (5 por defecto)')
+    run_parser.add_argument('--height', type=int, default=5, help='Alto del tablero (5 por defecto)')
+    run_parser.add_argument(
+        '--wall', type=parse_wall, action='append', default=[], metavar='X,Y', help='Pared (se puede repetir)'
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.width < 1 or args.height < 1:
+        print('El tablero debe tener al menos una celda', file=sys.stderr)
+        return 2
+    board = Board(args.width, args.height, expected_walls=len(args.wall))
+    _, rejected = board.add_walls(args.wall)
+    if rejected:
+        for _, error in rejected:
+            print(str(error), file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    try:
+        # stdin no es nuestro: no se cierra al terminar
+        source = nullcontext(sys.stdin) if args.file == '-' else open(args.file, encoding='utf-8')
+        with source as source:
+            executed, errors = run(source, board, sys.stdout, sys.stderr)
+    except OSError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    rate = executed / elapsed if elapsed > 0 else 0
+    print(f"{executed} comandos en {elapsed:.3f} s ({rate:,.0f} comandos/s), {errors} errores", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())